@@ -0,0 +1,177 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Benchmark the computation of ``QueryObject.cache_key``.
+
+The cache key of every query of a chart is computed on each chart data request,
+including when the results are cached. For a few typical payloads, this measures
+the time taken by ``to_dict``, by serializing the cache dict with simplejson
+(the previous implementation) and with the current ``md5_sha_from_dict``, and by
+the full ``cache_key`` method.
+"""
+
+import time
+from typing import Any, Callable
+
+import click
+
+from superset.app import create_app
+from superset.utils import json
+from superset.utils.hashing import md5_sha_from_dict, md5_sha_from_str
+from superset.utils.json import json_int_dttm_ser
+
+X_AXIS = {
+    "columnType": "BASE_AXIS",
+    "label": "ds",
+    "sqlExpression": "ds",
+    "timeGrain": "P1D",
+}
+
+PAYLOADS: dict[str, dict[str, Any]] = {
+    "table": {
+        "columns": ["name", "state", "gender"],
+        "metrics": ["count"],
+        "filters": [{"col": "gender", "op": "==", "val": "girl"}],
+        "orderby": [["count", False]],
+        "row_limit": 1000,
+    },
+    "timeseries": {
+        "columns": [X_AXIS, "country"],
+        "metrics": [
+            "count",
+            {
+                "aggregate": "SUM",
+                "column": {"column_name": "num"},
+                "expressionType": "SIMPLE",
+                "label": "SUM(num)",
+            },
+        ],
+        "filters": [
+            {"col": "ds", "op": "TEMPORAL_RANGE", "val": "Last quarter"},
+            {"col": "country", "op": "NOT IN", "val": ["a", "b", "c"]},
+        ],
+        "extras": {"having": "", "where": "num > 0"},
+        "series_limit": 10,
+        "series_limit_metric": "count",
+        "time_offsets": ["1 week ago", "1 year ago"],
+        "post_processing": [
+            {
+                "operation": "pivot",
+                "options": {
+                    "aggregates": {"count": {"operator": "mean"}},
+                    "columns": ["country"],
+                    "drop_missing_columns": False,
+                    "index": ["ds"],
+                },
+            },
+            {"operation": "rename", "options": {"level": 0, "inplace": True}},
+            {"operation": "flatten"},
+        ],
+        "row_limit": 10000,
+    },
+    "large filter": {
+        "columns": ["name"],
+        "metrics": ["count"],
+        "filters": [
+            {"col": "name", "op": "IN", "val": [f"name {i}" for i in range(5000)]}
+        ],
+        "row_limit": 10000,
+    },
+    "annotations": {
+        "columns": [X_AXIS],
+        "metrics": ["count"],
+        "filters": [{"col": "ds", "op": "TEMPORAL_RANGE", "val": "Last year"}],
+        "annotation_layers": [
+            {
+                "annotationType": "FORMULA",
+                "name": f"layer {i}",
+                "overrides": {"time_range": None},
+                "show": True,
+                "sourceType": "",
+                "value": f"{i} * x",
+            }
+            for i in range(10)
+        ],
+        "row_limit": 10000,
+    },
+}
+
+
+def measure(func: Callable[[], Any], iterations: int) -> float:
+    """
+    Return the average duration of a call, in microseconds.
+    """
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def simplejson_hash(obj: dict[str, Any]) -> str:
+    return md5_sha_from_str(
+        json.dumps(
+            obj,
+            sort_keys=True,
+            ignore_nan=True,
+            default=json_int_dttm_ser,
+            allow_nan=True,
+        )
+    )
+
+
+@click.command()
+@click.option("--iterations", default=2_000, help="Iterations for each payload.")
+def main(iterations: int) -> None:
+    # pylint: disable=import-outside-toplevel
+    from superset.common.query_object import QueryObject
+
+    extra = {
+        "datasource": "1__table",
+        "extra_cache_keys": [],
+        "rls": ["tenant_id = 1-tenant"],
+        "changed_on": None,
+    }
+    for name, payload in PAYLOADS.items():
+        query_object = QueryObject(**payload)
+        cache_dict = {**query_object.to_dict(), **extra}
+        assert simplejson_hash(cache_dict) == md5_sha_from_dict(
+            cache_dict, default=json_int_dttm_ser, ignore_nan=True
+        )
+
+        results = {
+            "to_dict": measure(query_object.to_dict, iterations),
+            "simplejson": measure(lambda d=cache_dict: simplejson_hash(d), iterations),
+            "md5_sha_from_dict": measure(
+                lambda d=cache_dict: md5_sha_from_dict(
+                    d, default=json_int_dttm_ser, ignore_nan=True
+                ),
+                iterations,
+            ),
+            "cache_key": measure(
+                lambda q=query_object: q.cache_key(**extra), iterations
+            ),
+        }
+        print(
+            f"{name}: "
+            + ", ".join(f"{key} {value:,.1f} µs" for key, value in results.items())
+        )
+
+
+if __name__ == "__main__":
+    with create_app().app_context():
+        # pylint: disable=no-value-for-parameter
+        main()
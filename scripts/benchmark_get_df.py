@@ -0,0 +1,108 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Benchmark the conversion of query results to pandas in ``Database.get_df``.
+
+The Arrow table built from the rows returned by the driver is converted to a
+dataframe with NumPy dtypes (the default) and with Arrow dtypes, and post-processed
+the same way as in ``get_df``. Results with many columns and with many rows are
+compared. Each run happens in a fresh process so that peak RSS is measured
+independently for each conversion.
+"""
+
+import multiprocessing
+import resource
+import time
+from typing import Any
+
+import click
+import numpy as np
+import pyarrow as pa
+
+from superset.app import create_app
+from superset.result_set import SupersetResultSet
+
+
+def generate_table(columns: int, rows: int) -> pa.Table:
+    """
+    Build a result with integers with NULLs, floats and strings, in equal
+    proportions, the way ``SupersetResultSet`` stores it.
+
+    The columns are built with Arrow directly, so that the peak RSS measured
+    afterwards is not the one of generating the rows.
+    """
+    ints = pa.array(np.arange(rows), mask=np.arange(rows) % 10 == 0)
+    floats = pa.array(np.arange(rows) * 1.5)
+    strings = pa.array([f"value {i}" for i in range(1000)]).take(
+        pa.array(np.arange(rows) % 1000)
+    )
+    arrays = [(ints, floats, strings)[j % 3] for j in range(columns)]
+    return pa.Table.from_arrays(arrays, names=[f"col_{j}" for j in range(columns)])
+
+
+def run(columns: int, rows: int, arrow_dtypes: bool, queue: Any) -> None:
+    # pylint: disable=import-outside-toplevel
+    from superset.models.core import Database
+
+    table = generate_table(columns, rows)
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    df = Database.post_process_df(
+        SupersetResultSet.convert_table_to_df(table, arrow_dtypes=arrow_dtypes)
+    )
+    duration = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    size = int(df.memory_usage(deep=True).sum())
+    queue.put((duration, (peak - baseline) / 1024, size / 1024 / 1024))
+
+
+@click.command()
+@click.option("--wide-columns", default=250, help="Columns of the wide result.")
+@click.option("--wide-rows", default=20_000, help="Rows of the wide result.")
+@click.option("--tall-columns", default=6, help="Columns of the tall result.")
+@click.option("--tall-rows", default=1_000_000, help="Rows of the tall result.")
+def main(
+    wide_columns: int,
+    wide_rows: int,
+    tall_columns: int,
+    tall_rows: int,
+) -> None:
+    queue: Any = multiprocessing.Queue()
+    for name, columns, rows in (
+        ("wide", wide_columns, wide_rows),
+        ("tall", tall_columns, tall_rows),
+    ):
+        print(f"{name}: {columns} columns, {rows:,} rows")
+        for arrow_dtypes in (False, True):
+            process = multiprocessing.Process(
+                target=run,
+                args=(columns, rows, arrow_dtypes, queue),
+            )
+            process.start()
+            duration, peak_mb, size_mb = queue.get()
+            process.join()
+            print(
+                f"  {'arrow' if arrow_dtypes else 'numpy'} dtypes: "
+                f"{duration:.2f} s, peak RSS increase {peak_mb:,.1f} MB, "
+                f"dataframe {size_mb:,.1f} MB"
+            )
+
+
+if __name__ == "__main__":
+    with create_app().app_context():
+        # pylint: disable=no-value-for-parameter
+        main()
@@ -0,0 +1,199 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Benchmark the construction of ``SupersetResultSet`` from DB API rows.
+
+The columnar ingestion path is compared against the previous implementation,
+which built a NumPy structured array of objects and stringified failing
+columns cell by cell. With ``--duckdb`` fetching rows from a DuckDB cursor is
+also compared to fetching Arrow data with ``fetch_arrow``. Each run happens in
+a fresh process so that peak RSS is measured independently for each
+implementation.
+"""
+
+import multiprocessing
+import resource
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any, Callable
+
+import click
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from superset.db_engine_specs.base import BaseEngineSpec
+from superset.result_set import dedup, stringify, SupersetResultSet
+
+
+def generate_rows(rows: int) -> tuple[list[tuple[Any, ...]], list[tuple[Any, ...]]]:
+    """
+    Generate a result with a mix of the column types returned by drivers.
+    """
+    start = datetime(2024, 1, 1)
+    data = [
+        (
+            i,
+            i * 1.5,
+            f"name {i % 1000}",
+            start + timedelta(seconds=i),
+            Decimal(i) / 100,
+            [i, i + 1] if i % 2 else None,
+            i % 3 == 0,
+        )
+        for i in range(rows)
+    ]
+    description = [
+        (name, None, None, None, None, None, True)
+        for name in ("id", "value", "name", "ts", "amount", "tags", "flag")
+    ]
+    return data, description
+
+
+def legacy_result_set(data: list[tuple[Any, ...]], description: Any) -> pa.Table:
+    """
+    The previous row-oriented implementation, kept here as a baseline.
+    """
+
+    def stringify_values(array: Any) -> Any:
+        result = np.copy(array)
+        with np.nditer(result, flags=["refs_ok"], op_flags=[["readwrite"]]) as it:
+            for obj in it:
+                if na_obj := pd.isna(obj):
+                    obj[na_obj] = None
+                else:
+                    try:
+                        obj[...] = obj.astype(str)
+                    except ValueError:
+                        obj[...] = stringify(obj)
+        return result
+
+    column_names = dedup([col[0] for col in description])
+    array = np.array(data, dtype=[(name, "object") for name in column_names])
+    pa_data = []
+    for column in column_names:
+        try:
+            pa_data.append(pa.array(array[column].tolist()))
+        except (pa.lib.ArrowInvalid, pa.lib.ArrowTypeError, ValueError, TypeError):
+            pa_data.append(pa.array(stringify_values(array[column]).tolist()))
+    for i, column in enumerate(column_names):
+        if pa.types.is_nested(pa_data[i].type):
+            pa_data[i] = pa.array(stringify_values(array[column]).tolist())
+    return pa.Table.from_arrays(pa_data, names=column_names)
+
+
+def columnar_result_set(data: list[tuple[Any, ...]], description: Any) -> pa.Table:
+    return SupersetResultSet(data, description, BaseEngineSpec).pa_table
+
+
+def prepare_in_memory(
+    build: Callable[[list[tuple[Any, ...]], Any], pa.Table],
+) -> Callable[[int], Callable[[], pa.Table]]:
+    def prepare(rows: int) -> Callable[[], pa.Table]:
+        data, description = generate_rows(rows)
+        return lambda: build(data, description)
+
+    return prepare
+
+
+def prepare_duckdb(arrow: bool) -> Callable[[int], Callable[[], pa.Table]]:
+    """
+    Fetch the result of a DuckDB query either as rows or as Arrow data.
+    """
+
+    def prepare(rows: int) -> Callable[[], pa.Table]:
+        import duckdb  # pylint: disable=import-outside-toplevel
+
+        from superset.db_engine_specs.duckdb import (  # pylint: disable=import-outside-toplevel
+            DuckDBEngineSpec,
+        )
+
+        connection = duckdb.connect()
+        connection.execute(
+            "CREATE TABLE t AS SELECT i AS id, i * 1.5 AS value, "
+            "'name ' || (i % 1000) AS name, "
+            "TIMESTAMP '2024-01-01' + to_seconds(i) AS ts, "
+            "i % 3 = 0 AS flag FROM range(?) r(i)",
+            [rows],
+        )
+
+        def run_query() -> pa.Table:
+            cursor = connection.cursor()
+            cursor.execute("SELECT * FROM t")
+            if arrow:
+                return SupersetResultSet.from_arrow(
+                    DuckDBEngineSpec.fetch_arrow(cursor),
+                    cursor.description,
+                    DuckDBEngineSpec,
+                ).pa_table
+            return SupersetResultSet(
+                DuckDBEngineSpec.fetch_data(cursor),
+                cursor.description,
+                DuckDBEngineSpec,
+            ).pa_table
+
+        return run_query
+
+    return prepare
+
+
+IMPLEMENTATIONS: dict[str, Callable[[int], Callable[[], pa.Table]]] = {
+    "legacy": prepare_in_memory(legacy_result_set),
+    "columnar": prepare_in_memory(columnar_result_set),
+    "duckdb (rows)": prepare_duckdb(arrow=False),
+    "duckdb (arrow)": prepare_duckdb(arrow=True),
+}
+
+
+def run(name: str, rows: int, queue: Any) -> None:
+    benchmark = IMPLEMENTATIONS[name](rows)
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    table = benchmark()
+    duration = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    queue.put((table.num_rows, duration, (peak - baseline) / 1024))
+
+
+@click.command()
+@click.option("--rows", default=500_000, help="Number of rows in the result.")
+@click.option(
+    "--duckdb",
+    "with_duckdb",
+    is_flag=True,
+    help="Also compare row and Arrow fetching from DuckDB (requires duckdb).",
+)
+def main(rows: int, with_duckdb: bool = False) -> None:
+    queue: Any = multiprocessing.Queue()
+    print(f"Building result sets with {rows} rows\n")
+    for name in IMPLEMENTATIONS:
+        if name.startswith("duckdb") and not with_duckdb:
+            continue
+        process = multiprocessing.Process(target=run, args=(name, rows, queue))
+        process.start()
+        num_rows, duration, peak_mb = queue.get()
+        process.join()
+        print(
+            f"{name}: {num_rows / duration:,.0f} rows/s "
+            f"({duration:.2f} s), peak RSS increase {peak_mb:,.1f} MB"
+        )
+
+
+if __name__ == "__main__":
+    # pylint: disable=no-value-for-parameter
+    main()
@@ -354,6 +354,7 @@ export type QueryResults = {
 
 export type InnerQueryResults = {
   displayLimitReached: boolean;
+  resultsTruncated?: boolean;
   columns: QueryColumn[];
   data: Record<string, unknown>[];
   expanded_columns: QueryColumn[];
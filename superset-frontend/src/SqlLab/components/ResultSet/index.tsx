@@ -443,7 +443,12 @@ const ResultSet = ({
     const shouldUseDefaultDropdownAlert =
       limit === defaultQueryLimit && limitingFactor === LimitingFactor.Dropdown;
 
-    if (limitingFactor === LimitingFactor.Query && csv) {
+    if (results?.resultsTruncated) {
+      limitMessage = t(
+        'The number of rows displayed is limited to %(rows)d by the maximum size of the results',
+        { rows },
+      );
+    } else if (limitingFactor === LimitingFactor.Query && csv) {
       limitMessage = t(
         'The number of rows displayed is limited to %(rows)d by the query',
         { rows },
@@ -128,6 +128,19 @@ describe('asyncEvent middleware', () => {
       expect(fetchMock.calls(CACHED_DATA_ENDPOINT)).toHaveLength(1);
     });
 
+    it('waits on the server for new events when long polling', async () => {
+      asyncEvent.init({
+        ...config,
+        GLOBAL_ASYNC_QUERIES_LONG_POLLING_TIMEOUT: 5,
+      });
+
+      await expect(
+        asyncEvent.waitForAsyncData(asyncPendingEvent),
+      ).resolves.toEqual([chartData]);
+
+      expect(fetchMock.lastUrl(EVENTS_ENDPOINT)).toContain('timeout=5');
+    });
+
     it('rejects on event error status', async () => {
       fetchMock.reset();
       fetchMock.get(EVENTS_ENDPOINT, {
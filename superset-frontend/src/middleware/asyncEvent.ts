@@ -48,6 +48,7 @@ type ListenerFn = (asyncEvent: AsyncEvent) => Promise<any>;
 
 const TRANSPORT_POLLING = 'polling';
 const TRANSPORT_WS = 'ws';
+const TRANSPORT_SSE = 'sse';
 const JOB_STATUS = {
   PENDING: 'pending',
   RUNNING: 'running',
@@ -56,12 +57,14 @@ const JOB_STATUS = {
 };
 const LOCALSTORAGE_KEY = 'last_async_event_id';
 const POLLING_URL = '/api/v1/async_event/';
+const STREAM_URL = '/api/v1/async_event/stream';
 const MAX_RETRIES = 6;
 const RETRY_DELAY = 100;
 
 let config: AppConfig;
 let transport: string;
 let pollingDelayMs: number;
+let longPollingTimeout: number;
 let pollingTimeoutId: number;
 let listenersByJobId: Record<string, ListenerFn>;
 let retriesByJobId: Record<string, number>;
@@ -124,7 +127,7 @@ export const waitForAsyncData = async (asyncResponse: AsyncEvent) =>
   });
 
 const fetchEvents = makeApi<
-  { last_id?: string | null },
+  { last_id?: string | null; timeout?: number },
   { result: AsyncEvent[] }
 >({
   method: 'GET',
@@ -167,7 +170,11 @@ export const processEvents = async (events: AsyncEvent[]) => {
 };
 
 const loadEventsFromApi = async () => {
-  const eventArgs = lastReceivedEventId ? { last_id: lastReceivedEventId } : {};
+  const eventArgs = {
+    ...(lastReceivedEventId ? { last_id: lastReceivedEventId } : {}),
+    // wait on the server for new events instead of polling again
+    ...(longPollingTimeout ? { timeout: longPollingTimeout } : {}),
+  };
   if (Object.keys(listenersByJobId).length) {
     try {
       const { result: events } = await fetchEvents(eventArgs);
@@ -227,9 +234,35 @@ const wsConnect = (): void => {
   });
 };
 
+let eventSource: EventSource | undefined;
+
+const sseConnect = (): void => {
+  let url = STREAM_URL;
+  if (lastReceivedEventId) url += `?last_id=${lastReceivedEventId}`;
+  eventSource = new EventSource(url);
+
+  eventSource.addEventListener('message', async event => {
+    try {
+      await processEvents([JSON.parse(event.data)]);
+    } catch (err) {
+      logging.warn(err);
+    }
+  });
+
+  eventSource.addEventListener('error', () => {
+    // the browser reconnects by itself, unless the stream can't be opened
+    if (eventSource?.readyState === EventSource.CLOSED) {
+      logging.warn('Event stream not available, falling back to async polling');
+      transport = TRANSPORT_POLLING;
+      loadEventsFromApi();
+    }
+  });
+};
+
 export const init = (appConfig?: AppConfig) => {
   if (!isFeatureEnabled(FeatureFlag.GlobalAsyncQueries)) return;
   if (pollingTimeoutId) clearTimeout(pollingTimeoutId);
+  eventSource?.close();
 
   listenersByJobId = {};
   retriesByJobId = {};
@@ -238,6 +271,7 @@ export const init = (appConfig?: AppConfig) => {
   config = appConfig || getBootstrapData().common.conf;
   transport = config.GLOBAL_ASYNC_QUERIES_TRANSPORT || TRANSPORT_POLLING;
   pollingDelayMs = config.GLOBAL_ASYNC_QUERIES_POLLING_DELAY || 500;
+  longPollingTimeout = config.GLOBAL_ASYNC_QUERIES_LONG_POLLING_TIMEOUT || 0;
 
   try {
     lastReceivedEventId = localStorage.getItem(LOCALSTORAGE_KEY);
@@ -251,6 +285,9 @@ export const init = (appConfig?: AppConfig) => {
   if (transport === TRANSPORT_WS) {
     wsConnect();
   }
+  if (transport === TRANSPORT_SSE) {
+    sseConnect();
+  }
 };
 
 init();
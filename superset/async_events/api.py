@@ -15,14 +15,16 @@
 # specific language governing permissions and limitations
 # under the License.
 import logging
+from collections.abc import Iterator
 
-from flask import request, Response
+from flask import current_app, request, Response, stream_with_context
 from flask_appbuilder import expose
 from flask_appbuilder.api import safe
 from flask_appbuilder.security.decorators import permission_name, protect
 
 from superset.async_events.async_query_manager import AsyncQueryTokenException
 from superset.extensions import async_query_manager, event_logger
+from superset.utils import json
 from superset.views.base_api import BaseSupersetApi, statsd_metrics
 
 logger = logging.getLogger(__name__)
@@ -54,6 +56,13 @@ class AsyncEventsRestApi(BaseSupersetApi):
             description: Last ID received by the client
             schema:
                 type: string
+          - in: query
+            name: timeout
+            description: >-
+              Seconds to wait for new events when there are none, capped to
+              GLOBAL_ASYNC_QUERIES_LONG_POLLING_TIMEOUT
+            schema:
+                type: number
           responses:
             200:
               description: Async event results
@@ -93,9 +102,74 @@ class AsyncEventsRestApi(BaseSupersetApi):
                 request
             )
             last_event_id = request.args.get("last_id")
-            events = async_query_manager.read_events(async_channel_id, last_event_id)
+            timeout = request.args.get("timeout", 0, type=float)
+            events = async_query_manager.read_events(
+                async_channel_id, last_event_id, timeout
+            )
 
         except AsyncQueryTokenException:
             return self.response_401()
 
         return self.response(200, result=events)
+
+    @expose("/stream", methods=("GET",))
+    @protect()
+    @safe
+    @statsd_metrics
+    @permission_name("list")
+    def stream(self) -> Response:
+        """
+        Stream the Redis async events as Server-Sent Events.
+        ---
+        get:
+          summary: Stream the Redis events stream
+          description: >-
+            Streams the events of the Redis events stream as Server-Sent Events, as
+            soon as they are added, using the user's JWT token and the last event
+            received, from the Last-Event-ID header or the last_id query param.
+          parameters:
+          - in: query
+            name: last_id
+            description: Last ID received by the client
+            schema:
+                type: string
+          responses:
+            200:
+              description: Async events, in the format of the events endpoint
+              content:
+                text/event-stream:
+                  schema:
+                    type: string
+            401:
+              $ref: '#/components/responses/401'
+            500:
+              $ref: '#/components/responses/500'
+        """
+        try:
+            async_channel_id = async_query_manager.parse_channel_id_from_request(
+                request
+            )
+        except AsyncQueryTokenException:
+            return self.response_401()
+
+        last_event_id = request.headers.get("Last-Event-ID") or request.args.get(
+            "last_id"
+        )
+        # the browser reconnects after this delay when the stream ends
+        retry = current_app.config["GLOBAL_ASYNC_QUERIES_POLLING_DELAY"]
+
+        def generate() -> Iterator[str]:
+            yield f"retry: {retry}\n\n"
+            for events in async_query_manager.stream_events(
+                async_channel_id, last_event_id
+            ):
+                if not events:
+                    yield ": keep-alive\n\n"
+                for event in events:
+                    yield f"id: {event['id']}\ndata: {json.dumps(event)}\n\n"
+
+        return Response(
+            stream_with_context(generate()),
+            mimetype="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
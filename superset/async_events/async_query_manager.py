@@ -17,7 +17,11 @@
 from __future__ import annotations
 
 import logging
+import threading
+import time
 import uuid
+from collections import defaultdict
+from collections.abc import Iterator
 from typing import Any, Literal, Optional
 
 import jwt
@@ -78,6 +82,11 @@ def increment_id(entry_id: str) -> str:
         return entry_id
 
 
+def to_block_ms(timeout: float) -> int:
+    # XREAD BLOCK 0 waits forever, so a positive timeout blocks at least 1 ms
+    return max(1, int(timeout * 1000))
+
+
 def get_cache_backend(
     config: dict[str, Any],
 ) -> RedisCacheBackend | RedisSentinelCacheBackend:
@@ -96,6 +105,8 @@ def get_cache_backend(
 
 class AsyncQueryManager:
     MAX_EVENT_COUNT = 100
+    # how long a read of an event stream waits for events before a keep-alive
+    STREAM_KEEP_ALIVE_INTERVAL = 15
     STATUS_PENDING = "pending"
     STATUS_RUNNING = "running"
     STATUS_ERROR = "error"
@@ -112,8 +123,15 @@ class AsyncQueryManager:
         self._jwt_cookie_domain: Optional[str]
         self._jwt_cookie_samesite: Optional[Literal["None", "Lax", "Strict"]] = None
         self._jwt_secret: str
+        self._long_polling_timeout: float = 0
+        self._stream_max_duration: float = 0
+        self._blocking_connections = threading.BoundedSemaphore(1)
+        self._max_batch_size: int = 1
+        self._chart_data_time_limit: int = 0
         self._load_chart_data_into_cache_job: Any = None
         # pylint: disable=invalid-name
+        self._load_chart_data_batch_into_cache_job: Any = None
+        # pylint: disable=invalid-name
         self._load_explore_json_into_cache_job: Any = None
 
     def init_app(self, app: Flask) -> None:
@@ -146,17 +164,27 @@ class AsyncQueryManager:
         self._jwt_cookie_samesite = config["GLOBAL_ASYNC_QUERIES_JWT_COOKIE_SAMESITE"]
         self._jwt_cookie_domain = config["GLOBAL_ASYNC_QUERIES_JWT_COOKIE_DOMAIN"]
         self._jwt_secret = config["GLOBAL_ASYNC_QUERIES_JWT_SECRET"]
+        self._long_polling_timeout = config["GLOBAL_ASYNC_QUERIES_LONG_POLLING_TIMEOUT"]
+        self._stream_max_duration = config["GLOBAL_ASYNC_QUERIES_SSE_MAX_DURATION"]
+        # blocking reads hold a web worker thread and a Redis connection each
+        self._blocking_connections = threading.BoundedSemaphore(
+            config["GLOBAL_ASYNC_QUERIES_MAX_BLOCKING_CONNECTIONS"]
+        )
+        self._max_batch_size = config["GLOBAL_ASYNC_QUERIES_MAX_BATCH_SIZE"]
+        self._chart_data_time_limit = config["SQLLAB_ASYNC_TIME_LIMIT_SEC"]
 
         if config["GLOBAL_ASYNC_QUERIES_REGISTER_REQUEST_HANDLERS"]:
             self.register_request_handlers(app)
 
         # pylint: disable=import-outside-toplevel
         from superset.tasks.async_queries import (
+            load_chart_data_batch_into_cache,
             load_chart_data_into_cache,
             load_explore_json_into_cache,
         )
 
         self._load_chart_data_into_cache_job = load_chart_data_into_cache
+        self._load_chart_data_batch_into_cache_job = load_chart_data_batch_into_cache
         self._load_explore_json_into_cache_job = load_explore_json_into_cache
 
     def register_request_handlers(self, app: Flask) -> None:
@@ -256,15 +284,121 @@ class AsyncQueryManager:
         )
         return job_metadata
 
+    def submit_chart_data_jobs(
+        self,
+        channel_id: str,
+        form_datas: list[dict[str, Any]],
+        user_id: Optional[int] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Submit the jobs loading the data of several charts, e.g. all the charts of a
+        dashboard, with a single Celery task per dataset, so that the charts of a
+        dataset share the setup of the task, up to
+        ``GLOBAL_ASYNC_QUERIES_MAX_BATCH_SIZE`` charts per task. Each chart of a task
+        gets the time limit of a single chart.
+
+        :param channel_id: The async channel the events of the jobs are added to
+        :param form_datas: The query contexts of the charts
+        :param user_id: The user requesting the data
+        :returns: The metadata of the job of each chart, in the same order
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset import security_manager
+
+        jobs = [self.init_job(channel_id, user_id) for _ in form_datas]
+        user_metadata: dict[str, Any] = {"user_id": user_id}
+        if guest_user := security_manager.get_current_guest_user_if_guest():
+            user_metadata["guest_token"] = guest_user.guest_token
+
+        positions_by_datasource: dict[tuple[str, str], list[int]] = defaultdict(list)
+        for position, form_data in enumerate(form_datas):
+            datasource = form_data.get("datasource") or {}
+            key = (str(datasource.get("type")), str(datasource.get("id")))
+            positions_by_datasource[key].append(position)
+
+        for positions in positions_by_datasource.values():
+            for start in range(0, len(positions), self._max_batch_size):
+                batch = positions[start : start + self._max_batch_size]
+                self._load_chart_data_batch_into_cache_job.apply_async(
+                    (
+                        user_metadata,
+                        [jobs[position] for position in batch],
+                        [form_datas[position] for position in batch],
+                    ),
+                    soft_time_limit=self._chart_data_time_limit * len(batch) or None,
+                )
+        return jobs
+
     def read_events(
-        self, channel: str, last_id: Optional[str]
+        self,
+        channel: str,
+        last_id: Optional[str],
+        timeout: float = 0,
+    ) -> list[Optional[dict[str, Any]]]:
+        """
+        Read the events of a channel after the last event received.
+
+        When there are no events yet, wait up to `timeout` seconds (capped to
+        GLOBAL_ASYNC_QUERIES_LONG_POLLING_TIMEOUT) for new events, if this process
+        has a blocking connection available. Otherwise return immediately.
+        """
+        timeout = min(timeout, self._long_polling_timeout)
+        if timeout <= 0 or not self._blocking_connections.acquire(blocking=False):
+            return self._read_events(channel, last_id)
+
+        try:
+            return self._read_events(channel, last_id, to_block_ms(timeout))
+        finally:
+            self._blocking_connections.release()
+
+    def stream_events(
+        self,
+        channel: str,
+        last_id: Optional[str],
+    ) -> Iterator[list[Optional[dict[str, Any]]]]:
+        """
+        Yield the events of a channel as soon as they are added, for up to
+        GLOBAL_ASYNC_QUERIES_SSE_MAX_DURATION seconds. An empty list is yielded when
+        no event is added for STREAM_KEEP_ALIVE_INTERVAL seconds.
+
+        When this process has no blocking connection available, only the events
+        already added are yielded, and the client is expected to reconnect later.
+        """
+        if not self._blocking_connections.acquire(blocking=False):
+            yield self._read_events(channel, last_id)
+            return
+
+        try:
+            deadline = time.monotonic() + self._stream_max_duration
+            while (remaining := deadline - time.monotonic()) > 0:
+                block = min(remaining, self.STREAM_KEEP_ALIVE_INTERVAL)
+                events = self._read_events(channel, last_id, to_block_ms(block))
+                if events:
+                    last_id = events[-1]["id"]  # type: ignore
+                yield events
+        finally:
+            self._blocking_connections.release()
+
+    def _read_events(
+        self,
+        channel: str,
+        last_id: Optional[str],
+        block: Optional[int] = None,
     ) -> list[Optional[dict[str, Any]]]:
         if not self._cache:
             raise CacheBackendNotInitialized("Cache backend not initialized")
 
         stream_name = f"{self._stream_prefix}{channel}"
-        start_id = increment_id(last_id) if last_id else "-"
-        results = self._cache.xrange(stream_name, start_id, "+", self.MAX_EVENT_COUNT)
+        if block is not None:
+            # XREAD returns the events following last_id, waiting for them
+            results = self._cache.xread(
+                stream_name, last_id or "0", self.MAX_EVENT_COUNT, block
+            )
+        else:
+            start_id = increment_id(last_id) if last_id else "-"
+            results = self._cache.xrange(
+                stream_name, start_id, "+", self.MAX_EVENT_COUNT
+            )
         # Decode bytes to strings, decode_responses is not supported at RedisCache and RedisSentinelCache  # noqa: E501
         if isinstance(self._cache, (RedisSentinelCacheBackend, RedisCacheBackend)):
             decoded_results = [
@@ -80,6 +80,21 @@ class RedisCacheBackend(RedisCache):
         count = count or self.MAX_EVENT_COUNT
         return self._cache.xrange(stream_name, start, end, count)
 
+    def xread(
+        self,
+        stream_name: str,
+        last_id: str = "0",
+        count: Optional[int] = None,
+        block: Optional[int] = None,
+    ) -> List[Any]:
+        """
+        Read the events after an ID, waiting up to `block` milliseconds for new
+        events when there are none.
+        """
+        count = count or self.MAX_EVENT_COUNT
+        streams = self._cache.xread({stream_name: last_id}, count, block)
+        return streams[0][1] if streams else []
+
     @classmethod
     def from_config(cls, config: Dict[str, Any]) -> "RedisCacheBackend":
         kwargs = {
@@ -196,6 +211,21 @@ class RedisSentinelCacheBackend(RedisSentinelCache):
         count = count or self.MAX_EVENT_COUNT
         return self._cache.xrange(stream_name, start, end, count)
 
+    def xread(
+        self,
+        stream_name: str,
+        last_id: str = "0",
+        count: Optional[int] = None,
+        block: Optional[int] = None,
+    ) -> List[Any]:
+        """
+        Read the events after an ID, waiting up to `block` milliseconds for new
+        events when there are none.
+        """
+        count = count or self.MAX_EVENT_COUNT
+        streams = self._cache.xread({stream_name: last_id}, count, block)
+        return streams[0][1] if streams else []
+
     @classmethod
     def from_config(cls, config: Dict[str, Any]) -> "RedisSentinelCacheBackend":
         kwargs = {
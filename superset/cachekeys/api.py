@@ -93,6 +93,11 @@ class CacheRestApi(BaseSupersetModelRestApi):
             if ds_obj:
                 datasource_uids.add(ds_obj.uid)
 
+        # entries in the local cache of other workers expire on their own, after
+        # at most `DATA_CACHE_LOCAL_TIMEOUT` seconds
+        for datasource_uid in datasource_uids:
+            cache_manager.local_data_cache.delete_tag(datasource_uid)
+
         cache_key_objs = (
             db.session.query(CacheKey)
             .filter(CacheKey.datasource_uid.in_(datasource_uids))
@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import contextlib
 import logging
+import uuid
 from typing import Any, TYPE_CHECKING
 
 from flask import current_app, g, make_response, request, Response
@@ -26,11 +27,17 @@ from flask_babel import gettext as _
 from marshmallow import ValidationError
 
 from superset import is_feature_enabled, security_manager
-from superset.async_events.async_query_manager import AsyncQueryTokenException
+from superset.async_events.async_query_manager import (
+    AsyncQueryTokenException,
+    build_job_metadata,
+)
 from superset.charts.api import ChartRestApi
 from superset.charts.client_processing import apply_client_processing
 from superset.charts.data.query_context_cache_loader import QueryContextCacheLoader
-from superset.charts.schemas import ChartDataQueryContextSchema
+from superset.charts.schemas import (
+    ChartDataBatchRequestSchema,
+    ChartDataQueryContextSchema,
+)
 from superset.commands.chart.data.create_async_job_command import (
     CreateAsyncChartDataJobCommand,
 )
@@ -42,8 +49,8 @@ from superset.commands.chart.exceptions import (
 from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
 from superset.connectors.sqla.models import BaseDatasource
 from superset.daos.exceptions import DatasourceNotFound
-from superset.exceptions import QueryObjectValidationError
-from superset.extensions import event_logger
+from superset.exceptions import QueryObjectValidationError, SupersetSecurityException
+from superset.extensions import async_query_manager, event_logger
 from superset.models.sql_lab import Query
 from superset.utils import json
 from superset.utils.core import (
@@ -62,7 +69,7 @@ logger = logging.getLogger(__name__)
 
 
 class ChartDataRestApi(ChartRestApi):
-    include_route_methods = {"get_data", "data", "data_from_cache"}
+    include_route_methods = {"get_data", "data", "data_batch", "data_from_cache"}
 
     @expose("/<int:pk>/data/", methods=("GET",))
     @protect()
@@ -261,6 +268,77 @@ class ChartDataRestApi(ChartRestApi):
             command, form_data=form_data, datasource=query_context.datasource
         )
 
+    @expose("/data/batch", methods=("POST",))
+    @protect()
+    @statsd_metrics
+    @event_logger.log_this_with_context(
+        action=lambda self, *args, **kwargs: f"{self.__class__.__name__}.data_batch",
+        log_to_statsd=False,
+    )
+    def data_batch(self) -> Response:
+        """
+        Take the query contexts of several charts, e.g. all the charts of a dashboard,
+        and load their data asynchronously
+        ---
+        post:
+          summary: Load the data of several charts asynchronously
+          description: >-
+            Takes the query contexts of several charts and returns an async job for
+            each of them. The charts of the same dataset are loaded by the same
+            background task, and an event is added for each chart when its data is
+            loaded. Jobs of charts whose data is already cached are done, and jobs of
+            invalid query contexts have errors. Requires the GLOBAL_ASYNC_QUERIES
+            feature flag.
+          requestBody:
+            required: true
+            content:
+              application/json:
+                schema:
+                  $ref: "#/components/schemas/ChartDataBatchRequestSchema"
+          responses:
+            202:
+              description: Async job details of each chart
+              content:
+                application/json:
+                  schema:
+                    $ref: "#/components/schemas/ChartDataAsyncBatchResponseSchema"
+            400:
+              $ref: '#/components/responses/400'
+            401:
+              $ref: '#/components/responses/401'
+            500:
+              $ref: '#/components/responses/500'
+        """
+        if not is_feature_enabled("GLOBAL_ASYNC_QUERIES"):
+            return self.response_400(message=_("Async queries are not enabled"))
+        if not request.is_json:
+            return self.response_400(message=_("Request is not JSON"))
+        try:
+            form_datas = ChartDataBatchRequestSchema().load(request.json)[
+                "query_contexts"
+            ]
+        except ValidationError as error:
+            return self.response_400(message=error.messages)
+
+        async_command = CreateAsyncChartDataJobCommand()
+        try:
+            async_command.validate(request)
+        except AsyncQueryTokenException:
+            return self.response_401()
+
+        user_id = get_user_id()
+        jobs: list[dict[str, Any] | None] = [
+            self._get_batch_job(async_command.async_channel_id, form_data, user_id)
+            for form_data in form_datas
+        ]
+        pending = [position for position, job in enumerate(jobs) if job is None]
+        submitted = async_command.run_batch(
+            [form_datas[position] for position in pending], user_id
+        )
+        for position, job in zip(pending, submitted, strict=True):
+            jobs[position] = job
+        return self.response(202, result=jobs)
+
     @expose("/data/<cache_key>", methods=("GET",))
     @protect()
     @statsd_metrics
@@ -343,6 +421,64 @@ class ChartDataRestApi(ChartRestApi):
         result = async_command.run(form_data, get_user_id())
         return self.response(202, **result)
 
+    def _get_batch_job(
+        self,
+        channel_id: str,
+        form_data: dict[str, Any],
+        user_id: int | None,
+    ) -> dict[str, Any] | None:
+        """
+        Return the job of a chart of a batch when it doesn't need to be submitted:
+        done when its data is already cached, or with errors when its query context
+        is invalid.
+        """
+
+        def make_job(status: str, **kwargs: Any) -> dict[str, Any]:
+            return build_job_metadata(
+                channel_id, str(uuid.uuid4()), user_id, status=status, **kwargs
+            )
+
+        try:
+            query_context = self._create_query_context_from_form(form_data)
+            command = ChartDataCommand(query_context)
+            command.validate()
+        except DatasourceNotFound:
+            return make_job(
+                async_query_manager.STATUS_ERROR,
+                errors=[{"message": _("Datasource does not exist")}],
+            )
+        except (QueryObjectValidationError, SupersetSecurityException) as error:
+            return make_job(
+                async_query_manager.STATUS_ERROR, errors=[{"message": error.message}]
+            )
+        except ValidationError as error:
+            return make_job(
+                async_query_manager.STATUS_ERROR,
+                errors=[{"message": str(error.normalized_messages())}],
+            )
+
+        if (
+            query_context.result_format != ChartDataResultFormat.JSON
+            or query_context.result_type != ChartDataResultType.FULL
+        ):
+            return make_job(
+                async_query_manager.STATUS_ERROR,
+                errors=[{"message": _("Only JSON results can be loaded in batch")}],
+            )
+
+        try:
+            result = command.run(cache=True, force_cached=True)
+        except ChartDataCacheLoadError:
+            return None
+        except ChartDataQueryFailedError as error:
+            return make_job(
+                async_query_manager.STATUS_ERROR, errors=[{"message": error.message}]
+            )
+        return make_job(
+            async_query_manager.STATUS_DONE,
+            result_url=f"/api/v1/chart/data/{result['cache_key']}",
+        )
+
     def _send_chart_response(  # noqa: C901
         self,
         result: dict[Any, Any],
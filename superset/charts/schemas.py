@@ -39,6 +39,7 @@ from superset.utils.core import (
 if TYPE_CHECKING:
     from superset.common.query_context import QueryContext
     from superset.common.query_context_factory import QueryContextFactory
+    from superset.connectors.sqla.models import BaseDatasource
 
 config = app.config
 
@@ -1383,10 +1384,25 @@ class ChartDataQueryContextSchema(Schema):
 
     form_data = fields.Raw(allow_none=True, required=False)
 
+    def __init__(
+        self,
+        *args: Any,
+        datasource_model: BaseDatasource | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """
+        :param datasource_model: The datasource of the query contexts, when it is
+            already loaded, instead of loading it for each query context
+        """
+        super().__init__(*args, **kwargs)
+        self.datasource_model = datasource_model
+
     # pylint: disable=unused-argument
     @post_load
     def make_query_context(self, data: dict[str, Any], **kwargs: Any) -> QueryContext:
-        query_context = self.get_query_context_factory().create(**data)
+        query_context = self.get_query_context_factory().create(
+            **data, datasource_model=self.datasource_model
+        )
         return query_context
 
     def get_query_context_factory(self) -> QueryContextFactory:
@@ -1477,6 +1493,13 @@ class ChartDataResponseResult(Schema):
         metadata={"description": "Amount of rows in result set"},
         allow_none=False,
     )
+    duration_ms = fields.Float(
+        metadata={
+            "description": "Time spent loading the results, from the cache or the "
+            "database, in milliseconds"
+        },
+        allow_none=True,
+    )
     data = fields.List(fields.Dict(), metadata={"description": "A list with results"})
     colnames = fields.List(
         fields.String(), metadata={"description": "A list of column names"}
@@ -1534,6 +1557,33 @@ class ChartDataAsyncResponseSchema(Schema):
         metadata={"description": "Unique result URL for fetching async query data"},
         allow_none=False,
     )
+    errors = fields.List(
+        fields.Dict(),
+        metadata={"description": "Errors of a failed async job"},
+        required=False,
+    )
+
+
+class ChartDataBatchRequestSchema(Schema):
+    query_contexts = fields.List(
+        fields.Dict(),
+        metadata={
+            "description": "The query context of each chart, as sent to "
+            "/api/v1/chart/data"
+        },
+        required=True,
+        validate=Length(min=1),
+    )
+
+
+class ChartDataAsyncBatchResponseSchema(Schema):
+    result = fields.List(
+        fields.Nested(ChartDataAsyncResponseSchema),
+        metadata={
+            "description": "The async job of each chart, in the order of the query "
+            "contexts"
+        },
+    )
 
 
 class ChartFavStarResponseResult(Schema):
@@ -1609,6 +1659,8 @@ CHART_SCHEMAS = (
     ChartDataQueryContextSchema,
     ChartDataResponseSchema,
     ChartDataAsyncResponseSchema,
+    ChartDataAsyncBatchResponseSchema,
+    ChartDataBatchRequestSchema,
     # TODO: These should optimally be included in the QueryContext schema as an `anyOf`
     #  in ChartDataPostProcessingOperation.options, but since `anyOf` is not
     #  by Marshmallow<3, this is not currently possible.
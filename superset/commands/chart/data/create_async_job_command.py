@@ -36,3 +36,14 @@ class CreateAsyncChartDataJobCommand:
         return async_query_manager.submit_chart_data_job(
             self._async_channel_id, form_data, user_id
         )
+
+    def run_batch(
+        self, form_datas: list[dict[str, Any]], user_id: Optional[int]
+    ) -> list[dict[str, Any]]:
+        return async_query_manager.submit_chart_data_jobs(
+            self._async_channel_id, form_datas, user_id
+        )
+
+    @property
+    def async_channel_id(self) -> str:
+        return self._async_channel_id
@@ -17,6 +17,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable, Iterator
 from typing import Any, cast, TypedDict
 
 import pandas as pd
@@ -28,9 +29,10 @@ from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
 from superset.exceptions import SupersetErrorException, SupersetSecurityException
 from superset.models.sql_lab import Query
 from superset.sql.parse import SQLScript
+from superset.sqllab import result_chunks
 from superset.sqllab.limiting_factor import LimitingFactor
 from superset.utils import core as utils, csv
-from superset.views.utils import _deserialize_results_payload
+from superset.views.utils import _decode_results_payload, _load_results_payload
 
 config = app.config
 
@@ -39,8 +41,39 @@ logger = logging.getLogger(__name__)
 
 class SqlExportResult(TypedDict):
     query: Query
-    count: int
-    data: list[Any]
+    # unknown when the results are streamed from the database
+    count: int | None
+    data: str | Iterator[str]
+
+
+def limit_chunks(
+    chunks: Iterable[pd.DataFrame], limit: int | None
+) -> Iterator[pd.DataFrame]:
+    """
+    Yield dataframes until they add up to `limit` rows.
+
+    Empty dataframes are kept, as they carry the columns of empty results.
+    """
+    remaining = limit
+    for chunk in chunks:
+        if remaining is not None:
+            chunk = chunk[:remaining]
+            remaining -= len(chunk.index)
+        yield chunk
+        if remaining == 0:
+            return
+
+
+def results_to_df(obj: dict[str, Any]) -> pd.DataFrame:
+    return pd.DataFrame(
+        data=obj["data"],
+        dtype=object,
+        columns=[c["name"] for c in obj["columns"]],
+    )
+
+
+def min_limit(*limits: int | None) -> int | None:
+    return min((limit for limit in limits if limit is not None), default=None)
 
 
 class SqlResultExportCommand(BaseCommand):
@@ -86,6 +119,8 @@ class SqlResultExportCommand(BaseCommand):
         self,
     ) -> SqlExportResult:
         self.validate()
+        streaming = config["CSV_STREAMING_EXPORT"]
+        max_rows = config["CSV_STREAMING_MAX_ROWS"] if streaming else None
         blob = None
         if results_backend and self._query.results_key:
             logger.info(
@@ -97,17 +132,43 @@ class SqlResultExportCommand(BaseCommand):
             payload = utils.zlib_decompress(
                 blob, decode=not results_backend_use_msgpack
             )
-            obj = _deserialize_results_payload(
-                payload, self._query, cast(bool, results_backend_use_msgpack)
-            )
+            use_msgpack = cast(bool, results_backend_use_msgpack)
+            stored = _load_results_payload(payload, use_msgpack)
+            if streaming and result_chunks.is_chunked(stored):
+                logger.info("Streaming stored result chunks as CSV")
+                return {
+                    "query": self._query,
+                    "count": min_limit(stored["query"]["rows"], max_rows),
+                    "data": csv.df_chunks_to_escaped_csv(
+                        limit_chunks(self._read_chunks(stored), max_rows),
+                        columns=[column["name"] for column in stored["columns"]],
+                        index=False,
+                        **config["CSV_EXPORT"],
+                    ),
+                }
 
-            df = pd.DataFrame(
-                data=obj["data"],
-                dtype=object,
-                columns=[c["name"] for c in obj["columns"]],
+            df = results_to_df(
+                _decode_results_payload(
+                    stored, self._query, use_msgpack, limit=max_rows
+                )
             )
 
             logger.info("Using pandas to convert to CSV")
+            if streaming:
+                chunk_size = config["CSV_STREAMING_CHUNK_SIZE"]
+                return {
+                    "query": self._query,
+                    "count": len(df.index),
+                    "data": csv.df_chunks_to_escaped_csv(
+                        (
+                            df[i : i + chunk_size]
+                            for i in range(0, len(df.index), chunk_size)
+                        ),
+                        columns=df.columns,
+                        index=False,
+                        **config["CSV_EXPORT"],
+                    ),
+                }
         else:
             logger.info("Running a query to turn into CSV")
             if self._query.select_sql:
@@ -125,6 +186,24 @@ class SqlResultExportCommand(BaseCommand):
             }:
                 # remove extra row from `increased_limit`
                 limit -= 1
+            if streaming:
+                logger.info("Streaming query results as CSV")
+                chunks = self._query.database.get_df_chunks(
+                    sql,
+                    self._query.catalog,
+                    self._query.schema,
+                    chunk_size=config["CSV_STREAMING_CHUNK_SIZE"],
+                    max_chunk_bytes=config["CSV_STREAMING_MAX_CHUNK_BYTES"],
+                )
+                return {
+                    "query": self._query,
+                    "count": None,
+                    "data": csv.df_chunks_to_escaped_csv(
+                        limit_chunks(chunks, min_limit(limit, max_rows)),
+                        index=False,
+                        **config["CSV_EXPORT"],
+                    ),
+                }
             df = self._query.database.get_df(
                 sql,
                 self._query.catalog,
@@ -138,3 +217,19 @@ class SqlResultExportCommand(BaseCommand):
             "count": len(df.index),
             "data": csv_data,
         }
+
+    def _read_chunks(self, stored: dict[str, Any]) -> Iterator[pd.DataFrame]:
+        """
+        Read the stored result chunks one at a time.
+        """
+        chunk_rows = stored["chunks"]["rows"]
+        for index in range(stored["chunks"]["count"]):
+            yield results_to_df(
+                _decode_results_payload(
+                    stored,
+                    self._query,
+                    cast(bool, results_backend_use_msgpack),
+                    offset=index * chunk_rows,
+                    limit=chunk_rows,
+                )
+            )
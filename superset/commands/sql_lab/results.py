@@ -26,7 +26,10 @@ from superset.commands.base import BaseCommand
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
 from superset.exceptions import SerializationError, SupersetErrorException
 from superset.models.sql_lab import Query
-from superset.sqllab.utils import apply_display_max_row_configuration_if_require
+from superset.sqllab.utils import (
+    apply_display_max_row_configuration_if_require,
+    get_statement_results_query_id,
+)
 from superset.utils import core as utils
 from superset.utils.dates import now_as_float
 from superset.views.utils import _deserialize_results_payload
@@ -41,6 +44,7 @@ logger = logging.getLogger(__name__)
 class SqlExecutionResultsCommand(BaseCommand):
     _key: str
     _rows: int | None
+    _offset: int
     _blob: Any
     _query: Query
 
@@ -48,9 +52,11 @@ class SqlExecutionResultsCommand(BaseCommand):
         self,
         key: str,
         rows: int | None = None,
+        offset: int = 0,
     ) -> None:
         self._key = key
         self._rows = rows
+        self._offset = offset
 
     def validate(self) -> None:
         if not results_backend:
@@ -82,9 +88,7 @@ class SqlExecutionResultsCommand(BaseCommand):
                 status=410,
             )
 
-        self._query = (
-            db.session.query(Query).filter_by(results_key=self._key).one_or_none()
-        )
+        self._query = self._get_query()
         if self._query is None:
             raise SupersetErrorException(
                 SupersetError(
@@ -98,6 +102,28 @@ class SqlExecutionResultsCommand(BaseCommand):
                 status=404,
             )
 
+    def _get_query(self) -> Query | None:
+        """
+        Return the query whose results, or the results of one of whose statements,
+        are stored under the key.
+        """
+        if query := (
+            db.session.query(Query).filter_by(results_key=self._key).one_or_none()
+        ):
+            return query
+
+        # the keys of the results of the statements of a script end with its ID, and
+        # are listed in its extra
+        if (query_id := get_statement_results_query_id(self._key)) is None:
+            return None
+        query = db.session.query(Query).filter_by(id=query_id).one_or_none()
+        if query and any(
+            result.get("resultsKey") == self._key
+            for result in query.extra.get("statement_results", [])
+        ):
+            return query
+        return None
+
     def run(
         self,
     ) -> dict[str, Any]:
@@ -108,7 +134,12 @@ class SqlExecutionResultsCommand(BaseCommand):
         )
         try:
             obj = _deserialize_results_payload(
-                payload, self._query, cast(bool, results_backend_use_msgpack)
+                payload,
+                self._query,
+                cast(bool, results_backend_use_msgpack),
+                offset=self._offset,
+                limit=self._rows or None,
+                results_key=self._key,
             )
         except SerializationError as ex:
             raise SupersetErrorException(
@@ -125,6 +156,8 @@ class SqlExecutionResultsCommand(BaseCommand):
             ) from ex
 
         if self._rows:
-            obj = apply_display_max_row_configuration_if_require(obj, self._rows)
+            obj = apply_display_max_row_configuration_if_require(
+                obj, self._rows, self._offset
+            )
 
         return obj
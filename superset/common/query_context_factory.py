@@ -54,9 +54,10 @@ class QueryContextFactory:  # pylint: disable=too-few-public-methods
         result_format: ChartDataResultFormat | None = None,
         force: bool = False,
         custom_cache_timeout: int | None = None,
+        datasource_model: BaseDatasource | None = None,
     ) -> QueryContext:
-        datasource_model_instance = None
-        if datasource:
+        datasource_model_instance = datasource_model
+        if datasource and datasource_model_instance is None:
             datasource_model_instance = self._convert_to_model(datasource)
 
         slice_ = None
@@ -81,6 +82,7 @@ class QueryContextFactory:  # pylint: disable=too-few-public-methods
                     result_type,
                     datasource=datasource,
                     server_pagination=server_pagination,
+                    datasource_model=datasource_model_instance,
                     **query_obj,
                 ),
             )
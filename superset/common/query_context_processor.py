@@ -19,7 +19,11 @@ from __future__ import annotations
 import copy
 import logging
 import re
-from datetime import datetime
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from functools import partial
 from typing import Any, cast, ClassVar, TYPE_CHECKING, TypedDict
 
 import numpy as np
@@ -31,11 +35,12 @@ from superset import app
 from superset.common.chart_data import ChartDataResultFormat
 from superset.common.db_query_status import QueryStatus
 from superset.common.query_actions import get_query_results
-from superset.common.utils import dataframe_utils
+from superset.common.utils import dataframe_utils, query_executor
 from superset.common.utils.query_cache_manager import QueryCacheManager
 from superset.common.utils.time_range_utils import (
     get_since_until_from_query_object,
     get_since_until_from_time_range,
+    get_time_partitions,
 )
 from superset.connectors.sqla.models import BaseDatasource
 from superset.constants import CacheRegion, TimeGrain
@@ -51,7 +56,11 @@ from superset.models.helpers import QueryResult
 from superset.models.sql_lab import Query
 from superset.superset_typing import AdhocColumn, AdhocMetric
 from superset.utils import csv, excel
-from superset.utils.cache import generate_cache_key, set_and_log_cache
+from superset.utils.cache import (
+    generate_cache_key,
+    memoize_per_request,
+    set_and_log_cache,
+)
 from superset.utils.core import (
     DatasourceType,
     DateColumn,
@@ -104,6 +113,49 @@ AGGREGATED_JOIN_GRAINS = {
 # Right suffix used for joining offset results
 R_SUFFIX = "__right_suffix"
 
+# Frequencies of the time grains of a fixed duration, used to know if a time shifted
+# range starts and ends at the start of a time grain.
+FIXED_TIME_GRAIN_FREQUENCIES = {
+    TimeGrain.SECOND: "s",
+    TimeGrain.FIVE_SECONDS: "5s",
+    TimeGrain.THIRTY_SECONDS: "30s",
+    TimeGrain.MINUTE: "min",
+    TimeGrain.FIVE_MINUTES: "5min",
+    TimeGrain.TEN_MINUTES: "10min",
+    TimeGrain.FIFTEEN_MINUTES: "15min",
+    TimeGrain.THIRTY_MINUTES: "30min",
+    TimeGrain.HALF_HOUR: "30min",
+    TimeGrain.HOUR: "h",
+    TimeGrain.SIX_HOURS: "6h",
+    TimeGrain.DAY: "D",
+}
+
+
+def is_time_grain_start(dttm: datetime, time_grain: str | None) -> bool:
+    """
+    Return whether a datetime is the start of a time grain, ie the metrics grouped by
+    time grain are the same whether the time range starts (or ends) there or earlier.
+    """
+    timestamp = pd.Timestamp(dttm)
+    if not time_grain:
+        return True
+    if freq := FIXED_TIME_GRAIN_FREQUENCIES.get(time_grain):
+        return timestamp.floor(freq) == timestamp
+    if timestamp != timestamp.normalize():
+        return False
+    # the first day of TimeGrain.WEEK depends on the database
+    if time_grain == TimeGrain.WEEK_STARTING_MONDAY:
+        return timestamp.dayofweek == 0
+    if time_grain == TimeGrain.WEEK_STARTING_SUNDAY:
+        return timestamp.dayofweek == 6
+    if time_grain == TimeGrain.MONTH:
+        return timestamp.day == 1
+    if time_grain in (TimeGrain.QUARTER, TimeGrain.QUARTER_YEAR):
+        return timestamp.day == 1 and timestamp.month in (1, 4, 7, 10)
+    if time_grain == TimeGrain.YEAR:
+        return timestamp.day == 1 and timestamp.month == 1
+    return False
+
 
 class CachedTimeOffset(TypedDict):
     df: pd.DataFrame
@@ -111,6 +163,16 @@ class CachedTimeOffset(TypedDict):
     cache_keys: list[str | None]
 
 
+class OffsetQuery(TypedDict):
+    offset: str
+    index: int
+    query_object: QueryObject
+    query_object_dct: dict[str, Any]
+    metrics_mapping: dict[str, str]
+    cache: QueryCacheManager
+    cache_key: str | None
+
+
 class QueryContextProcessor:
     """
     The query context contains the query object and additional fields necessary
@@ -131,6 +193,7 @@ class QueryContextProcessor:
         self, query_obj: QueryObject, force_cached: bool | None = False
     ) -> dict[str, Any]:
         """Handles caching around the df payload retrieval"""
+        start = time.perf_counter()
         cache_key = self.query_cache_key(query_obj)
         timeout = self.get_cache_timeout()
         force_query = self._query_context.force or timeout == -1
@@ -159,17 +222,21 @@ class QueryContextProcessor:
                         )
                     )
 
-                query_result = self.get_query_result(query_obj)
-                annotation_data = self.get_annotation_data(query_obj)
-                cache.set_query_result(
-                    key=cache_key,
-                    query_result=query_result,
-                    annotation_data=annotation_data,
-                    force_query=force_query,
-                    timeout=self.get_cache_timeout(),
-                    datasource_uid=self._qc_datasource.uid,
-                    region=CacheRegion.DATA,
-                )
+                with self._coalesce_query(cache_key, force_query) as coalesced_cache:
+                    if coalesced_cache:
+                        cache = coalesced_cache
+                    else:
+                        query_result = self.get_query_result(query_obj)
+                        annotation_data = self.get_annotation_data(query_obj)
+                        cache.set_query_result(
+                            key=cache_key,
+                            query_result=query_result,
+                            annotation_data=annotation_data,
+                            force_query=force_query,
+                            timeout=self.get_cache_timeout(),
+                            datasource_uid=self._qc_datasource.uid,
+                            region=CacheRegion.DATA,
+                        )
             except QueryObjectValidationError as ex:
                 cache.error_message = str(ex)
                 cache.status = QueryStatus.FAILED
@@ -228,20 +295,75 @@ class QueryContextProcessor:
             "from_dttm": query_obj.from_dttm,
             "to_dttm": query_obj.to_dttm,
             "label_map": label_map,
+            "duration_ms": (time.perf_counter() - start) * 1000,
         }
 
+    @contextmanager
+    def _coalesce_query(
+        self, cache_key: str, force_query: bool
+    ) -> Iterator[QueryCacheManager | None]:
+        """
+        Make sure only one request at a time runs the query for a given cache key.
+
+        The first request takes a lock on the cache key and yields ``None``, meaning
+        that it should run the query, releasing the lock once done. Other requests
+        wait for the result to be cached and yield it, or yield ``None`` if it's not
+        available within ``CHART_DATA_COALESCING_TIMEOUT`` seconds.
+        """
+        timeout = config["CHART_DATA_COALESCING_TIMEOUT"]
+        if not timeout or force_query:
+            yield None
+            return
+
+        if QueryCacheManager.acquire_lock(cache_key, timeout, CacheRegion.DATA):
+            try:
+                yield None
+            finally:
+                QueryCacheManager.release_lock(cache_key, CacheRegion.DATA)
+            return
+
+        yield self._wait_for_cache(cache_key, timeout)
+
+    @staticmethod
+    def _wait_for_cache(cache_key: str, timeout: int) -> QueryCacheManager | None:
+        start = time.monotonic()
+        while time.monotonic() - start < timeout:
+            time.sleep(config["CHART_DATA_COALESCING_POLL_INTERVAL"])
+            # check the lock before the cache, since the result is cached before the
+            # lock is released
+            is_locked = QueryCacheManager.is_locked(cache_key, CacheRegion.DATA)
+            cache = QueryCacheManager.get(key=cache_key, region=CacheRegion.DATA)
+            if cache.is_loaded:
+                stats_logger.incr("coalesced_query")
+                stats_logger.timing(
+                    "coalesced_query.wait_time", (time.monotonic() - start) * 1000
+                )
+                return cache
+            if not is_locked:
+                # the request running the query failed
+                break
+
+        stats_logger.incr("coalesced_query_not_loaded")
+        return None
+
     def query_cache_key(self, query_obj: QueryObject, **kwargs: Any) -> str | None:
         """
         Returns a QueryObject cache key for objects in self.queries
         """
         datasource = self._qc_datasource
         extra_cache_keys = datasource.get_extra_cache_keys(query_obj.to_dict())
+        # the RLS filters of a datasource are loaded from the metadata database, and
+        # they are the same for all the queries of a request
+        rls = memoize_per_request(
+            ("rls_cache_key", datasource.uid),
+            lambda: security_manager.get_rls_cache_key(datasource),
+        )
 
         cache_key = (
             query_obj.cache_key(
                 datasource=datasource.uid,
                 extra_cache_keys=extra_cache_keys,
-                rls=security_manager.get_rls_cache_key(datasource),
+                rls=rls,
                 changed_on=datasource.changed_on,
                 **kwargs,
             )
@@ -258,22 +380,34 @@ class QueryContextProcessor:
         # support multiple queries from different data sources.
 
         query = ""
-        if isinstance(query_context.datasource, Query):
-            # todo(hugh): add logic to manage all sip68 models here
-            result = query_context.datasource.exc_query(query_object.to_dict())
-        else:
-            result = query_context.datasource.query(query_object.to_dict())
+        partitions = self.get_time_partitions(query_object)
+        if partitions and (
+            partitioned_result := self.get_partitioned_query_result(
+                query_object, partitions
+            )
+        ):
+            # the partitions are normalized before being cached
+            result = partitioned_result
             query = result.query + ";\n\n"
+        else:
+            with query_executor.database_slot(self._database_id):
+                if isinstance(query_context.datasource, Query):
+                    # todo(hugh): add logic to manage all sip68 models here
+                    result = query_context.datasource.exc_query(query_object.to_dict())
+                else:
+                    result = query_context.datasource.query(query_object.to_dict())
+                    query = result.query + ";\n\n"
+
+            # Transform the timestamp we received from database to pandas supported
+            # datetime format. If no python_date_format is specified, the pattern
+            # will be considered as the default ISO date format
+            # If the datetime format is unix, the parse will use the corresponding
+            # parsing logic
+            if not result.df.empty:
+                result.df = self.normalize_df(result.df, query_object)
 
         df = result.df
-        # Transform the timestamp we received from database to pandas supported
-        # datetime format. If no python_date_format is specified, the pattern will
-        # be considered as the default ISO date format
-        # If the datetime format is unix, the parse will use the corresponding
-        # parsing logic
         if not df.empty:
-            df = self.normalize_df(df, query_object)
-
             if query_object.time_offsets:
                 time_offsets = self.processing_time_offsets(df, query_object)
                 df = time_offsets["df"]
@@ -294,6 +428,251 @@ class QueryContextProcessor:
         result.to_dttm = query_object.to_dttm
         return result
 
+    def get_time_partitions(
+        self, query_object: QueryObject
+    ) -> list[tuple[datetime, datetime]] | None:
+        """
+        Return the time partitions of a query, if it can be cached incrementally.
+
+        Incremental caching is enabled per dataset, and only supported for queries
+        with a temporal x-axis filtered by a time range, where every row belongs to a
+        single time grain bucket.
+        """
+        datasource = self._qc_datasource
+        if isinstance(datasource, Query) or not (
+            getattr(datasource, "extra_dict", {}).get("incremental_cache")
+        ):
+            return None
+
+        # the rows can't be split in partitions if they are shifted, and limits
+        # apply to the whole time range
+        if (
+            query_object.granularity
+            or query_object.time_shift
+            or datasource.offset
+            or query_object.series_limit
+            or query_object.row_offset
+            or query_object.is_rowcount
+        ):
+            return None
+
+        x_axis_label = get_x_axis_label(query_object.columns)
+        time_range_filters = [
+            flt
+            for flt in query_object.filter
+            if flt.get("op") == FilterOperator.TEMPORAL_RANGE.value
+            and isinstance(flt.get("val"), str)
+        ]
+        if (
+            not x_axis_label
+            or len(time_range_filters) != 1
+            or time_range_filters[0].get("col") != x_axis_label
+        ):
+            return None
+
+        since, until = get_since_until_from_time_range(
+            time_range=cast(str, time_range_filters[0]["val"]),
+            extras=query_object.extras,
+        )
+        if not since or not until:
+            return None
+
+        partitions = get_time_partitions(
+            since, until, self.get_time_grain(query_object)
+        )
+        if (
+            not partitions
+            or len(partitions) > config["CHART_DATA_INCREMENTAL_CACHE_MAX_PARTITIONS"]
+        ):
+            return None
+        return partitions
+
+    def get_partitioned_query_result(  # pylint: disable=too-many-locals  # noqa: C901
+        self,
+        query_object: QueryObject,
+        partitions: list[tuple[datetime, datetime]],
+    ) -> QueryResult | None:
+        """
+        Load the result of a query from the cached time partitions, querying the
+        missing ones, and concatenate them.
+
+        Consecutive missing partitions are queried at once, and split before being
+        cached. Partitions ending less than `lag` seconds ago are never cached. Returns
+        None if the result can't be built from partitions, in which case the query
+        runs as a whole.
+        """
+        incremental_cache = self._qc_datasource.extra_dict["incremental_cache"]
+        lag = (
+            incremental_cache.get("lag", 0)
+            if isinstance(incremental_cache, dict)
+            else 0
+        )
+        closed_until = datetime.now() - timedelta(seconds=lag)
+        x_axis_label = cast(str, get_x_axis_label(query_object.columns))
+
+        cache_keys: list[str | None] = []
+        caches: list[QueryCacheManager] = []
+        for start, end in partitions:
+            cache_key = self.query_cache_key(
+                self._get_partition_query_object(query_object, start, end),
+                time_partition=f"{start.isoformat()}/{end.isoformat()}",
+            )
+            cache_keys.append(cache_key)
+            caches.append(
+                QueryCacheManager.get(
+                    cache_key, CacheRegion.DATA, self._query_context.force
+                )
+            )
+
+        # group consecutive missing partitions
+        runs: list[list[int]] = []
+        for i, cache in enumerate(caches):
+            if cache.is_loaded:
+                stats_logger.incr("incremental_cache.partition_hit")
+                continue
+            stats_logger.incr("incremental_cache.partition_miss")
+            if runs and runs[-1][-1] == i - 1:
+                runs[-1].append(i)
+            else:
+                runs.append([i])
+
+        # the row limit applies to the whole time range: the cached partitions are
+        # checked before querying the missing ones, which are limited to the rows left
+        row_limit = query_object.row_limit
+        cached_rows = sum(len(cache.df.index) for cache in caches if cache.is_loaded)
+        if row_limit and cached_rows >= row_limit:
+            return None
+
+        run_objects = []
+        for run in runs:
+            run_object = self._get_partition_query_object(
+                query_object, partitions[run[0]][0], partitions[run[-1]][1]
+            )
+            if row_limit:
+                run_object.row_limit = row_limit - cached_rows
+            run_objects.append(run_object)
+
+        results = query_executor.run_queries(
+            [
+                partial(self._query_datasource, run_object.to_dict())
+                for run_object in run_objects
+            ]
+        )
+        for result in results:
+            if result.status == QueryStatus.FAILED:
+                return result
+        if row_limit and (
+            cached_rows + sum(len(result.df.index) for result in results) >= row_limit
+        ):
+            # the results may have been truncated
+            return None
+
+        frames: list[pd.DataFrame | None] = [
+            cache.df if cache.is_loaded else None for cache in caches
+        ]
+        queries = [cache.query for cache in caches if cache.is_loaded]
+        for run, result in zip(runs, results, strict=True):
+            queries.append(result.query)
+            df = result.df
+            if df.empty:
+                for i in run:
+                    frames[i] = df
+                continue
+
+            df = self.normalize_df(df, query_object)
+            masks = self._get_partition_masks(
+                df, x_axis_label, [partitions[i] for i in run]
+            )
+            if masks is None:
+                # the rows can't be split in partitions, so they can't be cached
+                frames[run[0]] = df
+                continue
+
+            for i, mask in zip(run, masks, strict=True):
+                frames[i] = df[mask].reset_index(drop=True)
+                if partitions[i][1] <= closed_until:
+                    caches[i].set_query_result(
+                        key=cast(str, cache_keys[i]),
+                        query_result=QueryResult(
+                            df=frames[i],
+                            query=result.query,
+                            duration=result.duration,
+                            applied_template_filters=result.applied_template_filters,
+                            applied_filter_columns=result.applied_filter_columns,
+                            rejected_filter_columns=result.rejected_filter_columns,
+                        ),
+                        timeout=self.get_cache_timeout(),
+                        datasource_uid=self._qc_datasource.uid,
+                        region=CacheRegion.DATA,
+                    )
+
+        dfs = [frame for frame in frames if frame is not None and not frame.empty]
+        df = pd.concat(dfs, ignore_index=True) if dfs else pd.DataFrame()
+
+        # every partition has the same filters, applied to the same columns
+        source = results[-1] if results else caches[-1]
+        return QueryResult(
+            df=df,
+            query=";\n\n".join(dict.fromkeys(queries)),
+            duration=sum((result.duration for result in results), timedelta()),
+            applied_template_filters=source.applied_template_filters,
+            applied_filter_columns=source.applied_filter_columns,
+            rejected_filter_columns=source.rejected_filter_columns,
+        )
+
+    @staticmethod
+    def _get_partition_masks(
+        df: pd.DataFrame,
+        x_axis_label: str,
+        partitions: list[tuple[datetime, datetime]],
+    ) -> list[pd.Series] | None:
+        if x_axis_label not in df or not pd.api.types.is_datetime64_dtype(
+            df[x_axis_label]
+        ):
+            return None
+
+        dttm = df[x_axis_label]
+        masks = [(dttm >= start) & (dttm < end) for start, end in partitions]
+        if sum(int(mask.sum()) for mask in masks) != len(df.index):
+            return None
+        return masks
+
+    @staticmethod
+    def _get_partition_query_object(
+        query_object: QueryObject, start: datetime, end: datetime
+    ) -> QueryObject:
+        partition_object = copy.copy(query_object)
+        partition_object.filter = [
+            {**flt, "val": f"{start} : {end}"}
+            if flt.get("op") == FilterOperator.TEMPORAL_RANGE.value
+            else flt
+            for flt in query_object.filter
+        ]
+        partition_object.time_range = None
+        partition_object.from_dttm = start
+        partition_object.to_dttm = end
+        partition_object.time_offsets = []
+        partition_object.post_processing = []
+        return partition_object
+
+    def _query_datasource(self, query_obj_dct: dict[str, Any]) -> QueryResult:
+        with query_executor.database_slot(self._database_id):
+            if isinstance(self._qc_datasource, Query):
+                return self._qc_datasource.exc_query(query_obj_dct)
+            return self._qc_datasource.query(query_obj_dct)
+
+    @property
+    def _database_id(self) -> int | None:
+        return getattr(self._qc_datasource, "database_id", None)
+
+    def _load_datasource(self) -> None:
+        """
+        Load the relationships of the datasource used to run queries beforehand, so
+        that they aren't lazy loaded by several threads running queries at once.
+        """
+        for relationship in ("database", "columns", "metrics"):
+            getattr(self._qc_datasource, relationship, None)
+
     def normalize_df(self, df: pd.DataFrame, query_object: QueryObject) -> pd.DataFrame:
         # todo: should support "python_date_format" and "get_column" in each datasource
         def _get_timestamp_format(
@@ -440,6 +819,8 @@ class QueryContextProcessor:
         queries: list[str] = []
         cache_keys: list[str | None] = []
         offset_dfs: dict[str, pd.DataFrame] = {}
+        # offsets that aren't cached, queried once all of them are known
+        offset_queries: list[OffsetQuery] = []
 
         outer_from_dttm, outer_to_dttm = get_since_until_from_query_object(query_object)
         if not outer_from_dttm or not outer_to_dttm:
@@ -559,44 +940,73 @@ class QueryContextProcessor:
                 query_object_clone_dct["row_limit"] = config["ROW_LIMIT"]
                 query_object_clone_dct["row_offset"] = 0
 
-            if isinstance(self._qc_datasource, Query):
-                result = self._qc_datasource.exc_query(query_object_clone_dct)
-            else:
-                result = self._qc_datasource.query(query_object_clone_dct)
-
-            queries.append(result.query)
+            offset_queries.append(
+                OffsetQuery(
+                    offset=offset,
+                    index=len(queries),
+                    query_object=copy.copy(query_object_clone),
+                    query_object_dct=query_object_clone_dct,
+                    metrics_mapping=metrics_mapping,
+                    cache=cache,
+                    cache_key=cache_key,
+                )
+            )
+            queries.append("")
             cache_keys.append(None)
 
+        if query_executor.is_enabled():
+            self._load_datasource()
+        results = None
+        if self.can_query_time_offsets_once(
+            df,
+            query_object,
+            offset_queries,
+            time_grain,
+        ):
+            results = self.query_time_offsets_once(query_object, offset_queries)
+        if results is None:
+            results = query_executor.run_queries(
+                [
+                    partial(self._query_datasource, offset_query["query_object_dct"])
+                    for offset_query in offset_queries
+                ]
+            )
+        for offset_query, result in zip(offset_queries, results, strict=True):
+            queries[offset_query["index"]] = result.query
+
             offset_metrics_df = result.df
             if offset_metrics_df.empty:
                 offset_metrics_df = pd.DataFrame(
                     {
                         col: [np.NaN]
-                        for col in join_keys + list(metrics_mapping.values())
+                        for col in join_keys
+                        + list(offset_query["metrics_mapping"].values())
                     }
                 )
             else:
                 # 1. normalize df, set dttm column
                 offset_metrics_df = self.normalize_df(
-                    offset_metrics_df, query_object_clone
+                    offset_metrics_df, offset_query["query_object"]
                 )
 
                 # 2. rename extra query columns
-                offset_metrics_df = offset_metrics_df.rename(columns=metrics_mapping)
+                offset_metrics_df = offset_metrics_df.rename(
+                    columns=offset_query["metrics_mapping"]
+                )
 
             # cache df and query
             value = {
                 "df": offset_metrics_df,
                 "query": result.query,
             }
-            cache.set(
-                key=cache_key,
+            offset_query["cache"].set(
+                key=offset_query["cache_key"],
                 value=value,
                 timeout=self.get_cache_timeout(),
                 datasource_uid=query_context.datasource.uid,
                 region=CacheRegion.DATA,
             )
-            offset_dfs[offset] = offset_metrics_df
+            offset_dfs[offset_query["offset"]] = offset_metrics_df
 
         if offset_dfs:
             df = self.join_offset_dfs(
@@ -608,6 +1018,101 @@ class QueryContextProcessor:
 
         return CachedTimeOffset(df=df, queries=queries, cache_keys=cache_keys)
 
+    def can_query_time_offsets_once(
+        self,
+        df: pd.DataFrame,
+        query_object: QueryObject,
+        offset_queries: list[OffsetQuery],
+        time_grain: str | None,
+    ) -> bool:
+        """
+        Return whether the metrics of several time offsets can be sliced from a single
+        query covering all the shifted time ranges.
+
+        The offsets must only shift the time range of a temporal x-axis, the shifted
+        ranges must overlap or touch, so that the single query doesn't scan more
+        rows than the queries of each offset, and they must start and end at the
+        start of a time grain, so that the metrics of the first and last time grains
+        of each range are the same in both cases.
+        """
+        index = (get_base_axis_labels(query_object.columns) or [DTTM_ALIAS])[0]
+        if (
+            len(offset_queries) < 2
+            or not dataframe_utils.is_datetime_series(df.get(index))
+            or query_object.time_shift
+            or getattr(self._qc_datasource, "offset", 0)
+        ):
+            return False
+
+        ranges = sorted(
+            (
+                offset_query["query_object"].from_dttm,
+                offset_query["query_object"].to_dttm,
+            )
+            for offset_query in offset_queries
+        )
+        if any(
+            not is_time_grain_start(dttm, time_grain)
+            for time_range in ranges
+            for dttm in time_range
+        ):
+            return False
+
+        end = ranges[0][1]
+        for from_dttm, to_dttm in ranges[1:]:
+            if from_dttm > end:
+                return False
+            end = max(end, to_dttm)
+        return True
+
+    def query_time_offsets_once(
+        self,
+        query_object: QueryObject,
+        offset_queries: list[OffsetQuery],
+    ) -> list[QueryResult] | None:
+        """
+        Query the metrics of all the time offsets at once, over the union of their
+        time ranges, and slice the result of each offset from it.
+
+        :returns: The result of each offset, or None when the query reached its row
+            limit, and the offsets need to be queried separately
+        """
+        index = (get_base_axis_labels(query_object.columns) or [DTTM_ALIAS])[0]
+        union_query_object = copy.copy(offset_queries[0]["query_object"])
+        union_query_object.from_dttm = min(
+            offset_query["query_object"].from_dttm for offset_query in offset_queries
+        )
+        union_query_object.to_dttm = max(
+            offset_query["query_object"].to_dttm for offset_query in offset_queries
+        )
+        union_query_object_dct = {
+            **offset_queries[0]["query_object_dct"],
+            "from_dttm": union_query_object.from_dttm,
+            "to_dttm": union_query_object.to_dttm,
+        }
+        result = self._query_datasource(union_query_object_dct)
+        row_limit = union_query_object_dct.get("row_limit")
+        if result.status == QueryStatus.FAILED or (
+            row_limit and len(result.df) >= row_limit
+        ):
+            return None
+
+        stats_logger.incr("time_offsets.single_query")
+        if result.df.empty:
+            return [result] * len(offset_queries)
+
+        # the slices are taken from the raw result, normalized with each offset
+        dttm = self.normalize_df(result.df.copy(), union_query_object)[index]
+        results = []
+        for offset_query in offset_queries:
+            offset_result = copy.copy(result)
+            mask = (dttm >= offset_query["query_object"].from_dttm) & (
+                dttm < offset_query["query_object"].to_dttm
+            )
+            offset_result.df = result.df[mask].reset_index(drop=True)
+            results.append(offset_result)
+        return results
+
     def join_offset_dfs(
         self,
         df: pd.DataFrame,
@@ -749,15 +1254,20 @@ class QueryContextProcessor:
         """Returns the query results with both metadata and data"""
 
         # Get all the payloads from the QueryObjects
-        query_results = [
-            get_query_results(
-                query_obj.result_type or self._query_context.result_type,
-                self._query_context,
-                query_obj,
-                force_cached,
-            )
-            for query_obj in self._query_context.queries
-        ]
+        if query_executor.is_enabled():
+            self._load_datasource()
+        query_results = query_executor.run_queries(
+            [
+                partial(
+                    get_query_results,
+                    query_obj.result_type or self._query_context.result_type,
+                    self._query_context,
+                    query_obj,
+                    force_cached,
+                )
+                for query_obj in self._query_context.queries
+            ]
+        )
         return_value = {"queries": query_results}
 
         if cache_query_context:
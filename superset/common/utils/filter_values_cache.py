@@ -0,0 +1,226 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Cache of the distinct values of a column, shown in the native filter dropdowns.
+
+The values are cached in the data cache under a key derived from the SQL fetching
+them, which includes the RLS filters and the templated predicates of the dataset,
+so that users with different filters never share values. Each entry also has the
+values sorted by their lowercase string representation, so that values starting
+with a prefix can be searched without querying the database again. When a column
+has more values than cached, the values starting with a prefix are queried.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from bisect import bisect_left
+from itertools import islice
+from typing import Any, Callable, Optional, TYPE_CHECKING, TypedDict
+
+import numpy as np
+import pandas as pd
+from flask import current_app
+from sqlalchemy.engine import Engine
+from sqlalchemy.sql.elements import TextClause
+
+from superset.extensions import cache_manager
+from superset.utils.core import get_username
+from superset.utils.hashing import md5_sha_from_dict
+
+if TYPE_CHECKING:
+    from superset.models.core import Database
+
+logger = logging.getLogger(__name__)
+
+FILTER_VALUES_CACHE_KEY_PREFIX = "filter_values_"
+
+
+class FilterValues(TypedDict):
+    values: list[Any]
+    index: list[tuple[str, int]]
+    loaded_at: float
+
+
+def fetch_values(engine: Engine, sql: TextClause) -> list[Any]:
+    """
+    Run the query fetching the distinct values of a column.
+    """
+    with engine.connect() as con:
+        df = pd.read_sql_query(sql=sql, con=con)
+        # replace NaN with None to ensure it can be serialized to JSON
+        df = df.replace({np.nan: None})
+        return df["column_values"].to_list()
+
+
+def get_cache_key(database_id: int, sql: str, username: Optional[str]) -> str:
+    return FILTER_VALUES_CACHE_KEY_PREFIX + md5_sha_from_dict(
+        {"database_id": database_id, "sql": sql, "username": username}
+    )
+
+
+def build_index(values: list[Any]) -> list[tuple[str, int]]:
+    """
+    Return the lowercase string representation of each value, and its position,
+    sorted. NULL values are not indexed.
+    """
+    return sorted(
+        (str(value).casefold(), position)
+        for position, value in enumerate(values)
+        if value is not None
+    )
+
+
+def search(
+    entry: FilterValues,
+    prefix: str,
+    limit: Optional[int] = None,
+) -> list[Any]:
+    """
+    Return the values starting with a prefix, ignoring the case, in sorted order.
+    """
+    prefix = prefix.casefold()
+    index = entry["index"]
+    matches = []
+    for key, position in islice(index, bisect_left(index, (prefix,)), None):
+        if not key.startswith(prefix) or (limit and len(matches) >= limit):
+            break
+        matches.append(entry["values"][position])
+    return matches
+
+
+def _make_entry(values: list[Any]) -> FilterValues:
+    return FilterValues(values=values, index=build_index(values), loaded_at=time.time())
+
+
+def set_values(cache_key: str, values: list[Any]) -> FilterValues:
+    """
+    Cache the values of a column, and their index.
+    """
+    entry = _make_entry(values)
+    try:
+        cache_manager.data_cache.set(
+            cache_key,
+            entry,
+            timeout=current_app.config["FILTER_VALUES_CACHE_TIMEOUT"],
+        )
+    except Exception:  # pylint: disable=broad-except
+        logger.warning("Unable to cache the filter values", exc_info=True)
+    return entry
+
+
+def get_values(
+    database: Database,
+    sql: str,
+    load: Callable[[], list[Any]],
+    prefix: Optional[str] = None,
+    limit: Optional[int] = None,
+    catalog: Optional[str] = None,
+    schema: Optional[str] = None,
+    max_values: Optional[int] = None,
+    load_matches: Optional[Callable[[], list[Any]]] = None,
+) -> list[Any]:
+    """
+    Return the distinct values of a column, from the cache when possible.
+
+    :param database: The database the values are fetched from
+    :param sql: The SQL fetching the values
+    :param load: A function fetching the values from the database
+    :param prefix: Only return the values starting with this prefix
+    :param limit: The maximum number of values starting with the prefix
+    :param catalog: The catalog the values are fetched from
+    :param schema: The schema the values are fetched from
+    :param max_values: The maximum number of values fetched by the SQL
+    :param load_matches: A function fetching the values starting with the prefix
+        from the database, when the SQL may not fetch all of them
+    :returns: The values, or the values starting with the prefix
+    """
+    config = current_app.config
+    stats_logger = config["STATS_LOGGER"]
+    entry: Optional[FilterValues] = None
+    if not config["FILTER_VALUES_CACHE_TIMEOUT"]:
+        if prefix is not None and load_matches:
+            return load_matches()
+        values = load()
+        return values if prefix is None else search(_make_entry(values), prefix, limit)
+
+    # queries run as the user when impersonating, so they may return other values
+    username = get_username() if database.impersonate_user else None
+    cache_key = get_cache_key(database.id, sql, username)
+    try:
+        entry = cache_manager.data_cache.get(cache_key)
+    except Exception:  # pylint: disable=broad-except
+        logger.warning("Unable to read the cached filter values", exc_info=True)
+
+    if entry is None:
+        stats_logger.incr("filter_values_cache.miss")
+        entry = set_values(cache_key, load())
+    else:
+        stats_logger.incr("filter_values_cache.hit")
+        refresh_after = config["FILTER_VALUES_CACHE_REFRESH_AFTER"]
+        if (
+            refresh_after is not None
+            and time.time() - entry["loaded_at"] > refresh_after
+        ):
+            _schedule_refresh(
+                database.id,
+                sql,
+                cache_key,
+                username,
+                refresh_after,
+                catalog=catalog,
+                schema=schema,
+            )
+
+    if prefix is None:
+        return entry["values"]
+    if load_matches and max_values and len(entry["values"]) >= max_values:
+        # the values are truncated, so values starting with the prefix may be missing
+        stats_logger.incr("filter_values_cache.truncated")
+        return load_matches()
+    return search(entry, prefix, limit)
+
+
+def _schedule_refresh(
+    database_id: int,
+    sql: str,
+    cache_key: str,
+    username: Optional[str],
+    refresh_after: int,
+    catalog: Optional[str] = None,
+    schema: Optional[str] = None,
+) -> None:
+    # pylint: disable=import-outside-toplevel
+    from superset.tasks.filter_values import refresh_filter_values
+
+    try:
+        # only one refresh is scheduled until the values are refreshed
+        if not cache_manager.data_cache.add(
+            f"{cache_key}_refresh", True, timeout=refresh_after
+        ):
+            return
+        refresh_filter_values.delay(
+            database_id,
+            sql,
+            cache_key,
+            username,
+            catalog=catalog,
+            schema=schema,
+        )
+    except Exception:  # pylint: disable=broad-except
+        logger.warning("Unable to schedule the refresh of filter values", exc_info=True)
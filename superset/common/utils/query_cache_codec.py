@@ -0,0 +1,106 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Codecs for the dataframes stored by ``QueryCacheManager``.
+
+The encoded dataframe is stored under the ``df`` key of the cache value. Values
+are always decoded based on what was stored, not on the configured codec, so
+that entries written before the codec was changed can still be read.
+"""
+
+from __future__ import annotations
+
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, Literal
+
+import pyarrow as pa
+from pandas import DataFrame
+
+logger = logging.getLogger(__name__)
+
+ARROW_CODEC_NAME = "arrow"
+
+
+class QueryCacheCodec(ABC):
+    @abstractmethod
+    def encode(self, df: DataFrame) -> Any: ...
+
+    @staticmethod
+    def decode(value: Any) -> DataFrame:
+        """
+        Decode a dataframe stored by any of the codecs.
+        """
+        if isinstance(value, dict) and value.get("codec") == ARROW_CODEC_NAME:
+            return _decode_arrow(value["data"])
+
+        # dataframes stored as is, pickled by the cache backend
+        return value
+
+
+def _decode_arrow(data: bytes) -> DataFrame:
+    # the reader references the buffer instead of copying it; buffers are only
+    # copied when they need to be decompressed
+    with pa.ipc.open_stream(pa.py_buffer(data)) as reader:
+        table = reader.read_all()
+    try:
+        return table.to_pandas(integer_object_nulls=True)
+    except pa.lib.ArrowInvalid:
+        return table.to_pandas(integer_object_nulls=True, timestamp_as_object=True)
+
+
+class PickleQueryCacheCodec(QueryCacheCodec):
+    """
+    Store the dataframe as is, leaving its serialization to the cache backend.
+    """
+
+    def encode(self, df: DataFrame) -> DataFrame:
+        return df
+
+
+class ArrowQueryCacheCodec(QueryCacheCodec):
+    """
+    Store the dataframe as a compressed Arrow IPC stream.
+
+    The stream is wrapped in a small header describing how it was encoded, so it
+    can be read regardless of the codec configured when reading. Dataframes that
+    can't be represented in Arrow are stored as is.
+    """
+
+    def __init__(self, compression: Literal["lz4", "zstd"] | None = "lz4"):
+        self.compression = compression
+
+    def encode(self, df: DataFrame) -> dict[str, Any] | DataFrame:
+        if not all(isinstance(column, str) for column in df.columns):
+            return df
+
+        try:
+            table = pa.Table.from_pandas(df)
+            sink = pa.BufferOutputStream()
+            options = pa.ipc.IpcWriteOptions(compression=self.compression)
+            with pa.ipc.new_stream(sink, table.schema, options=options) as writer:
+                writer.write_table(table)
+        except (pa.ArrowException, ValueError, TypeError) as ex:
+            logger.debug("Unable to encode dataframe as Arrow: %s", ex)
+            return df
+
+        return {
+            "codec": ARROW_CODEC_NAME,
+            "compression": self.compression,
+            "rows": table.num_rows,
+            "data": sink.getvalue().to_pybytes(),
+        }
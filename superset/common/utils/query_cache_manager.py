@@ -17,6 +17,7 @@
 from __future__ import annotations
 
 import logging
+from datetime import datetime, timedelta
 from typing import Any
 
 from flask_caching import Cache
@@ -24,6 +25,7 @@ from pandas import DataFrame
 
 from superset import app
 from superset.common.db_query_status import QueryStatus
+from superset.common.utils.query_cache_codec import QueryCacheCodec
 from superset.constants import CacheRegion
 from superset.exceptions import CacheLoadError
 from superset.extensions import cache_manager
@@ -32,6 +34,7 @@ from superset.stats_logger import BaseStatsLogger
 from superset.superset_typing import Column
 from superset.utils.cache import set_and_log_cache
 from superset.utils.core import error_msg_from_exception, get_stacktrace
+from superset.utils.local_cache import LocalCache
 
 config = app.config
 stats_logger: BaseStatsLogger = config["STATS_LOGGER"]
@@ -42,6 +45,10 @@ _cache: dict[CacheRegion, Cache] = {
     CacheRegion.DATA: cache_manager.data_cache,
 }
 
+_local_cache: dict[CacheRegion, LocalCache] = {
+    CacheRegion.DATA: cache_manager.local_data_cache,
+}
+
 
 class QueryCacheManager:
     """
@@ -113,14 +120,17 @@ class QueryCacheManager:
                     stats_logger.incr("loaded_from_source_without_force")
                 self.is_loaded = True
 
+            codec: QueryCacheCodec = config["DATA_CACHE_CODEC"]
             value = {
-                "df": self.df,
+                "df": codec.encode(self.df),
                 "query": self.query,
                 "applied_template_filters": self.applied_template_filters,
                 "applied_filter_columns": self.applied_filter_columns,
                 "rejected_filter_columns": self.rejected_filter_columns,
                 "annotation_data": self.annotation_data,
                 "sql_rowcount": self.sql_rowcount,
+                "timeout": timeout,
+                "datasource_uid": datasource_uid,
             }
             if self.is_loaded and key and self.status != QueryStatus.FAILED:
                 self.set(
@@ -130,6 +140,15 @@ class QueryCacheManager:
                     datasource_uid=datasource_uid,
                     region=region,
                 )
+                self._set_local(
+                    key,
+                    {
+                        **value,
+                        "df": self.df.copy(),
+                        "dttm": datetime.utcnow().isoformat().split(".")[0],
+                    },
+                    region,
+                )
         except Exception as ex:  # pylint: disable=broad-except
             logger.exception(ex)
             if not self.error_message:
@@ -152,7 +171,7 @@ class QueryCacheManager:
         if not key or not _cache[region] or force_query:
             return query_cache
 
-        if cache_value := _cache[region].get(key):
+        if cache_value := cls._get_value(key, region):
             logger.debug("Cache key: %s", key)
             stats_logger.incr("loading_from_cache")
             try:
@@ -193,6 +212,58 @@ class QueryCacheManager:
             raise CacheLoadError("Error loading data from cache")
         return query_cache
 
+    @classmethod
+    def _get_value(cls, key: str, region: CacheRegion) -> dict[str, Any] | None:
+        """
+        Get a cache value with a decoded dataframe, from the local cache if possible
+        """
+        local_cache = _local_cache.get(region)
+        if local_cache and local_cache.enabled:
+            if cache_value := local_cache.get(key):
+                stats_logger.incr("loaded_from_local_cache")
+                return {**cache_value, "df": cache_value["df"].copy()}
+            stats_logger.incr("local_cache_miss")
+
+        cache_value = _cache[region].get(key)
+        if not cache_value or "df" not in cache_value:
+            return cache_value
+
+        cache_value = {**cache_value, "df": QueryCacheCodec.decode(cache_value["df"])}
+        cls._set_local(key, {**cache_value, "df": cache_value["df"].copy()}, region)
+        return cache_value
+
+    @staticmethod
+    def _set_local(key: str, value: dict[str, Any], region: CacheRegion) -> None:
+        """
+        Store a value with a decoded dataframe in the local cache, if enabled.
+
+        The entry never outlives the corresponding entry in the data cache.
+        """
+        local_cache = _local_cache.get(region)
+        if not local_cache or not local_cache.enabled:
+            return
+
+        timeout = value.get("timeout")
+        if timeout is None:
+            timeout = config["CACHE_DEFAULT_TIMEOUT"]
+        if timeout and value.get("dttm"):
+            # a timeout of 0 means the entry never expires in the data cache
+            expiration = datetime.fromisoformat(value["dttm"]) + timedelta(
+                seconds=timeout
+            )
+            timeout = (expiration - datetime.utcnow()).total_seconds()
+
+        size = int(value["df"].memory_usage(index=True, deep=True).sum())
+        evicted = local_cache.set(
+            key,
+            value,
+            size=size,
+            timeout=timeout or None,
+            tag=value.get("datasource_uid"),
+        )
+        for _ in range(evicted):
+            stats_logger.incr("local_cache_eviction")
+
     @staticmethod
     def set(
         key: str | None,
@@ -214,6 +285,34 @@ class QueryCacheManager:
     ) -> None:
         if key:
             _cache[region].delete(key)
+            if local_cache := _local_cache.get(region):
+                local_cache.delete(key)
+
+    @staticmethod
+    def acquire_lock(
+        key: str,
+        timeout: int,
+        region: CacheRegion = CacheRegion.DEFAULT,
+    ) -> bool:
+        """
+        Try to take an exclusive lock on a cache key, released after ``timeout``
+        seconds if not released before. Relies on the atomic ``add`` of the backend.
+        """
+        return bool(_cache[region].add(f"{key}__lock", True, timeout=timeout))
+
+    @staticmethod
+    def release_lock(
+        key: str,
+        region: CacheRegion = CacheRegion.DEFAULT,
+    ) -> None:
+        _cache[region].delete(f"{key}__lock")
+
+    @staticmethod
+    def is_locked(
+        key: str,
+        region: CacheRegion = CacheRegion.DEFAULT,
+    ) -> bool:
+        return _cache[region].get(f"{key}__lock") is not None
 
     @staticmethod
     def has(
@@ -0,0 +1,106 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Concurrent execution of the queries of a chart data request.
+
+Queries only run concurrently when ``CHART_DATA_PARALLEL_QUERIES`` is enabled;
+otherwise they run one after the other in the current thread.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, TypeVar
+
+from flask import current_app, g, has_request_context
+from flask.globals import request_ctx
+
+T = TypeVar("T")
+
+# semaphores by database ID and limit
+_database_semaphores: dict[tuple[int, int], threading.BoundedSemaphore] = {}
+_database_semaphores_lock = threading.Lock()
+
+
+def is_enabled() -> bool:
+    return bool(current_app.config["CHART_DATA_PARALLEL_QUERIES"])
+
+
+def run_queries(funcs: Sequence[Callable[[], T]]) -> list[T]:
+    """
+    Run callables concurrently, returning their results in the same order.
+
+    If any of them fails the first exception, in order, is raised once all of
+    them are done.
+    """
+    max_workers = current_app.config["CHART_DATA_PARALLEL_QUERIES_MAX_WORKERS"]
+    if not is_enabled() or len(funcs) < 2 or max_workers < 2:
+        return [func() for func in funcs]
+
+    with ThreadPoolExecutor(
+        max_workers=min(len(funcs), max_workers),
+        thread_name_prefix="chart-data-query",
+    ) as executor:
+        futures = [executor.submit(copy_current_context(func)) for func in funcs]
+        return [future.result() for future in futures]
+
+
+def copy_current_context(func: Callable[[], T]) -> Callable[[], T]:
+    """
+    Wrap a callable so that it runs in a copy of the current Flask context.
+
+    Flask contexts are local to the thread that handles the request, so the request
+    context (when there is one) and ``g``, which holds the logged in user, need to
+    be copied for the security checks to work in another thread.
+    """
+    app = current_app._get_current_object()  # pylint: disable=protected-access
+    g_copy = dict(g.__dict__)
+    ctx = request_ctx.copy() if has_request_context() else app.app_context()
+
+    def wrapper() -> T:
+        with ctx:
+            for key, value in g_copy.items():
+                setattr(g, key, value)
+            return func()
+
+    return wrapper
+
+
+@contextmanager
+def database_slot(database_id: int | None) -> Iterator[None]:
+    """
+    Limit the number of queries running concurrently against a database.
+
+    The limit, ``CHART_DATA_PARALLEL_QUERIES_PER_DATABASE``, is shared by all the
+    requests handled by the process.
+    """
+    limit = current_app.config["CHART_DATA_PARALLEL_QUERIES_PER_DATABASE"]
+    if not is_enabled() or not limit or database_id is None:
+        yield
+        return
+
+    key = (database_id, limit)
+    with _database_semaphores_lock:
+        if key not in _database_semaphores:
+            _database_semaphores[key] = threading.BoundedSemaphore(limit)
+        semaphore = _database_semaphores[key]
+
+    with semaphore:
+        yield
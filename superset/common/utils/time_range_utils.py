@@ -19,8 +19,11 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any, cast
 
+import pandas as pd
+
 from superset import app
 from superset.common.query_object import QueryObject
+from superset.constants import TimeGrain
 from superset.utils.core import FilterOperator
 from superset.utils.date_parser import get_since_until
 
@@ -76,3 +79,59 @@ def get_since_until_from_query_object(
         time_shift=query_object.time_shift,
         extras=query_object.extras,
     )
+
+
+# pandas frequency of the partitions used for each time grain, so that a time grain
+# bucket never spans more than one partition. Sub-daily grains are partitioned by day,
+# and weeks aren't supported since their start depends on the database.
+TIME_PARTITION_FREQUENCIES = {
+    TimeGrain.SECOND: "D",
+    TimeGrain.FIVE_SECONDS: "D",
+    TimeGrain.THIRTY_SECONDS: "D",
+    TimeGrain.MINUTE: "D",
+    TimeGrain.FIVE_MINUTES: "D",
+    TimeGrain.TEN_MINUTES: "D",
+    TimeGrain.FIFTEEN_MINUTES: "D",
+    TimeGrain.THIRTY_MINUTES: "D",
+    TimeGrain.HALF_HOUR: "D",
+    TimeGrain.HOUR: "D",
+    TimeGrain.SIX_HOURS: "D",
+    TimeGrain.DAY: "D",
+    TimeGrain.MONTH: "MS",
+    TimeGrain.QUARTER: "QS",
+    TimeGrain.QUARTER_YEAR: "QS",
+    TimeGrain.YEAR: "YS",
+}
+
+
+def get_time_partitions(
+    since: datetime,
+    until: datetime,
+    time_grain: str | None,
+) -> list[tuple[datetime, datetime]] | None:
+    """
+    Split a time range into consecutive partitions aligned with a time grain.
+
+    Only the first and last partitions can be partial, when the range doesn't start
+    or end on a partition boundary.
+
+    :param since: the start of the time range, inclusive
+    :param until: the end of the time range, exclusive
+    :param time_grain: the time grain of the query
+    :return: the (start, end) of each partition, or None if the time grain can't
+        be partitioned
+    """
+    if not (freq := TIME_PARTITION_FREQUENCIES.get(time_grain)) or since >= until:  # type: ignore
+        return None
+
+    boundaries = pd.date_range(pd.Timestamp(since).normalize(), until, freq=freq)
+    points = [
+        since,
+        *(
+            boundary
+            for boundary in boundaries.to_pydatetime()
+            if since < boundary < until
+        ),
+        until,
+    ]
+    return list(zip(points[:-1], points[1:], strict=False))
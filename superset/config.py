@@ -51,6 +51,10 @@ from sqlalchemy.orm.query import Query
 from superset.advanced_data_type.plugins.internet_address import internet_address
 from superset.advanced_data_type.plugins.internet_port import internet_port
 from superset.advanced_data_type.types import AdvancedDataType
+from superset.common.utils.query_cache_codec import (
+    PickleQueryCacheCodec,
+    QueryCacheCodec,
+)
 from superset.constants import CHANGE_ME_SECRET_KEY
 from superset.jinja_context import BaseTemplateProcessor
 from superset.key_value.types import JsonKeyValueCodec
@@ -161,6 +165,18 @@ SAMPLES_ROW_LIMIT = 1000
 NATIVE_FILTER_DEFAULT_ROW_LIMIT = 1000
 # max rows retrieved by filter select auto complete
 FILTER_SELECT_ROW_LIMIT = 10000
+# Cache the distinct values of the columns shown in native filter dropdowns, for
+# each dataset, column and set of RLS filters, in the data cache for this many
+# seconds. The values are fetched on every request when set to 0.
+FILTER_VALUES_CACHE_TIMEOUT = 0
+# Refresh the cached values in the background, with Celery, once they are older
+# than this many seconds, while the cached values are still served.
+FILTER_VALUES_CACHE_REFRESH_AFTER: int | None = None
+# Values starting with the text typed in a filter dropdown are searched among up to
+# this many distinct values of the column, cached with the values above. Columns
+# with more values are queried for the values starting with the text instead. At
+# most FILTER_SELECT_ROW_LIMIT values are returned.
+FILTER_VALUES_SEARCH_ROW_LIMIT = 100_000
 # default time filter in explore
 # values may be "Last day", "Last week", "<ISO date> : now", etc.
 DEFAULT_TIME_FILTER = NO_TIME_RANGE
@@ -587,6 +603,11 @@ SSH_TUNNEL_LOCAL_BIND_ADDRESS = "127.0.0.1"
 SSH_TUNNEL_TIMEOUT_SEC = 10.0
 #: Timeout (seconds) for transport socket (``socket.settimeout``)
 SSH_TUNNEL_PACKET_TIMEOUT_SEC = 1.0
+#: Share tunnels between the queries to a database, instead of opening a new tunnel
+#: for every query. Pooled tunnels are reconnected when the SSH connection is lost.
+SSH_TUNNEL_POOL = False
+#: Time (seconds) after which pooled tunnels that are not used are closed
+SSH_TUNNEL_POOL_IDLE_TIMEOUT_SEC = 300.0
 
 
 # Feature flags may also be set via 'SUPERSET_FEATURE_' prefixed environment vars.
@@ -702,6 +723,19 @@ EXTRA_SEQUENTIAL_COLOR_SCHEMES: list[dict[str, Any]] = []
 # CACHE_WARMUP_EXECUTORS = [ExecutorType.OWNER, FixedExecutor("admin")]
 CACHE_WARMUP_EXECUTORS = [ExecutorType.OWNER]
 
+# Warm up the cache by running the queries of charts in Celery workers, instead of
+# calling the warm up API of the web server for each chart. Charts are deduplicated
+# across dashboards, and the charts of each database are warmed up by at most
+# CACHE_WARMUP_DATABASE_CONCURRENCY tasks at once, across runs, each of them pausing
+# CACHE_WARMUP_CHART_INTERVAL seconds between charts. A task is stopped after
+# CACHE_WARMUP_CHART_TIME_LIMIT seconds per chart, the remaining charts being skipped.
+# The running tasks are counted in the cache of CACHE_CONFIG, like the tasks limited
+# by CELERY_TASK_CONCURRENCY_LIMITS.
+CACHE_WARMUP_NATIVE = False
+CACHE_WARMUP_DATABASE_CONCURRENCY = 1
+CACHE_WARMUP_CHART_INTERVAL = 0
+CACHE_WARMUP_CHART_TIME_LIMIT = int(timedelta(minutes=10).total_seconds())
+
 # ---------------------------------------------------
 # Thumbnail config (behind feature flag)
 # ---------------------------------------------------
@@ -785,9 +819,73 @@ CACHE_DEFAULT_TIMEOUT = int(timedelta(days=1).total_seconds())
 # Default cache for Superset objects
 CACHE_CONFIG: CacheConfig = {"CACHE_TYPE": "NullCache"}
 
+# How long the catalogs, schemas, tables and views of a database are kept in the
+# default cache after their metadata cache timeout expires. Expired listings are
+# served immediately while a Celery task fetches them again, so that users don't wait
+# on slow inspector calls. When 0 expired listings are fetched in the request.
+DATABASE_METADATA_CACHE_STALE_TIMEOUT = 0
+
+# Timeout of the row level security filters of each set of roles in the default cache.
+# The cached filters are invalidated when any RLS filter changes, and users get the
+# filters of their new set of roles when their roles change.
+RLS_FILTERS_CACHE_TIMEOUT = int(timedelta(hours=1).total_seconds())
+
+# Timeout of the permissions of each set of roles in the default cache, which are also
+# kept in memory by each process. They are invalidated when the permissions of any role
+# change. Without a default cache, the permissions are only kept for each request.
+PERMISSION_INDEX_CACHE_TIMEOUT = int(timedelta(hours=1).total_seconds())
+
 # Cache for datasource metadata and query results
 DATA_CACHE_CONFIG: CacheConfig = {"CACHE_TYPE": "NullCache"}
 
+# How should the dataframes of chart query results be stored in the cache? The default
+# `PickleQueryCacheCodec` stores them as is, leaving their serialization to the cache
+# backend. `ArrowQueryCacheCodec` stores them as compressed Arrow IPC streams, which
+# are smaller and faster to (de)serialize, e.g.:
+# DATA_CACHE_CODEC = ArrowQueryCacheCodec(compression="zstd")
+# Entries are decoded based on how they were stored, so the codec can be changed
+# without flushing the cache.
+DATA_CACHE_CODEC: QueryCacheCodec = PickleQueryCacheCodec()
+
+# Size in bytes of an optional in-process LRU cache in front of the data cache, holding
+# the deserialized results of chart queries so that requests for the same chart served
+# by the same worker don't need a round trip to the cache backend. Entries expire after
+# `DATA_CACHE_LOCAL_TIMEOUT` seconds, or earlier if the entry in the data cache does.
+# Since each worker has its own copy, keep the timeout short: invalidating the cache of
+# a datasource only clears the entries of the worker handling the request.
+DATA_CACHE_LOCAL_MAX_BYTES = 0
+DATA_CACHE_LOCAL_TIMEOUT = int(timedelta(minutes=1).total_seconds())
+
+# When several requests need the same chart query while it isn't cached (e.g. when a
+# popular dashboard loads right after the cache expired), only the first one runs the
+# query in the database. The others wait up to `CHART_DATA_COALESCING_TIMEOUT` seconds
+# for its result to be stored in the data cache, checking every
+# `CHART_DATA_COALESCING_POLL_INTERVAL` seconds, before running the query themselves.
+# Requires a data cache backend with an atomic `add` (eg, Redis or Memcached). Set to 0
+# to disable.
+CHART_DATA_COALESCING_TIMEOUT = 0
+CHART_DATA_COALESCING_POLL_INTERVAL = 0.5
+
+# Run the queries of a chart data request concurrently instead of one after the other:
+# the query objects of charts with multiple queries (eg, mixed timeseries), and the
+# time comparison queries of each query object. Each request uses up to
+# `CHART_DATA_PARALLEL_QUERIES_MAX_WORKERS` threads, and at most
+# `CHART_DATA_PARALLEL_QUERIES_PER_DATABASE` queries run concurrently against a single
+# database across all the requests handled by a worker process (0 for no limit).
+CHART_DATA_PARALLEL_QUERIES = False
+CHART_DATA_PARALLEL_QUERIES_MAX_WORKERS = 4
+CHART_DATA_PARALLEL_QUERIES_PER_DATABASE = 8
+
+# Datasets can opt in to incremental caching of time series queries by setting
+# `"incremental_cache": true` in their `extra`, or `{"lag": <seconds>}` when recent
+# data can still change. The time range of queries with a temporal x-axis is then
+# split in partitions (a day for daily and sub-daily time grains, otherwise the time
+# grain itself) cached separately, so that only the partitions missing from the cache
+# and the ones ending less than `lag` seconds ago are queried. Queries that would be
+# split in more than `CHART_DATA_INCREMENTAL_CACHE_MAX_PARTITIONS` partitions are
+# cached as a whole.
+CHART_DATA_INCREMENTAL_CACHE_MAX_PARTITIONS = 1000
+
 # Cache for dashboard filter state. `CACHE_TYPE` defaults to `SupersetMetastoreCache`
 # that stores the values in the key-value table in the Superset metastore, as it's
 # required for Superset to operate correctly, but can be replaced by any
@@ -866,6 +964,16 @@ ALLOWED_EXTENSIONS = {*EXCEL_EXTENSIONS, *CSV_EXTENSIONS, *COLUMNAR_EXTENSIONS}
 # note: index option should not be overridden
 CSV_EXPORT = {"encoding": "utf-8"}
 
+# Stream SQL Lab CSV exports instead of building the whole file in memory. Rows
+# are fetched from the cursor (or sliced from the cached results) in chunks of
+# CSV_STREAMING_CHUNK_SIZE rows, and the number of rows fetched at once is reduced
+# whenever a chunk takes more than CSV_STREAMING_MAX_CHUNK_BYTES in memory.
+# CSV_STREAMING_MAX_ROWS caps the number of rows exported, when set.
+CSV_STREAMING_EXPORT = False
+CSV_STREAMING_CHUNK_SIZE = 10_000
+CSV_STREAMING_MAX_CHUNK_BYTES = 64 * 1024 * 1024
+CSV_STREAMING_MAX_ROWS: int | None = None
+
 # Excel Options: key/value pairs that will be passed as argument to DataFrame.to_excel
 # method.
 # note: index option should not be overridden
@@ -1025,6 +1133,8 @@ class CeleryConfig:  # pylint: disable=too-few-public-methods
         "superset.tasks.thumbnails",
         "superset.tasks.cache",
         "superset.tasks.slack",
+        "superset.tasks.filter_values",
+        "superset.tasks.database_metadata",
     )
     result_backend = "db+sqlite:///celery_results.sqlite"
     worker_prefetch_multiplier = 1
@@ -1056,6 +1166,12 @@ class CeleryConfig:  # pylint: disable=too-few-public-methods
         #     "schedule": crontab(minute="*", hour="*"),
         #     "kwargs": {"retention_period_days": 180},
         # },
+        # Uncomment to prefetch the metadata of databases
+        # "prefetch_database_metadata": {
+        #     "task": "prefetch_database_metadata",
+        #     "schedule": crontab(minute="0", hour="*"),
+        #     "kwargs": {"database_names": ["examples"]},
+        # },
         # Uncomment to enable Slack channel cache warm-up
         # "slack.cache_channels": {
         #     "task": "slack.cache_channels",
@@ -1069,6 +1185,33 @@ CELERY_CONFIG: type[CeleryConfig] = CeleryConfig
 # Set celery config to None to disable all the above configuration
 # CELERY_CONFIG = None
 
+# Celery tasks are classified as "interactive" (charts of dashboards and Explore),
+# "sql_lab", "reports", "warmup" (cache warm-up and background refreshes) and
+# "thumbnails", see superset/tasks/routing.py. Tasks of a class can be routed to a
+# dedicated queue, consumed by dedicated workers, so that a burst of reports or
+# thumbnails doesn't delay interactive charts, e.g.
+# CELERY_TASK_QUEUES = {
+#     "interactive": "interactive",
+#     "sql_lab": "sql_lab",
+#     "reports": "background",
+#     "warmup": "background",
+#     "thumbnails": "background",
+# }
+# with workers started with `celery worker --queues interactive`, etc. Tasks of
+# classes missing here are sent to the default queue.
+CELERY_TASK_QUEUES: dict[str, str] = {}
+# The maximum number of "interactive" or "sql_lab" tasks running at once for the same
+# user and for the same database, across all the workers, e.g.
+# {"interactive": {"user": 6, "database": 20}, "sql_lab": {"user": 2}}.
+# A task over a limit is retried after CELERY_TASK_CONCURRENCY_RETRY_DELAY seconds,
+# letting the tasks of other users run in the meantime. The running tasks are counted
+# in the cache of CACHE_CONFIG, which must be shared by the workers, and a task stops
+# being counted after its time limit, or after CELERY_TASK_CONCURRENCY_SLOT_TIMEOUT
+# seconds if longer, in case its worker died before it finished.
+CELERY_TASK_CONCURRENCY_LIMITS: dict[str, dict[str, int]] = {}
+CELERY_TASK_CONCURRENCY_RETRY_DELAY = 1
+CELERY_TASK_CONCURRENCY_SLOT_TIMEOUT = int(timedelta(minutes=10).total_seconds())
+
 # Additional static HTTP headers to be served by your Superset server. Note
 # Flask-Talisman applies the relevant security HTTP headers.
 #
@@ -1169,6 +1312,29 @@ RESULTS_BACKEND: BaseCache | None = None
 # in order to disable should breaking issues be discovered.
 RESULTS_BACKEND_USE_MSGPACK = True
 
+# Store SQL Lab results in the results backend as chunks of this many rows, along
+# with a manifest holding the query metadata. Chunks are compressed separately, so
+# that the results API and CSV exports only read the rows they need. When set to
+# None the results are stored as a single blob.
+SQLLAB_RESULTS_BACKEND_CHUNK_ROWS: int | None = None
+
+# Stop fetching the results of a SQL Lab query once they take this many bytes, in
+# Arrow format, and keep the rows fetched so far, flagged with `results_truncated`
+# in the extra of the query. Rows are then fetched in batches of
+# SQLLAB_FETCH_BATCH_ROWS rows, each converted to Arrow before the next one is
+# fetched. Engines fetching Arrow tables directly fetch all the rows, which are then
+# cut to the same size. SQL Lab tells the user when the results were truncated.
+# Results are fetched all at once when set to None.
+SQLLAB_RESULTS_MAX_BYTES: int | None = None
+SQLLAB_FETCH_BATCH_ROWS = 10_000
+
+# Store the results of each statement of a SQL Lab script returning rows in the
+# results backend as soon as it completes, instead of only the results of the last
+# statement, so that they can be shown while the next statements run. The keys of
+# the results are listed under `statement_results` in the extra of the query, and
+# the progress of the query is the share of statements that completed.
+SQLLAB_PUBLISH_STATEMENT_RESULTS = False
+
 # The S3 bucket where you want to store your external hive tables created
 # from CSV files. For example, 'companyname-superset'
 CSV_TO_HIVE_UPLOAD_S3_BUCKET = None
@@ -1350,6 +1516,28 @@ ENGINE_CONTEXT_MANAGER = engine_context_manager
 # as such `create_engine(url, **params)`
 DB_CONNECTION_MUTATOR = None
 
+# By default a new SQLAlchemy engine, without a connection pool, is created every
+# time a database is used, so each query pays for establishing a new connection.
+# Setting a maximum number of engines keeps them, and their pools, in a registry
+# shared by the requests handled by each process. Engines are keyed by database,
+# catalog, schema, effective user and connection parameters, so connections are
+# only reused with the same credentials and settings; note that session state set
+# by a query (eg, with SET statements in SQL Lab) is kept by pooled connections.
+# Engines of databases connected through SSH tunnels are only reused when the
+# tunnels are pooled (see SSH_TUNNEL_POOL), since pooled tunnels keep their local
+# port; tunnels opened for each use get a new engine every time.
+DATABASE_ENGINE_REGISTRY_MAX_ENGINES = 0
+# Engines not used for this many seconds are disposed, closing their connections
+DATABASE_ENGINE_REGISTRY_IDLE_TIMEOUT = 300
+# Pool options of the registered engines, unless the `engine_params` of the
+# database define their own `poolclass`
+DATABASE_ENGINE_REGISTRY_POOL_OPTIONS: dict[str, Any] = {
+    "pool_size": 5,
+    "max_overflow": 10,
+    "pool_pre_ping": True,
+    "pool_recycle": 3600,
+}
+
 
 # A callable that is invoked for every invocation of DB Engine Specs
 # which allows for custom validation of the engine URI.
@@ -1773,11 +1961,29 @@ GLOBAL_ASYNC_QUERIES_JWT_COOKIE_SAMESITE: None | (Literal["None", "Lax", "Strict
 )
 GLOBAL_ASYNC_QUERIES_JWT_COOKIE_DOMAIN = None
 GLOBAL_ASYNC_QUERIES_JWT_SECRET = "test-secret-change-me"  # noqa: S105
-GLOBAL_ASYNC_QUERIES_TRANSPORT: Literal["polling", "ws"] = "polling"
+# The transport of async query events to the browser: "polling" the events API,
+# a WebSocket ("ws", see superset-websocket) or Server-Sent Events ("sse") streamed
+# by the events API.
+GLOBAL_ASYNC_QUERIES_TRANSPORT: Literal["polling", "ws", "sse"] = "polling"
 GLOBAL_ASYNC_QUERIES_POLLING_DELAY = int(
     timedelta(milliseconds=500).total_seconds() * 1000
 )
+# When set, each poll of the events API waits up to this many seconds for new events
+# with a blocking Redis XREAD, instead of returning immediately when there are none,
+# so that events reach the browser as soon as they are added (long polling).
+GLOBAL_ASYNC_QUERIES_LONG_POLLING_TIMEOUT = 0
+# How long, in seconds, an SSE stream of events stays open before the browser
+# reconnects to it.
+GLOBAL_ASYNC_QUERIES_SSE_MAX_DURATION = 300
+# The maximum number of long polling requests and SSE streams waiting for events at
+# once in each web server process, each of them holding a worker thread and a Redis
+# connection. Further requests return the events already added immediately.
+GLOBAL_ASYNC_QUERIES_MAX_BLOCKING_CONNECTIONS = 10
 GLOBAL_ASYNC_QUERIES_WEBSOCKET_URL = "ws://127.0.0.1:8080/"
+# The maximum number of charts of a dashboard loaded by the same Celery task when
+# their data is requested in one batch. Charts of the same dataset share a task, which
+# runs their queries one after the other, so smaller batches use more workers at once.
+GLOBAL_ASYNC_QUERIES_MAX_BATCH_SIZE = 10
 
 # Global async queries cache backend configuration options:
 # - Set 'CACHE_TYPE' to 'RedisCache' for RedisCacheBackend.
@@ -116,6 +116,8 @@ from superset.superset_typing import (
 )
 from superset.utils import core as utils, json
 from superset.utils.backports import StrEnum
+from superset.utils.cache import memoize_per_request
+from superset.utils.hashing import md5_sha_from_dict
 
 config = app.config
 metadata = Model.metadata  # pylint: disable=no-member
@@ -1643,27 +1645,24 @@ class SqlaTable(
             )
         return ob
 
-    def _normalize_prequery_result_type(
+    def _normalize_prequery_result_value(
         self,
-        row: pd.Series,
+        value: Any,
         dimension: str,
         columns_by_name: dict[str, TableColumn],
     ) -> str | int | float | bool | Text:
         """
-        Convert a prequery result type to its equivalent Python type.
+        Convert a value of a prequery result to its equivalent Python type.
 
         Some databases like Druid will return timestamps as strings, but do not perform
         automatic casting when comparing these strings to a timestamp. For cases like
         this we convert the value via the appropriate SQL transform.
 
-        :param row: A prequery record
+        :param value: A value of the dimension
         :param dimension: The dimension name
         :param columns_by_name: The mapping of columns by name
         :return: equivalent primitive python type
         """
-
-        value = row[dimension]
-
         if isinstance(value, np.generic):
             value = value.item()
 
@@ -1680,28 +1679,6 @@ class SqlaTable(
 
         return value
 
-    def _get_top_groups(
-        self,
-        df: pd.DataFrame,
-        dimensions: list[str],
-        groupby_exprs: dict[str, Any],
-        columns_by_name: dict[str, TableColumn],
-    ) -> ColumnElement:
-        groups = []
-        for _unused, row in df.iterrows():
-            group = []
-            for dimension in dimensions:
-                value = self._normalize_prequery_result_type(
-                    row,
-                    dimension,
-                    columns_by_name,
-                )
-
-                group.append(groupby_exprs[dimension] == value)
-            groups.append(and_(*group))
-
-        return or_(*groups)
-
     def query(self, query_obj: QueryObjectDict) -> QueryResult:
         qry_start_dttm = datetime.now()
         query_str_ext = self.get_query_str_extended(query_obj)
@@ -1997,8 +1974,20 @@ class SqlaTable(
         """
         extra_cache_keys = super().get_extra_cache_keys(query_obj)
         if self.has_extra_cache_key_calls(query_obj):
-            sqla_query = self.get_sqla_query(**query_obj)
-            extra_cache_keys += sqla_query.extra_cache_keys
+            # rendering the templates can be expensive, and the same query is often
+            # keyed more than once in a request
+            extra_cache_keys += memoize_per_request(
+                (
+                    "extra_cache_keys",
+                    self.uid,
+                    md5_sha_from_dict(
+                        query_obj,  # type: ignore
+                        default=json.json_int_dttm_ser,
+                        ignore_nan=True,
+                    ),
+                ),
+                lambda: self.get_sqla_query(**query_obj).extra_cache_keys,
+            )
         return list(set(extra_cache_keys))
 
     @property
@@ -2103,3 +2092,14 @@ class RowLevelSecurityFilter(Model, AuditMixinNullable):
         backref="row_level_security_filters",
     )
     clause = Column(utils.MediumText(), nullable=False)
+
+
+sa.event.listen(
+    RowLevelSecurityFilter, "after_insert", security_manager.rls_filter_after_change
+)
+sa.event.listen(
+    RowLevelSecurityFilter, "after_update", security_manager.rls_filter_after_change
+)
+sa.event.listen(
+    RowLevelSecurityFilter, "after_delete", security_manager.rls_filter_after_change
+)
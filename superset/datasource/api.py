@@ -16,6 +16,7 @@
 # under the License.
 import logging
 
+from flask import request
 from flask_appbuilder.api import expose, protect, safe
 
 from superset import app, event_logger
@@ -70,6 +71,12 @@ class DatasourceRestApi(BaseSupersetApi):
               type: string
             name: column_name
             description: The name of the column to get values for
+          - in: query
+            schema:
+              type: string
+            name: prefix
+            description: >-
+              Only return the values starting with this prefix, ignoring the case
           responses:
             200:
               description: A List of distinct values for the column
@@ -121,6 +128,7 @@ class DatasourceRestApi(BaseSupersetApi):
                 column_name=column_name,
                 limit=row_limit,
                 denormalize_column=denormalize_column,
+                prefix=request.args.get("prefix"),
             )
             return self.response(200, result=payload)
         except KeyError:
@@ -21,6 +21,7 @@ from __future__ import annotations
 import logging
 import re
 import warnings
+from collections.abc import Iterator
 from datetime import datetime
 from inspect import signature
 from re import Match, Pattern
@@ -38,6 +39,7 @@ from urllib.parse import urlencode, urljoin
 from uuid import uuid4
 
 import pandas as pd
+import pyarrow as pa
 import requests
 from apispec import APISpec
 from apispec.ext.marshmallow import MarshmallowPlugin
@@ -71,6 +73,7 @@ from superset.sql.parse import (
     Table,
 )
 from superset.superset_typing import (
+    DbapiDescription,
     OAuth2ClientConfig,
     OAuth2State,
     OAuth2TokenResponse,
@@ -357,6 +360,10 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
     # that are the same as a source column
     allows_alias_to_source_column = True
 
+    # Whether tuples of columns can be compared with a list of tuples, ie,
+    # `(a, b) IN ((1, 'x'), (2, 'y'))`, used to filter the top groups of series limits
+    supports_tuple_in = False
+
     # Whether ORDER BY clause must appear in SELECT
     # if True, then it doesn't have to.
     allows_hidden_orderby_agg = True
@@ -428,6 +435,16 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
     # Driver-specific exception that should be mapped to OAuth2RedirectError
     oauth2_exception = OAuth2RedirectError
 
+    # Can the DB API cursor return results as Arrow data? When this is True the DB
+    # engine spec MUST implement `fetch_arrow`, and results are loaded into a
+    # `SupersetResultSet` without being converted to Python objects first.
+    supports_arrow_fetch = False
+
+    # Can the rows be fetched in batches with `fetch_data_batches`? DB engine specs
+    # that process the rows fetched in `fetch_data`, without overriding
+    # `fetch_data_batches` as well, must set this to False.
+    supports_streaming_fetch = True
+
     # Does the query id related to the connection?
     # The default value is True, which means that the query id is determined when
     # the connection is created.
@@ -978,32 +995,131 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
             if cls.limit_method == LimitMethod.FETCH_MANY and limit:
                 return cursor.fetchmany(limit)
             data = cursor.fetchall()
-            description = cursor.description or []
-            # Create a mapping between column name and a mutator function to normalize
-            # values with. The first two items in the description row are
-            # the column name and type.
-            column_mutators = {
-                row[0]: func
-                for row in description
-                if (
-                    func := cls.column_type_mutators.get(
-                        type(cls.get_sqla_column_type(cls.get_datatype(row[1])))
-                    )
-                )
-            }
-            if column_mutators:
-                indexes = {row[0]: idx for idx, row in enumerate(description)}
-                for row_idx, row in enumerate(data):
-                    new_row = list(row)
-                    for col, func in column_mutators.items():
-                        col_idx = indexes[col]
-                        new_row[col_idx] = func(row[col_idx])
-                    data[row_idx] = tuple(new_row)
-
-            return data
+            return cls.mutate_rows(cursor.description, data)
         except Exception as ex:
             raise cls.get_dbapi_mapped_exception(ex) from ex
 
+    @classmethod
+    def fetch_data_batches(
+        cls,
+        cursor: Any,
+        batch_size: int,
+        limit: int | None = None,
+    ) -> Iterator[list[tuple[Any, ...]]]:
+        """
+        Fetch the results of a query in batches of at most `batch_size` rows.
+
+        Only called for DB engine specs that set ``supports_streaming_fetch``. Rows
+        are fetched with `fetchmany` as the batches are consumed, so callers can
+        process each batch, or stop fetching, before the next one is fetched.
+
+        :param cursor: Cursor instance
+        :param batch_size: Maximum number of rows in each batch
+        :param limit: Maximum number of rows to be returned by the cursor
+        :return: The batches of rows
+        """
+        if cls.arraysize:
+            cursor.arraysize = cls.arraysize
+        if not cursor.description:
+            return
+
+        fetched = 0
+        try:
+            while limit is None or fetched < limit:
+                size = batch_size if limit is None else min(batch_size, limit - fetched)
+                if not (rows := cursor.fetchmany(size)):
+                    break
+                fetched += len(rows)
+                yield cls.mutate_rows(cursor.description, rows)
+        except Exception as ex:
+            raise cls.get_dbapi_mapped_exception(ex) from ex
+
+    @classmethod
+    def get_column_mutators(
+        cls,
+        description: DbapiDescription | None,
+    ) -> dict[str, Callable[[Any], Any]]:
+        """
+        Return the `column_type_mutators` function of each column that has one.
+
+        :param description: The description of the cursor
+        :return: The mutator function of each column, by name
+        """
+        # The first two items in the description row are the column name and type.
+        return {
+            row[0]: func
+            for row in description or []
+            if (
+                func := cls.column_type_mutators.get(
+                    type(cls.get_sqla_column_type(cls.get_datatype(row[1])))
+                )
+            )
+        }
+
+    @classmethod
+    def mutate_rows(
+        cls,
+        description: DbapiDescription | None,
+        data: list[tuple[Any, ...]],
+    ) -> list[tuple[Any, ...]]:
+        """
+        Normalize the values of columns whose type has a `column_type_mutators`.
+        """
+        if column_mutators := cls.get_column_mutators(description):
+            indexes = {row[0]: idx for idx, row in enumerate(description or [])}
+            for row_idx, row in enumerate(data):
+                new_row = list(row)
+                for col, func in column_mutators.items():
+                    col_idx = indexes[col]
+                    new_row[col_idx] = func(row[col_idx])
+                data[row_idx] = tuple(new_row)
+
+        return data
+
+    @classmethod
+    def fetch_arrow(cls, cursor: Any, limit: int | None = None) -> pa.Table | None:
+        """
+        Fetch the results of a query as an Arrow table.
+
+        Only called for DB engine specs that set ``supports_arrow_fetch``. Returns
+        ``None`` when the cursor can't return its results as Arrow data, in which
+        case they are fetched with ``fetch_data`` instead. Implementations must pass
+        the table through ``mutate_arrow_table``, as ``fetch_data`` does with
+        ``mutate_rows``.
+
+        :param cursor: Cursor instance
+        :param limit: Maximum number of rows to be returned by the cursor
+        :return: Result of query, or ``None`` if it isn't available as Arrow data
+        """
+        raise NotImplementedError()
+
+    @classmethod
+    def mutate_arrow_table(
+        cls,
+        description: DbapiDescription | None,
+        table: pa.Table,
+    ) -> pa.Table:
+        """
+        Normalize the values of Arrow columns whose type has a `column_type_mutators`.
+
+        Only these columns are converted to Python objects and back.
+        """
+        for name, func in cls.get_column_mutators(description).items():
+            if (idx := table.schema.get_field_index(name)) == -1:
+                continue
+            values = [func(value) for value in table.column(idx).to_pylist()]
+            table = table.set_column(idx, name, pa.array(values))
+        return table
+
+    @staticmethod
+    def limit_arrow_table(table: pa.Table, limit: int | None = None) -> pa.Table:
+        """
+        Truncate an Arrow table to at most ``limit`` rows, without copying.
+        """
+        if limit is not None and table.num_rows > limit:
+            return table.slice(0, limit)
+        return table
+
     @classmethod
     def expand_data(
         cls, columns: list[ResultSetColumnType], data: list[dict[Any, Any]]
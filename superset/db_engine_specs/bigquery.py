@@ -248,6 +248,9 @@ class BigQueryEngineSpec(BaseEngineSpec):  # pylint: disable=too-many-public-met
             return f"""CAST('{dttm.strftime("%H:%M:%S.%f")}' AS TIME)"""
         return None
 
+    # the rows are processed in `fetch_data`, so they are not fetched in batches
+    supports_streaming_fetch = False
+
     @classmethod
     def fetch_data(cls, cursor: Any, limit: int | None = None) -> list[tuple[Any, ...]]:
         data = super().fetch_data(cursor, limit)
@@ -19,6 +19,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any, TYPE_CHECKING, TypedDict, Union
 
+import pyarrow as pa
 from apispec import APISpec
 from apispec.ext.marshmallow import MarshmallowPlugin
 from flask_babel import gettext as __
@@ -191,6 +192,7 @@ class DatabricksODBCEngineSpec(DatabricksBaseEngineSpec):
 class DatabricksDynamicBaseEngineSpec(BasicParametersMixin, DatabricksBaseEngineSpec):
     default_driver = ""
     encryption_parameters = {"ssl": "1"}
+    supports_arrow_fetch = True
     required_parameters = {"access_token", "host", "port"}
     context_key_mapping = {
         "access_token": "password",
@@ -231,6 +233,17 @@ class DatabricksDynamicBaseEngineSpec(BasicParametersMixin, DatabricksBaseEngine
             database, inspector, schema
         ) - cls.get_view_names(database, inspector, schema)
 
+    @classmethod
+    def fetch_arrow(cls, cursor: Any, limit: int | None = None) -> pa.Table | None:
+        try:
+            if limit:
+                table = cursor.fetchmany_arrow(limit)
+            else:
+                table = cursor.fetchall_arrow()
+            return cls.mutate_arrow_table(cursor.description, table)
+        except Exception as ex:
+            raise cls.get_dbapi_mapped_exception(ex) from ex
+
     @classmethod
     def extract_errors(
         cls, ex: Exception, context: dict[str, Any] | None = None
@@ -124,6 +124,9 @@ class DrillEngineSpec(BaseEngineSpec):
 
         return url, engine_kwargs
 
+    # the rows are processed in `fetch_data`, so they are not fetched in batches
+    supports_streaming_fetch = False
+
     @classmethod
     def fetch_data(
         cls,
@@ -22,6 +22,7 @@ from datetime import datetime
 from re import Pattern
 from typing import Any, TYPE_CHECKING, TypedDict
 
+import pyarrow as pa
 from apispec import APISpec
 from apispec.ext.marshmallow import MarshmallowPlugin
 from flask_babel import gettext as __
@@ -197,6 +198,9 @@ class DuckDBEngineSpec(DuckDBParametersMixin, BaseEngineSpec):
 
     sqlalchemy_uri_placeholder = "duckdb:////path/to/duck.db"
 
+    supports_arrow_fetch = True
+    supports_tuple_in = True
+
     _time_grain_expressions = {
         None: "{col}",
         TimeGrain.SECOND: "DATE_TRUNC('second', {col})",
@@ -237,6 +241,14 @@ class DuckDBEngineSpec(DuckDBParametersMixin, BaseEngineSpec):
     ) -> set[str]:
         return set(inspector.get_table_names(schema))
 
+    @classmethod
+    def fetch_arrow(cls, cursor: Any, limit: int | None = None) -> pa.Table | None:
+        try:
+            table = cls.limit_arrow_table(cursor.fetch_arrow_table(), limit)
+            return cls.mutate_arrow_table(cursor.description, table)
+        except Exception as ex:
+            raise cls.get_dbapi_mapped_exception(ex) from ex
+
     @staticmethod
     def get_extra_params(
         database: Database, source: QuerySource | None = None
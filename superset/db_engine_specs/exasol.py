@@ -40,6 +40,9 @@ class ExasolEngineSpec(BaseEngineSpec):  # pylint: disable=abstract-method
         TimeGrain.YEAR: "DATE_TRUNC('year', {col})",
     }
 
+    # the rows are processed in `fetch_data`, so they are not fetched in batches
+    supports_streaming_fetch = False
+
     @classmethod
     def fetch_data(
         cls, cursor: Any, limit: Optional[int] = None
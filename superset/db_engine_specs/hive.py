@@ -145,6 +145,9 @@ class HiveEngineSpec(PrestoEngineSpec):
         hive.constants = patched_constants
         hive.ttypes = patched_ttypes
 
+    # the rows are processed in `fetch_data`, so they are not fetched in batches
+    supports_streaming_fetch = False
+
     @classmethod
     def fetch_data(cls, cursor: Any, limit: int | None = None) -> list[tuple[Any, ...]]:
         # pylint: disable=import-outside-toplevel
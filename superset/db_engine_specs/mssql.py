@@ -144,6 +144,9 @@ class MssqlEngineSpec(BaseEngineSpec):
             return f"""CONVERT(DATETIME, '{datetime_formatted}', 126)"""
         return None
 
+    # the rows are processed in `fetch_data`, so they are not fetched in batches
+    supports_streaming_fetch = False
+
     @classmethod
     def fetch_data(
         cls, cursor: Any, limit: Optional[int] = None
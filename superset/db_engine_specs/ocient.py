@@ -308,6 +308,9 @@ class OcientEngineSpec(BaseEngineSpec):
     ) -> set[str]:
         return inspector.get_table_names(schema)
 
+    # the rows are processed in `fetch_data`, so they are not fetched in batches
+    supports_streaming_fetch = False
+
     @classmethod
     def fetch_data(
         cls, cursor: Any, limit: Optional[int] = None
@@ -206,6 +206,7 @@ class PostgresEngineSpec(BasicParametersMixin, PostgresBaseEngineSpec):
     supports_dynamic_schema = True
     supports_catalog = True
     supports_dynamic_catalog = True
+    supports_tuple_in = True
 
     default_driver = "psycopg2"
     sqlalchemy_uri_placeholder = (
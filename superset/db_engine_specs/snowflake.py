@@ -23,6 +23,7 @@ from re import Pattern
 from typing import Any, Optional, TYPE_CHECKING, TypedDict
 from urllib import parse
 
+import pyarrow as pa
 from apispec import APISpec
 from apispec.ext.marshmallow import MarshmallowPlugin
 from cryptography.hazmat.backends import default_backend
@@ -89,6 +90,7 @@ class SnowflakeEngineSpec(PostgresBaseEngineSpec):
 
     supports_dynamic_schema = True
     supports_catalog = supports_dynamic_catalog = supports_cross_catalog_queries = True
+    supports_arrow_fetch = True
 
     # pylint: disable=invalid-name
     encrypted_extra_sensitive_fields = {
@@ -251,6 +253,24 @@ class SnowflakeEngineSpec(PostgresBaseEngineSpec):
         extra["engine_params"] = engine_params
         database.extra = json.dumps(extra)
 
+    @classmethod
+    def fetch_arrow(cls, cursor: Any, limit: int | None = None) -> pa.Table | None:
+        if not cursor.description:
+            return pa.table({})
+        # ``fetch_arrow_all`` raises when the account or the session sets the
+        # result format to JSON, the rows are then fetched with ``fetch_data``
+        if getattr(cursor, "_query_result_format", "arrow") != "arrow":
+            return None
+        try:
+            # the connector returns ``None`` instead of a table for empty results
+            table = cursor.fetch_arrow_all()
+        except Exception as ex:
+            raise cls.get_dbapi_mapped_exception(ex) from ex
+        if table is None:
+            return pa.table({})
+        table = cls.limit_arrow_table(table, limit)
+        return cls.mutate_arrow_table(cursor.description, table)
+
     @classmethod
     def get_cancel_query_id(cls, cursor: Any, query: Query) -> Optional[str]:
         """
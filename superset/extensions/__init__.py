@@ -29,6 +29,7 @@ from werkzeug.local import LocalProxy
 
 from superset.async_events.async_query_manager import AsyncQueryManager
 from superset.async_events.async_query_manager_factory import AsyncQueryManagerFactory
+from superset.extensions.engine_registry import EngineRegistry
 from superset.extensions.ssh import SSHManagerFactory
 from superset.extensions.stats_logger import BaseStatsLoggerManager
 from superset.security.manager import SupersetSecurityManager
@@ -126,6 +127,7 @@ csrf = CSRFProtect()
 db = SQLA()  # pylint: disable=disallowed-name
 _event_logger: dict[str, Any] = {}
 encrypted_field_factory = EncryptedFieldFactory()
+engine_registry = EngineRegistry()
 event_logger = LocalProxy(lambda: _event_logger.get("event_logger"))
 feature_flag_manager = FeatureFlagManager()
 machine_auth_provider_factory = MachineAuthProviderFactory()
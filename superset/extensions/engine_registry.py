@@ -0,0 +1,174 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Registry of SQLAlchemy engines reused across requests.
+
+By default every use of a database creates a new engine without a connection pool,
+so that each query opens, and closes, its own connection. When
+``DATABASE_ENGINE_REGISTRY_MAX_ENGINES`` is set the engines are kept in this
+registry instead, together with their pools, and connections are reused by the
+following requests with the same key.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from flask import Flask
+from sqlalchemy.engine import Engine
+
+from superset.stats_logger import BaseStatsLogger, DummyStatsLogger
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Entry:
+    database_id: int | None
+    engine: Engine
+    last_used: float
+
+
+class EngineRegistry:
+    def __init__(self) -> None:
+        self.max_engines = 0
+        self.idle_timeout = 0
+        self.pool_options: dict[str, Any] = {}
+        self._stats_logger: BaseStatsLogger = DummyStatsLogger()
+        self._engines: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def init_app(self, app: Flask) -> None:
+        self.dispose_all()
+        self.max_engines = app.config["DATABASE_ENGINE_REGISTRY_MAX_ENGINES"]
+        self.idle_timeout = app.config["DATABASE_ENGINE_REGISTRY_IDLE_TIMEOUT"]
+        self.pool_options = app.config["DATABASE_ENGINE_REGISTRY_POOL_OPTIONS"]
+        self._stats_logger = app.config["STATS_LOGGER"]
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_engines > 0
+
+    def get_engine(
+        self,
+        database_id: int | None,
+        key: Hashable,
+        create: Callable[[], Engine],
+    ) -> Engine:
+        """
+        Return the engine registered under `key`, creating it if needed.
+
+        Engines that have been idle for longer than the idle timeout, and the least
+        recently used engines beyond the maximum number of engines, are disposed.
+        Engines are created without holding the lock, so that a slow driver doesn't
+        block the requests to other databases; when another thread registers an
+        engine under the same key meanwhile, that one is kept.
+
+        :param database_id: the ID of the database the engine connects to
+        :param key: the key identifying the engine and its configuration
+        :param create: a callable creating the engine when it is not registered
+        :returns: the registered engine
+        """
+        now = time.monotonic()
+        with self._lock:
+            disposed = self._pop_idle(now)
+            entry = self._use(key, now)
+
+        if entry is None:
+            created = _Entry(database_id, create(), now)
+            with self._lock:
+                if (entry := self._use(key, now)) is not None:
+                    disposed.append(created)
+                else:
+                    entry = self._engines[key] = created
+                    self._stats_logger.incr("engine_registry.miss")
+                    while len(self._engines) > self.max_engines:
+                        disposed.append(self._engines.popitem(last=False)[1])
+
+        self._dispose(disposed)
+        self.report_stats()
+        return entry.engine
+
+    def dispose_database(self, database_id: int | None) -> None:
+        """
+        Dispose all the engines of a database, eg, when its connection changes.
+        """
+        with self._lock:
+            keys = [
+                key
+                for key, entry in self._engines.items()
+                if entry.database_id == database_id
+            ]
+            disposed = [self._engines.pop(key) for key in keys]
+
+        self._dispose(disposed)
+
+    def dispose_all(self) -> None:
+        with self._lock:
+            disposed = list(self._engines.values())
+            self._engines.clear()
+
+        self._dispose(disposed)
+
+    def report_stats(self) -> None:
+        """
+        Send the number of engines, and of connections in their pools, to the
+        stats logger.
+        """
+        with self._lock:
+            pools = [entry.engine.pool for entry in self._engines.values()]
+
+        self._stats_logger.gauge("engine_registry.engines", len(pools))
+        self._stats_logger.gauge(
+            "engine_registry.connections.checked_out",
+            sum(pool.checkedout() for pool in pools if hasattr(pool, "checkedout")),
+        )
+        self._stats_logger.gauge(
+            "engine_registry.connections.checked_in",
+            sum(pool.checkedin() for pool in pools if hasattr(pool, "checkedin")),
+        )
+
+    def _use(self, key: Hashable, now: float) -> _Entry | None:
+        if entry := self._engines.get(key):
+            self._engines.move_to_end(key)
+            entry.last_used = now
+            self._stats_logger.incr("engine_registry.hit")
+        return entry
+
+    def _pop_idle(self, now: float) -> list[_Entry]:
+        if not self.idle_timeout:
+            return []
+
+        keys = [
+            key
+            for key, entry in self._engines.items()
+            if now - entry.last_used > self.idle_timeout
+        ]
+        return [self._engines.pop(key) for key in keys]
+
+    def _dispose(self, entries: list[_Entry]) -> None:
+        # connections checked out by other threads are closed once returned
+        for entry in entries:
+            logger.debug("Disposing engine of database %s", entry.database_id)
+            entry.engine.dispose()
+            self._stats_logger.incr("engine_registry.dispose")
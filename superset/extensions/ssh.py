@@ -16,8 +16,13 @@
 # under the License.
 
 import logging
+import threading
+import time
+from collections.abc import Hashable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from io import StringIO
-from typing import TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
 
 import sshtunnel
 from flask import Flask
@@ -29,6 +34,18 @@ from superset.utils.class_utils import load_class_from_name
 if TYPE_CHECKING:
     from superset.databases.ssh_tunnel.models import SSHTunnel
 
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PooledTunnel:
+    key: Hashable
+    server: sshtunnel.SSHTunnelForwarder
+    users: int = 0
+    last_used: float = 0.0
+    started: bool = False
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
 
 class SSHManager:
     def __init__(self, app: Flask) -> None:
@@ -36,6 +53,11 @@ class SSHManager:
         self.local_bind_address = app.config["SSH_TUNNEL_LOCAL_BIND_ADDRESS"]
         sshtunnel.TUNNEL_TIMEOUT = app.config["SSH_TUNNEL_TIMEOUT_SEC"]
         sshtunnel.SSH_TIMEOUT = app.config["SSH_TUNNEL_PACKET_TIMEOUT_SEC"]
+        self.pool_enabled = app.config["SSH_TUNNEL_POOL"]
+        self.pool_idle_timeout = app.config["SSH_TUNNEL_POOL_IDLE_TIMEOUT_SEC"]
+        self._tunnels: dict[Hashable, PooledTunnel] = {}
+        self._lock = threading.Lock()
+        self._reaper: Optional[threading.Timer] = None
 
     def build_sqla_url(
         self, sqlalchemy_url: str, server: sshtunnel.SSHTunnelForwarder
@@ -75,6 +97,151 @@ class SSHManager:
 
         return sshtunnel.open_tunnel(**params)
 
+    @contextmanager
+    def tunnel(
+        self,
+        ssh_tunnel: "SSHTunnel",
+        sqlalchemy_database_uri: str,
+    ) -> Iterator[sshtunnel.SSHTunnelForwarder]:
+        """
+        Context manager for a started tunnel to the database.
+
+        Unless ``SSH_TUNNEL_POOL`` is enabled a new tunnel is opened, and closed on
+        exit. Otherwise tunnels are shared by concurrent users of the same SSH tunnel
+        configuration, and closed once they have been idle for
+        ``SSH_TUNNEL_POOL_IDLE_TIMEOUT_SEC``.
+        """
+        if not self.is_pooled(ssh_tunnel):
+            with self.create_tunnel(ssh_tunnel, sqlalchemy_database_uri) as server:
+                yield server
+            return
+
+        tunnel = self._acquire(ssh_tunnel, sqlalchemy_database_uri)
+        try:
+            yield tunnel.server
+        finally:
+            self._release(tunnel)
+
+    def is_pooled(self, ssh_tunnel: "SSHTunnel") -> bool:
+        """
+        Whether the tunnels of an SSH tunnel configuration are kept in the pool, and
+        stay open on the same local port after being used.
+        """
+        # tunnels being tested have not been saved yet
+        return self.pool_enabled and ssh_tunnel.id is not None
+
+    def close_tunnels(self) -> None:
+        """
+        Close all the pooled tunnels, including the ones in use.
+        """
+        with self._lock:
+            tunnels = list(self._tunnels.values())
+            self._tunnels.clear()
+            if self._reaper:
+                self._reaper.cancel()
+                self._reaper = None
+
+        for tunnel in tunnels:
+            self._stop(tunnel)
+
+    def close_idle_tunnels(self) -> None:
+        """
+        Close the pooled tunnels that have been idle for longer than
+        ``SSH_TUNNEL_POOL_IDLE_TIMEOUT_SEC``.
+        """
+        with self._lock:
+            idle = self._pop_idle(time.monotonic())
+
+        for tunnel in idle:
+            self._stop(tunnel)
+
+    def _acquire(
+        self,
+        ssh_tunnel: "SSHTunnel",
+        sqlalchemy_database_uri: str,
+    ) -> PooledTunnel:
+        url = make_url_safe(sqlalchemy_database_uri)
+        key = (ssh_tunnel.id, ssh_tunnel.changed_on, url.host, url.port)
+
+        with self._lock:
+            idle = self._pop_idle(time.monotonic())
+            tunnel = self._tunnels.get(key)
+            if tunnel is None:
+                tunnel = PooledTunnel(
+                    key,
+                    self.create_tunnel(ssh_tunnel, sqlalchemy_database_uri),
+                )
+                self._tunnels[key] = tunnel
+            tunnel.users += 1
+
+        for idle_tunnel in idle:
+            self._stop(idle_tunnel)
+
+        try:
+            # the SSH connection is established by the first user, and again by the
+            # next one if it was lost, eg, when the bastion restarted
+            with tunnel.lock:
+                if not tunnel.server.is_active:
+                    if tunnel.started:
+                        logger.warning("[SSH] Tunnel is down, reconnecting")
+                        tunnel.server.stop(force=True)
+                    tunnel.server.start()
+                    tunnel.started = True
+        except Exception:
+            self._release(tunnel, discard=True)
+            raise
+
+        return tunnel
+
+    def _release(self, tunnel: PooledTunnel, discard: bool = False) -> None:
+        with self._lock:
+            tunnel.users -= 1
+            tunnel.last_used = time.monotonic()
+            discard = (
+                discard
+                and tunnel.users == 0
+                and self._tunnels.get(tunnel.key) is tunnel
+            )
+            if discard:
+                del self._tunnels[tunnel.key]
+            elif tunnel.users == 0:
+                self._schedule_reaper()
+
+        if discard:
+            self._stop(tunnel)
+
+    def _schedule_reaper(self) -> None:
+        # idle tunnels are closed even when no other tunnel is acquired afterwards
+        if self._reaper is None:
+            self._reaper = threading.Timer(self.pool_idle_timeout, self._reap)
+            self._reaper.daemon = True
+            self._reaper.start()
+
+    def _reap(self) -> None:
+        with self._lock:
+            self._reaper = None
+            idle = self._pop_idle(time.monotonic())
+            if self._tunnels:
+                self._schedule_reaper()
+
+        for tunnel in idle:
+            self._stop(tunnel)
+
+    def _pop_idle(self, now: float) -> list[PooledTunnel]:
+        keys = [
+            key
+            for key, tunnel in self._tunnels.items()
+            if tunnel.users == 0 and now - tunnel.last_used > self.pool_idle_timeout
+        ]
+        return [self._tunnels.pop(key) for key in keys]
+
+    @staticmethod
+    def _stop(tunnel: PooledTunnel) -> None:
+        try:
+            tunnel.server.stop(force=True)
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("[SSH] Unable to close tunnel", exc_info=True)
+
 
 class SSHManagerFactory:
     def __init__(self) -> None:
@@ -45,6 +45,7 @@ from superset.extensions import (
     csrf,
     db,
     encrypted_field_factory,
+    engine_registry,
     feature_flag_manager,
     machine_auth_provider_factory,
     manifest_processor,
@@ -100,6 +101,16 @@ class SupersetAppInitializer:  # pylint: disable=too-many-public-methods
         celery_app.set_default()
         superset_app = self.superset_app
 
+        # pylint: disable=import-outside-toplevel
+        from superset.tasks.routing import get_task_router
+
+        # the routes of CELERY_CONFIG take precedence over the queues of task classes
+        if queues := self.config["CELERY_TASK_QUEUES"]:
+            routes = celery_app.conf.task_routes or []
+            if not isinstance(routes, (list, tuple)):
+                routes = [routes]
+            celery_app.conf.task_routes = [*routes, get_task_router(queues)]
+
         # Here, we want to ensure that every call into Celery task has an app context
         # setup properly
         task_base = celery_app.Task
@@ -436,6 +447,7 @@ class SupersetAppInitializer:  # pylint: disable=too-many-public-methods
         self.configure_async_queries()
         self.configure_ssh_manager()
         self.configure_stats_manager()
+        self.configure_engine_registry()
 
         # Hook that provides administrators a handle on the Flask APP
         # after initialization
@@ -543,6 +555,9 @@ class SupersetAppInitializer:  # pylint: disable=too-many-public-methods
     def configure_stats_manager(self) -> None:
         stats_logger_manager.init_app(self.superset_app)
 
+    def configure_engine_registry(self) -> None:
+        engine_registry.init_app(self.superset_app)
+
     def setup_event_logger(self) -> None:
         _event_logger["event_logger"] = get_event_logger_from_cfg_value(
             self.superset_app.config.get("EVENT_LOGGER", DBEventLogger())
@@ -25,6 +25,7 @@ import builtins
 import logging
 import textwrap
 from ast import literal_eval
+from collections.abc import Iterator
 from contextlib import closing, contextmanager, nullcontext, suppress
 from copy import deepcopy
 from datetime import datetime
@@ -34,6 +35,7 @@ from typing import Any, Callable, cast, TYPE_CHECKING
 
 import numpy
 import pandas as pd
+import pyarrow as pa
 import sqlalchemy as sqla
 import sshtunnel
 from flask import g
@@ -57,7 +59,8 @@ from sqlalchemy.engine.url import URL
 from sqlalchemy.exc import NoSuchModuleError
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
-from sqlalchemy.pool import NullPool
+from sqlalchemy.orm.mapper import Mapper
+from sqlalchemy.pool import NullPool, QueuePool
 from sqlalchemy.schema import UniqueConstraint
 from sqlalchemy.sql import ColumnElement, expression, Select
 
@@ -69,12 +72,13 @@ from superset.db_engine_specs.base import MetricType, TimeGrain
 from superset.extensions import (
     cache_manager,
     encrypted_field_factory,
+    engine_registry,
     event_logger,
     security_manager,
     ssh_manager_factory,
 )
 from superset.models.helpers import AuditMixinNullable, ImportExportMixin, UUIDMixin
-from superset.result_set import SupersetResultSet
+from superset.result_set import dedup, SupersetResultSet
 from superset.sql.parse import SQLScript, Table
 from superset.superset_typing import (
     DbapiDescription,
@@ -84,6 +88,7 @@ from superset.superset_typing import (
 from superset.utils import cache as cache_util, core as utils, json
 from superset.utils.backports import StrEnum
 from superset.utils.core import get_query_source_from_request, get_username
+from superset.utils.hashing import md5_sha_from_str
 from superset.utils.oauth2 import (
     check_for_oauth2,
     get_oauth2_access_token,
@@ -126,6 +131,51 @@ class ConfigurationMethod(StrEnum):
     DYNAMIC_FORM = "dynamic_form"
 
 
+def get_metadata_cache_stale_timeout() -> int:
+    return config["DATABASE_METADATA_CACHE_STALE_TIMEOUT"]
+
+
+def schedule_metadata_refresh(
+    func: Callable[..., Any],
+    arguments: dict[str, Any],
+    cache_timeout: int,
+) -> bool:
+    """
+    Refresh the expired metadata of a database in a background task.
+
+    Metadata that depends on the user, because of impersonation or OAuth2, or on an
+    SSH tunnel that is not saved yet, is fetched again in the request instead.
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.tasks.database_metadata import refresh_database_metadata
+
+    database: Database = arguments["self"]
+    if (
+        database.id is None
+        or database.impersonate_user
+        or database.is_oauth2_enabled()
+        or arguments.get("ssh_tunnel")
+    ):
+        return False
+
+    kwargs = {
+        name: value
+        for name, value in arguments.items()
+        if name not in {"self", "ssh_tunnel"}
+    }
+    try:
+        refresh_database_metadata.delay(
+            database.id,
+            func.__name__,
+            kwargs,
+            cache_timeout,
+        )
+    except Exception:  # pylint: disable=broad-except
+        logger.warning("Unable to schedule the refresh of metadata", exc_info=True)
+        return False
+    return True
+
+
 class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable=too-many-public-methods
     """An ORM object that stores Database related information"""
 
@@ -430,7 +480,7 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
 
         ssh_tunnel = override_ssh_tunnel or DatabaseDAO.get_ssh_tunnel(self.id)
         ssh_context_manager = (
-            ssh_manager_factory.instance.create_tunnel(
+            ssh_manager_factory.instance.tunnel(
                 ssh_tunnel=ssh_tunnel,
                 sqlalchemy_database_uri=sqlalchemy_uri,
             )
@@ -461,6 +511,13 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
                         nullpool=nullpool,
                         source=source,
                         sqlalchemy_uri=sqlalchemy_uri,
+                        # pooled tunnels stay open on the same local port, which is
+                        # part of the URL in the key of the engine
+                        reuse_engine=engine_registry.enabled
+                        and (
+                            not ssh_tunnel
+                            or ssh_manager_factory.instance.is_pooled(ssh_tunnel)
+                        ),
                     )
 
     def _get_sqla_engine(  # pylint: disable=too-many-locals  # noqa: C901
@@ -470,6 +527,7 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
         nullpool: bool = True,
         source: utils.QuerySource | None = None,
         sqlalchemy_uri: str | None = None,
+        reuse_engine: bool = False,
     ) -> Engine:
         sqlalchemy_url = make_url_safe(
             sqlalchemy_uri if sqlalchemy_uri else self.sqlalchemy_uri_decrypted
@@ -478,7 +536,15 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
 
         extra = self.get_extra(source)
         engine_kwargs = extra.get("engine_params", {})
-        if nullpool:
+        if reuse_engine:
+            # registered engines are shared by requests, so they need a pool
+            if "poolclass" not in engine_kwargs:
+                engine_kwargs = {
+                    "poolclass": QueuePool,
+                    **engine_registry.pool_options,
+                    **engine_kwargs,
+                }
+        elif nullpool:
             engine_kwargs["poolclass"] = NullPool
         connect_args = engine_kwargs.setdefault("connect_args", {})
 
@@ -531,10 +597,35 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
                 security_manager,
                 source,
             )
-        try:
-            return create_engine(sqlalchemy_url, **engine_kwargs)
-        except Exception as ex:
-            raise self.db_engine_spec.get_dbapi_mapped_exception(ex) from ex
+
+        def create() -> Engine:
+            try:
+                return create_engine(sqlalchemy_url, **engine_kwargs)
+            except Exception as ex:
+                raise self.db_engine_spec.get_dbapi_mapped_exception(ex) from ex
+
+        if not reuse_engine:
+            return create()
+
+        # the final URL and parameters include the credentials of the user, eg,
+        # when impersonating or using OAuth2, any change to the connection, and the
+        # local port of the SSH tunnel, which changes when the tunnel is reopened
+        url = (
+            sqlalchemy_url.render_as_string(hide_password=False)
+            if isinstance(sqlalchemy_url, URL)
+            else str(sqlalchemy_url)
+        )
+        key = (
+            self.id,
+            self.changed_on,
+            catalog,
+            schema,
+            effective_username,
+            md5_sha_from_str(
+                f"{url}|{json.dumps(engine_kwargs, default=str, sort_keys=True)}"
+            ),
+        )
+        return engine_registry.get_engine(self.id, key, create)
 
     def add_database_to_signature(
         self,
@@ -651,13 +742,41 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
             )
         return sql_
 
-    def get_df(
+    def get_df(  # pylint: disable=too-many-arguments
         self,
         sql: str,
         catalog: str | None = None,
         schema: str | None = None,
         mutator: Callable[[pd.DataFrame], None] | None = None,
+        arrow_dtypes: bool = False,
     ) -> pd.DataFrame:
+        """
+        Run a query and return the results of its last statement as a dataframe.
+
+        The results are converted to pandas once, from the Arrow table returned by
+        `get_arrow_table`. When `arrow_dtypes` is set the columns are backed by the
+        Arrow data, with `pd.ArrowDtype`, instead of being copied to NumPy arrays
+        and, for strings and integers with NULLs, to Python objects.
+        """
+        table = self.get_arrow_table(sql, catalog, schema)
+        df = SupersetResultSet.convert_table_to_df(table, arrow_dtypes=arrow_dtypes)
+        # unless the dataframe is backed by them, the Arrow buffers can be released
+        del table
+
+        if mutator:
+            df = mutator(df)
+
+        return self.post_process_df(df)
+
+    def get_arrow_table(
+        self,
+        sql: str,
+        catalog: str | None = None,
+        schema: str | None = None,
+    ) -> pa.Table:
+        """
+        Run a query and return the results of its last statement as an Arrow table.
+        """
         script = SQLScript(sql, self.db_engine_spec.engine)
         with self.get_sqla_engine(catalog=catalog, schema=schema) as engine:
             engine_url = engine.url
@@ -674,7 +793,7 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
 
         with self.get_raw_connection(catalog=catalog, schema=schema) as conn:
             cursor = conn.cursor()
-            df = None
+            table = pa.table({})
             for i, statement in enumerate(script.statements):
                 sql_ = self.mutate_sql_based_on_config(
                     statement.format(),
@@ -690,33 +809,118 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
 
                 rows = self.fetch_rows(cursor, i == len(script.statements) - 1)
                 if rows is not None:
-                    df = self.load_into_dataframe(cursor.description, rows)
+                    table = self.load_into_arrow_table(cursor.description, rows)
 
-            if mutator:
-                df = mutator(df)
+            return table
 
-            return self.post_process_df(df)
+    def get_df_chunks(  # pylint: disable=too-many-arguments
+        self,
+        sql: str,
+        catalog: str | None = None,
+        schema: str | None = None,
+        chunk_size: int = 10_000,
+        max_chunk_bytes: int | None = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Run a query and yield its results as dataframes of at most `chunk_size` rows.
+
+        Rows are fetched in batches with `fetch_data_batches` of the DB engine spec,
+        so only one chunk is held in memory at a time. When `max_chunk_bytes` is set
+        the number of rows fetched at once is reduced every time a chunk is larger
+        than it. An empty result yields a single empty dataframe with the columns of
+        the result. DB engine specs not supporting streaming fetches read the whole
+        result with `get_df` instead.
+        """
+        if not self.db_engine_spec.supports_streaming_fetch:
+            yield self.get_df(sql, catalog, schema)
+            return
+
+        script = SQLScript(sql, self.db_engine_spec.engine)
+        with self.get_sqla_engine(catalog=catalog, schema=schema) as engine:
+            engine_url = engine.url
+
+        with self.get_raw_connection(catalog=catalog, schema=schema) as conn:
+            cursor = conn.cursor()
+            for i, statement in enumerate(script.statements):
+                sql_ = self.mutate_sql_based_on_config(
+                    statement.format(),
+                    is_split=True,
+                )
+                if log_query:
+                    log_query(engine_url, sql_, schema, __name__, security_manager)
+                with event_logger.log_context(
+                    action="execute_sql",
+                    database=self,
+                    object_ref=__name__,
+                ):
+                    self.db_engine_spec.execute(cursor, sql_, self)
+
+                # only the last statement returns data
+                if i < len(script.statements) - 1:
+                    cursor.fetchall()
+
+            empty = True
+            # a batch is fetched at a time, so that the size of the next one can be
+            # reduced
+            while rows := next(
+                self.db_engine_spec.fetch_data_batches(
+                    cursor, chunk_size, limit=chunk_size
+                ),
+                None,
+            ):
+                empty = False
+                result_set = SupersetResultSet(
+                    rows,
+                    cursor.description,
+                    self.db_engine_spec,
+                )
+                df = self.post_process_df(result_set.to_pandas_df())
+                del rows, result_set
+                if max_chunk_bytes:
+                    chunk_bytes = int(df.memory_usage(deep=True).sum())
+                    if chunk_bytes > max_chunk_bytes:
+                        chunk_size = max(1, chunk_size * max_chunk_bytes // chunk_bytes)
+                yield df
+
+            if empty and cursor.description:
+                # result sets without rows have no columns
+                columns = dedup([str(column[0]) for column in cursor.description])
+                yield self.post_process_df(pd.DataFrame(columns=columns))
 
     @event_logger.log_this
-    def fetch_rows(self, cursor: Any, last: bool) -> list[tuple[Any, ...]] | None:
+    def fetch_rows(
+        self, cursor: Any, last: bool
+    ) -> list[tuple[Any, ...]] | pa.Table | None:
         if not last:
             cursor.fetchall()
             return None
 
+        if self.db_engine_spec.supports_arrow_fetch and (
+            (table := self.db_engine_spec.fetch_arrow(cursor)) is not None
+        ):
+            return table
+
         return self.db_engine_spec.fetch_data(cursor)
 
     @event_logger.log_this
-    def load_into_dataframe(
+    def load_into_arrow_table(
         self,
         description: DbapiDescription,
-        data: list[tuple[Any, ...]],
-    ) -> pd.DataFrame:
-        result_set = SupersetResultSet(
-            data,
-            description,
-            self.db_engine_spec,
-        )
-        return result_set.to_pandas_df()
+        data: list[tuple[Any, ...]] | pa.Table,
+    ) -> pa.Table:
+        if isinstance(data, pa.Table):
+            result_set = SupersetResultSet.from_arrow(
+                data,
+                description,
+                self.db_engine_spec,
+            )
+        else:
+            result_set = SupersetResultSet(
+                data,
+                description,
+                self.db_engine_spec,
+            )
+        return result_set.pa_table
 
     def compile_sqla_query(
         self,
@@ -783,6 +987,8 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
     @cache_util.memoized_func(
         key="db:{self.id}:catalog:{catalog}:schema:{schema}:table_list",
         cache=cache_manager.cache,
+        revalidate=schedule_metadata_refresh,
+        stale_timeout=get_metadata_cache_stale_timeout,
     )
     def get_all_table_names_in_schema(
         self,
@@ -817,6 +1023,8 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
     @cache_util.memoized_func(
         key="db:{self.id}:catalog:{catalog}:schema:{schema}:view_list",
         cache=cache_manager.cache,
+        revalidate=schedule_metadata_refresh,
+        stale_timeout=get_metadata_cache_stale_timeout,
     )
     def get_all_view_names_in_schema(
         self,
@@ -865,6 +1073,8 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
     @cache_util.memoized_func(
         key="db:{self.id}:catalog:{catalog}:schema_list",
         cache=cache_manager.cache,
+        revalidate=schedule_metadata_refresh,
+        stale_timeout=get_metadata_cache_stale_timeout,
     )
     def get_all_schema_names(
         self,
@@ -894,6 +1104,8 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
     @cache_util.memoized_func(
         key="db:{self.id}:catalog_list",
         cache=cache_manager.cache,
+        revalidate=schedule_metadata_refresh,
+        stale_timeout=get_metadata_cache_stale_timeout,
     )
     def get_all_catalog_names(
         self,
@@ -1176,6 +1388,21 @@ sqla.event.listen(Database, "after_update", security_manager.database_after_upda
 sqla.event.listen(Database, "after_delete", security_manager.database_after_delete)
 
 
+def dispose_database_engines(
+    mapper: Mapper,  # pylint: disable=unused-argument
+    connection: Connection,  # pylint: disable=unused-argument
+    target: Database,
+) -> None:
+    """
+    Close the pooled connections of a database when it's updated or deleted.
+    """
+    engine_registry.dispose_database(target.id)
+
+
+sqla.event.listen(Database, "after_update", dispose_database_engines)
+sqla.event.listen(Database, "after_delete", dispose_database_engines)
+
+
 class DatabaseUserOAuth2Tokens(Model, AuditMixinNullable):
     """
     Store OAuth2 tokens, for authenticating to DBs using user personal tokens.
@@ -43,11 +43,16 @@ from flask_appbuilder.security.sqla.models import User
 from flask_babel import lazy_gettext as _
 from jinja2.exceptions import TemplateError
 from markupsafe import escape, Markup
-from sqlalchemy import and_, Column, or_, UniqueConstraint
+from sqlalchemy import and_, Column, or_, tuple_, UniqueConstraint
 from sqlalchemy.exc import MultipleResultsFound
 from sqlalchemy.ext.declarative import declared_attr
 from sqlalchemy.orm import Mapper, validates
-from sqlalchemy.sql.elements import ColumnElement, literal_column, TextClause
+from sqlalchemy.sql.elements import (
+    ClauseElement,
+    ColumnElement,
+    literal_column,
+    TextClause,
+)
 from sqlalchemy.sql.expression import Label, Select, TextAsFrom
 from sqlalchemy.sql.selectable import Alias, TableClause
 from sqlalchemy_utils import UUIDType
@@ -55,6 +60,7 @@ from sqlalchemy_utils import UUIDType
 from superset import app, db, is_feature_enabled
 from superset.advanced_data_type.types import AdvancedDataTypeResponse
 from superset.common.db_query_status import QueryStatus
+from superset.common.utils import filter_values_cache
 from superset.common.utils.time_range_utils import get_since_until_from_time_range
 from superset.constants import EMPTY_STRING, NULL_STRING
 from superset.db_engine_specs.base import TimestampExpression
@@ -913,9 +919,27 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
         :param columns_by_name: The mapping of columns by name
         :return: equivalent primitive python type
         """
+        return self._normalize_prequery_result_value(
+            row[dimension],
+            dimension,
+            columns_by_name,
+        )
 
-        value = row[dimension]
+    def _normalize_prequery_result_value(
+        self,
+        value: Any,
+        dimension: str,
+        columns_by_name: dict[str, "TableColumn"],
+    ) -> Union[str, int, float, bool, str]:
+        """
+        Convert a value of a prequery result to its equivalent Python type, see
+        `_normalize_prequery_result_type`.
 
+        :param value: A value of the dimension
+        :param dimension: The dimension name
+        :param columns_by_name: The mapping of columns by name
+        :return: equivalent primitive python type
+        """
         if isinstance(value, np.generic):
             value = value.item()
 
@@ -1233,6 +1257,56 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
     ) -> ColumnElement:
         raise NotImplementedError()
 
+    def _normalize_prequery_result_column(
+        self,
+        df: pd.DataFrame,
+        dimension: str,
+        columns_by_name: dict[str, "TableColumn"],
+    ) -> list[Any]:
+        """
+        Convert the values of a prequery result column to their equivalent Python type.
+
+        This is equivalent to calling `_normalize_prequery_result_value` for each value,
+        but only the strings of temporal columns, which may need to be converted to SQL
+        expressions, are converted one by one, and only once for each distinct value.
+
+        :param df: The prequery result
+        :param dimension: The dimension name
+        :param columns_by_name: The mapping of columns by name
+        :return: The equivalent primitive Python values
+        """
+        series = df[dimension]
+        values = series.tolist()
+        # only object columns hold NumPy scalars, and only string columns, including
+        # the ones backed by Arrow, hold strings
+        if not pd.api.types.is_string_dtype(series.dtype):
+            return values
+
+        values = [
+            value.item() if isinstance(value, np.generic) else value for value in values
+        ]
+
+        column_ = columns_by_name.get(dimension)
+        is_temporal = (
+            bool(column_.get("type") and column_.get("is_temporal"))
+            if isinstance(column_, dict)
+            else bool(column_ and column_.type and column_.is_temporal)
+        )
+        if not is_temporal:
+            return values
+
+        converted: dict[str, Any] = {}
+        for value in values:
+            if isinstance(value, str) and value not in converted:
+                converted[value] = self._normalize_prequery_result_value(
+                    value,
+                    dimension,
+                    columns_by_name,
+                )
+        return [
+            converted[value] if isinstance(value, str) else value for value in values
+        ]
+
     def _get_top_groups(
         self,
         df: pd.DataFrame,
@@ -1240,19 +1314,55 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
         groupby_exprs: dict[str, Any],
         columns_by_name: dict[str, "TableColumn"],
     ) -> ColumnElement:
-        groups = []
-        for _unused, row in df.iterrows():
-            group = []
-            for dimension in dimensions:
-                value = self._normalize_prequery_result_type(
-                    row,
-                    dimension,
-                    columns_by_name,
-                )
+        """
+        Build the predicate restricting a query to the top groups of the prequery.
+
+        Groups are matched with `IN` on the dimension, or on the tuple of dimensions
+        when the database supports it, instead of an `OR` of equalities for each group.
+        Groups with NULL values or values converted to SQL expressions are still
+        matched with equalities, since `IN` can't match them.
+
+        :param df: The prequery result
+        :param dimensions: The names of the dimensions
+        :param groupby_exprs: The expressions of the dimensions, by name
+        :param columns_by_name: The mapping of columns by name
+        :return: The predicate
+        """
+        exprs = [groupby_exprs[dimension] for dimension in dimensions]
+        rows = list(
+            zip(
+                *(
+                    self._normalize_prequery_result_column(
+                        df,
+                        dimension,
+                        columns_by_name,
+                    )
+                    for dimension in dimensions
+                ),
+                strict=False,
+            )
+        )
+
+        literal_rows = []
+        other_rows = []
+        for row in rows:
+            if any(value is None or isinstance(value, ClauseElement) for value in row):
+                other_rows.append(row)
+            else:
+                literal_rows.append(row)
 
-                group.append(groupby_exprs[dimension] == value)
-            groups.append(and_(*group))
+        groups: list[ColumnElement] = []
+        if len(exprs) == 1 and literal_rows:
+            groups.append(exprs[0].in_([row[0] for row in literal_rows]))
+        elif self.db_engine_spec.supports_tuple_in and literal_rows:
+            groups.append(tuple_(*exprs).in_(literal_rows))
+        else:
+            other_rows = literal_rows + other_rows
 
+        groups.extend(
+            and_(*[expr == value for expr, value in zip(exprs, row, strict=False)])
+            for row in other_rows
+        )
         return or_(*groups)
 
     def dttm_sql_literal(self, dttm: datetime, col: "TableColumn") -> str:
@@ -1328,6 +1438,7 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
         column_name: str,
         limit: int = 10000,
         denormalize_column: bool = False,
+        prefix: Optional[str] = None,
     ) -> list[Any]:
         # denormalize column name before querying for values
         # unless disabled in the dataset configuration
@@ -1341,28 +1452,37 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
         target_col = cols[column_name_]
         tp = self.get_template_processor()
         tbl, cte = self.get_from_clause(tp)
-
-        qry = (
-            sa.select(
-                # The alias (label) here is important because some dialects will
-                # automatically add a random alias to the projection because of the
-                # call to DISTINCT; others will uppercase the column names. This
-                # gives us a deterministic column name in the dataframe.
-                [target_col.get_sqla_col(template_processor=tp).label("column_values")]
+        sqla_col = target_col.get_sqla_col(template_processor=tp)
+
+        def get_sql(
+            engine: sa.engine.Engine, limit: Optional[int], prefix: Optional[str]
+        ) -> str:
+            qry = (
+                sa.select(
+                    # The alias (label) here is important because some dialects will
+                    # automatically add a random alias to the projection because of
+                    # the call to DISTINCT; others will uppercase the column names.
+                    # This gives us a deterministic column name in the dataframe.
+                    [sqla_col.label("column_values")]
+                )
+                .select_from(tbl)
+                .distinct()
             )
-            .select_from(tbl)
-            .distinct()
-        )
-        if limit:
-            qry = qry.limit(limit)
+            if prefix is not None:
+                qry = qry.where(
+                    sa.func.lower(sa.cast(sqla_col, sa.String)).startswith(
+                        prefix.lower(), autoescape=True
+                    )
+                )
+            if limit:
+                qry = qry.limit(limit)
 
-        if self.fetch_values_predicate:
-            qry = qry.where(self.get_fetch_values_predicate(template_processor=tp))
+            if self.fetch_values_predicate:
+                qry = qry.where(self.get_fetch_values_predicate(template_processor=tp))
 
-        rls_filters = self.get_sqla_row_level_filters(template_processor=tp)
-        qry = qry.where(and_(*rls_filters))
+            rls_filters = self.get_sqla_row_level_filters(template_processor=tp)
+            qry = qry.where(and_(*rls_filters))
 
-        with self.database.get_sqla_engine() as engine:
             sql = str(qry.compile(engine, compile_kwargs={"literal_binds": True}))
             sql = self._apply_cte(sql, cte)
             sql = self.database.mutate_sql_based_on_config(sql)
@@ -1370,12 +1490,30 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
             # pylint: disable=protected-access
             if engine.dialect.identifier_preparer._double_percents:
                 sql = sql.replace("%%", "%")
+            return sql
 
-            with engine.connect() as con:
-                df = pd.read_sql_query(sql=self.text(sql), con=con)
-                # replace NaN with None to ensure it can be serialized to JSON
-                df = df.replace({np.nan: None})
-                return df["column_values"].to_list()
+        # prefix searches are run on more values than returned, queried with the
+        # prefix when the column has even more values
+        max_values = (
+            config["FILTER_VALUES_SEARCH_ROW_LIMIT"] if prefix is not None else limit
+        )
+        with self.database.get_sqla_engine(
+            catalog=self.catalog, schema=self.schema
+        ) as engine:
+            sql = get_sql(engine, max_values, None)
+            return filter_values_cache.get_values(
+                self.database,
+                sql,
+                lambda: filter_values_cache.fetch_values(engine, self.text(sql)),
+                prefix=prefix,
+                limit=limit,
+                catalog=self.catalog,
+                schema=self.schema,
+                max_values=max_values,
+                load_matches=lambda: filter_values_cache.fetch_values(
+                    engine, self.text(get_sql(engine, limit, prefix))
+                ),
+            )
 
     def get_timestamp_expression(
         self,
@@ -18,6 +18,7 @@
 
 import datetime
 import logging
+from collections.abc import Iterable, Sequence
 from typing import Any, Optional
 
 import numpy as np
@@ -63,21 +64,34 @@ def stringify(obj: Any) -> str:
     return json.dumps(obj, default=json.json_iso_dttm_ser)
 
 
+def _stringify_value(value: Any) -> str:
+    if isinstance(value, str):
+        return value
+    cell = np.empty(1, dtype=object)
+    cell[0] = value
+    try:
+        # for simple string conversions
+        # this handles odd character types better
+        return cell.astype(str)[0]
+    except ValueError:
+        return stringify(value)
+
+
 def stringify_values(array: NDArray[Any]) -> NDArray[Any]:
-    result = np.copy(array)
-
-    with np.nditer(result, flags=["refs_ok"], op_flags=[["readwrite"]]) as it:
-        for obj in it:
-            if na_obj := pd.isna(obj):
-                # pandas <NA> type cannot be converted to string
-                obj[na_obj] = None
-            else:
-                try:
-                    # for simple string conversions
-                    # this handles odd character types better
-                    obj[...] = obj.astype(str)
-                except ValueError:
-                    obj[...] = stringify(obj)
+    """
+    Convert every non-null value of a 1-D object array to a string.
+
+    Values are converted one by one into an object array, rather than casting the
+    whole array to a fixed-width NumPy string array, whose size would be the length
+    of the longest value times the number of rows. Values that NumPy can't cast
+    (e.g. nested sequences) are serialized as JSON instead.
+    """
+    values = array.astype(object, copy=False)
+    result = np.empty(values.shape, dtype=object)
+    # pandas <NA> type cannot be converted to string
+    mask = pd.isna(values)
+    result[~mask] = [_stringify_value(value) for value in values[~mask]]
+    result[mask] = None
 
     return result
 
@@ -100,6 +114,9 @@ def convert_to_string(value: Any) -> str:
 
 
 class SupersetResultSet:
+    # whether rows were left out to keep the result within a byte budget
+    truncated = False
+
     def __init__(  # pylint: disable=too-many-locals  # noqa: C901
         self,
         data: DbapiResult,
@@ -111,8 +128,7 @@ class SupersetResultSet:
         column_names: list[str] = []
         pa_data: list[pa.Array] = []
         deduped_cursor_desc: list[tuple[Any, ...]] = []
-        numpy_dtype: list[tuple[str, ...]] = []
-        stringified_arr: NDArray[Any]
+        columns: list[tuple[Any, ...]] = []
 
         if cursor_description:
             # get deduped list of column names
@@ -128,48 +144,47 @@ class SupersetResultSet:
                 )
             ]
 
-            # generate numpy structured array dtype
-            numpy_dtype = [(column_name, "object") for column_name in column_names]
-
-        # only do expensive recasting if datatype is not standard list of tuples
-        if data and (not isinstance(data, list) or not isinstance(data[0], tuple)):
-            data = [tuple(row) for row in data]
-        array = np.array(data, dtype=numpy_dtype)
-        if array.size > 0:
-            for column in column_names:
-                try:
-                    pa_data.append(pa.array(array[column].tolist()))
-                except (
-                    pa.lib.ArrowInvalid,
-                    pa.lib.ArrowTypeError,
-                    pa.lib.ArrowNotImplementedError,
-                    ValueError,
-                    TypeError,  # this is super hackey,
-                    # https://issues.apache.org/jira/browse/ARROW-7855
-                ):
-                    # attempt serialization of values as strings
-                    stringified_arr = stringify_values(array[column])
-                    pa_data.append(pa.array(stringified_arr.tolist()))
+        # transpose the rows into one buffer per column in a single pass, so
+        # that Arrow can infer the type of each column from a flat sequence
+        if data and column_names:
+            columns = list(zip(*data, strict=True))[: len(column_names)]
+
+        for column in columns:
+            try:
+                pa_data.append(pa.array(column))
+            except (
+                pa.lib.ArrowInvalid,
+                pa.lib.ArrowTypeError,
+                pa.lib.ArrowNotImplementedError,
+                ValueError,
+                TypeError,  # this is super hackey,
+                # https://issues.apache.org/jira/browse/ARROW-7855
+            ):
+                # attempt serialization of values as strings
+                pa_data.append(
+                    pa.array(stringify_values(self._to_object_array(column)))
+                )
 
         if pa_data:  # pylint: disable=too-many-nested-blocks
-            for i, column in enumerate(column_names):
+            for i, column in enumerate(columns):
                 if pa.types.is_nested(pa_data[i].type):
                     # TODO: revisit nested column serialization once nested types
                     #  are added as a natively supported column type in Superset
                     #  (superset.utils.core.GenericDataType).
-                    stringified_arr = stringify_values(array[column])
-                    pa_data[i] = pa.array(stringified_arr.tolist())
+                    pa_data[i] = pa.array(
+                        stringify_values(self._to_object_array(column))
+                    )
 
                 elif pa.types.is_temporal(pa_data[i].type):
                     # workaround for bug converting
                     # `psycopg2.tz.FixedOffsetTimezone` tzinfo values.
                     # related: https://issues.apache.org/jira/browse/ARROW-5248
-                    sample = self.first_nonempty(array[column])
+                    sample = self.first_nonempty(column)
                     if sample and isinstance(sample, datetime.datetime):
                         try:
                             if sample.tzinfo:
                                 tz = sample.tzinfo
-                                series = pd.Series(array[column])
+                                series = pd.Series(column, dtype=object)
                                 series = pd.to_datetime(series)
                                 pa_data[i] = pa.Array.from_pandas(
                                     series,
@@ -182,16 +197,140 @@ class SupersetResultSet:
             column_names = []
 
         self.table = pa.Table.from_arrays(pa_data, names=column_names)
-        self._type_dict: dict[str, Any] = {}
+        self._type_dict = self._get_type_dict(column_names, deduped_cursor_desc)
+
+    @classmethod
+    def from_arrow(
+        cls,
+        table: pa.Table,
+        cursor_description: DbapiDescription,
+        db_engine_spec: type[BaseEngineSpec],
+    ) -> "SupersetResultSet":
+        """
+        Build a result set from an Arrow table returned by the driver.
+
+        Used for DB engine specs that support ``fetch_arrow``, so that the values
+        are never converted to Python objects. Empty and nested columns are
+        handled the same way as when building the result set from rows.
+        """
+        result_set = cls.__new__(cls)
+        result_set.db_engine_spec = db_engine_spec
+
+        if not table.num_rows:
+            table = pa.table({})
+
+        column_names = dedup([convert_to_string(name) for name in table.column_names])
+        pa_data = [
+            pa.array(stringify_values(cls._to_object_array(column.to_pylist())))
+            if pa.types.is_nested(column.type)
+            else column
+            for column in table.columns
+        ]
+        result_set.table = pa.Table.from_arrays(pa_data, names=column_names)
+
+        deduped_cursor_desc = [
+            tuple([column_name, *list(description)[1:]])  # noqa: C409
+            for column_name, description in zip(
+                column_names, cursor_description or [], strict=False
+            )
+        ]
+        result_set._type_dict = result_set._get_type_dict(
+            column_names,
+            deduped_cursor_desc,
+        )
+        return result_set
+
+    @classmethod
+    def from_batches(
+        cls,
+        batches: Iterable[DbapiResult],
+        cursor_description: DbapiDescription,
+        db_engine_spec: type[BaseEngineSpec],
+        max_bytes: Optional[int] = None,
+    ) -> "SupersetResultSet":
+        """
+        Build a result set from batches of rows, as they are fetched.
+
+        Each batch is converted to Arrow before the next one is consumed, so only
+        one batch of Python objects is held in memory. When `max_bytes` is set no
+        more batches are consumed once the Arrow data reaches it, the rows beyond it
+        are left out and the result set is flagged as `truncated`.
+        """
+        tables: list[pa.Table] = []
+        size = 0
+        truncated = False
+        for batch in batches:
+            table = cls(batch, cursor_description, db_engine_spec).table
+            if not table.num_rows:
+                continue
+            if max_bytes is not None and size + table.nbytes > max_bytes:
+                rows = table.num_rows * (max_bytes - size) // table.nbytes
+                tables.append(table.slice(0, rows))
+                truncated = True
+                break
+            tables.append(table)
+            size += table.nbytes
+
+        result_set = cls.from_arrow(
+            cls._concat_tables(tables),
+            cursor_description,
+            db_engine_spec,
+        )
+        result_set.truncated = truncated
+        return result_set
+
+    @classmethod
+    def _concat_tables(cls, tables: list[pa.Table]) -> pa.Table:
+        if not tables:
+            return pa.table({})
+
+        try:
+            return pa.concat_tables(tables, promote_options="permissive")
+        except (
+            pa.lib.ArrowInvalid,
+            pa.lib.ArrowTypeError,
+            pa.lib.ArrowNotImplementedError,
+        ):
+            pass
+
+        # a column can be inferred with types that can't be unified in different
+        # batches, it is then converted to strings, as when building the result set
+        # from all the rows at once
+        pa_data = []
+        for i in range(tables[0].num_columns):
+            try:
+                pa_data.append(
+                    pa.concat_tables(
+                        [table.select([i]) for table in tables],
+                        promote_options="permissive",
+                    ).column(0)
+                )
+            except (
+                pa.lib.ArrowInvalid,
+                pa.lib.ArrowTypeError,
+                pa.lib.ArrowNotImplementedError,
+            ):
+                values = [
+                    value for table in tables for value in table.column(i).to_pylist()
+                ]
+                pa_data.append(pa.array(stringify_values(cls._to_object_array(values))))
+        return pa.Table.from_arrays(pa_data, names=tables[0].column_names)
+
+    def _get_type_dict(
+        self,
+        column_names: list[str],
+        deduped_cursor_desc: list[tuple[Any, ...]],
+    ) -> dict[str, Any]:
         try:
             # The driver may not be passing a cursor.description
-            self._type_dict = {
-                col: db_engine_spec.get_datatype(deduped_cursor_desc[i][1])
+            return {
+                col: self.db_engine_spec.get_datatype(deduped_cursor_desc[i][1])
                 for i, col in enumerate(column_names)
                 if deduped_cursor_desc
             }
         except Exception as ex:  # pylint: disable=broad-except
             logger.exception(ex)
+        return {}
 
     @staticmethod
     def convert_pa_dtype(pa_dtype: pa.DataType) -> Optional[str]:
@@ -208,14 +347,27 @@ class SupersetResultSet:
         return None
 
     @staticmethod
-    def convert_table_to_df(table: pa.Table) -> pd.DataFrame:
+    def convert_table_to_df(
+        table: pa.Table,
+        arrow_dtypes: bool = False,
+    ) -> pd.DataFrame:
+        if arrow_dtypes:
+            # the columns wrap the Arrow arrays, so values are neither copied nor
+            # converted, and timestamps out of the range of pandas are preserved
+            return table.to_pandas(types_mapper=pd.ArrowDtype)
         try:
             return table.to_pandas(integer_object_nulls=True)
         except pa.lib.ArrowInvalid:
             return table.to_pandas(integer_object_nulls=True, timestamp_as_object=True)
 
     @staticmethod
-    def first_nonempty(items: NDArray[Any]) -> Any:
+    def _to_object_array(values: Sequence[Any]) -> NDArray[Any]:
+        # building the array from an iterator keeps NumPy from broadcasting
+        # nested values (lists, tuples) into extra dimensions
+        return np.fromiter(values, dtype=object, count=len(values))
+
+    @staticmethod
+    def first_nonempty(items: Iterable[Any]) -> Any:
         return next((i for i in items if i), None)
 
     def is_temporal(self, db_type_str: Optional[str]) -> bool:
@@ -246,8 +398,8 @@ class SupersetResultSet:
 
         return None
 
-    def to_pandas_df(self) -> pd.DataFrame:
-        return self.convert_table_to_df(self.table)
+    def to_pandas_df(self, arrow_dtypes: bool = False) -> pd.DataFrame:
+        return self.convert_table_to_df(self.table, arrow_dtypes=arrow_dtypes)
 
     @property
     def pa_table(self) -> pa.Table:
@@ -0,0 +1,121 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Caching of values derived from the security metadata, eg, the RLS filters or the
+permissions of a set of roles, in the default cache.
+
+The values are stored under keys that include a version, and replacing the version
+when the metadata changes invalidates all of them at once, in every process.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Callable, Optional, TypeVar
+from uuid import uuid4
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def get_version(version_key: str) -> Optional[str]:
+    """
+    Return the current version of the cached values, if the cache is available.
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.extensions import cache_manager
+
+    cache = cache_manager.cache
+    try:
+        # a new version is set when the version is evicted from the cache, so that
+        # values cached under a previous version are never used
+        if version := cache.get(version_key):
+            return version
+        cache.add(version_key, uuid4().hex, timeout=0)
+        return cache.get(version_key)
+    except Exception:  # pylint: disable=broad-except
+        logger.warning(
+            "Unable to read the cache version %s", version_key, exc_info=True
+        )
+        return None
+
+
+def invalidate(version_key: str) -> None:
+    """
+    Invalidate all the values cached under a version.
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.extensions import cache_manager
+
+    try:
+        cache_manager.cache.set(version_key, uuid4().hex, timeout=0)
+    except Exception:  # pylint: disable=broad-except
+        logger.warning("Unable to invalidate the cache version %s", version_key)
+
+
+def invalidate_on_commit(session: Session, version_key: str) -> None:
+    """
+    Invalidate all the values cached under a version once the session is committed,
+    so that they are not cached again from the data being changed.
+    """
+    event.listen(
+        session,
+        "after_commit",
+        lambda _: invalidate(version_key),
+        once=True,
+    )
+
+
+def get_or_load(
+    version: Optional[str],
+    key: str,
+    load: Callable[[], T],
+    timeout: int,
+) -> T:
+    """
+    Return the value cached under a version, loading and caching it if needed.
+
+    :param version: The current version, values are not cached without one
+    :param key: The key of the value, within the version
+    :param load: A function returning the value
+    :param timeout: The cache timeout
+    :returns: The value
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.extensions import cache_manager
+
+    if not version:
+        return load()
+
+    cache = cache_manager.cache
+    cache_key = f"{key}_{version}"
+    try:
+        if (value := cache.get(cache_key)) is not None:
+            return value
+    except Exception:  # pylint: disable=broad-except
+        logger.warning("Unable to read the cached value %s", key, exc_info=True)
+
+    value = load()
+    try:
+        cache.set(cache_key, value, timeout=timeout)
+    except Exception:  # pylint: disable=broad-except
+        logger.warning("Unable to cache the value %s", key, exc_info=True)
+    return value
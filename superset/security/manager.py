@@ -28,10 +28,7 @@ from flask_appbuilder import Model
 from flask_appbuilder.security.sqla.apis import RoleApi, UserApi
 from flask_appbuilder.security.sqla.manager import SecurityManager
 from flask_appbuilder.security.sqla.models import (
-    assoc_group_role,
     assoc_permissionview_role,
-    assoc_user_group,
-    assoc_user_role,
     Permission,
     PermissionView,
     Role,
@@ -47,12 +44,10 @@ from flask_appbuilder.widgets import ListWidget
 from flask_babel import lazy_gettext as _
 from flask_login import AnonymousUserMixin, LoginManager
 from jwt.api_jwt import _jwt_global_obj
-from sqlalchemy import and_, inspect, or_
+from sqlalchemy import and_, event as sqla_event, inspect, or_
 from sqlalchemy.engine.base import Connection
 from sqlalchemy.orm import eagerload
 from sqlalchemy.orm.mapper import Mapper
-from sqlalchemy.orm.query import Query as SqlaQuery
-from sqlalchemy.sql import exists
 
 from superset.constants import RouteMethod
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
@@ -60,6 +55,7 @@ from superset.exceptions import (
     DatasetInvalidPermissionEvaluationException,
     SupersetSecurityException,
 )
+from superset.security import cache as security_cache
 from superset.security.guest_token import (
     GuestToken,
     GuestTokenResources,
@@ -104,6 +100,20 @@ class DatabaseCatalogSchema(NamedTuple):
     schema: str
 
 
+class RLSFilter(NamedTuple):
+    id: int
+    group_key: Optional[str]
+    clause: str
+
+
+RLS_FILTERS_VERSION_CACHE_KEY = "rls_filters_version"
+PERMISSIONS_VERSION_CACHE_KEY = "permissions_version"
+PERMISSION_INDEXES_MAX_SIZE = 1000
+
+# the names of the view menus of each permission granted to a set of roles
+PermissionIndex = dict[str, frozenset[str]]
+
+
 class SupersetSecurityListWidget(ListWidget):  # pylint: disable=too-few-public-methods
     """
     Redeclaring to avoid circular imports
@@ -247,6 +257,10 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
     role_api = SupersetRoleApi
     user_api = SupersetUserApi
 
+    # permission indexes of the sets of roles, for the current permissions version
+    _permission_indexes: dict[tuple[int, ...], PermissionIndex] = {}
+    _permission_indexes_version: Optional[str] = None
+
     USER_MODEL_VIEWS = {
         "RegisterUserModelView",
         "UserDBModelView",
@@ -763,45 +777,143 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         return True
 
     def user_view_menu_names(self, permission_name: str) -> set[str]:
-        base_query = (
-            self.get_session.query(self.viewmenu_model.name)
-            .join(self.permissionview_model)
+        # guest users only have the access granted by their token
+        if self.is_guest_user():
+            return set()
+
+        roles = self.get_user_roles(g.user)
+        if not self._is_permission_index_cached():
+            # without a cache only the view menus of the permission are queried
+            role_ids = tuple({role.id for role in roles if role})
+            return set(
+                self._get_permission_index(role_ids, permission_name).get(
+                    permission_name, ()
+                )
+            )
+        return set(self.get_permission_index(roles).get(permission_name, ()))
+
+    def _has_view_access(
+        self, user: object, permission_name: str, view_name: str
+    ) -> bool:
+        if not self._is_permission_index_cached():
+            # checking a single permission is cheaper than building the index
+            return super()._has_view_access(user, permission_name, view_name)
+
+        roles = self.get_user_roles(user)
+
+        if any(
+            role.name in self.builtin_roles
+            and self._has_access_builtin_roles(role, permission_name, view_name)
+            for role in roles
+        ):
+            return True
+
+        db_roles = [role for role in roles if role.name not in self.builtin_roles]
+        return view_name in self.get_permission_index(db_roles).get(permission_name, ())
+
+    def get_permission_index(self, roles: list[Role]) -> PermissionIndex:
+        """
+        Returns the names of the view menus of each permission granted to the roles.
+
+        The index of each set of roles is built with a single query, and cached in the
+        process and in the cache until the permissions of any role change, so that
+        access checks don't need to query the metadata database.
+
+        :param roles: The roles
+        :returns: The view menu names, by permission name
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.utils.cache import memoize_per_request
+
+        role_ids = tuple(sorted({role.id for role in roles if role}))
+        if not role_ids:
+            return {}
+
+        version = memoize_per_request(
+            (PERMISSIONS_VERSION_CACHE_KEY,),
+            lambda: security_cache.get_version(PERMISSIONS_VERSION_CACHE_KEY),
+        )
+        if version is None:
+            return memoize_per_request(
+                ("permission_index", role_ids),
+                lambda: self._get_permission_index(role_ids),
+            )
+
+        # the in-process copy is only valid for the current version
+        if self._permission_indexes_version != version:
+            self._permission_indexes = {}
+            self._permission_indexes_version = version
+
+        if (index := self._permission_indexes.get(role_ids)) is None:
+            index = security_cache.get_or_load(
+                version,
+                f"permission_index_{'_'.join(map(str, role_ids))}",
+                lambda: self._get_permission_index(role_ids),
+                current_app.config["PERMISSION_INDEX_CACHE_TIMEOUT"],
+            )
+            if len(self._permission_indexes) >= PERMISSION_INDEXES_MAX_SIZE:
+                self._permission_indexes = {}
+            self._permission_indexes[role_ids] = index
+
+        return index
+
+    @staticmethod
+    def _is_permission_index_cached() -> bool:
+        # pylint: disable=import-outside-toplevel
+        from flask_caching.backends import NullCache
+
+        from superset.extensions import cache_manager
+
+        return not isinstance(cache_manager.cache.cache, NullCache)
+
+    def _get_permission_index(
+        self,
+        role_ids: tuple[int, ...],
+        permission_name: Optional[str] = None,
+    ) -> PermissionIndex:
+        query = (
+            self.get_session.query(self.permission_model.name, self.viewmenu_model.name)
+            .select_from(self.permissionview_model)
             .join(self.permission_model)
+            .join(self.viewmenu_model)
             .join(assoc_permissionview_role)
-            .join(self.role_model)
-        )
-
-        if not g.user.is_anonymous:
-            user_id = get_user_id()
-
-            user_roles_filter = or_(
-                exists().where(
-                    (assoc_user_role.c.user_id == user_id)
-                    & (assoc_user_role.c.role_id == self.role_model.id)
-                    & (self.permission_model.name == permission_name)
-                ),
-                exists().where(
-                    (assoc_user_group.c.user_id == user_id)
-                    & (assoc_user_group.c.group_id == self.group_model.id)
-                    & (assoc_group_role.c.group_id == self.group_model.id)
-                    & (assoc_group_role.c.role_id == self.role_model.id)
-                    & (self.permission_model.name == permission_name)
-                ),
-            )
-
-            view_menu_names = base_query.filter(user_roles_filter).all()
-            return {s.name for s in view_menu_names}
-
-        # Properly treat anonymous user
-        if public_role := self.get_public_role():
-            # filter by public role
-            view_menu_names = (
-                base_query.filter(self.role_model.id == public_role.id).filter(
-                    self.permission_model.name == permission_name
-                )
-            ).all()
-            return {s.name for s in view_menu_names}
-        return set()
+            .filter(assoc_permissionview_role.c.role_id.in_(role_ids))
+            .distinct()
+        )
+        if permission_name is not None:
+            query = query.filter(self.permission_model.name == permission_name)
+
+        index: dict[str, set[str]] = defaultdict(set)
+        for permission_name, view_menu_name in query:
+            index[permission_name].add(view_menu_name)
+        return {name: frozenset(view_menus) for name, view_menus in index.items()}
+
+    def invalidate_permission_index(self) -> None:
+        """
+        Invalidates the cached permissions of all the roles once the change being
+        made to the permissions is committed.
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.utils.cache import forget_per_request
+
+        def forget_permission_indexes() -> None:
+            self._permission_indexes = {}
+            forget_per_request(
+                lambda key: isinstance(key, tuple)
+                and key[0] in (PERMISSIONS_VERSION_CACHE_KEY, "permission_index")
+            )
+
+        # the indexes are discarded again once committed, in case they were loaded
+        # from the permissions being changed in the meantime
+        forget_permission_indexes()
+        session = self.get_session()
+        security_cache.invalidate_on_commit(session, PERMISSIONS_VERSION_CACHE_KEY)
+        sqla_event.listen(
+            session,
+            "after_commit",
+            lambda _: forget_permission_indexes(),
+            once=True,
+        )
 
     def get_accessible_databases(self) -> list[int]:
         """
@@ -2100,6 +2212,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         :param connection: The DB-API connection
         :param target: The mapped instance being changed
         """
+        self.invalidate_permission_index()
 
     def on_view_menu_after_insert(
         self, mapper: Mapper, connection: Connection, target: ViewMenu
@@ -2132,6 +2245,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         :param connection: The DB-API connection
         :param target: The mapped instance being persisted
         """
+        self.invalidate_permission_index()
 
     def on_permission_after_insert(
         self, mapper: Mapper, connection: Connection, target: Permission
@@ -2164,6 +2278,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         :param connection: The DB-API connection
         :param target: The mapped instance being persisted
         """
+        self.invalidate_permission_index()
 
     def on_permission_view_after_delete(
         self, mapper: Mapper, connection: Connection, target: PermissionView
@@ -2180,6 +2295,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         :param connection: The DB-API connection
         :param target: The mapped instance being persisted
         """
+        self.invalidate_permission_index()
 
     @staticmethod
     def get_exclude_users_from_lists() -> list[str]:
@@ -2496,7 +2612,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             ]
         return []
 
-    def get_rls_filters(self, table: "BaseDatasource") -> list[SqlaQuery]:
+    def get_rls_filters(self, table: "BaseDatasource") -> list[RLSFilter]:
         """
         Retrieves the appropriate row level security filters for the current user and
         the passed table.
@@ -2504,10 +2620,49 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         :param table: The table to check against
         :returns: A list of filters
         """
+        return self.get_rls_filters_for_tables([table])[table.id]
+
+    def get_rls_filters_for_tables(
+        self, tables: list["BaseDatasource"]
+    ) -> dict[int, list[RLSFilter]]:
+        """
+        Retrieves the row level security filters for the current user and several
+        tables at once.
+
+        The filters of all the tables are resolved with a single query for the roles
+        of the user, which is cached for the duration of the request, and in the
+        cache until the RLS filters change.
 
+        :param tables: The tables to check against
+        :returns: The list of filters of each table, by table ID
+        """
         if not (hasattr(g, "user") and g.user is not None):
-            return []
+            return {table.id: [] for table in tables}
+
+        # pylint: disable=import-outside-toplevel
+        from superset.utils.cache import memoize_per_request
+
+        role_ids = tuple(sorted(role.id for role in self.get_user_roles(g.user)))
+        filters = memoize_per_request(
+            ("rls_filters", role_ids),
+            lambda: security_cache.get_or_load(
+                security_cache.get_version(RLS_FILTERS_VERSION_CACHE_KEY),
+                f"rls_filters_{'_'.join(map(str, role_ids))}",
+                lambda: self._get_rls_filters_by_table(role_ids),
+                current_app.config["RLS_FILTERS_CACHE_TIMEOUT"],
+            ),
+        )
+        return {table.id: list(filters.get(table.id, [])) for table in tables}
+
+    def _get_rls_filters_by_table(
+        self, role_ids: tuple[int, ...]
+    ) -> dict[int, list[RLSFilter]]:
+        """
+        Retrieves the row level security filters of all the tables for a set of roles.
 
+        :param role_ids: The IDs of the roles of the user
+        :returns: The list of filters of each table with filters, by table ID
+        """
         # pylint: disable=import-outside-toplevel
         from superset.connectors.sqla.models import (
             RLSFilterRoles,
@@ -2515,14 +2670,13 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             RowLevelSecurityFilter,
         )
 
-        user_roles = [role.id for role in self.get_user_roles(g.user)]
         regular_filter_roles = (
             self.get_session.query(RLSFilterRoles.c.rls_filter_id)
             .join(RowLevelSecurityFilter)
             .filter(
                 RowLevelSecurityFilter.filter_type == RowLevelSecurityFilterType.REGULAR
             )
-            .filter(RLSFilterRoles.c.role_id.in_(user_roles))
+            .filter(RLSFilterRoles.c.role_id.in_(role_ids))
         )
         base_filter_roles = (
             self.get_session.query(RLSFilterRoles.c.rls_filter_id)
@@ -2530,18 +2684,19 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             .filter(
                 RowLevelSecurityFilter.filter_type == RowLevelSecurityFilterType.BASE
             )
-            .filter(RLSFilterRoles.c.role_id.in_(user_roles))
-        )
-        filter_tables = self.get_session.query(RLSFilterTables.c.rls_filter_id).filter(
-            RLSFilterTables.c.table_id == table.id
+            .filter(RLSFilterRoles.c.role_id.in_(role_ids))
         )
         query = (
             self.get_session.query(
+                RLSFilterTables.c.table_id,
                 RowLevelSecurityFilter.id,
                 RowLevelSecurityFilter.group_key,
                 RowLevelSecurityFilter.clause,
             )
-            .filter(RowLevelSecurityFilter.id.in_(filter_tables))
+            .join(
+                RLSFilterTables,
+                RLSFilterTables.c.rls_filter_id == RowLevelSecurityFilter.id,
+            )
             .filter(
                 or_(
                     and_(
@@ -2556,10 +2711,33 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
                     ),
                 )
             )
+            .order_by(RowLevelSecurityFilter.id)
         )
-        return query.all()
 
-    def get_rls_sorted(self, table: "BaseDatasource") -> list["RowLevelSecurityFilter"]:
+        filters: dict[int, list[RLSFilter]] = defaultdict(list)
+        for table_id, filter_id, group_key, clause in query:
+            filters[table_id].append(RLSFilter(filter_id, group_key, clause))
+        return dict(filters)
+
+    def rls_filter_after_change(
+        self,
+        mapper: Mapper,
+        connection: Connection,
+        target: "RowLevelSecurityFilter",
+    ) -> None:
+        """
+        Invalidates the cached RLS filters once a change to a filter is committed,
+        including changes to its tables and roles.
+
+        :param mapper: The table mapper
+        :param connection: The DB-API connection
+        :param target: The changed RLS filter
+        """
+        security_cache.invalidate_on_commit(
+            self.get_session(), RLS_FILTERS_VERSION_CACHE_KEY
+        )
+
+    def get_rls_sorted(self, table: "BaseDatasource") -> list[RLSFilter]:
         """
         Retrieves a list RLS filters sorted by ID for
         the current user and the passed table.
@@ -2802,3 +2980,14 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             for item in list(security_menu.childs):
                 if item.name in ["List Roles", "List Users", "List Groups"]:
                     security_menu.childs.remove(item)
+
+
+def on_role_after_update(mapper: Mapper, connection: Connection, target: Role) -> None:
+    # pylint: disable=import-outside-toplevel
+    from superset.extensions import security_manager
+
+    security_manager.on_role_after_update(mapper, connection, target)
+
+
+# changes to the permissions of a role invalidate the permission index
+sqla_event.listen(Role, "after_update", on_role_after_update, propagate=True)
@@ -26,6 +26,7 @@ from typing import Any, cast, Optional, TYPE_CHECKING, TypeVar, Union
 
 import backoff
 import msgpack
+import pyarrow as pa
 from celery.exceptions import SoftTimeLimitExceeded
 from flask import current_app
 from flask_babel import gettext as __
@@ -57,8 +58,10 @@ from superset.extensions import celery_app, event_logger
 from superset.models.sql_lab import Query
 from superset.result_set import SupersetResultSet
 from superset.sql.parse import BaseSQLStatement, CTASMethod, SQLScript, Table
+from superset.sqllab import result_chunks
 from superset.sqllab.limiting_factor import LimitingFactor
-from superset.sqllab.utils import write_ipc_buffer
+from superset.sqllab.utils import get_statement_results_key, write_ipc_buffer
+from superset.tasks.routing import concurrency_slot, TaskClass
 from superset.utils import json
 from superset.utils.core import (
     override_user,
@@ -180,7 +183,15 @@ def get_sql_results(  # pylint: disable=too-many-arguments
 ) -> Optional[dict[str, Any]]:
     """Executes the sql query returns the results."""
     with current_app.test_request_context():
-        with override_user(security_manager.find_user(username)):
+        query = get_query(query_id=query_id)
+        with (
+            concurrency_slot(
+                TaskClass.SQL_LAB,
+                user_id=query.user_id,
+                database_id=query.database_id,
+            ),
+            override_user(security_manager.find_user(username)),
+        ):
             try:
                 return execute_sql_statements(
                     query_id,
@@ -277,8 +288,45 @@ def execute_query(  # pylint: disable=too-many-statements, too-many-locals  # no
                     str(query.to_dict()),
                 )
                 increased_limit = None if query.limit is None else query.limit + 1
-                data = db_engine_spec.fetch_data(cursor, increased_limit)
-                if query.limit is None or len(data) <= query.limit:
+                max_bytes = config["SQLLAB_RESULTS_MAX_BYTES"]
+                data: list[tuple[Any, ...]] | pa.Table | None = None
+                truncated = False
+                if db_engine_spec.supports_arrow_fetch:
+                    data = db_engine_spec.fetch_arrow(cursor, increased_limit)
+                    if (
+                        data is not None
+                        and max_bytes is not None
+                        and data.nbytes > max_bytes
+                    ):
+                        # the rows are already fetched, but the results that are
+                        # stored and returned are kept within the same budget
+                        data = data.slice(0, data.num_rows * max_bytes // data.nbytes)
+                        truncated = True
+                if (
+                    data is None
+                    and max_bytes is not None
+                    and db_engine_spec.supports_streaming_fetch
+                ):
+                    result_set = SupersetResultSet.from_batches(
+                        db_engine_spec.fetch_data_batches(
+                            cursor,
+                            config["SQLLAB_FETCH_BATCH_ROWS"],
+                            increased_limit,
+                        ),
+                        cursor.description,
+                        db_engine_spec,
+                        max_bytes=max_bytes,
+                    )
+                    data = result_set.pa_table
+                    truncated = result_set.truncated
+                elif data is None:
+                    data = db_engine_spec.fetch_data(cursor, increased_limit)
+                if truncated:
+                    logger.info(
+                        "Query %d: Results truncated to %d bytes", query.id, max_bytes
+                    )
+                    query.set_extra_json_key("results_truncated", True)
+                elif query.limit is None or len(data) <= query.limit:
                     query.limiting_factor = LimitingFactor.NOT_LIMITED
                 else:
                     # return 1 row less than increased_query
@@ -314,6 +362,8 @@ def execute_query(  # pylint: disable=too-many-statements, too-many-locals  # no
 
     logger.debug("Query %d: Fetching cursor description", query.id)
     cursor_description = cursor.description
+    if isinstance(data, pa.Table):
+        return SupersetResultSet.from_arrow(data, cursor_description, db_engine_spec)
     return SupersetResultSet(data, cursor_description, db_engine_spec)
 
 
@@ -360,6 +410,169 @@ def _serialize_and_expand_data(
     return (data, selected_columns, all_columns, expanded_columns)
 
 
+def _get_results_payload(
+    query: Query,
+    result_set: SupersetResultSet,
+    use_arrow_data: bool,
+    chunk_rows: Optional[int],
+    expand_data: bool,
+) -> dict[str, Any]:
+    db_engine_spec = query.database.db_engine_spec
+    if chunk_rows and use_arrow_data:
+        # the Arrow table is serialized chunk by chunk when storing the results
+        data, selected_columns, all_columns, expanded_columns = (
+            None,
+            result_set.columns,
+            result_set.columns,
+            [],
+        )
+    else:
+        (
+            data,
+            selected_columns,
+            all_columns,
+            expanded_columns,
+        ) = _serialize_and_expand_data(
+            result_set, db_engine_spec, use_arrow_data, expand_data
+        )
+
+    payload = {
+        "status": QueryStatus.SUCCESS,
+        "data": data,
+        "columns": all_columns,
+        "selected_columns": selected_columns,
+        "expanded_columns": expanded_columns,
+        "query": query.to_dict(),
+    }
+    payload["query"]["state"] = QueryStatus.SUCCESS
+    if query.extra.get("results_truncated"):
+        # shown by SQL Lab next to the number of rows
+        payload["resultsTruncated"] = True
+    return payload
+
+
+def _store_results(
+    query: Query,
+    payload: dict[str, Any],
+    result_set: SupersetResultSet,
+    use_arrow_data: bool,
+    chunk_rows: Optional[int],
+    key: Optional[str] = None,
+) -> str:
+    """
+    Store the results of a query in the results backend, under a new key by default,
+    and return their key.
+    """
+    key = key or str(uuid.uuid4())
+    payload["query"]["resultsKey"] = key
+    logger.info(
+        "Query %s: Storing results in results backend, key: %s", str(query.id), key
+    )
+    cache_timeout = query.database.cache_timeout
+    if cache_timeout is None:
+        cache_timeout = config["CACHE_DEFAULT_TIMEOUT"]
+
+    with stats_timing("sqllab.query.results_backend_write", stats_logger):
+        with stats_timing(
+            "sqllab.query.results_backend_write_serialization", stats_logger
+        ):
+            chunks: list[bytes] = []
+            chunks_size = 0
+            stored_payload = payload
+            if chunk_rows:
+                chunks, chunks_size = result_chunks.serialize_chunks(
+                    result_set.pa_table if use_arrow_data else payload["data"],
+                    chunk_rows,
+                )
+                stored_payload = {
+                    **payload,
+                    "data": None,
+                    "chunks": {"count": len(chunks), "rows": chunk_rows},
+                }
+
+            serialized_payload = _serialize_payload(
+                stored_payload, cast(bool, results_backend_use_msgpack)
+            )
+
+            # Check the size of the serialized payload
+            if sql_lab_payload_max_mb := config.get("SQLLAB_PAYLOAD_MAX_MB"):
+                serialized_payload_size = (
+                    sys.getsizeof(serialized_payload) + chunks_size
+                )
+                max_bytes = sql_lab_payload_max_mb * BYTES_IN_MB
+
+                if serialized_payload_size > max_bytes:
+                    logger.info("Result size exceeds the allowed limit.")
+                    raise SupersetErrorException(
+                        SupersetError(
+                            message=f"Result size ({serialized_payload_size / BYTES_IN_MB:.2f} MB) exceeds the allowed limit of {sql_lab_payload_max_mb} MB.",  # noqa: E501
+                            error_type=SupersetErrorType.RESULT_TOO_LARGE_ERROR,
+                            level=ErrorLevel.ERROR,
+                        )
+                    )
+
+        if chunks:
+            # chunks are written first, so that the manifest never references
+            # missing chunks
+            result_chunks.write_chunks(key, chunks, cache_timeout)
+        compressed = zlib_compress(serialized_payload)
+        logger.debug("*** serialized payload size: %i", getsizeof(serialized_payload))
+        logger.debug("*** compressed payload size: %i", getsizeof(compressed))
+        results_backend.set(key, compressed, cache_timeout)
+    return key
+
+
+def _publish_statement_results(  # pylint: disable=too-many-arguments
+    query: Query,
+    statement: BaseSQLStatement[Any],
+    statement_num: int,
+    statement_count: int,
+    result_set: SupersetResultSet,
+    use_arrow_data: bool,
+    chunk_rows: Optional[int],
+    expand_data: bool,
+) -> None:
+    """
+    Store the results of a statement of a script returning rows before the next
+    statements run, so that they can be shown while the script is running, and
+    report the progress of the script.
+    """
+    if result_set.columns and not statement.is_mutating():
+        payload = {
+            "query_id": query.id,
+            "statement": statement_num,
+            **_get_results_payload(
+                query, result_set, use_arrow_data, chunk_rows, expand_data
+            ),
+        }
+        payload["query"]["rows"] = result_set.size
+        try:
+            key = _store_results(
+                query,
+                payload,
+                result_set,
+                use_arrow_data,
+                chunk_rows,
+                key=get_statement_results_key(query.id),
+            )
+        except SupersetErrorException:
+            logger.info(
+                "Query %s: Results of statement %s are not published",
+                str(query.id),
+                statement_num,
+                exc_info=True,
+            )
+        else:
+            statement_results = query.extra.get("statement_results", [])
+            statement_results.append(
+                {"statement": statement_num, "rows": result_set.size, "resultsKey": key}
+            )
+            query.set_extra_json_key("statement_results", statement_results)
+
+    query.progress = statement_num * 100 // statement_count
+    db.session.commit()
+
+
 def execute_sql_statements(  # noqa: C901
     # pylint: disable=too-many-arguments, too-many-locals, too-many-statements, too-many-branches
     query_id: int,
@@ -442,6 +655,15 @@ def execute_sql_statements(  # noqa: C901
             for statement in parsed_script.statements
         ]
 
+    use_arrow_data = store_results and cast(bool, results_backend_use_msgpack)
+    chunk_rows = config["SQLLAB_RESULTS_BACKEND_CHUNK_ROWS"] if store_results else None
+    publish_statement_results = bool(
+        config["SQLLAB_PUBLISH_STATEMENT_RESULTS"]
+        and store_results
+        and results_backend
+        and len(blocks) > 1
+    )
+
     with database.get_raw_connection(
         catalog=query.catalog,
         schema=query.schema,
@@ -496,6 +718,18 @@ def execute_sql_statements(  # noqa: C901
                 payload = handle_query_error(ex, query, payload, prefix_message)
                 return payload
 
+            if publish_statement_results and i < block_count - 1:
+                _publish_statement_results(
+                    query,
+                    parsed_script.statements[i],
+                    i + 1,
+                    block_count,
+                    result_set,
+                    use_arrow_data,
+                    chunk_rows,
+                    expand_data,
+                )
+
         # Commit the connection so CTA queries will create the table and any DML.
         if parsed_script.has_mutation() or query.select_as_cta:
             conn.commit()
@@ -514,63 +748,13 @@ def execute_sql_statements(  # noqa: C901
         )
     query.end_time = now_as_float()
 
-    use_arrow_data = store_results and cast(bool, results_backend_use_msgpack)
-    data, selected_columns, all_columns, expanded_columns = _serialize_and_expand_data(
-        result_set, db_engine_spec, use_arrow_data, expand_data
-    )
-
     # TODO: data should be saved separately from metadata (likely in Parquet)
     payload.update(
-        {
-            "status": QueryStatus.SUCCESS,
-            "data": data,
-            "columns": all_columns,
-            "selected_columns": selected_columns,
-            "expanded_columns": expanded_columns,
-            "query": query.to_dict(),
-        }
+        _get_results_payload(query, result_set, use_arrow_data, chunk_rows, expand_data)
     )
-    payload["query"]["state"] = QueryStatus.SUCCESS
 
     if store_results and results_backend:
-        key = str(uuid.uuid4())
-        payload["query"]["resultsKey"] = key
-        logger.info(
-            "Query %s: Storing results in results backend, key: %s", str(query_id), key
-        )
-        with stats_timing("sqllab.query.results_backend_write", stats_logger):
-            with stats_timing(
-                "sqllab.query.results_backend_write_serialization", stats_logger
-            ):
-                serialized_payload = _serialize_payload(
-                    payload, cast(bool, results_backend_use_msgpack)
-                )
-
-                # Check the size of the serialized payload
-                if sql_lab_payload_max_mb := config.get("SQLLAB_PAYLOAD_MAX_MB"):
-                    serialized_payload_size = sys.getsizeof(serialized_payload)
-                    max_bytes = sql_lab_payload_max_mb * BYTES_IN_MB
-
-                    if serialized_payload_size > max_bytes:
-                        logger.info("Result size exceeds the allowed limit.")
-                        raise SupersetErrorException(
-                            SupersetError(
-                                message=f"Result size ({serialized_payload_size / BYTES_IN_MB:.2f} MB) exceeds the allowed limit of {sql_lab_payload_max_mb} MB.",  # noqa: E501
-                                error_type=SupersetErrorType.RESULT_TOO_LARGE_ERROR,
-                                level=ErrorLevel.ERROR,
-                            )
-                        )
-
-            cache_timeout = database.cache_timeout
-            if cache_timeout is None:
-                cache_timeout = config["CACHE_DEFAULT_TIMEOUT"]
-
-            compressed = zlib_compress(serialized_payload)
-            logger.debug(
-                "*** serialized payload size: %i", getsizeof(serialized_payload)
-            )
-            logger.debug("*** compressed payload size: %i", getsizeof(compressed))
-            results_backend.set(key, compressed, cache_timeout)
+        key = _store_results(query, payload, result_set, use_arrow_data, chunk_rows)
         query.results_key = key
 
     query.status = QueryStatus.SUCCESS
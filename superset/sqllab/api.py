@@ -18,7 +18,7 @@ import logging
 from typing import Any, cast, Optional
 from urllib import parse
 
-from flask import request, Response
+from flask import request, Response, stream_with_context
 from flask_appbuilder import permission_name
 from flask_appbuilder.api import expose, protect, rison, safe
 from flask_appbuilder.models.sqla.interface import SQLAInterface
@@ -274,6 +274,10 @@ class SqlLabRestApi(BaseSupersetApi):
 
         query, data, row_count = result["query"], result["data"], result["count"]
 
+        if not isinstance(data, str):
+            # keep the request context while the rows are streamed
+            data = stream_with_context(data)
+
         quoted_csv_name = parse.quote(query.name)
         response = CsvResponse(
             data, headers=generate_download_headers("csv", quoted_csv_name)
@@ -337,7 +341,8 @@ class SqlLabRestApi(BaseSupersetApi):
         params = kwargs["rison"]
         key = params.get("key")
         rows = params.get("rows")
-        result = SqlExecutionResultsCommand(key=key, rows=rows).run()
+        offset = params.get("offset", 0)
+        result = SqlExecutionResultsCommand(key=key, rows=rows, offset=offset).run()
 
         # Using pessimistic json serialization since some database drivers can return
         # unserializeable types at times
@@ -0,0 +1,145 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Storage of SQL Lab results in the results backend as fixed-size chunks.
+
+When ``SQLLAB_RESULTS_BACKEND_CHUNK_ROWS`` is set the payload stored under the
+results key is a manifest, with the query and column metadata but no data, and
+the rows are stored separately in chunks of that many rows, each compressed on
+its own. Chunks are Arrow IPC streams when ``RESULTS_BACKEND_USE_MSGPACK`` is
+enabled, and lists of JSON records otherwise. Reading a range of rows only needs
+the chunks that overlap it to be fetched and decompressed.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Union
+
+import pyarrow as pa
+
+from superset import results_backend
+from superset.exceptions import SerializationError
+from superset.sqllab.utils import write_ipc_buffer
+from superset.utils import json
+from superset.utils.core import zlib_compress, zlib_decompress
+
+logger = logging.getLogger(__name__)
+
+ChunkData = Union[pa.Table, list[dict[str, Any]]]
+
+
+def chunk_key(key: str, index: int) -> str:
+    return f"{key}/chunk/{index}"
+
+
+def is_chunked(payload: dict[str, Any]) -> bool:
+    return "chunks" in payload
+
+
+def serialize_chunks(
+    data: ChunkData,
+    chunk_rows: int,
+) -> tuple[list[bytes], int]:
+    """
+    Split the data in chunks of `chunk_rows` rows, serialized and compressed.
+
+    :param data: an Arrow table, or a list of records
+    :param chunk_rows: the number of rows in each chunk
+    :returns: the compressed chunks, and their total size before compression
+    """
+    num_rows = data.num_rows if isinstance(data, pa.Table) else len(data)
+    chunks = []
+    size = 0
+    for offset in range(0, num_rows, chunk_rows):
+        serialized: bytes | str
+        if isinstance(data, pa.Table):
+            serialized = write_ipc_buffer(data.slice(offset, chunk_rows)).to_pybytes()
+        else:
+            serialized = json.dumps(
+                data[offset : offset + chunk_rows],
+                default=json.json_iso_dttm_ser,
+                ignore_nan=True,
+            )
+        size += len(serialized)
+        chunks.append(zlib_compress(serialized))
+    return chunks, size
+
+
+def write_chunks(key: str, chunks: list[bytes], cache_timeout: int) -> None:
+    """
+    Store the compressed chunks of the results stored under `key`.
+    """
+    if results_backend is None:
+        raise SerializationError("Results backend is not configured")
+
+    results_backend.set_many(
+        {chunk_key(key, index): chunk for index, chunk in enumerate(chunks)},
+        cache_timeout,
+    )
+
+
+def read_chunk(key: str, index: int, use_msgpack: bool) -> ChunkData:
+    blob = results_backend.get(chunk_key(key, index)) if results_backend else None
+    if not blob:
+        raise SerializationError(f"Chunk {index} of results {key} is missing")
+
+    payload = zlib_decompress(blob, decode=not use_msgpack)
+    if use_msgpack:
+        try:
+            return pa.ipc.open_stream(pa.BufferReader(payload)).read_all()
+        except pa.ArrowException as ex:
+            raise SerializationError("Unable to deserialize table") from ex
+    return json.loads(payload)
+
+
+def read_rows(
+    key: str,
+    manifest: dict[str, Any],
+    use_msgpack: bool,
+    offset: int = 0,
+    limit: int | None = None,
+) -> ChunkData:
+    """
+    Read a range of rows, fetching only the chunks that overlap it.
+
+    :param key: the results key
+    :param manifest: the payload stored under the results key
+    :param use_msgpack: whether the chunks are Arrow tables or JSON records
+    :param offset: the first row to read
+    :param limit: the maximum number of rows to read
+    :returns: an Arrow table or a list of records, depending on `use_msgpack`
+    """
+    count = manifest["chunks"]["count"]
+    chunk_rows = manifest["chunks"]["rows"]
+    first = offset // chunk_rows
+    last = (
+        count
+        if limit is None
+        else min(count, (offset + limit + chunk_rows - 1) // chunk_rows)
+    )
+    chunks = [read_chunk(key, index, use_msgpack) for index in range(first, last)]
+    start = offset - first * chunk_rows
+    stop = None if limit is None else start + limit
+
+    if use_msgpack:
+        if not chunks:
+            return pa.table({})
+        table = pa.concat_tables(chunks)
+        return table.slice(start, None if stop is None else stop - start)
+
+    return [row for chunk in chunks for row in chunk][start:stop]
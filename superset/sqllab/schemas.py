@@ -22,6 +22,7 @@ sql_lab_get_results_schema = {
     "type": "object",
     "properties": {
         "key": {"type": "string"},
+        "offset": {"type": "integer", "minimum": 0},
     },
     "required": ["key"],
 }
@@ -16,6 +16,7 @@
 # under the License.
 from __future__ import annotations
 
+import uuid
 from typing import Any
 
 import pyarrow as pa
@@ -44,7 +45,7 @@ DATABASE_KEYS = [
 
 
 def apply_display_max_row_configuration_if_require(  # pylint: disable=invalid-name
-    sql_results: dict[str, Any], max_rows_in_result: int
+    sql_results: dict[str, Any], max_rows_in_result: int, offset: int = 0
 ) -> dict[str, Any]:
     """
     Given a `sql_results` nested structure, applies a limit to the number of rows
@@ -56,13 +57,14 @@ def apply_display_max_row_configuration_if_require(  # pylint: disable=invalid-n
 
     :param max_rows_in_result:
     :param sql_results: The results of a sql query from sql_lab.get_sql_results
+    :param offset: The number of rows skipped before the data in `sql_results`
     :returns: The mutated sql_results structure
     """
 
     def is_require_to_apply() -> bool:
         return (
             sql_results["status"] == QueryStatus.SUCCESS
-            and sql_results["query"]["rows"] > max_rows_in_result
+            and sql_results["query"]["rows"] - offset > max_rows_in_result
         )
 
     if is_require_to_apply():
@@ -71,6 +73,22 @@ def apply_display_max_row_configuration_if_require(  # pylint: disable=invalid-n
     return sql_results
 
 
+def get_statement_results_key(query_id: int) -> str:
+    """
+    Return a new results key for a statement of a query, ending with the ID of the
+    query so that the query can be found from the key.
+    """
+    return f"{uuid.uuid4()}_{query_id}"
+
+
+def get_statement_results_query_id(key: str) -> int | None:
+    """
+    Return the ID of the query of a statement results key, if it is one.
+    """
+    _, separator, query_id = key.rpartition("_")
+    return int(query_id) if separator and query_id.isdigit() else None
+
+
 def write_ipc_buffer(table: pa.Table) -> pa.Buffer:
     sink = pa.BufferOutputStream()
 
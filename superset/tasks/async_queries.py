@@ -26,6 +26,7 @@ from flask_appbuilder.security.sqla.models import User
 from marshmallow import ValidationError
 
 from superset.charts.schemas import ChartDataQueryContextSchema
+from superset.daos.datasource import DatasourceDAO
 from superset.exceptions import SupersetVizException
 from superset.extensions import (
     async_query_manager,
@@ -33,12 +34,18 @@ from superset.extensions import (
     celery_app,
     security_manager,
 )
+from superset.tasks.routing import (
+    concurrency_slot,
+    has_concurrency_limit,
+    TaskClass,
+)
 from superset.utils.cache import generate_cache_key, set_and_log_cache
-from superset.utils.core import override_user
+from superset.utils.core import DatasourceType, override_user
 from superset.views.utils import get_datasource_info, get_viz
 
 if TYPE_CHECKING:
     from superset.common.query_context import QueryContext
+    from superset.connectors.sqla.models import BaseDatasource
 
 logger = logging.getLogger(__name__)
 query_timeout = current_app.config[
@@ -50,17 +57,21 @@ def set_form_data(form_data: dict[str, Any]) -> None:
     g.form_data = form_data
 
 
-def _create_query_context_from_form(form_data: dict[str, Any]) -> QueryContext:
+def _create_query_context_from_form(
+    form_data: dict[str, Any],
+    schema: ChartDataQueryContextSchema | None = None,
+) -> QueryContext:
     """
     Create the query context from the form data.
 
     :param form_data: The task form data
+    :param schema: The schema loading the query context, a new one by default
     :returns: The query context
     :raises ValidationError: If the request is incorrect
     """
 
     try:
-        return ChartDataQueryContextSchema().load(form_data)
+        return (schema or ChartDataQueryContextSchema()).load(form_data)
     except KeyError as ex:
         raise ValidationError("Request is incorrect") from ex
 
@@ -79,38 +90,121 @@ def _load_user_from_job_metadata(job_metadata: dict[str, Any]) -> User:
     return user
 
 
-@celery_app.task(name="load_chart_data_into_cache", soft_time_limit=query_timeout)
-def load_chart_data_into_cache(
+def _load_chart_data(
     job_metadata: dict[str, Any],
     form_data: dict[str, Any],
+    schema: ChartDataQueryContextSchema | None = None,
 ) -> None:
     # pylint: disable=import-outside-toplevel
     from superset.commands.chart.data.get_data_command import ChartDataCommand
 
-    with override_user(_load_user_from_job_metadata(job_metadata), force=False):
-        try:
-            set_form_data(form_data)
-            query_context = _create_query_context_from_form(form_data)
-            command = ChartDataCommand(query_context)
-            result = command.run(cache=True)
-            cache_key = result["cache_key"]
-            result_url = f"/api/v1/chart/data/{cache_key}"
-            async_query_manager.update_job(
-                job_metadata,
-                async_query_manager.STATUS_DONE,
-                result_url=result_url,
-            )
-        except SoftTimeLimitExceeded as ex:
-            logger.warning("A timeout occurred while loading chart data, error: %s", ex)
-            raise
-        except Exception as ex:
-            # TODO: QueryContext should support SIP-40 style errors
-            error = str(ex.message if hasattr(ex, "message") else ex)
-            errors = [{"message": error}]
-            async_query_manager.update_job(
-                job_metadata, async_query_manager.STATUS_ERROR, errors=errors
-            )
-            raise
+    try:
+        set_form_data(form_data)
+        query_context = _create_query_context_from_form(form_data, schema)
+        command = ChartDataCommand(query_context)
+        result = command.run(cache=True)
+        cache_key = result["cache_key"]
+        result_url = f"/api/v1/chart/data/{cache_key}"
+        async_query_manager.update_job(
+            job_metadata,
+            async_query_manager.STATUS_DONE,
+            result_url=result_url,
+        )
+    except SoftTimeLimitExceeded as ex:
+        logger.warning("A timeout occurred while loading chart data, error: %s", ex)
+        raise
+    except Exception as ex:
+        # TODO: QueryContext should support SIP-40 style errors
+        error = str(ex.message if hasattr(ex, "message") else ex)
+        errors = [{"message": error}]
+        async_query_manager.update_job(
+            job_metadata, async_query_manager.STATUS_ERROR, errors=errors
+        )
+        raise
+
+
+def _get_dataset(form_data: dict[str, Any]) -> BaseDatasource | None:
+    try:
+        datasource = form_data["datasource"]
+        return DatasourceDAO.get_datasource(
+            datasource_type=DatasourceType(datasource["type"]),
+            datasource_id=int(datasource["id"]),
+        )
+    except Exception:  # pylint: disable=broad-except
+        return None
+
+
+@celery_app.task(name="load_chart_data_into_cache", soft_time_limit=query_timeout)
+def load_chart_data_into_cache(
+    job_metadata: dict[str, Any],
+    form_data: dict[str, Any],
+) -> None:
+    # the dataset is only loaded to find its database when databases are limited
+    dataset = (
+        _get_dataset(form_data)
+        if has_concurrency_limit(TaskClass.INTERACTIVE, "database")
+        else None
+    )
+    with (
+        concurrency_slot(
+            TaskClass.INTERACTIVE,
+            user_id=job_metadata.get("user_id"),
+            database_id=getattr(dataset, "database_id", None),
+        ),
+        override_user(_load_user_from_job_metadata(job_metadata), force=False),
+    ):
+        _load_chart_data(job_metadata, form_data)
+
+
+@celery_app.task(
+    name="load_chart_data_batch_into_cache",
+    soft_time_limit=query_timeout,
+)
+def load_chart_data_batch_into_cache(
+    user_metadata: dict[str, Any],
+    jobs_metadata: list[dict[str, Any]],
+    form_datas: list[dict[str, Any]],
+) -> None:
+    """
+    Load the data of several charts of the same dataset into the cache, one after
+    the other, adding an event for each chart as soon as its data is loaded.
+
+    The user and the dataset are loaded once for all the charts, the query context of
+    each chart being created with the same dataset, so that its columns and metrics
+    are reused. A chart failing doesn't prevent the next ones from loading.
+
+    :param user_metadata: The ID or the guest token of the user requesting the data
+    :param jobs_metadata: The metadata of the job of each chart
+    :param form_datas: The query context of each chart
+    """
+    # the charts of a batch share their dataset, errors loading it being reported
+    # for each chart
+    dataset = _get_dataset(form_datas[0]) if form_datas else None
+    with (
+        concurrency_slot(
+            TaskClass.INTERACTIVE,
+            user_id=user_metadata.get("user_id"),
+            database_id=getattr(dataset, "database_id", None),
+        ),
+        override_user(_load_user_from_job_metadata(user_metadata), force=False),
+    ):
+        schema = ChartDataQueryContextSchema(datasource_model=dataset)
+        for position, (job_metadata, form_data) in enumerate(
+            zip(jobs_metadata, form_datas, strict=False)
+        ):
+            try:
+                _load_chart_data(job_metadata, form_data, schema)
+            except SoftTimeLimitExceeded:
+                errors = [{"message": "A timeout occurred while loading chart data"}]
+                for pending_job_metadata in jobs_metadata[position + 1 :]:
+                    async_query_manager.update_job(
+                        pending_job_metadata,
+                        async_query_manager.STATUS_ERROR,
+                        errors=errors,
+                    )
+                raise
+            except Exception:  # pylint: disable=broad-except
+                logger.warning("Unable to load chart data", exc_info=True)
 
 
 @celery_app.task(name="load_explore_json_into_cache", soft_time_limit=query_timeout)
@@ -122,7 +216,10 @@ def load_explore_json_into_cache(  # pylint: disable=too-many-locals
 ) -> None:
     cache_key_prefix = "ejr-"  # ejr: explore_json request
 
-    with override_user(_load_user_from_job_metadata(job_metadata), force=False):
+    with (
+        concurrency_slot(TaskClass.INTERACTIVE, user_id=job_metadata.get("user_id")),
+        override_user(_load_user_from_job_metadata(job_metadata), force=False),
+    ):
         try:
             set_form_data(form_data)
             datasource_id, datasource_type = get_datasource_info(None, None, form_data)
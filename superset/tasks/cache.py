@@ -17,25 +17,31 @@
 from __future__ import annotations
 
 import logging
+import time
+from collections import defaultdict
 from typing import Any, Optional, TypedDict, Union
 from urllib import request
 from urllib.error import URLError
 
 from celery.beat import SchedulingError
+from celery.exceptions import SoftTimeLimitExceeded
 from celery.utils.log import get_task_logger
 from flask import current_app
 from sqlalchemy import and_, func
 
 from superset import db, security_manager
-from superset.extensions import celery_app
+from superset.extensions import cache_manager, celery_app
 from superset.models.core import Log
 from superset.models.dashboard import Dashboard
 from superset.models.slice import Slice
 from superset.tags.models import Tag, TaggedObject
 from superset.tasks.exceptions import ExecutorNotFoundError, InvalidExecutorError
+from superset.tasks.routing import concurrency_slot, TaskClass
 from superset.tasks.utils import fetch_csrf_token, get_executor
 from superset.utils import json
+from superset.utils.core import override_user
 from superset.utils.date_parser import parse_human_datetime
+from superset.utils.dates import now_as_float
 from superset.utils.machine_auth import MachineAuthProvider
 from superset.utils.urls import get_url_path, is_secure_url
 
@@ -278,6 +284,188 @@ def fetch_url(data: str, headers: dict[str, str]) -> dict[str, str]:
     return result
 
 
+def get_cache_key_coverage(chart: Slice) -> tuple[int, int] | None:
+    """
+    Return the number of queries of a chart whose results are cached for the current
+    user, and the number of its queries, or None for legacy charts.
+    """
+    query_context = chart.get_query_context()
+    if not query_context:
+        return None
+    cache_keys = [
+        query_context.query_cache_key(query) for query in query_context.queries
+    ]
+    cached = sum(
+        1
+        for cache_key in cache_keys
+        if cache_key and cache_manager.data_cache.has(cache_key)
+    )
+    return cached, len(cache_keys)
+
+
+def warm_up_chart(payload: CacheWarmupPayload, user: Any) -> dict[str, Any]:
+    """
+    Run the queries of a chart as a user, without going through the web server.
+
+    :param payload: The chart to warm up, and the dashboard it is shown on
+    :param user: The user running the queries
+    :returns: The status of the queries, how long they took in seconds, and how many
+        of their results are cached
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.commands.chart.warm_up_cache import ChartWarmUpCacheCommand
+
+    start = now_as_float()
+    result: dict[str, Any] = {
+        "chart_id": payload["chart_id"],
+        "dashboard_id": payload.get("dashboard_id"),
+        "viz_error": None,
+        "viz_status": None,
+        "cached_queries": None,
+        "queries": None,
+    }
+    chart = db.session.query(Slice).filter_by(id=payload["chart_id"]).one_or_none()
+    if not chart or not user:
+        result["viz_error"] = "Chart not found" if not chart else "Executor not found"
+        result["duration"] = 0
+        return result
+
+    with current_app.test_request_context(), override_user(user):
+        result.update(
+            ChartWarmUpCacheCommand(chart, payload.get("dashboard_id"), None).run()
+        )
+        try:
+            if coverage := get_cache_key_coverage(chart):
+                result["cached_queries"], result["queries"] = coverage
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("Unable to compute the cache keys of chart %s", chart.id)
+
+    duration = now_as_float() - start
+    current_app.config["STATS_LOGGER"].timing("cache_warmup.chart", duration)
+    result["duration"] = duration / 1000
+    return result
+
+
+def get_warm_up_time_limit(chart_count: int) -> int:
+    """
+    Return the time limit of a task warming up charts, in seconds, the pauses between
+    charts counting in it.
+    """
+    config = current_app.config
+    chart_time_limit = (
+        config["CACHE_WARMUP_CHART_TIME_LIMIT"] + config["CACHE_WARMUP_CHART_INTERVAL"]
+    )
+    return chart_time_limit * chart_count
+
+
+@celery_app.task(name="warm_up_charts")
+def warm_up_charts(
+    tasks: list[CacheWarmupTask],
+    database_id: Optional[int] = None,
+) -> list[dict[str, Any]]:
+    """
+    Warm up the cache of charts querying the same database, one after the other,
+    running their queries in the worker as the executor of each chart.
+
+    At most ``CACHE_WARMUP_DATABASE_CONCURRENCY`` tasks warm up the charts of a
+    database at once, including the tasks of previous runs still running. When the
+    time limit of the task is reached, the remaining charts are skipped.
+    """
+    config = current_app.config
+    interval = config["CACHE_WARMUP_CHART_INTERVAL"]
+    # the soft time limit interrupts the chart being warmed up, whose error is
+    # reported in its result, and the deadline stops the next ones
+    deadline = now_as_float() + get_warm_up_time_limit(len(tasks)) * 1000
+    users: dict[Optional[str], Any] = {}
+    results: list[dict[str, Any]] = []
+    tasks = sorted(tasks, key=lambda t: t["username"] or "")
+    with concurrency_slot(
+        TaskClass.WARMUP,
+        database_id=database_id,
+        limits={"database": config["CACHE_WARMUP_DATABASE_CONCURRENCY"]},
+    ):
+        # the charts of an executor are warmed up in a row, loading the user once
+        for position, task in enumerate(tasks):
+            try:
+                if now_as_float() > deadline:
+                    raise SoftTimeLimitExceeded()
+                if position and interval:
+                    time.sleep(interval)
+                username = task["username"]
+                if username not in users:
+                    users[username] = security_manager.find_user(username)
+                result = warm_up_chart(task["payload"], users[username])
+            except SoftTimeLimitExceeded:
+                logger.warning(
+                    "A timeout occurred while warming up charts, skipping %s",
+                    [skipped["payload"]["chart_id"] for skipped in tasks[position:]],
+                )
+                break
+            logger.info(
+                "Warmed up chart %s in %.2f s, %s of %s queries cached, error: %s",
+                result["chart_id"],
+                result["duration"],
+                result["cached_queries"],
+                result["queries"],
+                result["viz_error"],
+            )
+            results.append(result)
+    return results
+
+
+def schedule_native_warmup(tasks: list[CacheWarmupTask]) -> dict[str, list[str]]:
+    """
+    Schedule the warm up of charts in workers, once per chart and executor even when
+    the chart is on several dashboards, spreading the charts of each database over
+    ``CACHE_WARMUP_DATABASE_CONCURRENCY`` tasks, each chart getting
+    ``CACHE_WARMUP_CHART_TIME_LIMIT`` seconds.
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.viz import viz_types
+
+    chart_ids = {task["payload"]["chart_id"] for task in tasks}
+    charts = {
+        chart.id: chart
+        for chart in db.session.query(Slice).filter(Slice.id.in_(chart_ids))
+    }
+    unique_tasks: dict[tuple[Any, ...], CacheWarmupTask] = {}
+    for task in tasks:
+        payload = task["payload"]
+        if not task["username"]:
+            logger.warning("Executor not found for %s", json.dumps(payload))
+            continue
+        if not (chart := charts.get(payload["chart_id"])):
+            continue
+        # only legacy charts apply the filters of the dashboard they are shown on
+        dashboard_id = (
+            payload.get("dashboard_id") if chart.viz_type in viz_types else None
+        )
+        unique_tasks.setdefault((task["username"], chart.id, dashboard_id), task)
+
+    tasks_by_database: dict[Optional[int], list[CacheWarmupTask]] = defaultdict(list)
+    for task in unique_tasks.values():
+        datasource = charts[task["payload"]["chart_id"]].datasource
+        tasks_by_database[getattr(datasource, "database_id", None)].append(task)
+
+    results: dict[str, list[str]] = {"scheduled": [], "errors": []}
+    concurrency = current_app.config["CACHE_WARMUP_DATABASE_CONCURRENCY"]
+    for database_id, database_tasks in tasks_by_database.items():
+        for position in range(min(concurrency, len(database_tasks))):
+            batch = database_tasks[position::concurrency]
+            payloads = [json.dumps(task["payload"]) for task in batch]
+            try:
+                logger.info("Scheduling %s", payloads)
+                warm_up_charts.apply_async(
+                    (batch, database_id),
+                    soft_time_limit=get_warm_up_time_limit(len(batch)),
+                )
+                results["scheduled"].extend(payloads)
+            except SchedulingError:
+                logger.exception("Error scheduling warm_up_charts for %s", payloads)
+                results["errors"].extend(payloads)
+    return results
+
+
 @celery_app.task(name="cache-warmup")
 def cache_warmup(
     strategy_name: str, *args: Any, **kwargs: Any
@@ -307,6 +495,9 @@ def cache_warmup(
         logger.exception(message)
         return message
 
+    if current_app.config["CACHE_WARMUP_NATIVE"]:
+        return schedule_native_warmup(strategy.get_tasks())
+
     results: dict[str, list[str]] = {"scheduled": [], "errors": []}
     for task in strategy.get_tasks():
         username = task["username"]
@@ -0,0 +1,160 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import logging
+from typing import Any, Optional, TYPE_CHECKING
+
+from superset import db
+from superset.extensions import celery_app
+
+if TYPE_CHECKING:
+    from superset.models.core import Database
+
+logger = logging.getLogger(__name__)
+
+# the cached methods of ``Database`` listing its metadata
+METADATA_METHODS = {
+    "get_all_catalog_names",
+    "get_all_schema_names",
+    "get_all_table_names_in_schema",
+    "get_all_view_names_in_schema",
+}
+
+
+@celery_app.task(name="refresh_database_metadata", soft_time_limit=600)
+def refresh_database_metadata(
+    database_id: int,
+    method: str,
+    kwargs: dict[str, Any],
+    cache_timeout: int,
+) -> None:
+    """
+    Fetch an expired listing of catalogs, schemas, tables or views of a database
+    again, and replace the cached listing.
+    """
+    # pylint: disable=import-outside-toplevel,redefined-outer-name
+    from superset.models.core import Database
+
+    if method not in METADATA_METHODS:
+        logger.warning("Unknown metadata method %s", method)
+        return
+
+    database = db.session.query(Database).get(database_id)
+    if not database:
+        logger.warning("Database %s not found, skip refreshing metadata", database_id)
+        return
+
+    getattr(database, method)(
+        **kwargs,
+        cache=True,
+        cache_timeout=cache_timeout,
+        force=True,
+    )
+
+
+@celery_app.task(name="prefetch_database_metadata", soft_time_limit=3600)
+def prefetch_database_metadata(database_names: Optional[list[str]] = None) -> None:
+    """
+    Crawl the catalogs, schemas, tables and views of databases, and cache them
+    according to the metadata cache timeouts of each database.
+
+    Databases impersonating users or using OAuth2 are skipped, since their metadata
+    depends on the user.
+
+    :param database_names: The databases to crawl, all of them by default
+    """
+    # pylint: disable=import-outside-toplevel,redefined-outer-name
+    from superset.models.core import Database
+
+    query = db.session.query(Database)
+    if database_names is not None:
+        query = query.filter(Database.database_name.in_(database_names))
+
+    for database in query:
+        if database.impersonate_user or database.is_oauth2_enabled():
+            logger.info("Skip prefetching the metadata of %s", database.database_name)
+            continue
+        try:
+            prefetch_metadata(database)
+        except Exception:  # pylint: disable=broad-except
+            logger.warning(
+                "Unable to prefetch the metadata of %s",
+                database.database_name,
+                exc_info=True,
+            )
+
+
+def prefetch_metadata(database: "Database") -> None:
+    """
+    Fetch the metadata of a database, replacing the cached listings.
+
+    Listings whose cache is disabled are only fetched when the listings below them
+    are cached, since there is nothing to store for them.
+    """
+    fetch_tables = database.table_cache_enabled
+    fetch_schemas = database.schema_cache_enabled or fetch_tables
+    if not (database.catalog_cache_enabled or fetch_schemas):
+        return
+
+    catalogs: set[Optional[str]] = {None}
+    if database.db_engine_spec.supports_catalog:
+        catalogs = set(
+            database.get_all_catalog_names(
+                cache=database.catalog_cache_enabled,
+                cache_timeout=database.catalog_cache_timeout or None,
+                force=True,
+            )
+        )
+
+    if not fetch_schemas:
+        return
+
+    for catalog in catalogs:
+        schemas = database.get_all_schema_names(
+            catalog=catalog,
+            cache=database.schema_cache_enabled,
+            cache_timeout=database.schema_cache_timeout or None,
+            force=True,
+        )
+        if not fetch_tables:
+            continue
+
+        for schema in schemas:
+            try:
+                for method in (
+                    database.get_all_table_names_in_schema,
+                    database.get_all_view_names_in_schema,
+                ):
+                    method(
+                        catalog=catalog,
+                        schema=schema,
+                        cache=database.table_cache_enabled,
+                        cache_timeout=database.table_cache_timeout or None,
+                        force=True,
+                    )
+            except Exception:  # pylint: disable=broad-except
+                logger.warning(
+                    "Unable to prefetch the tables of %s.%s",
+                    database.database_name,
+                    schema,
+                    exc_info=True,
+                )
+        logger.info(
+            "Prefetched %d schemas of %s, catalog %s",
+            len(schemas),
+            database.database_name,
+            catalog,
+        )
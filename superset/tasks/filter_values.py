@@ -0,0 +1,59 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import logging
+from typing import Optional
+
+from superset import db, security_manager
+from superset.common.utils.filter_values_cache import fetch_values, set_values
+from superset.extensions import celery_app
+from superset.utils.core import override_user
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(name="refresh_filter_values", soft_time_limit=300)
+def refresh_filter_values(
+    database_id: int,
+    sql: str,
+    cache_key: str,
+    username: Optional[str],
+    catalog: Optional[str] = None,
+    schema: Optional[str] = None,
+) -> None:
+    """
+    Fetch the distinct values of a column again, and replace the cached values.
+
+    The SQL already includes the RLS filters of the user who requested the values,
+    the user is only needed when the database impersonates users. The SQL runs in the
+    catalog and the schema of the dataset, as when the values were first fetched.
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.models.core import Database
+
+    database = db.session.query(Database).get(database_id)
+    if not database:
+        logger.warning("Database %s not found, skip refreshing values", database_id)
+        return
+
+    user = security_manager.find_user(username) if username else None
+    with override_user(user):
+        with database.get_sqla_engine(catalog=catalog, schema=schema) as engine:
+            values = fetch_values(
+                engine,
+                database.db_engine_spec.get_text_clause(sql),
+            )
+    set_values(cache_key, values)
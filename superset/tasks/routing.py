@@ -0,0 +1,217 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Classes of Celery tasks, with their queues and their concurrency limits.
+
+Tasks are classified by name, so that charts of dashboards and Explore, SQL Lab
+queries, reports, cache warm-up and thumbnails can be routed to dedicated queues with
+``CELERY_TASK_QUEUES``, each consumed by its own workers, and a burst of reports or
+thumbnails doesn't delay interactive charts.
+
+Within a class, ``CELERY_TASK_CONCURRENCY_LIMITS`` limits the tasks running at once
+for the same user and for the same database. A task over a limit is retried a bit
+later, letting the tasks of other users run in the meantime.
+
+For each class, the number of tasks published and started, the time they waited in
+the queue, and the number of times they were throttled are sent to the stats logger,
+the depth of a queue being the tasks published but not started yet.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any, Callable, Optional
+
+from celery import current_task
+from celery.signals import before_task_publish, task_prerun
+from flask import current_app
+
+from superset.extensions import cache_manager, stats_logger_manager
+from superset.utils.backports import StrEnum
+from superset.utils.dates import now_as_float
+
+logger = logging.getLogger(__name__)
+
+PUBLISHED_AT_HEADER = "superset_published_at"
+
+
+class TaskClass(StrEnum):
+    INTERACTIVE = "interactive"
+    SQL_LAB = "sql_lab"
+    REPORTS = "reports"
+    WARMUP = "warmup"
+    THUMBNAILS = "thumbnails"
+
+
+TASK_CLASSES: dict[str, TaskClass] = {
+    "load_chart_data_into_cache": TaskClass.INTERACTIVE,
+    "load_chart_data_batch_into_cache": TaskClass.INTERACTIVE,
+    "load_explore_json_into_cache": TaskClass.INTERACTIVE,
+    "sql_lab.get_sql_results": TaskClass.SQL_LAB,
+    "reports.scheduler": TaskClass.REPORTS,
+    "reports.execute": TaskClass.REPORTS,
+    "reports.prune_log": TaskClass.REPORTS,
+    "cache-warmup": TaskClass.WARMUP,
+    "fetch_url": TaskClass.WARMUP,
+    "warm_up_charts": TaskClass.WARMUP,
+    "refresh_filter_values": TaskClass.WARMUP,
+    "refresh_database_metadata": TaskClass.WARMUP,
+    "prefetch_database_metadata": TaskClass.WARMUP,
+    "cache_chart_thumbnail": TaskClass.THUMBNAILS,
+    "cache_dashboard_thumbnail": TaskClass.THUMBNAILS,
+    "cache_dashboard_screenshot": TaskClass.THUMBNAILS,
+}
+
+
+def get_task_router(
+    queues: dict[str, str],
+) -> Callable[..., Optional[dict[str, str]]]:
+    """
+    Return a Celery router sending the tasks of each class to its queue.
+
+    :param queues: The queue of each task class, the tasks of other classes going to
+        the default queue
+    """
+
+    def route_task(name: str, *args: Any, **kwargs: Any) -> Optional[dict[str, str]]:
+        if (task_class := TASK_CLASSES.get(name)) and (queue := queues.get(task_class)):
+            return {"queue": queue}
+        return None
+
+    return route_task
+
+
+def has_concurrency_limit(task_class: TaskClass, scope: str) -> bool:
+    """
+    Return whether the tasks of a class are limited for a scope.
+
+    :param task_class: The class of the tasks
+    :param scope: The scope of the limit, ``user`` or ``database``
+    """
+    limits = current_app.config["CELERY_TASK_CONCURRENCY_LIMITS"].get(task_class, {})
+    return scope in limits
+
+
+def _get_slot_timeout(task: Any) -> int:
+    # a slot is held for as long as the task may run, the time limits given when
+    # publishing the task overriding the ones of the task
+    time_limits = [
+        *(getattr(task.request, "timelimit", None) or ()),
+        task.time_limit,
+        task.soft_time_limit,
+    ]
+    return max(
+        [
+            current_app.config["CELERY_TASK_CONCURRENCY_SLOT_TIMEOUT"],
+            *(int(time_limit) for time_limit in time_limits if time_limit),
+        ]
+    )
+
+
+def _acquire_slot(
+    task_class: TaskClass,
+    scope: str,
+    scope_id: int,
+    limit: int,
+    timeout: int,
+) -> Optional[str]:
+    for slot in range(limit):
+        key = f"task_slot_{task_class}_{scope}_{scope_id}_{slot}"
+        if cache_manager.cache.add(key, True, timeout=timeout):
+            return key
+    return None
+
+
+@contextmanager
+def concurrency_slot(
+    task_class: TaskClass,
+    user_id: Optional[int] = None,
+    database_id: Optional[int] = None,
+    limits: Optional[dict[str, int]] = None,
+) -> Iterator[None]:
+    """
+    Hold a slot of the concurrency limits of a task class, for a user and for a
+    database, while the current task runs.
+
+    When all the slots of the user or of the database are taken, the task is retried
+    after ``CELERY_TASK_CONCURRENCY_RETRY_DELAY`` seconds. Tasks called directly or
+    eagerly are never limited.
+
+    :param task_class: The class of the current task
+    :param user_id: The user running the task
+    :param database_id: The database queried by the task
+    :param limits: The limits of the task, the limits of its class by default
+    :raises Retry: When the task is over a limit
+    """
+    config = current_app.config
+    if limits is None:
+        limits = config["CELERY_TASK_CONCURRENCY_LIMITS"].get(task_class, {})
+    task = current_task
+    if not limits or not task or task.request.called_directly or task.request.is_eager:
+        yield
+        return
+
+    keys: list[str] = []
+    timeout = _get_slot_timeout(task)
+    try:
+        for scope, scope_id in (("user", user_id), ("database", database_id)):
+            if scope_id is None or scope not in limits:
+                continue
+            key = _acquire_slot(task_class, scope, scope_id, limits[scope], timeout)
+            if key is None:
+                logger.debug("Too many %s tasks for %s %s", task_class, scope, scope_id)
+                stats_logger_manager.instance.incr(f"celery.{task_class}.throttled")
+                raise task.retry(
+                    countdown=config["CELERY_TASK_CONCURRENCY_RETRY_DELAY"],
+                    max_retries=None,
+                )
+            keys.append(key)
+        yield
+    finally:
+        for key in keys:
+            cache_manager.cache.delete(key)
+
+
+@before_task_publish.connect
+def on_task_publish(  # pylint: disable=unused-argument
+    sender: Optional[str] = None,
+    headers: Optional[dict[str, Any]] = None,
+    **kwargs: Any,
+) -> None:
+    if not (task_class := TASK_CLASSES.get(sender or "")):
+        return
+    if headers is not None:
+        # read by the worker to measure the time the task waited in the queue
+        headers.setdefault(PUBLISHED_AT_HEADER, now_as_float())
+    stats_logger_manager.instance.incr(f"celery.{task_class}.published")
+
+
+@task_prerun.connect
+def on_task_prerun(  # pylint: disable=unused-argument
+    task: Any = None,
+    **kwargs: Any,
+) -> None:
+    if not task or not (task_class := TASK_CLASSES.get(task.name)):
+        return
+    stats_logger = stats_logger_manager.instance
+    stats_logger.incr(f"celery.{task_class}.started")
+    if published_at := getattr(task.request, PUBLISHED_AT_HEADER, None):
+        stats_logger.timing(
+            f"celery.{task_class}.wait_time", now_as_float() - published_at
+        )
@@ -18,11 +18,13 @@ from __future__ import annotations
 
 import inspect
 import logging
+import time
+from collections.abc import Hashable
 from datetime import datetime, timedelta
 from functools import wraps
-from typing import Any, Callable, TYPE_CHECKING
+from typing import Any, Callable, NamedTuple, TYPE_CHECKING, TypeVar
 
-from flask import current_app as app, request
+from flask import current_app as app, has_request_context, request
 from flask_caching import Cache
 from flask_caching.backends import NullCache
 from werkzeug.wrappers import Response
@@ -36,6 +38,10 @@ from superset.utils.json import json_int_dttm_ser
 if TYPE_CHECKING:
     from superset.stats_logger import BaseStatsLogger
 
+T = TypeVar("T")
+
+REQUEST_CACHE_ENVIRON_KEY = "superset.request_cache"
+
 config = app.config
 stats_logger: BaseStatsLogger = config["STATS_LOGGER"]
 logger = logging.getLogger(__name__)
@@ -89,7 +95,56 @@ ONE_YEAR = 365 * 24 * 60 * 60  # 1 year in seconds
 logger = logging.getLogger(__name__)
 
 
-def memoized_func(key: str, cache: Cache = cache_manager.cache) -> Callable[..., Any]:
+class StaleWhileRevalidateEntry(NamedTuple):
+    """
+    A value cached by `memoized_func` that is kept in the cache after it expires.
+    """
+
+    value: Any
+    expires_at: float
+
+
+def _schedule_revalidation(  # pylint: disable=too-many-arguments
+    cache: Cache,
+    cache_key: str,
+    revalidate: Callable[[Callable[..., Any], dict[str, Any], int], bool] | None,
+    f: Callable[..., Any],
+    arguments: dict[str, Any],
+    cache_timeout: int,
+) -> bool:
+    # only one refresh is scheduled for an expired value
+    if not cache.add(f"{cache_key}:revalidate", True, timeout=cache_timeout):
+        return True
+    if revalidate and revalidate(f, arguments, cache_timeout):
+        stats_logger.incr("memoized_func.revalidate")
+        return True
+    return False
+
+
+def _set_memoized(
+    cache: Cache,
+    cache_key: str,
+    obj: Any,
+    cache_timeout: int | None,
+    stale: int,
+) -> None:
+    if stale > 0 and cache_timeout:
+        cache.set(
+            cache_key,
+            StaleWhileRevalidateEntry(obj, time.time() + cache_timeout),
+            timeout=cache_timeout + stale,
+        )
+        cache.delete(f"{cache_key}:revalidate")
+    else:
+        cache.set(cache_key, obj, timeout=cache_timeout)
+
+
+def memoized_func(
+    key: str,
+    cache: Cache = cache_manager.cache,
+    revalidate: Callable[[Callable[..., Any], dict[str, Any], int], bool] | None = None,
+    stale_timeout: Callable[[], int] | None = None,
+) -> Callable[..., Any]:
     """
     Decorator with configurable key and cache backend.
 
@@ -112,9 +167,18 @@ def memoized_func(key: str, cache: Cache = cache_manager.cache) -> Callable[...,
     timeout of cache is set to CACHE_DEFAULT_TIMEOUT seconds by default,
     except cache_timeout = {timeout in seconds} is passed to the decorated function.
 
+    When `revalidate` is set and `stale_timeout` returns a positive number of seconds,
+    values are kept in the cache for that long after they expire. An expired value
+    is then returned immediately, and `revalidate` is called once with the decorated
+    function, its arguments and the cache timeout, to refresh the value eg in a
+    background task. When `revalidate` returns False the value is computed again
+    instead.
+
     :param key: a callable function that takes function arguments and returns
                 the caching key.
     :param cache: a FlaskCache instance that will store the cache.
+    :param revalidate: a callable scheduling the refresh of an expired value
+    :param stale_timeout: a callable returning how long expired values are kept
     """  # noqa: E501
 
     def wrap(f: Callable[..., Any]) -> Callable[..., Any]:
@@ -134,11 +198,30 @@ def memoized_func(key: str, cache: Cache = cache_manager.cache) -> Callable[...,
             bound_args.apply_defaults()
             cache_key = key.format(**bound_args.arguments)
 
+            stale = stale_timeout() if revalidate and stale_timeout else 0
+            # expired values are only kept with a known timeout, otherwise the
+            # default timeout of the cache backend applies
+            if stale > 0 and cache_timeout is None:
+                cache_timeout = app.config["CACHE_DEFAULT_TIMEOUT"]
+
             obj = cache.get(cache_key)
-            if not force and obj is not None:
+            if not force and isinstance(obj, StaleWhileRevalidateEntry):
+                if time.time() < obj.expires_at:
+                    return obj.value
+                if stale > 0 and _schedule_revalidation(
+                    cache,
+                    cache_key,
+                    revalidate,
+                    f,
+                    bound_args.arguments,
+                    cache_timeout,
+                ):
+                    return obj.value
+            elif not force and obj is not None:
                 return obj
+
             obj = f(*args, **kwargs)
-            cache.set(cache_key, obj, timeout=cache_timeout)
+            _set_memoized(cache, cache_key, obj, cache_timeout, stale)
             return obj
 
         return wrapped_f
@@ -146,6 +229,43 @@ def memoized_func(key: str, cache: Cache = cache_manager.cache) -> Callable[...,
     return wrap
 
 
+def memoize_per_request(key: Hashable, func: Callable[[], T]) -> T:
+    """
+    Compute a value once per request.
+
+    Values are stored in the WSGI environ of the request, so they are shared by the
+    threads running the queries of a request and discarded with it. Outside of a
+    request the value is computed on every call.
+
+    :param key: the key of the value, unique within the request
+    :param func: a callable computing the value
+    :returns: the value
+    """
+    if not has_request_context():
+        return func()
+
+    values = request.environ.setdefault(REQUEST_CACHE_ENVIRON_KEY, {})
+    if key not in values:
+        values[key] = func()
+    return values[key]
+
+
+def forget_per_request(predicate: Callable[[Hashable], bool]) -> None:
+    """
+    Discard the values computed for the current request whose key matches, see
+    `memoize_per_request`.
+
+    :param predicate: a callable returning whether a value should be discarded, given
+        its key
+    """
+    if not has_request_context():
+        return
+
+    values = request.environ.get(REQUEST_CACHE_ENVIRON_KEY, {})
+    for key in [key for key in values if predicate(key)]:
+        del values[key]
+
+
 def etag_cache(  # noqa: C901
     cache: Cache = cache_manager.cache,
     get_last_modified: Callable[..., datetime] | None = None,
@@ -22,6 +22,7 @@ from flask_caching import Cache
 from markupsafe import Markup
 
 from superset.utils.core import DatasourceType
+from superset.utils.local_cache import LocalCache
 
 logger = logging.getLogger(__name__)
 
@@ -55,6 +56,7 @@ class CacheManager:
 
         self._cache = Cache()
         self._data_cache = Cache()
+        self._local_data_cache = LocalCache()
         self._thumbnail_cache = Cache()
         self._filter_state_cache = Cache()
         self._explore_form_data_cache = ExploreFormDataCache()
@@ -89,6 +91,7 @@ class CacheManager:
     def init_app(self, app: Flask) -> None:
         self._init_cache(app, self._cache, "CACHE_CONFIG")
         self._init_cache(app, self._data_cache, "DATA_CACHE_CONFIG")
+        self._local_data_cache.init_app(app, "DATA_CACHE_LOCAL")
         self._init_cache(app, self._thumbnail_cache, "THUMBNAIL_CACHE_CONFIG")
         self._init_cache(
             app, self._filter_state_cache, "FILTER_STATE_CACHE_CONFIG", required=True
@@ -104,6 +107,10 @@ class CacheManager:
     def data_cache(self) -> Cache:
         return self._data_cache
 
+    @property
+    def local_data_cache(self) -> LocalCache:
+        return self._local_data_cache
+
     @property
     def cache(self) -> Cache:
         return self._cache
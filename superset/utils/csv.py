@@ -17,6 +17,7 @@
 import logging
 import re
 import urllib.request
+from collections.abc import Iterable, Iterator
 from typing import Any, Optional, Union
 from urllib.error import URLError
 
@@ -64,23 +65,64 @@ def escape_value(value: str) -> str:
     return value
 
 
+def escape_values(column: pd.Series) -> pd.Series:
+    """
+    Escapes all the string values of a column at once, see `escape_value`.
+    """
+    is_string = column.map(lambda value: isinstance(value, str)).astype(bool)
+    if not is_string.any():
+        return column
+
+    # non-string values are blanked, so that the masks have the same labels as the
+    # column, duplicates included
+    strings = column.where(is_string, "").astype(str)
+    is_problematic = strings.str.match(problematic_chars_re.pattern)
+    needs_escaping = (
+        is_string & is_problematic & ~strings.str.match(negative_number_re.pattern)
+    )
+    if not needs_escaping.any():
+        return column
+
+    escaped = "'" + strings.str.replace("|", "\\|", regex=False)
+    return column.mask(needs_escaping, escaped)
+
+
 def df_to_escaped_csv(df: pd.DataFrame, **kwargs: Any) -> Any:
-    def escape_values(v: Any) -> Union[str, Any]:
+    def escape_header(v: Any) -> Union[str, Any]:
         return escape_value(v) if isinstance(v, str) else v
 
     # Escape csv headers
-    df = df.rename(columns=escape_values)
+    df = df.rename(columns=escape_header)
 
     # Escape csv values
-    for name, column in df.items():
+    for idx, (_, column) in enumerate(df.items()):
         if column.dtype == np.dtype(object):
-            for idx, value in enumerate(column.values):
-                if isinstance(value, str):
-                    df.at[idx, name] = escape_value(value)
+            df.isetitem(idx, escape_values(column))
 
     return df.to_csv(escapechar="\\", **kwargs)
 
 
+def df_chunks_to_escaped_csv(
+    chunks: Iterable[pd.DataFrame],
+    columns: Optional[Iterable[Any]] = None,
+    **kwargs: Any,
+) -> Iterator[str]:
+    """
+    Convert dataframes to CSV one at a time, writing the header only once.
+
+    Used to stream exports without holding the whole result in memory. When there
+    are no dataframes, the header is written from `columns`, if given.
+    """
+    header = kwargs.pop("header", True)
+    empty = True
+    for chunk in chunks:
+        yield df_to_escaped_csv(chunk, header=header, **kwargs)
+        header = False
+        empty = False
+    if empty and columns is not None:
+        yield df_to_escaped_csv(pd.DataFrame(columns=columns), header=header, **kwargs)
+
+
 def get_chart_csv_data(
     chart_url: str, auth_cookies: Optional[dict[str, str]] = None
 ) -> Optional[bytes]:
@@ -15,10 +15,16 @@
 # specific language governing permissions and limitations
 # under the License.
 import hashlib
+import json as _json
+from decimal import Decimal
 from typing import Any, Callable, Optional
 
 from superset.utils import json
 
+# types serialized natively by simplejson, which the standard library delegates to
+# the `default` function
+_SIMPLEJSON_NATIVE_TYPES = (Decimal, bytes)
+
 
 def md5_sha_from_str(val: str) -> str:
     return hashlib.md5(val.encode("utf-8")).hexdigest()  # noqa: S324
@@ -29,8 +35,31 @@ def md5_sha_from_dict(
     ignore_nan: bool = False,
     default: Optional[Callable[[Any], Any]] = None,
 ) -> str:
-    json_data = json.dumps(
-        obj, sort_keys=True, ignore_nan=ignore_nan, default=default, allow_nan=True
-    )
+    return md5_sha_from_str(_dumps_sorted(obj, ignore_nan=ignore_nan, default=default))
+
+
+def _dumps_sorted(
+    obj: dict[Any, Any],
+    ignore_nan: bool = False,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> str:
+    """
+    Serialize a dict with sorted keys, for hashing.
+
+    The standard library encoder is about twice as fast as simplejson, and produces
+    the same output for string keys and the values found in form data. Objects
+    with values it serializes differently (NaN, decimals or bytes) fall back to
+    simplejson, so that their hashes don't change.
+    """
+
+    def fast_default(value: Any) -> Any:
+        if default is None or isinstance(value, _SIMPLEJSON_NATIVE_TYPES):
+            raise TypeError
+        return default(value)
 
-    return md5_sha_from_str(json_data)
+    try:
+        return _json.dumps(obj, sort_keys=True, default=fast_default, allow_nan=False)
+    except (TypeError, ValueError):
+        return json.dumps(
+            obj, sort_keys=True, ignore_nan=ignore_nan, default=default, allow_nan=True
+        )
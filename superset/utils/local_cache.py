@@ -0,0 +1,150 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from flask import Flask
+
+
+@dataclass
+class LocalCacheEntry:
+    value: Any
+    size: int
+    expires_at: float
+    tag: str | None
+
+
+class LocalCache:
+    """
+    A thread-safe, in-process LRU cache bounded by the total size of its values.
+
+    Entries expire after their own timeout, and can be tagged (e.g. with the UID of
+    a datasource) so that all the entries sharing a tag can be invalidated at once.
+    The cache is disabled when its maximum size is 0.
+    """
+
+    def __init__(self, max_bytes: int = 0, default_timeout: int = 60) -> None:
+        self.max_bytes = max_bytes
+        self.default_timeout = default_timeout
+        self._entries: OrderedDict[str, LocalCacheEntry] = OrderedDict()
+        self._tags: dict[str, set[str]] = {}
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def init_app(self, app: Flask, config_prefix: str) -> None:
+        self.max_bytes = app.config[f"{config_prefix}_MAX_BYTES"]
+        self.default_timeout = app.config[f"{config_prefix}_TIMEOUT"]
+        self.clear()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at <= time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry.value
+
+    def set(  # pylint: disable=too-many-arguments
+        self,
+        key: str,
+        value: Any,
+        size: int,
+        timeout: float | None = None,
+        tag: str | None = None,
+    ) -> int:
+        """
+        Store a value, evicting the least recently used entries to make room.
+
+        :param key: the cache key
+        :param value: the value to store
+        :param size: the size of the value, in bytes
+        :param timeout: seconds until the entry expires, bounded by the default
+        :param tag: an optional tag used to invalidate related entries
+        :returns: the number of entries evicted to make room for the value
+        """
+        timeout = (
+            self.default_timeout
+            if timeout is None
+            else min(timeout, self.default_timeout)
+        )
+        if not self.enabled or timeout <= 0 or size > self.max_bytes:
+            return 0
+
+        evicted = 0
+        with self._lock:
+            self._remove(key)
+            while self._entries and self._size + size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                evicted += 1
+
+            self._entries[key] = LocalCacheEntry(
+                value=value,
+                size=size,
+                expires_at=time.monotonic() + timeout,
+                tag=tag,
+            )
+            self._size += size
+            if tag:
+                self._tags.setdefault(tag, set()).add(key)
+
+        return evicted
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._remove(key)
+
+    def delete_tag(self, tag: str) -> int:
+        """
+        Remove all the entries with a given tag, returning how many were removed.
+        """
+        with self._lock:
+            keys = self._tags.pop(tag, set())
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+            self._size = 0
+
+    def _remove(self, key: str) -> None:
+        if (entry := self._entries.pop(key, None)) is None:
+            return
+
+        self._size -= entry.size
+        if entry.tag and (keys := self._tags.get(entry.tag)):
+            keys.discard(key)
+            if not keys:
+                del self._tags[entry.tag]
@@ -45,6 +45,7 @@ from superset.models.core import Database
 from superset.models.dashboard import Dashboard
 from superset.models.slice import Slice
 from superset.models.sql_lab import Query
+from superset.sqllab import result_chunks
 from superset.superset_typing import FormData
 from superset.utils import json
 from superset.utils.core import DatasourceType
@@ -500,21 +501,67 @@ def check_datasource_perms(
 
 
 def _deserialize_results_payload(
-    payload: Union[bytes, str], query: Query, use_msgpack: Optional[bool] = False
+    payload: Union[bytes, str],
+    query: Query,
+    use_msgpack: Optional[bool] = False,
+    offset: int = 0,
+    limit: Optional[int] = None,
+    results_key: Optional[str] = None,
+) -> dict[str, Any]:
+    return _decode_results_payload(
+        _load_results_payload(payload, use_msgpack),
+        query,
+        use_msgpack,
+        offset,
+        limit,
+        results_key,
+    )
+
+
+def _load_results_payload(
+    payload: Union[bytes, str], use_msgpack: Optional[bool] = False
 ) -> dict[str, Any]:
     logger.debug("Deserializing from msgpack: %r", use_msgpack)
     if use_msgpack:
         with stats_timing(
             "sqllab.query.results_backend_msgpack_deserialize", stats_logger
         ):
-            ds_payload = msgpack.loads(payload, raw=False)
+            return msgpack.loads(payload, raw=False)
 
+    with stats_timing("sqllab.query.results_backend_json_deserialize", stats_logger):
+        return json.loads(payload)
+
+
+def _decode_results_payload(
+    ds_payload: dict[str, Any],
+    query: Query,
+    use_msgpack: Optional[bool] = False,
+    offset: int = 0,
+    limit: Optional[int] = None,
+    results_key: Optional[str] = None,
+) -> dict[str, Any]:
+    """
+    Decode the data of a results payload loaded from the results backend.
+
+    Only the rows in the range given by `offset` and `limit` are returned; when the
+    results are stored in chunks only the chunks overlapping it are read, under
+    `results_key`, the results key of the query by default.
+    """
+    ds_payload = dict(ds_payload)
+    results_key = results_key or query.results_key
+    if use_msgpack:
         with stats_timing("sqllab.query.results_backend_pa_deserialize", stats_logger):
-            try:
-                reader = pa.BufferReader(ds_payload["data"])
-                pa_table = pa.ipc.open_stream(reader).read_all()
-            except pa.ArrowSerializationError as ex:
-                raise SerializationError("Unable to deserialize table") from ex
+            if result_chunks.is_chunked(ds_payload):
+                pa_table = result_chunks.read_rows(
+                    results_key, ds_payload, True, offset, limit
+                )
+            else:
+                try:
+                    reader = pa.BufferReader(ds_payload["data"])
+                    pa_table = pa.ipc.open_stream(reader).read_all()
+                except pa.ArrowSerializationError as ex:
+                    raise SerializationError("Unable to deserialize table") from ex
+                pa_table = pa_table.slice(offset, limit)
 
         df = result_set.SupersetResultSet.convert_table_to_df(pa_table)
         ds_payload["data"] = dataframe.df_to_records(df) or []
@@ -533,8 +580,14 @@ def _deserialize_results_payload(
 
         return ds_payload
 
-    with stats_timing("sqllab.query.results_backend_json_deserialize", stats_logger):
-        return json.loads(payload)
+    if result_chunks.is_chunked(ds_payload):
+        ds_payload["data"] = result_chunks.read_rows(
+            results_key, ds_payload, False, offset, limit
+        )
+    elif offset or limit is not None:
+        stop = None if limit is None else offset + limit
+        ds_payload["data"] = ds_payload["data"][offset:stop]
+    return ds_payload
 
 
 def get_cta_schema_name(
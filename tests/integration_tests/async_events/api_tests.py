@@ -125,6 +125,53 @@ class TestAsyncEventApi(SupersetTestCase):
             RedisSentinelCacheBackend, self._test_events_logic
         )
 
+    @mock.patch("uuid.uuid4", return_value=UUID)
+    def test_events_long_polling(self, mock_uuid4):
+        def test_func(mock_cache):
+            with (
+                mock.patch.object(async_query_manager, "_long_polling_timeout", 5),
+                mock.patch.object(mock_cache, "xread") as mock_xread,
+            ):
+                mock_xread.return_value = []
+                rv = self.client.get(
+                    "api/v1/async_event/?last_id=1607471525180-0&timeout=2"
+                )
+
+            assert rv.status_code == 200
+            channel_id = (
+                app.config["GLOBAL_ASYNC_QUERIES_REDIS_STREAM_PREFIX"] + self.UUID
+            )
+            mock_xread.assert_called_with(channel_id, "1607471525180-0", 100, 2000)
+
+        self.run_test_with_cache_backend(RedisCacheBackend, test_func)
+
+    @mock.patch("uuid.uuid4", return_value=UUID)
+    def test_stream(self, mock_uuid4):
+        def test_func(mock_cache):
+            event = {"id": "1607477697866-0", "job_id": "abc"}
+            with mock.patch.object(
+                async_query_manager,
+                "stream_events",
+                return_value=iter([[event], []]),
+            ) as stream_events:
+                rv = self.client.get(
+                    "api/v1/async_event/stream",
+                    headers={"Last-Event-ID": "1607471525180-0"},
+                )
+                body = rv.data.decode("utf-8")
+
+            assert rv.status_code == 200
+            assert rv.mimetype == "text/event-stream"
+            stream_events.assert_called_with(self.UUID, "1607471525180-0")
+            delay = app.config["GLOBAL_ASYNC_QUERIES_POLLING_DELAY"]
+            assert body == (
+                f"retry: {delay}\n\n"
+                f"id: 1607477697866-0\ndata: {json.dumps(event)}\n\n"
+                ": keep-alive\n\n"
+            )
+
+        self.run_test_with_cache_backend(RedisCacheBackend, test_func)
+
     def test_events_no_login(self):
         app._got_first_request = False
         async_query_manager_factory.init_app(app)
@@ -30,6 +30,7 @@ from flask.ctx import AppContext
 
 from superset.charts.data.api import ChartDataRestApi
 from superset.commands.chart.data.get_data_command import ChartDataCommand
+from superset.commands.chart.exceptions import ChartDataCacheLoadError
 from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
 from superset.connectors.sqla.models import SqlaTable, TableColumn
 from superset.errors import SupersetErrorType
@@ -788,6 +789,67 @@ class TestPostChartDataApi(BaseTestChartDataApi):
         rv = test_client.post(CHART_DATA_URI, json=self.query_context_payload)
         assert rv.status_code == 401
 
+    @with_feature_flags(GLOBAL_ASYNC_QUERIES=True)
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    def test_chart_data_batch(self):
+        """
+        Chart data API: Test loading the data of several charts in one batch, with
+        cached results and invalid query contexts answered right away
+        """
+        self.logout()
+        app._got_first_request = False
+        async_query_manager_factory.init_app(app)
+        self.login(ADMIN_USERNAME)
+        invalid_payload = copy.deepcopy(self.query_context_payload)
+        invalid_payload["datasource"] = {"id": -1, "type": "table"}
+        cmd_run_val = {"cache_key": "cached", "queries": []}
+
+        with (
+            mock.patch.object(
+                ChartDataCommand,
+                "run",
+                side_effect=[cmd_run_val, ChartDataCacheLoadError("")],
+            ),
+            mock.patch.object(
+                async_query_manager_factory.instance(),
+                "_load_chart_data_batch_into_cache_job",
+            ) as job_mock,
+        ):
+            rv = self.client.post(
+                f"{CHART_DATA_URI}/batch",
+                json={
+                    "query_contexts": [
+                        self.query_context_payload,
+                        invalid_payload,
+                        self.query_context_payload,
+                    ]
+                },
+            )
+
+        assert rv.status_code == 202
+        cached, invalid, pending = rv.json["result"]
+        assert cached["status"] == "done"
+        assert cached["result_url"] == f"/{CHART_DATA_URI}/cached"
+        assert invalid["status"] == "error"
+        assert invalid["errors"] == [{"message": "Datasource does not exist"}]
+        assert pending["status"] == "pending"
+        job_mock.delay.assert_called_once_with(
+            {"user_id": mock.ANY},
+            [pending],
+            [json.loads(json.dumps(self.query_context_payload))],
+        )
+
+    @with_feature_flags(GLOBAL_ASYNC_QUERIES=False)
+    def test_chart_data_batch_disabled(self):
+        """
+        Chart data API: Test that charts can only be loaded in batch asynchronously
+        """
+        rv = self.client.post(
+            f"{CHART_DATA_URI}/batch",
+            json={"query_contexts": [self.query_context_payload]},
+        )
+        assert rv.status_code == 400
+
     @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
     def test_chart_data_rowcount(self):
         """
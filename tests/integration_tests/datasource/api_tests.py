@@ -56,6 +56,17 @@ class TestDatasourceApi(SupersetTestCase):
         for val in ["a", "b", "c", "d", "e", "f", "g", "h", "i", "j"]:
             assert val in response["result"]
 
+    @pytest.mark.usefixtures("app_context", "virtual_dataset")
+    def test_get_column_values_prefix(self):
+        self.login(ADMIN_USERNAME)
+        table = self.get_virtual_dataset()
+        rv = self.client.get(
+            f"api/v1/datasource/table/{table.id}/column/col2/values/?prefix=B"
+        )
+        assert rv.status_code == 200
+        response = json.loads(rv.data.decode("utf-8"))
+        assert response["result"] == ["b"]
+
     @pytest.mark.usefixtures("app_context", "virtual_dataset")
     def test_get_column_values_floats(self):
         self.login(ADMIN_USERNAME)
@@ -144,6 +155,7 @@ class TestDatasourceApi(SupersetTestCase):
             column_name="col2",
             limit=10000,
             denormalize_column=False,
+            prefix=None,
         )
 
     @pytest.mark.usefixtures("app_context", "virtual_dataset")
@@ -166,6 +178,7 @@ class TestDatasourceApi(SupersetTestCase):
             column_name="col2",
             limit=10000,
             denormalize_column=True,
+            prefix=None,
         )
 
     @pytest.mark.usefixtures("app_context", "virtual_dataset")
@@ -624,14 +624,25 @@ class TestQueryContext(SupersetTestCase):
         query_context = ChartDataQueryContextSchema().load(payload)
         query_object = query_context.queries[0]
         time_offsets_obj = query_context.processing_time_offsets(df, query_object)
-        query_from_1977_to_1988 = time_offsets_obj["queries"][0]
-        query_from_1983_to_1994 = time_offsets_obj["queries"][1]
+        query_from_1977_to_1994 = time_offsets_obj["queries"][0]
+
+        # overlapping offsets are queried at once, over the union of their ranges
+        assert time_offsets_obj["queries"][1] == query_from_1977_to_1994
+        assert "1977-01-01" in query_from_1977_to_1994
+        assert "1994-01-01" in query_from_1977_to_1994
 
         # should generate expected date range in sql
+        payload["queries"][0]["time_offsets"] = ["3 years ago", "20 years later"]
+        query_context = ChartDataQueryContextSchema().load(payload)
+        query_object = query_context.queries[0]
+        time_offsets_obj = query_context.processing_time_offsets(df, query_object)
+        query_from_1977_to_1988 = time_offsets_obj["queries"][0]
+        query_from_2000_to_2011 = time_offsets_obj["queries"][1]
+
         assert "1977-01-01" in query_from_1977_to_1988
         assert "1988-01-01" in query_from_1977_to_1988
-        assert "1983-01-01" in query_from_1983_to_1994
-        assert "1994-01-01" in query_from_1983_to_1994
+        assert "2000-01-01" in query_from_2000_to_2011
+        assert "2011-01-01" in query_from_2000_to_2011
 
     @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
     def test_time_offsets_accuracy(self):
@@ -459,3 +459,43 @@ class TestSqlLabApi(SupersetTestCase):
         assert list(expected_data) == list(data)
         db.session.delete(query_obj)
         db.session.commit()
+
+    @mock.patch("superset.models.sql_lab.Query.raise_for_access", lambda _: None)  # noqa: PT008
+    @mock.patch("superset.commands.sql_lab.export.results_backend", None)
+    @mock.patch("superset.models.core.Database.get_df_chunks")
+    def test_export_results_streaming(self, get_df_chunks_mock: mock.Mock) -> None:
+        self.login(ADMIN_USERNAME)
+
+        database = get_example_database()
+        query_obj = Query(
+            client_id="test",
+            database=database,
+            tab_name="test_tab",
+            sql_editor_id="test_editor_id",
+            sql="select * from bar",
+            select_sql=None,
+            executed_sql="select * from bar limit 2",
+            limit=100,
+            select_as_cta=False,
+            rows=104,
+            error_message="none",
+            results_key="test_abc",
+        )
+
+        db.session.add(query_obj)
+        db.session.commit()
+
+        get_df_chunks_mock.return_value = iter(
+            [pd.DataFrame({"foo": [1]}), pd.DataFrame({"foo": [2, 3]})]
+        )
+
+        with mock.patch.dict(
+            "superset.commands.sql_lab.export.config", {"CSV_STREAMING_EXPORT": True}
+        ):
+            resp = self.client.get("/api/v1/sqllab/export/test/")
+
+        assert resp.status_code == 200
+        assert resp.is_streamed
+        assert resp.get_data(as_text=True) == "foo\n1\n2\n"
+        db.session.delete(query_obj)
+        db.session.commit()
@@ -14,6 +14,7 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+from typing import Any
 from unittest import mock
 from unittest.mock import Mock, patch
 
@@ -33,6 +34,7 @@ from superset.exceptions import (
 )
 from superset.models.core import Database  # noqa: F401
 from superset.models.sql_lab import Query
+from superset.sqllab import result_chunks
 from superset.sqllab.limiting_factor import LimitingFactor
 from superset.sqllab.schemas import EstimateQueryCostSchema
 from superset.utils import core as utils
@@ -40,6 +42,28 @@ from superset.utils.database import get_example_database
 from tests.integration_tests.base_tests import SupersetTestCase
 
 
+def store_chunked_results(
+    backend: Mock, data: list[dict[str, Any]], chunk_rows: int, **payload: Any
+) -> None:
+    """
+    Store JSON results in chunks in a mocked results backend.
+    """
+    values: dict[str, Any] = {}
+    backend.get.side_effect = values.get
+    backend.set_many.side_effect = lambda mapping, timeout: values.update(mapping)
+
+    chunks, _ = result_chunks.serialize_chunks(data, chunk_rows)
+    result_chunks.write_chunks("abc_query", chunks, 60)
+    manifest = {
+        **payload,
+        "data": None,
+        "chunks": {"count": len(chunks), "rows": chunk_rows},
+    }
+    values["abc_query"] = utils.zlib_compress(
+        sql_lab._serialize_payload(manifest, False)
+    )
+
+
 class TestQueryEstimationCommand(SupersetTestCase):
     def test_validation_no_database(self) -> None:
         params = {"database_id": 1, "sql": "SELECT 1"}
@@ -244,6 +268,98 @@ class TestSqlResultExportCommand(SupersetTestCase):
         assert result["count"] == 5
         assert result["query"].client_id == "test"
 
+    @pytest.mark.usefixtures("create_database_and_query")
+    @patch("superset.models.sql_lab.Query.raise_for_access", lambda _: None)
+    @patch("superset.commands.sql_lab.export.results_backend", None)
+    @patch("superset.models.core.Database.get_df_chunks")
+    def test_run_streaming_executed_sql(self, get_df_chunks_mock: Mock) -> None:
+        query_obj = db.session.query(Query).filter_by(client_id="test").one()
+        query_obj.executed_sql = "select * from bar limit 3"
+        query_obj.select_sql = None
+        db.session.commit()
+
+        command = export.SqlResultExportCommand("test")
+
+        get_df_chunks_mock.return_value = iter(
+            [pd.DataFrame({"foo": [1, 2]}), pd.DataFrame({"foo": [3, 4]})]
+        )
+        with patch.dict(
+            "superset.commands.sql_lab.export.config",
+            {"CSV_STREAMING_EXPORT": True, "CSV_STREAMING_CHUNK_SIZE": 2},
+        ):
+            result = command.run()
+
+        assert not isinstance(result["data"], str)
+        assert "".join(result["data"]) == "foo\n1\n2\n3\n"
+        assert result["count"] is None
+        assert get_df_chunks_mock.call_args.kwargs["chunk_size"] == 2
+
+    @pytest.mark.usefixtures("create_database_and_query")
+    @patch("superset.models.sql_lab.Query.raise_for_access", lambda _: None)
+    @patch("superset.commands.sql_lab.export.results_backend_use_msgpack", False)
+    def test_run_streaming_with_results_backend(self) -> None:
+        command = export.SqlResultExportCommand("test")
+
+        payload = {
+            "columns": [{"name": "foo"}],
+            "data": [{"foo": i} for i in range(5)],
+        }
+        compressed = utils.zlib_compress(sql_lab._serialize_payload(payload, False))
+
+        with (
+            patch(
+                "superset.commands.sql_lab.export.results_backend", new=mock.Mock()
+            ) as backend,
+            patch.dict(
+                "superset.commands.sql_lab.export.config",
+                {
+                    "CSV_STREAMING_EXPORT": True,
+                    "CSV_STREAMING_CHUNK_SIZE": 2,
+                    "CSV_STREAMING_MAX_ROWS": 3,
+                },
+            ),
+        ):
+            backend.get.return_value = compressed
+            result = command.run()
+
+        assert list(result["data"]) == ["foo\n0\n1\n", "2\n"]
+        assert result["count"] == 3
+
+    @pytest.mark.usefixtures("create_database_and_query")
+    @patch("superset.models.sql_lab.Query.raise_for_access", lambda _: None)
+    @patch("superset.commands.sql_lab.export.results_backend_use_msgpack", False)
+    def test_run_streaming_with_chunked_results(self) -> None:
+        command = export.SqlResultExportCommand("test")
+
+        with (
+            patch(
+                "superset.commands.sql_lab.export.results_backend", new=mock.Mock()
+            ) as backend,
+            patch("superset.sqllab.result_chunks.results_backend", new=backend),
+            patch.dict(
+                "superset.commands.sql_lab.export.config",
+                {"CSV_STREAMING_EXPORT": True, "CSV_STREAMING_MAX_ROWS": 5},
+            ),
+        ):
+            store_chunked_results(
+                backend,
+                [{"foo": i} for i in range(7)],
+                2,
+                columns=[{"name": "foo"}],
+                query={"rows": 7},
+            )
+            result = command.run()
+            data = list(result["data"])
+
+        assert data == ["foo\n0\n1\n", "2\n3\n", "4\n"]
+        assert result["count"] == 5
+        assert [call.args[0] for call in backend.get.call_args_list] == [
+            "abc_query",
+            "abc_query/chunk/0",
+            "abc_query/chunk/1",
+            "abc_query/chunk/2",
+        ]
+
 
 class TestSqlExecutionResultsCommand(SupersetTestCase):
     @pytest.fixture
@@ -364,3 +480,32 @@ class TestSqlExecutionResultsCommand(SupersetTestCase):
         assert result.get("status") == "success"
         assert result["query"].get("rows") == 104
         assert result.get("data") == data
+
+    @pytest.mark.usefixtures("create_database_and_query")
+    @patch("superset.commands.sql_lab.results.results_backend_use_msgpack", False)
+    def test_run_chunked_results(self) -> None:
+        data = [{"col_0": i} for i in range(104)]
+        with (
+            patch(
+                "superset.commands.sql_lab.results.results_backend", new=mock.Mock()
+            ) as backend,
+            patch("superset.sqllab.result_chunks.results_backend", new=backend),
+        ):
+            store_chunked_results(
+                backend,
+                data,
+                10,
+                status=QueryStatus.SUCCESS,
+                query={"rows": 104},
+            )
+            result = results.SqlExecutionResultsCommand(
+                "abc_query", rows=10, offset=25
+            ).run()
+
+        assert result["data"] == data[25:35]
+        assert result["displayLimitReached"] is True
+        assert [call.args[0] for call in backend.get.call_args_list] == [
+            "abc_query",
+            "abc_query/chunk/2",
+            "abc_query/chunk/3",
+        ]
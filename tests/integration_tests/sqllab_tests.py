@@ -40,10 +40,11 @@ from superset.sql_lab import (
     cancel_query,
     execute_sql_statements,
 )
-from superset.utils.core import backend
+from superset.utils.core import backend, zlib_decompress
 from superset.utils import json
 from superset.utils.json import datetime_to_epoch  # noqa: F401
 from superset.utils.database import get_example_database, get_main_database
+from superset.views.utils import _deserialize_results_payload
 
 from tests.integration_tests.base_tests import SupersetTestCase
 from tests.integration_tests.conftest import CTAS_SCHEMA_NAME
@@ -683,6 +684,70 @@ class TestSqlLab(SupersetTestCase):
             },
         )
 
+    @mock.patch.dict(
+        "superset.sql_lab.config", {"SQLLAB_RESULTS_BACKEND_CHUNK_ROWS": 2}
+    )
+    @mock.patch("superset.sql_lab.results_backend_use_msgpack", True)
+    @mock.patch("superset.sql_lab.db")
+    @mock.patch("superset.sql_lab.get_query")
+    @mock.patch("superset.sql_lab.execute_query")
+    def test_execute_sql_statements_chunked_results(
+        self,
+        mock_execute_query,
+        mock_get_query,
+        mock_db,
+    ):
+        values = {}
+        results_backend = mock.MagicMock()
+        results_backend.get.side_effect = values.get
+        results_backend.set.side_effect = lambda key, value, timeout: values.update(
+            {key: value}
+        )
+        results_backend.set_many.side_effect = lambda mapping, timeout: (
+            values.update(mapping)
+        )
+        mock_query = mock.MagicMock(select_as_cta=False)
+        mock_query.database.cache_timeout = 60
+        mock_query.database.db_engine_spec.run_multiple_statements_as_one = False
+        mock_query.to_dict.return_value = {"rows": 5}
+        mock_get_query.return_value = mock_query
+        mock_execute_query.return_value = SupersetResultSet(
+            [(i,) for i in range(5)], [("a", "int")], BaseEngineSpec
+        )
+
+        with (
+            mock.patch("superset.sql_lab.results_backend", new=results_backend),
+            mock.patch(
+                "superset.sqllab.result_chunks.results_backend", results_backend
+            ),
+        ):
+            execute_sql_statements(
+                query_id=1,
+                rendered_query="SELECT a FROM t",
+                return_results=False,
+                store_results=True,
+                start_time=None,
+                expand_data=False,
+                log_params=None,
+            )
+            mock_query.database.db_engine_spec = BaseEngineSpec
+            payload = _deserialize_results_payload(
+                zlib_decompress(values[mock_query.results_key], decode=False),
+                mock_query,
+                use_msgpack=True,
+                offset=1,
+                limit=2,
+            )
+
+        assert sorted(values) == [
+            mock_query.results_key,
+            f"{mock_query.results_key}/chunk/0",
+            f"{mock_query.results_key}/chunk/1",
+            f"{mock_query.results_key}/chunk/2",
+        ]
+        assert payload["chunks"] == {"count": 3, "rows": 2}
+        assert payload["data"] == [{"a": 1}, {"a": 2}]
+
     @mock.patch("superset.sql_lab.db")
     @mock.patch("superset.sql_lab.get_query")
     @mock.patch("superset.sql_lab.execute_query")
@@ -16,9 +16,11 @@
 # under the License.
 import datetime
 import math
+from decimal import Decimal
 from typing import Any
 
 import pytest  # noqa: F401
+import simplejson
 
 from superset.utils.hashing import md5_sha_from_dict, md5_sha_from_str
 
@@ -94,3 +96,30 @@ def test_ignore_nan_md5_sha():
 
     assert md5_sha_from_str(serialized_obj) == md5_sha_from_dict(obj, ignore_nan=True)
     assert md5_sha_from_str(serialized_obj) == "40e87d61f6add03816bccdeac5713b9f"
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        {"b": [1, 2.5, None, True], "a": {"d": "é", "c": "\n"}},
+        {"price": Decimal("1.10"), "product": "Coffee"},
+        {"data": b"Coffee"},
+        {"price": math.nan},
+        {"when": datetime.datetime(2024, 1, 1)},
+    ],
+)
+def test_md5_sha_from_dict_matches_simplejson(obj: dict[str, Any]) -> None:
+    """
+    Test that hashes are the same as when dicts were serialized with simplejson.
+    """
+
+    def default(value: Any) -> Any:
+        return value.isoformat() if isinstance(value, datetime.datetime) else None
+
+    serialized_obj = simplejson.dumps(
+        obj, sort_keys=True, ignore_nan=True, default=default, allow_nan=True
+    )
+
+    assert md5_sha_from_str(serialized_obj) == md5_sha_from_dict(
+        obj, default=default, ignore_nan=True
+    )
@@ -14,6 +14,7 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+from threading import BoundedSemaphore
 from unittest import mock
 from unittest.mock import ANY, Mock
 
@@ -122,6 +123,45 @@ def test_submit_chart_data_job_as_guest_user(
     job_mock.reset_mock()  # Reset the mock for the next iteration
 
 
+@mock.patch("superset.is_feature_enabled")
+def test_submit_chart_data_jobs(is_feature_enabled_mock, async_query_manager):
+    is_feature_enabled_mock.return_value = True
+    set_current_as_guest_user()
+    async_query_manager._max_batch_size = 2
+    async_query_manager._chart_data_time_limit = 60
+    job_mock = Mock()
+    async_query_manager._load_chart_data_batch_into_cache_job = job_mock
+    form_datas = [
+        {"datasource": {"id": 1, "type": "table"}, "queries": [{"row_limit": 1}]},
+        {"datasource": {"id": 2, "type": "table"}, "queries": [{"row_limit": 2}]},
+        {"datasource": {"id": "1", "type": "table"}, "queries": [{"row_limit": 3}]},
+        {"datasource": {"id": 1, "type": "table"}, "queries": [{"row_limit": 4}]},
+    ]
+
+    jobs = async_query_manager.submit_chart_data_jobs(
+        channel_id="test_channel_id",
+        form_datas=form_datas,
+    )
+
+    assert len({job["job_id"] for job in jobs}) == 4
+    assert all("guest_token" not in job for job in jobs)
+    user_metadata = {
+        "user_id": None,
+        "guest_token": {
+            "resources": [{"id": "some-uuid", "type": "dashboard"}],
+            "user": {},
+        },
+    }
+    assert job_mock.apply_async.call_args_list == [
+        mock.call(
+            (user_metadata, [jobs[0], jobs[2]], [form_datas[0], form_datas[2]]),
+            soft_time_limit=120,
+        ),
+        mock.call((user_metadata, [jobs[3]], [form_datas[3]]), soft_time_limit=60),
+        mock.call((user_metadata, [jobs[1]], [form_datas[1]]), soft_time_limit=60),
+    ]
+
+
 @mark.parametrize(
     "cache_type, cache_backend",
     [
@@ -166,3 +206,83 @@ def test_submit_explore_json_job_as_guest_user(
     )
 
     assert "guest_token" not in job_meta
+
+
+def make_event(event_id: str) -> tuple[bytes, dict[bytes, bytes]]:
+    return (event_id.encode(), {b"data": b'{"job_id": "abc"}'})
+
+
+def test_read_events_long_polling(async_query_manager):
+    cache = mock.Mock(spec=RedisCacheBackend)
+    cache.xread.return_value = [make_event("1607477697866-1")]
+    cache.xrange.return_value = [make_event("1607477697866-1")]
+    async_query_manager._cache = cache
+    async_query_manager._long_polling_timeout = 10
+    async_query_manager._blocking_connections = BoundedSemaphore(1)
+
+    # the timeout is capped
+    assert async_query_manager.read_events("channel", "1607477697866-0", 30) == [
+        {"id": "1607477697866-1", "job_id": "abc"}
+    ]
+    cache.xread.assert_called_once_with(
+        "channel", "1607477697866-0", AsyncQueryManager.MAX_EVENT_COUNT, 10000
+    )
+
+    # events are read immediately when no blocking connection is available
+    async_query_manager._blocking_connections.acquire()
+    async_query_manager.read_events("channel", "1607477697866-0", 30)
+    cache.xrange.assert_called_once_with(
+        "channel", "1607477697866-1", "+", AsyncQueryManager.MAX_EVENT_COUNT
+    )
+    assert cache.xread.call_count == 1
+
+
+def test_read_events_fractional_timeout(async_query_manager):
+    cache = mock.Mock(spec=RedisCacheBackend)
+    cache.xread.return_value = []
+    async_query_manager._cache = cache
+    async_query_manager._long_polling_timeout = 10
+    async_query_manager._blocking_connections = BoundedSemaphore(1)
+
+    # a timeout under a millisecond never blocks forever
+    assert async_query_manager.read_events("channel", None, 0.0004) == []
+    cache.xread.assert_called_once_with(
+        "channel", "0", AsyncQueryManager.MAX_EVENT_COUNT, 1
+    )
+
+
+def test_stream_events_deadline(async_query_manager):
+    cache = mock.Mock(spec=RedisCacheBackend)
+    cache.xread.return_value = []
+    async_query_manager._cache = cache
+    async_query_manager._stream_max_duration = 60
+    async_query_manager._blocking_connections = BoundedSemaphore(1)
+
+    with mock.patch(
+        "superset.async_events.async_query_manager.time.monotonic",
+        side_effect=[0, 59.9996, 60],
+    ):
+        assert list(async_query_manager.stream_events("channel", None)) == [[]]
+    cache.xread.assert_called_once_with(
+        "channel", "0", AsyncQueryManager.MAX_EVENT_COUNT, 1
+    )
+
+
+def test_stream_events(async_query_manager):
+    cache = mock.Mock(spec=RedisCacheBackend)
+    cache.xread.side_effect = [[make_event("1607477697866-1")], [], []]
+    async_query_manager._cache = cache
+    async_query_manager._stream_max_duration = 60
+    async_query_manager._blocking_connections = BoundedSemaphore(1)
+
+    stream = async_query_manager.stream_events("channel", None)
+    assert next(stream) == [{"id": "1607477697866-1", "job_id": "abc"}]
+    assert next(stream) == []
+    cache.xread.assert_called_with(
+        "channel", "1607477697866-1", AsyncQueryManager.MAX_EVENT_COUNT, 15000
+    )
+
+    # the blocking connection is released when the client disconnects
+    assert not async_query_manager._blocking_connections.acquire(blocking=False)
+    stream.close()
+    assert async_query_manager._blocking_connections.acquire(blocking=False)
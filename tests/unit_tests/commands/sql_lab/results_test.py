@@ -0,0 +1,70 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import pytest
+from pytest_mock import MockerFixture
+from sqlalchemy.orm.session import Session
+
+from superset.exceptions import SupersetErrorException
+
+
+def test_statement_results(mocker: MockerFixture, session: Session) -> None:
+    """
+    Test that the published results of a statement of a script can be read.
+    """
+    from superset import db
+    from superset.commands.sql_lab.results import SqlExecutionResultsCommand
+    from superset.models.core import Database
+    from superset.models.sql_lab import Query
+    from superset.sql_lab import _serialize_payload
+    from superset.sqllab.utils import get_statement_results_key
+    from superset.utils.core import zlib_compress
+
+    engine = db.session.get_bind()
+    Query.metadata.create_all(engine)  # pylint: disable=no-member
+
+    database = Database(database_name="my_database", sqlalchemy_uri="sqlite://")
+    query = Query(
+        client_id="foo",
+        database=database,
+        sql="SELECT 1; SELECT 2",
+        limit=100,
+        select_as_cta=False,
+        results_key="script",
+    )
+    db.session.add(database)
+    db.session.add(query)
+    db.session.flush()
+    key = get_statement_results_key(query.id)
+    query.set_extra_json_key(
+        "statement_results", [{"statement": 1, "rows": 1, "resultsKey": key}]
+    )
+
+    payload = {"query_id": query.id, "statement": 1, "data": [{"1": 1}]}
+    backend = mocker.patch(
+        "superset.commands.sql_lab.results.results_backend", new=mocker.MagicMock()
+    )
+    backend.get.return_value = zlib_compress(_serialize_payload(payload, False))
+    mocker.patch("superset.commands.sql_lab.results.results_backend_use_msgpack", False)
+
+    assert SqlExecutionResultsCommand(key).run() == payload
+
+    # the key must be listed by the query
+    for other_key in ("other", get_statement_results_key(query.id)):
+        with pytest.raises(SupersetErrorException) as excinfo:
+            SqlExecutionResultsCommand(other_key).run()
+        assert excinfo.value.status == 404
@@ -0,0 +1,146 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from cachelib import SimpleCache
+from flask import current_app
+from freezegun import freeze_time
+from pytest_mock import MockerFixture
+
+from superset.common.utils.filter_values_cache import (
+    build_index,
+    FilterValues,
+    get_values,
+    search,
+)
+
+
+def test_search() -> None:
+    """
+    Test that values are searched by prefix, ignoring the case and NULL values.
+    """
+    values = ["banana", None, "Apple", "apricot", 42, "avocado"]
+    entry = FilterValues(values=values, index=build_index(values), loaded_at=0)
+
+    assert search(entry, "a") == ["Apple", "apricot", "avocado"]
+    assert search(entry, "AP") == ["Apple", "apricot"]
+    assert search(entry, "ap", limit=1) == ["Apple"]
+    assert search(entry, "4") == [42]
+    assert search(entry, "c") == []
+    assert search(entry, "") == [42, "Apple", "apricot", "avocado", "banana"]
+
+
+def test_get_values(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that values are cached by database and SQL, and searched from the cache.
+    """
+    cache_manager = mocker.patch(
+        "superset.common.utils.filter_values_cache.cache_manager"
+    )
+    cache_manager.data_cache = SimpleCache()
+    mocker.patch.dict(current_app.config, {"FILTER_VALUES_CACHE_TIMEOUT": 60})
+    database = mocker.MagicMock(id=1, impersonate_user=False)
+    load = mocker.MagicMock(return_value=["b", "a", None])
+
+    assert get_values(database, "SELECT a", load) == ["b", "a", None]
+    assert get_values(database, "SELECT a", load, prefix="A") == ["a"]
+    load.assert_called_once()
+
+    assert get_values(database, "SELECT b", load) == ["b", "a", None]
+    assert load.call_count == 2
+
+
+def test_get_values_truncated(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that values starting with a prefix are queried when the cached values are
+    truncated, and searched from the cache otherwise.
+    """
+    cache_manager = mocker.patch(
+        "superset.common.utils.filter_values_cache.cache_manager"
+    )
+    cache_manager.data_cache = SimpleCache()
+    mocker.patch.dict(current_app.config, {"FILTER_VALUES_CACHE_TIMEOUT": 60})
+    database = mocker.MagicMock(id=1, impersonate_user=False)
+    load = mocker.MagicMock(return_value=["b", "a"])
+    load_matches = mocker.MagicMock(return_value=["ab"])
+
+    assert get_values(
+        database, "SELECT a", load, prefix="a", max_values=3, load_matches=load_matches
+    ) == ["a"]
+    load_matches.assert_not_called()
+
+    assert get_values(
+        database, "SELECT b", load, prefix="a", max_values=2, load_matches=load_matches
+    ) == ["ab"]
+    load_matches.assert_called_once()
+
+
+def test_get_values_disabled(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that values are fetched on every request when the cache is disabled.
+    """
+    mocker.patch.dict(current_app.config, {"FILTER_VALUES_CACHE_TIMEOUT": 0})
+    database = mocker.MagicMock(id=1, impersonate_user=False)
+    load = mocker.MagicMock(return_value=["b", "a"])
+
+    assert get_values(database, "SELECT a", load) == ["b", "a"]
+    assert get_values(database, "SELECT a", load, prefix="b") == ["b"]
+    assert load.call_count == 2
+
+    # values starting with the prefix are queried directly when given the query
+    load_matches = mocker.MagicMock(return_value=["b"])
+    assert get_values(
+        database, "SELECT a", load, prefix="b", load_matches=load_matches
+    ) == ["b"]
+    assert load.call_count == 2
+
+
+def test_get_values_refresh(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that stale values are served while they are refreshed in the background,
+    and that a single refresh is scheduled.
+    """
+    cache_manager = mocker.patch(
+        "superset.common.utils.filter_values_cache.cache_manager"
+    )
+    cache_manager.data_cache = SimpleCache()
+    refresh = mocker.patch("superset.tasks.filter_values.refresh_filter_values")
+    mocker.patch.dict(
+        current_app.config,
+        {
+            "FILTER_VALUES_CACHE_TIMEOUT": 3600,
+            "FILTER_VALUES_CACHE_REFRESH_AFTER": 60,
+        },
+    )
+    database = mocker.MagicMock(id=1, impersonate_user=False)
+    load = mocker.MagicMock(return_value=["a"])
+
+    with freeze_time("2024-01-01 00:00:00"):
+        get_values(database, "SELECT a", load, schema="public")
+        get_values(database, "SELECT a", load, schema="public")
+    refresh.delay.assert_not_called()
+
+    with freeze_time("2024-01-01 00:02:00"):
+        assert get_values(database, "SELECT a", load, schema="public") == ["a"]
+        assert get_values(database, "SELECT a", load, schema="public") == ["a"]
+    load.assert_called_once()
+    refresh.delay.assert_called_once_with(
+        1,
+        "SELECT a",
+        mocker.ANY,
+        None,
+        catalog=None,
+        schema="public",
+    )
@@ -0,0 +1,76 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import pickle
+from datetime import datetime
+from decimal import Decimal
+
+import pandas as pd
+import pytest
+
+from superset.common.utils.query_cache_codec import (
+    ArrowQueryCacheCodec,
+    PickleQueryCacheCodec,
+    QueryCacheCodec,
+)
+
+
+@pytest.mark.parametrize("compression", ["lz4", "zstd", None])
+def test_arrow_codec_round_trip(compression: str | None) -> None:
+    """
+    Test that dataframes are stored as Arrow and read back unchanged.
+    """
+    df = pd.DataFrame(
+        {
+            "name": ["a", "b", None],
+            "count": pd.Series([1, None, 3], dtype=object),
+            "value": [1.5, float("nan"), 2.5],
+            "ds": [datetime(2024, 1, 1), datetime(2024, 1, 2), None],
+            "amount": [Decimal("1.10"), None, Decimal("3.30")],
+        }
+    )
+
+    encoded = ArrowQueryCacheCodec(compression=compression).encode(df)  # type: ignore
+    assert encoded["codec"] == "arrow"
+    assert encoded["rows"] == 3
+
+    # the encoded value must survive the pickling done by the cache backend
+    decoded = QueryCacheCodec.decode(pickle.loads(pickle.dumps(encoded)))  # noqa: S301
+    pd.testing.assert_frame_equal(decoded, df)
+    assert decoded["count"].tolist() == [1, None, 3]
+
+
+def test_arrow_codec_unsupported_dataframe() -> None:
+    """
+    Test that dataframes Arrow can't represent are stored as is.
+    """
+    codec = ArrowQueryCacheCodec()
+
+    df = pd.DataFrame({"mixed": [1, "a", {"b": 2}]})
+    assert codec.encode(df) is df
+
+    df = pd.DataFrame({0: [1, 2]})
+    assert codec.encode(df) is df
+
+
+def test_decode_pickled_dataframe() -> None:
+    """
+    Test that entries stored as dataframes are still read with any codec.
+    """
+    df = pd.DataFrame({"a": [1, 2]})
+
+    assert PickleQueryCacheCodec().encode(df) is df
+    assert QueryCacheCodec.decode(df) is df
@@ -0,0 +1,92 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=import-outside-toplevel
+from datetime import datetime
+
+import pandas as pd
+from pytest_mock import MockerFixture
+
+from superset.common.utils.query_cache_manager import QueryCacheManager
+from superset.constants import CacheRegion
+from superset.utils.local_cache import LocalCache
+
+
+def test_get_uses_local_cache(mocker: MockerFixture) -> None:
+    """
+    Test that values read from the data cache are kept in the local cache.
+    """
+    local_cache = LocalCache(max_bytes=1024 * 1024)
+    data_cache = mocker.MagicMock()
+    data_cache.get.return_value = {
+        "df": pd.DataFrame({"a": [1, 2]}),
+        "query": "SELECT a FROM t",
+        "dttm": datetime.utcnow().isoformat().split(".")[0],
+        "timeout": 300,
+        "datasource_uid": "1__table",
+    }
+    mocker.patch.dict(
+        "superset.common.utils.query_cache_manager._cache",
+        {CacheRegion.DATA: data_cache},
+    )
+    mocker.patch.dict(
+        "superset.common.utils.query_cache_manager._local_cache",
+        {CacheRegion.DATA: local_cache},
+    )
+    stats_logger = mocker.patch(
+        "superset.common.utils.query_cache_manager.stats_logger"
+    )
+
+    first = QueryCacheManager.get("key", region=CacheRegion.DATA)
+    assert first.is_loaded
+    first.df["a"] = 0
+
+    second = QueryCacheManager.get("key", region=CacheRegion.DATA)
+    assert second.is_loaded
+    assert second.query == "SELECT a FROM t"
+    assert second.df["a"].tolist() == [1, 2]
+    data_cache.get.assert_called_once_with("key")
+    stats_logger.incr.assert_any_call("local_cache_miss")
+    stats_logger.incr.assert_any_call("loaded_from_local_cache")
+
+    local_cache.delete_tag("1__table")
+    QueryCacheManager.get("key", region=CacheRegion.DATA)
+    assert data_cache.get.call_count == 2
+
+
+def test_get_local_cache_bounded_by_remote_timeout(mocker: MockerFixture) -> None:
+    """
+    Test that expired entries of the data cache are not stored locally.
+    """
+    local_cache = LocalCache(max_bytes=1024 * 1024)
+    data_cache = mocker.MagicMock()
+    data_cache.get.return_value = {
+        "df": pd.DataFrame({"a": [1, 2]}),
+        "query": "SELECT a FROM t",
+        "dttm": "2020-01-01T00:00:00",
+        "timeout": 300,
+    }
+    mocker.patch.dict(
+        "superset.common.utils.query_cache_manager._cache",
+        {CacheRegion.DATA: data_cache},
+    )
+    mocker.patch.dict(
+        "superset.common.utils.query_cache_manager._local_cache",
+        {CacheRegion.DATA: local_cache},
+    )
+
+    assert QueryCacheManager.get("key", region=CacheRegion.DATA).is_loaded
+    assert local_cache.get("key") is None
@@ -15,14 +15,20 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import threading
+from datetime import datetime, timedelta
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pandas as pd
 import pytest
+from freezegun import freeze_time
 
 from superset.common.chart_data import ChartDataResultFormat
 from superset.common.query_context_processor import QueryContextProcessor
+from superset.common.query_object import QueryObject
+from superset.models.helpers import QueryResult
 from superset.utils.core import GenericDataType
 
 
@@ -236,3 +242,295 @@ def test_get_data_xlsx_apply_column_types_error(
     mock_query_context.result_format = ChartDataResultFormat.XLSX
     with pytest.raises(ValueError, match="Conversion error"):
         processor.get_data(df, coltypes)
+
+
+@patch.dict(
+    "superset.common.query_context_processor.config",
+    {"CHART_DATA_COALESCING_TIMEOUT": 10},
+)
+@patch("superset.common.query_context_processor.QueryCacheManager")
+def test_coalesce_query_first_request(mock_cache_manager, processor):
+    """
+    Test that the first request runs the query and releases the lock afterwards.
+    """
+    mock_cache_manager.acquire_lock.return_value = True
+
+    with processor._coalesce_query("key", force_query=False) as cache:
+        assert cache is None
+        mock_cache_manager.release_lock.assert_not_called()
+
+    mock_cache_manager.release_lock.assert_called_once()
+
+
+@patch.dict(
+    "superset.common.query_context_processor.config",
+    {"CHART_DATA_COALESCING_TIMEOUT": 10, "CHART_DATA_COALESCING_POLL_INTERVAL": 0},
+)
+@patch("superset.common.query_context_processor.QueryCacheManager")
+def test_coalesce_query_waits_for_result(mock_cache_manager, processor):
+    """
+    Test that concurrent requests wait for the result cached by the first one.
+    """
+    mock_cache_manager.acquire_lock.return_value = False
+    mock_cache_manager.is_locked.return_value = True
+    pending = MagicMock(is_loaded=False)
+    loaded = MagicMock(is_loaded=True)
+    mock_cache_manager.get.side_effect = [pending, loaded]
+
+    with processor._coalesce_query("key", force_query=False) as cache:
+        assert cache is loaded
+
+    mock_cache_manager.release_lock.assert_not_called()
+
+
+@patch.dict(
+    "superset.common.query_context_processor.config",
+    {"CHART_DATA_COALESCING_TIMEOUT": 10, "CHART_DATA_COALESCING_POLL_INTERVAL": 0},
+)
+@patch("superset.common.query_context_processor.QueryCacheManager")
+def test_coalesce_query_first_request_failed(mock_cache_manager, processor):
+    """
+    Test that requests run the query when the lock is released without a result.
+    """
+    mock_cache_manager.acquire_lock.return_value = False
+    mock_cache_manager.is_locked.return_value = False
+    mock_cache_manager.get.return_value = MagicMock(is_loaded=False)
+
+    with processor._coalesce_query("key", force_query=False) as cache:
+        assert cache is None
+
+
+@patch("superset.common.query_context_processor.QueryCacheManager")
+def test_coalesce_query_disabled(mock_cache_manager, processor):
+    """
+    Test that no lock is taken when coalescing is disabled or the query is forced.
+    """
+    with processor._coalesce_query("key", force_query=False) as cache:
+        assert cache is None
+
+    with patch.dict(
+        "superset.common.query_context_processor.config",
+        {"CHART_DATA_COALESCING_TIMEOUT": 10},
+    ):
+        with processor._coalesce_query("key", force_query=True) as cache:
+            assert cache is None
+
+    mock_cache_manager.acquire_lock.assert_not_called()
+
+
+@patch("superset.common.query_context_processor.get_query_results")
+def test_get_payload_parallel(mock_get_query_results, app_context, processor):
+    """
+    Test that query objects run concurrently when enabled.
+    """
+    from flask import current_app
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    def get_query_results(result_type, query_context, query_obj, force_cached):
+        barrier.wait()
+        return {"query": query_obj}
+
+    mock_get_query_results.side_effect = get_query_results
+    queries = [MagicMock(), MagicMock()]
+    processor._query_context.queries = queries
+
+    with patch.dict(
+        current_app.config,
+        {
+            "CHART_DATA_PARALLEL_QUERIES": True,
+            "CHART_DATA_PARALLEL_QUERIES_MAX_WORKERS": 2,
+        },
+    ):
+        payload = processor.get_payload()
+
+    assert payload["queries"] == [{"query": queries[0]}, {"query": queries[1]}]
+
+
+def test_query_cache_key_memoizes_rls(processor, mocker, app_context):
+    """
+    Test that the RLS cache key is loaded once per request.
+    """
+    from flask import current_app
+
+    get_rls_cache_key = mocker.patch(
+        "superset.common.query_context_processor.security_manager.get_rls_cache_key",
+        return_value=["a = 1-"],
+    )
+    processor._qc_datasource.uid = "1__table"
+    processor._qc_datasource.get_extra_cache_keys.return_value = []
+    processor._qc_datasource.changed_on = None
+
+    with current_app.test_request_context():
+        keys = {
+            processor.query_cache_key(QueryObject(row_limit=row_limit))
+            for row_limit in (10, 20)
+        }
+    assert len(keys) == 2
+    get_rls_cache_key.assert_called_once_with(processor._qc_datasource)
+
+
+@pytest.fixture
+def incremental_processor(mock_query_context, mocker):
+    """
+    A processor for a dataset with incremental caching, with an in-memory data cache.
+    """
+    from superset.common.utils import query_cache_manager
+    from superset.constants import CacheRegion
+
+    values: dict[str, Any] = {}
+    data_cache = MagicMock()
+    data_cache.get.side_effect = values.get
+    data_cache.set.side_effect = lambda key, value, **kwargs: values.update(
+        {key: value}
+    )
+    mocker.patch.dict(query_cache_manager._cache, {CacheRegion.DATA: data_cache})
+    mocker.patch.dict(
+        query_cache_manager._local_cache, {CacheRegion.DATA: MagicMock(enabled=False)}
+    )
+
+    source = pd.DataFrame(
+        {
+            "ds": pd.to_datetime(["2024-01-01", "2024-01-02", "2024-01-03"]),
+            "count": [1, 2, 3],
+        }
+    )
+
+    def query(query_obj):
+        since, until = query_obj["filter"][0]["val"].split(" : ")
+        df = source[(source["ds"] >= since) & (source["ds"] < until)]
+        return QueryResult(
+            df=df.reset_index(drop=True),
+            query=f"SELECT {since} {until}",
+            duration=timedelta(seconds=1),
+        )
+
+    datasource = mock_query_context.datasource
+    datasource.extra_dict = {"incremental_cache": True}
+    datasource.offset = 0
+    datasource.uid = "1__table"
+    datasource.query.side_effect = query
+    mock_query_context.force = False
+    mock_query_context.get_cache_timeout.return_value = 300
+
+    processor = QueryContextProcessor(mock_query_context)
+    mocker.patch.object(
+        processor,
+        "query_cache_key",
+        side_effect=lambda query_obj, **kwargs: kwargs["time_partition"],
+    )
+    mocker.patch.object(processor, "normalize_df", side_effect=lambda df, _: df)
+    return processor
+
+
+def incremental_query_object(**kwargs):
+    return QueryObject(
+        columns=[
+            {
+                "columnType": "BASE_AXIS",
+                "label": "ds",
+                "sqlExpression": "ds",
+                "timeGrain": "P1D",
+            }
+        ],
+        metrics=["count"],
+        filters=[
+            {"col": "ds", "op": "TEMPORAL_RANGE", "val": "2024-01-01 : 2024-01-04"}
+        ],
+        **kwargs,
+    )
+
+
+def test_get_time_partitions(incremental_processor):
+    """
+    Test which queries can be cached incrementally.
+    """
+    assert incremental_processor.get_time_partitions(incremental_query_object()) == [
+        (datetime(2024, 1, 1), datetime(2024, 1, 2)),
+        (datetime(2024, 1, 2), datetime(2024, 1, 3)),
+        (datetime(2024, 1, 3), datetime(2024, 1, 4)),
+    ]
+    assert (
+        incremental_processor.get_time_partitions(
+            incremental_query_object(series_limit=10)
+        )
+        is None
+    )
+    assert (
+        incremental_processor.get_time_partitions(
+            incremental_query_object(time_shift="1 day ago")
+        )
+        is None
+    )
+
+    incremental_processor._qc_datasource.extra_dict = {}
+    assert incremental_processor.get_time_partitions(incremental_query_object()) is None
+
+
+@freeze_time("2024-01-03 12:00:00")
+def test_get_partitioned_query_result(incremental_processor):
+    """
+    Test that only the missing and open partitions are queried.
+    """
+    query_object = incremental_query_object()
+    partitions = incremental_processor.get_time_partitions(query_object)
+    datasource = incremental_processor._qc_datasource
+
+    result = incremental_processor.get_partitioned_query_result(
+        query_object, partitions
+    )
+    assert result.df["count"].tolist() == [1, 2, 3]
+    assert result.query == "SELECT 2024-01-01 00:00:00 2024-01-04 00:00:00"
+    assert datasource.query.call_count == 1
+
+    # the last partition is still open, so it wasn't cached
+    result = incremental_processor.get_partitioned_query_result(
+        query_object, partitions
+    )
+    assert result.df["count"].tolist() == [1, 2, 3]
+    assert datasource.query.call_count == 2
+    assert datasource.query.call_args[0][0]["filter"][0]["val"] == (
+        "2024-01-03 00:00:00 : 2024-01-04 00:00:00"
+    )
+
+
+def test_get_partitioned_query_result_row_limit(incremental_processor):
+    """
+    Test that the query runs as a whole when its row limit may truncate results.
+    """
+    query_object = incremental_query_object(row_limit=3)
+    partitions = incremental_processor.get_time_partitions(query_object)
+
+    assert (
+        incremental_processor.get_partitioned_query_result(query_object, partitions)
+        is None
+    )
+
+
+@freeze_time("2024-01-03 12:00:00")
+def test_get_partitioned_query_result_cached_row_limit(incremental_processor):
+    """
+    Test that the row limit is checked against the cached partitions before
+    querying the missing ones, which are limited to the rows left.
+    """
+    datasource = incremental_processor._qc_datasource
+    query_object = incremental_query_object()
+    partitions = incremental_processor.get_time_partitions(query_object)
+    incremental_processor.get_partitioned_query_result(query_object, partitions)
+    assert datasource.query.call_count == 1
+
+    # the first two partitions are cached, and already reach the row limit
+    query_object = incremental_query_object(row_limit=2)
+    assert (
+        incremental_processor.get_partitioned_query_result(query_object, partitions)
+        is None
+    )
+    assert datasource.query.call_count == 1
+
+    query_object = incremental_query_object(row_limit=4)
+    result = incremental_processor.get_partitioned_query_result(
+        query_object, partitions
+    )
+    assert result.df["count"].tolist() == [1, 2, 3]
+    assert datasource.query.call_count == 2
+    assert datasource.query.call_args[0][0]["row_limit"] == 2
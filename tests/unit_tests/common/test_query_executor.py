@@ -0,0 +1,111 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from flask import current_app, g, request
+
+from superset.common.utils import query_executor
+
+PARALLEL_CONFIG = {
+    "CHART_DATA_PARALLEL_QUERIES": True,
+    "CHART_DATA_PARALLEL_QUERIES_MAX_WORKERS": 4,
+    "CHART_DATA_PARALLEL_QUERIES_PER_DATABASE": 2,
+}
+
+
+def test_run_queries_sequential(app_context: None) -> None:
+    """
+    Test that queries run in the current thread when disabled.
+    """
+    threads = query_executor.run_queries(
+        [lambda: threading.current_thread(), lambda: threading.current_thread()]
+    )
+    assert threads == [threading.current_thread()] * 2
+
+
+def test_run_queries_concurrent(app_context: None) -> None:
+    """
+    Test that queries run concurrently, with the context of the caller.
+    """
+    barrier = threading.Barrier(3, timeout=5)
+
+    def query(i: int) -> tuple[int, str, str]:
+        # fails unless the 3 queries are running at the same time
+        barrier.wait()
+        return i, g.user, request.args["slice_id"]
+
+    with (
+        patch.dict(current_app.config, PARALLEL_CONFIG),
+        current_app.test_request_context("/?slice_id=1"),
+    ):
+        g.user = "admin"
+        results = query_executor.run_queries(
+            [lambda i=i: query(i) for i in range(3)]  # type: ignore
+        )
+
+    assert results == [(0, "admin", "1"), (1, "admin", "1"), (2, "admin", "1")]
+
+
+def test_run_queries_error(app_context: None) -> None:
+    """
+    Test that errors are raised once all the queries are done.
+    """
+    done = []
+
+    def query(i: int) -> int:
+        if i == 0:
+            raise ValueError("failed")
+        time.sleep(0.05)
+        done.append(i)
+        return i
+
+    with patch.dict(current_app.config, PARALLEL_CONFIG):
+        with pytest.raises(ValueError, match="failed"):
+            query_executor.run_queries([lambda i=i: query(i) for i in range(3)])  # type: ignore
+
+    assert sorted(done) == [1, 2]
+
+
+def test_database_slot(app_context: None) -> None:
+    """
+    Test that the number of concurrent queries to a database is limited.
+    """
+    running = {1: 0, 2: 0}
+    peak = {1: 0, 2: 0}
+    lock = threading.Lock()
+
+    def query(database_id: int) -> None:
+        with query_executor.database_slot(database_id):
+            with lock:
+                running[database_id] += 1
+                peak[database_id] = max(peak[database_id], running[database_id])
+            time.sleep(0.2)
+            with lock:
+                running[database_id] -= 1
+
+    with (
+        patch.dict(current_app.config, PARALLEL_CONFIG),
+        current_app.test_request_context(),
+    ):
+        query_executor.run_queries(
+            [lambda i=i: query(1 if i < 3 else 2) for i in range(4)]  # type: ignore
+        )
+
+    assert peak == {1: 2, 2: 1}
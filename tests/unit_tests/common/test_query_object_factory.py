@@ -138,3 +138,20 @@ class TestQueryObjectFactory:
             **raw_query_object,
         )
         assert query_object.metric_names == ["SUM", "num_girls", "num_boys"]
+
+    def test_query_context_datasource_model(
+        self,
+        query_object_factory: QueryObjectFactory,
+        connector_registry: Mock,
+        raw_query_context: dict[str, Any],
+    ):
+        datasource_model = Mock()
+        connector_registry.get_datasource.reset_mock()
+        query_object = query_object_factory.create(
+            raw_query_context["result_type"],
+            datasource=raw_query_context["datasource"],
+            datasource_model=datasource_model,
+            **raw_query_context["queries"][0],
+        )
+        assert query_object.datasource is datasource_model
+        connector_registry.get_datasource.assert_not_called()
@@ -22,6 +22,7 @@ import pytest
 from superset.common.utils.time_range_utils import (
     get_since_until_from_query_object,
     get_since_until_from_time_range,
+    get_time_partitions,
 )
 
 
@@ -92,3 +93,25 @@ def test__since_until_from_adhoc_filters(dummy_query_object):
         datetime(2001, 1, 1, 0, 0, 0),
         datetime(2002, 1, 1, 0, 0, 0),
     )
+
+
+def test_get_time_partitions():
+    assert get_time_partitions(
+        datetime(2024, 1, 30, 12), datetime(2024, 2, 2), "PT1H"
+    ) == [
+        (datetime(2024, 1, 30, 12), datetime(2024, 1, 31)),
+        (datetime(2024, 1, 31), datetime(2024, 2, 1)),
+        (datetime(2024, 2, 1), datetime(2024, 2, 2)),
+    ]
+    assert get_time_partitions(datetime(2024, 1, 1), datetime(2024, 7, 15), "P3M") == [
+        (datetime(2024, 1, 1), datetime(2024, 4, 1)),
+        (datetime(2024, 4, 1), datetime(2024, 7, 1)),
+        (datetime(2024, 7, 1), datetime(2024, 7, 15)),
+    ]
+    assert (
+        get_time_partitions(datetime(2024, 1, 1), datetime(2024, 3, 1), "P1W") is None
+    )
+    assert get_time_partitions(datetime(2024, 1, 1), datetime(2024, 3, 1), None) is None
+    assert (
+        get_time_partitions(datetime(2024, 1, 2), datetime(2024, 1, 1), "P1D") is None
+    )
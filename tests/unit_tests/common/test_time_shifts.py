@@ -14,15 +14,22 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+from datetime import datetime, timedelta
+
 from pandas import DataFrame, Series, Timestamp
 from pandas.testing import assert_frame_equal
 from pytest import fixture, mark  # noqa: PT013
+from pytest_mock import MockerFixture
 
 from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
 from superset.common.query_context import QueryContext
-from superset.common.query_context_processor import QueryContextProcessor
+from superset.common.query_context_processor import (
+    is_time_grain_start,
+    QueryContextProcessor,
+)
 from superset.connectors.sqla.models import BaseDatasource
 from superset.constants import TimeGrain
+from superset.models.helpers import QueryResult
 
 query_context_processor = QueryContextProcessor(
     QueryContext(
@@ -185,3 +192,118 @@ def test_join_offset_dfs_with_month_granularity():
     )
 
     assert_frame_equal(expected, result)
+
+
+@mark.parametrize(
+    ("dttm", "time_grain", "expected"),
+    [
+        (datetime(2021, 3, 15, 10, 30), None, True),
+        (datetime(2021, 3, 15, 10, 30), TimeGrain.FIFTEEN_MINUTES, True),
+        (datetime(2021, 3, 15, 10, 30), TimeGrain.HOUR, False),
+        (datetime(2021, 3, 15), TimeGrain.DAY, True),
+        (datetime(2021, 3, 15), TimeGrain.WEEK, False),
+        (datetime(2021, 3, 15), TimeGrain.WEEK_STARTING_MONDAY, True),
+        (datetime(2021, 3, 15), TimeGrain.WEEK_STARTING_SUNDAY, False),
+        (datetime(2021, 3, 15), TimeGrain.MONTH, False),
+        (datetime(2021, 4, 1), TimeGrain.QUARTER, True),
+        (datetime(2021, 4, 1), TimeGrain.YEAR, False),
+        (datetime(2021, 3, 13), TimeGrain.WEEK_ENDING_SATURDAY, False),
+    ],
+)
+def test_is_time_grain_start(dttm: datetime, time_grain: str, expected: bool):
+    assert is_time_grain_start(dttm, time_grain) == expected
+
+
+def make_offset_query(mocker: MockerFixture, offset: str, since: str, until: str):
+    return {
+        "offset": offset,
+        "query_object": mocker.MagicMock(
+            from_dttm=datetime.fromisoformat(since),
+            to_dttm=datetime.fromisoformat(until),
+        ),
+        "query_object_dct": {"row_limit": 100},
+    }
+
+
+def test_can_query_time_offsets_once(mocker: MockerFixture):
+    mocker.patch.object(
+        query_context_processor, "_qc_datasource", mocker.MagicMock(offset=0)
+    )
+    df = DataFrame({"__timestamp": [Timestamp("2021-01-01")], "A": [1]})
+    query_object = mocker.MagicMock(columns=[], time_shift=None)
+    one_month_ago = make_offset_query(mocker, "1 month ago", "2020-12-01", "2021-01-01")
+    two_months_ago = make_offset_query(
+        mocker, "2 months ago", "2020-11-01", "2020-12-01"
+    )
+    one_year_ago = make_offset_query(mocker, "1 year ago", "2020-01-01", "2020-02-01")
+
+    assert query_context_processor.can_query_time_offsets_once(
+        df, query_object, [one_month_ago, two_months_ago], TimeGrain.MONTH
+    )
+    # the ranges don't start at the start of a time grain
+    assert not query_context_processor.can_query_time_offsets_once(
+        df, query_object, [one_month_ago, two_months_ago], TimeGrain.QUARTER
+    )
+    # the ranges aren't contiguous
+    assert not query_context_processor.can_query_time_offsets_once(
+        df, query_object, [one_month_ago, one_year_ago], TimeGrain.MONTH
+    )
+    # the x-axis is not temporal
+    assert not query_context_processor.can_query_time_offsets_once(
+        df.astype({"__timestamp": str}),
+        query_object,
+        [one_month_ago, two_months_ago],
+        TimeGrain.MONTH,
+    )
+
+
+def test_query_time_offsets_once(mocker: MockerFixture):
+    query_object = mocker.MagicMock(columns=[])
+    offset_queries = [
+        make_offset_query(mocker, "1 day ago", "2021-01-01", "2021-01-03"),
+        make_offset_query(mocker, "2 days ago", "2020-12-31", "2021-01-02"),
+    ]
+    query_datasource = mocker.patch.object(
+        query_context_processor,
+        "_query_datasource",
+        return_value=QueryResult(
+            df=DataFrame(
+                {
+                    "__timestamp": [
+                        Timestamp("2020-12-31"),
+                        Timestamp("2021-01-01"),
+                        Timestamp("2021-01-02"),
+                    ],
+                    "A": [1, 2, 3],
+                }
+            ),
+            query="SELECT",
+            duration=timedelta(seconds=1),
+        ),
+    )
+    mocker.patch.object(
+        query_context_processor,
+        "normalize_df",
+        side_effect=lambda df, query_object: df,
+    )
+
+    results = query_context_processor.query_time_offsets_once(
+        query_object, offset_queries
+    )
+
+    query_datasource.assert_called_once_with(
+        {
+            "row_limit": 100,
+            "from_dttm": datetime(2020, 12, 31),
+            "to_dttm": datetime(2021, 1, 3),
+        }
+    )
+    assert [result.df["A"].tolist() for result in results] == [[2, 3], [1, 2]]
+    assert [result.query for result in results] == ["SELECT", "SELECT"]
+
+    # the offsets are queried separately when the row limit is reached
+    offset_queries[0]["query_object_dct"]["row_limit"] = 3
+    assert (
+        query_context_processor.query_time_offsets_once(query_object, offset_queries)
+        is None
+    )
@@ -18,9 +18,10 @@
 import pandas as pd
 import pytest
 from pytest_mock import MockerFixture
-from sqlalchemy import create_engine
+from sqlalchemy import column, create_engine
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.elements import ColumnElement
 
 from superset.connectors.sqla.models import SqlaTable, TableColumn
 from superset.daos.dataset import DatasetDAO
@@ -187,10 +188,13 @@ def test_query_datasources_by_permissions_with_catalog_schema(
         ["[my_db].[db1].[schema1]", "[my_other_db].[schema]"],  # type: ignore
     )
     clause = db.session.query().filter_by().filter.mock_calls[0].args[0]
-    assert str(clause.compile(engine, compile_kwargs={"literal_binds": True})) == (
-        "tables.perm IN ('[my_db].[table1](id:1)') OR "
-        "tables.schema_perm IN ('[my_db].[db1].[schema1]', '[my_other_db].[schema]') OR "  # noqa: E501
-        "tables.catalog_perm IN ('[my_db].[db1]')"
+    assert (
+        str(clause.compile(engine, compile_kwargs={"literal_binds": True}))
+        == (
+            "tables.perm IN ('[my_db].[table1](id:1)') OR "
+            "tables.schema_perm IN ('[my_db].[db1].[schema1]', '[my_other_db].[schema]') OR "  # noqa: E501
+            "tables.catalog_perm IN ('[my_db].[db1]')"
+        )
     )
 
 
@@ -287,3 +291,151 @@ def test_normalize_prequery_result_type_custom_sql() -> None:
         sqla_table._normalize_prequery_result_type(row, dimension, columns_by_name)
         == "Car"
     )
+
+
+def _compile(sqla_table: SqlaTable, clause: ColumnElement) -> str:
+    return str(
+        clause.compile(
+            dialect=sqla_table.database.get_dialect(),
+            compile_kwargs={"literal_binds": True},
+        )
+    )
+
+
+def test_get_top_groups_single_dimension() -> None:
+    """
+    Test that the top groups of a single dimension are matched with `IN`.
+    """
+    sqla_table = SqlaTable(
+        table_name="my_sqla_table",
+        columns=[],
+        metrics=[],
+        database=Database(database_name="my_db", sqlalchemy_uri="sqlite://"),
+    )
+    df = pd.DataFrame({"country": ["US", "FR", None]})
+    columns_by_name = {"country": TableColumn(column_name="country")}
+
+    clause = sqla_table._get_top_groups(
+        df,
+        ["country"],
+        {"country": column("country")},
+        columns_by_name,
+    )
+
+    assert _compile(sqla_table, clause) == "country IN ('US', 'FR') OR country IS NULL"
+
+
+def test_get_top_groups_tuple_in(mocker: MockerFixture) -> None:
+    """
+    Test that the top groups of multiple dimensions are matched with a tuple `IN`
+    only when the database supports it.
+    """
+    sqla_table = SqlaTable(
+        table_name="my_sqla_table",
+        columns=[],
+        metrics=[],
+        database=Database(database_name="my_db", sqlalchemy_uri="sqlite://"),
+    )
+    df = pd.DataFrame({"country": ["US", "FR"], "year": [2020, 2021]})
+    groupby_exprs = {"country": column("country"), "year": column("year")}
+    columns_by_name = {
+        "country": TableColumn(column_name="country"),
+        "year": TableColumn(column_name="year", type="INTEGER"),
+    }
+
+    clause = sqla_table._get_top_groups(
+        df,
+        ["country", "year"],
+        groupby_exprs,
+        columns_by_name,
+    )
+    assert (
+        _compile(sqla_table, clause)
+        == "(country, year) IN (VALUES ('US', 2020), ('FR', 2021))"
+    )
+
+    mocker.patch.object(
+        SqlaTable,
+        "db_engine_spec",
+        mocker.MagicMock(
+            supports_tuple_in=False,
+        ),
+    )
+    clause = sqla_table._get_top_groups(
+        df,
+        ["country", "year"],
+        groupby_exprs,
+        columns_by_name,
+    )
+    assert (
+        _compile(sqla_table, clause)
+        == "country = 'US' AND year = 2020 OR country = 'FR' AND year = 2021"
+    )
+
+
+def test_get_top_groups_temporal(mocker: MockerFixture) -> None:
+    """
+    Test that temporal strings are converted once for each distinct value, and that
+    the groups with converted values are matched with equalities.
+    """
+    sqla_table = SqlaTable(
+        table_name="my_sqla_table",
+        columns=[],
+        metrics=[],
+        database=Database(database_name="my_db", sqlalchemy_uri="sqlite://"),
+    )
+    df = pd.DataFrame(
+        {
+            "ds": ["2024-01-01", "2024-01-02", "2024-01-01"],
+            "country": ["US", "US", "FR"],
+        }
+    )
+    groupby_exprs = {"ds": column("ds"), "country": column("country")}
+    columns_by_name = {
+        "ds": TableColumn(column_name="ds", type="DATETIME", is_dttm=True),
+        "country": TableColumn(column_name="country"),
+    }
+    normalize = mocker.spy(sqla_table, "_normalize_prequery_result_value")
+
+    clause = sqla_table._get_top_groups(
+        df,
+        ["ds", "country"],
+        groupby_exprs,
+        columns_by_name,
+    )
+
+    assert normalize.call_count == 2
+    assert _compile(sqla_table, clause) == (
+        "ds = '2024-01-01 00:00:00' AND country = 'US' "
+        "OR ds = '2024-01-02 00:00:00' AND country = 'US' "
+        "OR ds = '2024-01-01 00:00:00' AND country = 'FR'"
+    )
+
+
+@pytest.mark.parametrize("dtype", ["string", "string[pyarrow]"])
+def test_get_top_groups_temporal_string_dtype(dtype: str) -> None:
+    """
+    Test that temporal strings are converted in string columns, including the ones
+    backed by Arrow.
+    """
+    sqla_table = SqlaTable(
+        table_name="my_sqla_table",
+        columns=[],
+        metrics=[],
+        database=Database(database_name="my_db", sqlalchemy_uri="sqlite://"),
+    )
+    df = pd.DataFrame({"ds": pd.Series(["2024-01-01", "2024-01-02"], dtype=dtype)})
+    columns_by_name = {
+        "ds": TableColumn(column_name="ds", type="DATETIME", is_dttm=True),
+    }
+
+    clause = sqla_table._get_top_groups(
+        df,
+        ["ds"],
+        {"ds": column("ds")},
+        columns_by_name,
+    )
+
+    assert _compile(sqla_table, clause) == (
+        "ds = '2024-01-01 00:00:00' OR ds = '2024-01-02 00:00:00'"
+    )
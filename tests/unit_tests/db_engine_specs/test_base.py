@@ -423,3 +423,58 @@ def test_impersonate_user_no_database(mocker: MockerFixture) -> None:
         "alice",
         "SECRET",
     )
+
+
+def test_fetch_data_batches(mocker: MockerFixture) -> None:
+    """
+    Test that rows are fetched in batches, up to the limit.
+    """
+    from superset.db_engine_specs.base import BaseEngineSpec
+
+    def fetchmany(size: int) -> list[tuple[int]]:
+        batch, rows[:] = rows[:size], rows[size:]
+        return batch
+
+    cursor = mocker.MagicMock()
+    cursor.description = [("a", "INTEGER", None, None, None, None, True)]
+    cursor.fetchmany.side_effect = fetchmany
+
+    rows = [(i,) for i in range(5)]
+    assert list(BaseEngineSpec.fetch_data_batches(cursor, 2)) == [
+        [(0,), (1,)],
+        [(2,), (3,)],
+        [(4,)],
+    ]
+
+    rows = [(i,) for i in range(5)]
+    assert list(BaseEngineSpec.fetch_data_batches(cursor, 2, limit=3)) == [
+        [(0,), (1,)],
+        [(2,)],
+    ]
+    cursor.fetchmany.assert_called_with(1)
+
+    cursor.description = None
+    assert list(BaseEngineSpec.fetch_data_batches(cursor, 2)) == []
+
+
+def test_mutate_arrow_table() -> None:
+    """
+    Test that only the Arrow columns with a mutator are normalized.
+    """
+    import pyarrow as pa
+
+    from superset.db_engine_specs.base import BaseEngineSpec
+
+    class MutatingEngineSpec(BaseEngineSpec):
+        column_type_mutators = {types.String: lambda val: val.strip()}
+
+    table = pa.table({"id": [1, 2], "name": [" foo", "bar "]})
+    description = [
+        ("id", "INTEGER", None, None, None, None, False),
+        ("name", "VARCHAR", None, None, None, None, False),
+    ]
+    assert MutatingEngineSpec.mutate_arrow_table(description, table).to_pydict() == {
+        "id": [1, 2],
+        "name": ["foo", "bar"],
+    }
+    assert BaseEngineSpec.mutate_arrow_table(description, table) is table
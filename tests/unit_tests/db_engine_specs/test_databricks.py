@@ -284,3 +284,19 @@ def test_get_prequeries(mocker: MockerFixture) -> None:
         "USE CATALOG `escaped-hyphen`",
         "USE SCHEMA `hyphen-escaped`",
     ]
+
+
+def test_fetch_arrow(mocker: MockerFixture) -> None:
+    """
+    Test that Databricks results are fetched with the Arrow cursor methods.
+    """
+    import pyarrow as pa
+
+    table = pa.table({"a": [1, 2]})
+    cursor = mocker.MagicMock()
+    cursor.fetchall_arrow.return_value = table
+    cursor.fetchmany_arrow.return_value = table.slice(0, 1)
+
+    assert DatabricksNativeEngineSpec.fetch_arrow(cursor) == table
+    assert DatabricksNativeEngineSpec.fetch_arrow(cursor, 1).num_rows == 1
+    cursor.fetchmany_arrow.assert_called_with(1)
@@ -127,3 +127,19 @@ def test_get_parameters_from_uri() -> None:
 
     assert parameters["database"] == "md:my_db"
     assert parameters["access_token"] == "token"  # noqa: S105
+
+
+def test_fetch_arrow(mocker: MockerFixture) -> None:
+    """
+    Test that results are fetched as Arrow tables and truncated to the limit.
+    """
+    import pyarrow as pa
+
+    from superset.db_engine_specs.duckdb import DuckDBEngineSpec
+
+    cursor = mocker.MagicMock()
+    cursor.fetch_arrow_table.return_value = pa.table({"a": [1, 2, 3]})
+
+    assert DuckDBEngineSpec.supports_arrow_fetch
+    assert DuckDBEngineSpec.fetch_arrow(cursor).num_rows == 3
+    assert DuckDBEngineSpec.fetch_arrow(cursor, 2).to_pydict() == {"a": [1, 2]}
@@ -396,3 +396,33 @@ def test_unmask_encrypted_extra() -> None:
             },
         }
     )
+
+
+def test_fetch_arrow(mocker: MockerFixture) -> None:
+    """
+    Test that empty Snowflake results are returned as empty Arrow tables.
+    """
+    import pyarrow as pa
+
+    from superset.db_engine_specs.snowflake import SnowflakeEngineSpec
+
+    cursor = mocker.MagicMock()
+    cursor._query_result_format = "arrow"
+    cursor.fetch_arrow_all.return_value = None
+    assert SnowflakeEngineSpec.fetch_arrow(cursor).num_columns == 0
+
+    cursor.fetch_arrow_all.return_value = pa.table({"a": [1, 2]})
+    assert SnowflakeEngineSpec.fetch_arrow(cursor, 1).to_pydict() == {"a": [1]}
+
+
+def test_fetch_arrow_json_result_format(mocker: MockerFixture) -> None:
+    """
+    Test that no Arrow table is returned when the result format is JSON, for the
+    rows to be fetched with `fetch_data` instead.
+    """
+    from superset.db_engine_specs.snowflake import SnowflakeEngineSpec
+
+    cursor = mocker.MagicMock()
+    cursor._query_result_format = "json"
+    assert SnowflakeEngineSpec.fetch_arrow(cursor) is None
+    cursor.fetch_arrow_all.assert_not_called()
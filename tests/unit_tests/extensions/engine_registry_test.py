@@ -0,0 +1,115 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from unittest.mock import MagicMock
+
+from freezegun import freeze_time
+from sqlalchemy import create_engine
+from sqlalchemy.pool import QueuePool
+
+from superset.extensions.engine_registry import EngineRegistry
+
+
+def get_registry(max_engines: int = 2, idle_timeout: int = 0) -> EngineRegistry:
+    app = MagicMock()
+    app.config = {
+        "DATABASE_ENGINE_REGISTRY_MAX_ENGINES": max_engines,
+        "DATABASE_ENGINE_REGISTRY_IDLE_TIMEOUT": idle_timeout,
+        "DATABASE_ENGINE_REGISTRY_POOL_OPTIONS": {},
+        "STATS_LOGGER": MagicMock(),
+    }
+    registry = EngineRegistry()
+    registry.init_app(app)
+    return registry
+
+
+def test_get_engine() -> None:
+    """
+    Test that engines are reused, and the least recently used ones evicted.
+    """
+    registry = get_registry()
+    engines = {key: MagicMock() for key in "abc"}
+
+    assert registry.get_engine(1, "a", lambda: engines["a"]) == engines["a"]
+    assert registry.get_engine(1, "a", MagicMock()) == engines["a"]
+    registry.get_engine(1, "b", lambda: engines["b"])
+    registry.get_engine(1, "a", MagicMock())
+    registry.get_engine(2, "c", lambda: engines["c"])
+
+    engines["b"].dispose.assert_called_once()
+    engines["a"].dispose.assert_not_called()
+    assert registry.get_engine(1, "a", MagicMock()) == engines["a"]
+
+    registry.dispose_database(1)
+    engines["a"].dispose.assert_called_once()
+    engines["c"].dispose.assert_not_called()
+
+
+def test_get_engine_created_without_lock() -> None:
+    """
+    Test that engines are created without holding the lock, keeping the engine
+    registered by another thread meanwhile.
+    """
+    registry = get_registry()
+    registered = MagicMock()
+    duplicate = MagicMock()
+
+    def create() -> MagicMock:
+        assert not registry._lock.locked()
+        # another thread registers an engine under the same key meanwhile
+        registry.get_engine(1, "a", lambda: registered)
+        return duplicate
+
+    assert registry.get_engine(1, "a", create) == registered
+    duplicate.dispose.assert_called_once()
+    registered.dispose.assert_not_called()
+
+
+def test_get_engine_idle_timeout() -> None:
+    """
+    Test that idle engines are disposed.
+    """
+    registry = get_registry(idle_timeout=60)
+    engine = MagicMock()
+
+    with freeze_time("2024-01-01 00:00:00", tick=False) as frozen_time:
+        registry.get_engine(1, "a", lambda: engine)
+        frozen_time.tick(30)
+        registry.get_engine(1, "a", MagicMock())
+        frozen_time.tick(61)
+        other = registry.get_engine(1, "a", MagicMock())
+
+    engine.dispose.assert_called_once()
+    assert other != engine
+
+
+def test_report_stats() -> None:
+    """
+    Test that the number of engines and connections are reported.
+    """
+    registry = get_registry()
+    stats_logger = registry._stats_logger
+    engine = registry.get_engine(
+        1, "a", lambda: create_engine("sqlite://", poolclass=QueuePool)
+    )
+
+    with engine.connect():
+        registry.report_stats()
+        stats_logger.gauge.assert_any_call("engine_registry.connections.checked_out", 1)
+    registry.report_stats()
+    stats_logger.gauge.assert_any_call("engine_registry.connections.checked_in", 1)
+    stats_logger.gauge.assert_any_call("engine_registry.engines", 1)
+    stats_logger.incr.assert_called_with("engine_registry.miss")
@@ -18,8 +18,13 @@
 # pylint: disable=import-outside-toplevel
 
 
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
+from typing import Any
 
+import pandas as pd
+import pyarrow as pa
 import pytest
 from pytest_mock import MockerFixture
 from sqlalchemy import (
@@ -32,12 +37,13 @@ from sqlalchemy import (
 from sqlalchemy.engine.reflection import Inspector
 from sqlalchemy.engine.url import make_url
 from sqlalchemy.orm.session import Session
+from sqlalchemy.pool import QueuePool
 from sqlalchemy.sql import Select
 
 from superset.connectors.sqla.models import SqlaTable, TableColumn
 from superset.errors import SupersetErrorType
 from superset.exceptions import OAuth2Error, OAuth2RedirectError
-from superset.models.core import Database
+from superset.models.core import Database, dispose_database_engines
 from superset.sql.parse import LimitMethod, Table
 from superset.utils import json
 from tests.unit_tests.conftest import with_feature_flags
@@ -436,6 +442,101 @@ def test_get_sqla_engine(mocker: MockerFixture) -> None:
     )
 
 
+def test_get_sqla_engine_registry(mocker: MockerFixture) -> None:
+    """
+    Test that `_get_sqla_engine` reuses pooled engines from the registry.
+    """
+    from superset.extensions.engine_registry import EngineRegistry
+
+    registry = EngineRegistry()
+    registry.max_engines = 10
+    registry.pool_options = {"pool_size": 2}
+    mocker.patch("superset.models.core.engine_registry", new=registry)
+    mocker.patch("superset.models.core.get_username", return_value="alice")
+    create_engine = mocker.patch("superset.models.core.create_engine")
+
+    database = Database(id=1, database_name="my_db", sqlalchemy_uri="sqlite://")
+    engine = database._get_sqla_engine(schema="main", reuse_engine=True)
+    assert database._get_sqla_engine(schema="main", reuse_engine=True) == engine
+    create_engine.assert_called_once_with(
+        make_url("sqlite://"),
+        poolclass=QueuePool,
+        pool_size=2,
+        connect_args={},
+    )
+
+    # a different user gets a different engine
+    mocker.patch("superset.models.core.get_username", return_value="bob")
+    database.impersonate_user = True
+    database._get_sqla_engine(schema="main", reuse_engine=True)
+    assert create_engine.call_count == 2
+
+    # updating the database disposes its engines
+    dispose_database_engines(mocker.MagicMock(), mocker.MagicMock(), database)
+    assert engine.dispose.called
+    database._get_sqla_engine(schema="main", reuse_engine=True)
+    assert create_engine.call_count == 3
+
+
+def test_get_sqla_engine_registry_key(mocker: MockerFixture) -> None:
+    """
+    Test that the engine parameters are part of the registry key, whatever their
+    order and types.
+    """
+    from superset.extensions.engine_registry import EngineRegistry
+
+    registry = EngineRegistry()
+    registry.max_engines = 10
+    mocker.patch("superset.models.core.engine_registry", new=registry)
+    create_engine = mocker.patch(
+        "superset.models.core.create_engine",
+        side_effect=lambda *args, **kwargs: mocker.MagicMock(),
+    )
+
+    database = Database(id=1, database_name="my_db", sqlalchemy_uri="sqlite://")
+    database.extra = json.dumps(
+        {"engine_params": {"connect_args": {"a": 1, "b": [2]}, "echo": False}}
+    )
+    engine = database._get_sqla_engine(reuse_engine=True)
+
+    database.extra = json.dumps(
+        {"engine_params": {"echo": False, "connect_args": {"b": [2], "a": 1}}}
+    )
+    assert database._get_sqla_engine(reuse_engine=True) == engine
+
+    database.extra = json.dumps(
+        {"engine_params": {"echo": True, "connect_args": {"b": [2], "a": 1}}}
+    )
+    assert database._get_sqla_engine(reuse_engine=True) != engine
+    assert create_engine.call_count == 2
+
+
+@pytest.mark.parametrize("pooled", [True, False])
+def test_get_sqla_engine_registry_ssh_tunnel(
+    mocker: MockerFixture,
+    app_context: None,
+    pooled: bool,
+) -> None:
+    """
+    Test that engines are reused through SSH tunnels only when they are pooled.
+    """
+    mocker.patch("superset.models.core.engine_registry.max_engines", 10)
+    mocker.patch(
+        "superset.daos.database.DatabaseDAO.get_ssh_tunnel",
+        return_value=mocker.MagicMock(id=1),
+    )
+    ssh_manager = mocker.patch("superset.models.core.ssh_manager_factory").instance
+    ssh_manager.is_pooled.return_value = pooled
+    ssh_manager.build_sqla_url.return_value = "sqlite://"
+    _get_sqla_engine = mocker.patch.object(Database, "_get_sqla_engine")
+
+    database = Database(id=1, database_name="my_db", sqlalchemy_uri="sqlite://")
+    with database.get_sqla_engine():
+        pass
+
+    assert _get_sqla_engine.call_args.kwargs["reuse_engine"] == pooled
+
+
 def test_get_sqla_engine_user_impersonation(mocker: MockerFixture) -> None:
     """
     Test user impersonation in `_get_sqla_engine`.
@@ -700,6 +801,7 @@ def test_engine_context_manager(mocker: MockerFixture) -> None:
         nullpool=True,
         source=None,
         sqlalchemy_uri="trino://",
+        reuse_engine=False,
     )
 
 
@@ -1051,3 +1153,129 @@ def test_apply_limit_to_sql(
 
     limited = db.apply_limit_to_sql(sql, limit, force)
     assert limited == expected
+
+
+def test_get_df(app_context: None) -> None:
+    """
+    Test that query results are converted to pandas, optionally with Arrow dtypes.
+    """
+    database = Database(database_name="db", sqlalchemy_uri="sqlite://")
+    sql = """
+CREATE TEMP TABLE t AS SELECT 1 AS i, 'a' AS name UNION ALL SELECT NULL, 'b';
+SELECT i, name FROM t
+    """
+
+    df = database.get_df(sql)
+    assert df.dtypes.to_dict() == {"i": object, "name": object}
+    assert df.to_dict(orient="list") == {"i": [1, None], "name": ["a", "b"]}
+
+    df = database.get_df(sql, arrow_dtypes=True)
+    assert df.dtypes.to_dict() == {
+        "i": pd.ArrowDtype(pa.int64()),
+        "name": pd.ArrowDtype(pa.string()),
+    }
+    assert df["i"].isna().tolist() == [False, True]
+    assert df["name"].tolist() == ["a", "b"]
+
+    table = database.get_arrow_table("SELECT 1 AS i")
+    assert table.to_pydict() == {"i": [1]}
+
+
+def test_get_df_chunks(app_context: None) -> None:
+    """
+    Test that query results are fetched in chunks, reduced to fit the byte budget.
+    """
+    database = Database(database_name="db", sqlalchemy_uri="sqlite://")
+    sql = """
+WITH RECURSIVE t AS (SELECT 1 AS i UNION ALL SELECT i + 1 FROM t WHERE i < 100)
+SELECT i, 'name ' || i AS name FROM t
+    """
+
+    chunks = list(database.get_df_chunks(sql, chunk_size=30))
+    assert [len(chunk) for chunk in chunks] == [30, 30, 30, 10]
+    assert chunks[-1].to_dict(orient="list") == {
+        "i": list(range(91, 101)),
+        "name": [f"name {i}" for i in range(91, 101)],
+    }
+
+    chunk_bytes = chunks[0].memory_usage(deep=True).sum()
+    chunks = list(
+        database.get_df_chunks(sql, chunk_size=30, max_chunk_bytes=chunk_bytes // 3)
+    )
+    assert len(chunks[0]) == 30
+    assert all(len(chunk) <= 10 for chunk in chunks[1:])
+    assert sum(len(chunk) for chunk in chunks) == 100
+
+
+def test_get_df_chunks_fetchmany(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that results are read with `fetchmany`, one chunk at a time, and never
+    with `fetchall`.
+    """
+    from superset.utils.csv import df_chunks_to_escaped_csv
+
+    rows = [(i, f"=name {i}") for i in range(25)]
+
+    def fetchmany(size: int) -> list[tuple[int, str]]:
+        chunk, rows[:] = rows[:size], rows[size:]
+        return chunk
+
+    cursor = mocker.MagicMock()
+    cursor.description = [
+        ("i", "INTEGER", None, None, None, None, True),
+        ("name", "VARCHAR", None, None, None, None, True),
+    ]
+    cursor.fetchmany.side_effect = fetchmany
+
+    @contextmanager
+    def get_raw_connection(*args: Any, **kwargs: Any) -> Iterator[Any]:
+        yield mocker.MagicMock(cursor=mocker.MagicMock(return_value=cursor))
+
+    database = Database(database_name="db", sqlalchemy_uri="sqlite://")
+    mocker.patch.object(database, "get_raw_connection", get_raw_connection)
+
+    chunks = df_chunks_to_escaped_csv(
+        database.get_df_chunks("SELECT i, name FROM t", chunk_size=10),
+        index=False,
+    )
+    assert next(chunks).splitlines()[:2] == ["i,name", "0,'=name 0"]
+    assert cursor.fetchmany.call_count == 1
+    assert [chunk.count("\n") for chunk in chunks] == [10, 5]
+    cursor.fetchmany.assert_called_with(10)
+    cursor.fetchall.assert_not_called()
+
+
+def test_get_df_chunks_empty(app_context: None) -> None:
+    """
+    Test that an empty result yields an empty dataframe with its columns, so that
+    exports still have a header.
+    """
+    from superset.utils.csv import df_chunks_to_escaped_csv
+
+    database = Database(database_name="db", sqlalchemy_uri="sqlite://")
+    sql = "SELECT 1 AS i, 'a' AS name WHERE 1 = 0"
+
+    chunks = list(database.get_df_chunks(sql, chunk_size=10))
+    assert len(chunks) == 1
+    assert chunks[0].empty
+    assert list(chunks[0].columns) == ["i", "name"]
+    assert "".join(df_chunks_to_escaped_csv(chunks, index=False)) == "i,name\n"
+
+
+def test_get_df_chunks_engine_spec(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that rows are fetched through the DB engine spec, and that engines without
+    streaming fetches read the whole result at once.
+    """
+    database = Database(database_name="db", sqlalchemy_uri="sqlite://")
+    sql = "SELECT 1 AS i UNION ALL SELECT 2"
+    mutate_rows = mocker.spy(database.db_engine_spec, "mutate_rows")
+
+    chunks = list(database.get_df_chunks(sql, chunk_size=1))
+    assert [chunk["i"].tolist() for chunk in chunks] == [[1], [2]]
+    assert mutate_rows.call_count == 2
+
+    mocker.patch.object(database.db_engine_spec, "supports_streaming_fetch", False)
+    get_df = mocker.patch.object(database, "get_df")
+    assert list(database.get_df_chunks(sql, chunk_size=1)) == [get_df.return_value]
+    get_df.assert_called_once_with(sql, None, None)
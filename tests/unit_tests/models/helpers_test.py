@@ -56,7 +56,7 @@ def database(mocker: MockerFixture, session: Session) -> Database:
     # since we're using an in-memory SQLite database, make sure we always
     # return the same engine where the table was created
     @contextmanager
-    def mock_get_sqla_engine():
+    def mock_get_sqla_engine(*args, **kwargs):
         yield engine
 
     mocker.patch.object(
@@ -86,6 +86,29 @@ def test_values_for_column(database: Database) -> None:
     assert table.values_for_column("a") == [1, None]
 
 
+def test_values_for_column_prefix(
+    mocker: MockerFixture,
+    database: Database,
+) -> None:
+    """
+    Test that values starting with a prefix are queried with the prefix, the
+    percent and underscore characters being escaped.
+    """
+    from flask import current_app
+
+    from superset.connectors.sqla.models import SqlaTable, TableColumn
+
+    mocker.patch.dict(current_app.config, {"FILTER_VALUES_CACHE_TIMEOUT": 0})
+    table = SqlaTable(
+        database=database,
+        schema=None,
+        table_name="t",
+        columns=[TableColumn(column_name="b")],
+    )
+    assert table.values_for_column("b", prefix="AL") == ["Alice"]
+    assert table.values_for_column("b", prefix="_") == []
+
+
 def test_values_for_column_with_rls(database: Database) -> None:
     """
     Test the `values_for_column` method with RLS enabled.
@@ -190,7 +213,7 @@ def test_values_for_column_double_percents(
         "mutate_sql_based_on_config",
         side_effect=lambda sql: sql,
     )
-    pd = mocker.patch("superset.models.helpers.pd")
+    pd = mocker.patch("superset.common.utils.filter_values_cache.pd")
 
     table.values_for_column("starts_with_A")
 
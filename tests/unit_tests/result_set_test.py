@@ -17,10 +17,12 @@
 
 # pylint: disable=import-outside-toplevel, unused-argument
 
+from collections.abc import Iterator
 from datetime import datetime, timezone
 
 import numpy as np
 import pandas as pd
+import pytest
 from numpy.core.multiarray import array
 from pytest_mock import MockerFixture
 
@@ -164,3 +166,166 @@ def test_timezone_series(mocker: MockerFixture) -> None:
         [pd.Timestamp("2023-01-01 00:00:00+0000", tz="UTC")]
     ]
     logger.exception.assert_not_called()
+
+
+def test_stringify_mixed_values() -> None:
+    """
+    Test that values NumPy can't cast are serialized individually.
+    """
+    values = np.empty(4, dtype=object)
+    values[:] = [[1, 2], None, "foo", {"a": 1}]
+
+    assert stringify_values(values).tolist() == ["[1, 2]", None, "foo", "{'a': 1}"]
+
+
+def test_stringify_long_value() -> None:
+    """
+    Test that a long value doesn't make every converted value as long as it.
+    """
+    values = np.empty(3, dtype=object)
+    values[:] = ["x" * 1000, 1, None]
+
+    result = stringify_values(values)
+
+    assert result.dtype == object
+    assert result.tolist() == ["x" * 1000, "1", None]
+
+
+def test_rows_of_different_lengths() -> None:
+    """
+    Test that rows with a different number of values are rejected.
+    """
+    description = [
+        ("a", "int", None, None, None, None, False),
+        ("b", "int", None, None, None, None, False),
+    ]
+    with pytest.raises(ValueError, match="zip"):
+        SupersetResultSet(
+            [(1, 2), (3,)],
+            description,  # type: ignore
+            BaseEngineSpec,
+        )
+
+
+def test_ragged_nested_columns() -> None:
+    """
+    Test that nested values of different lengths are kept one per row.
+    """
+    data = [
+        (1, [1, 2, 3], "a"),
+        (2, [4], "b"),
+        (3, None, "c"),
+    ]
+    description = [
+        ("id", "int", None, None, None, None, False),
+        ("items", "array", None, None, None, None, True),
+        ("name", "varchar", None, None, None, None, False),
+    ]
+    result_set = SupersetResultSet(
+        data,
+        description,  # type: ignore
+        BaseEngineSpec,
+    )
+    assert result_set.to_pandas_df().to_dict(orient="list") == {
+        "id": [1, 2, 3],
+        "items": ["[1, 2, 3]", "[4]", None],
+        "name": ["a", "b", "c"],
+    }
+
+
+def test_from_arrow_matches_rows() -> None:
+    """
+    Test that a result set built from Arrow data matches one built from rows.
+    """
+    import sqlite3
+
+    import pyarrow as pa
+
+    connection = sqlite3.connect(":memory:")
+    cursor = connection.cursor()
+    cursor.execute("CREATE TABLE t (id INTEGER, name TEXT, value REAL)")
+    cursor.executemany(
+        "INSERT INTO t VALUES (?, ?, ?)",
+        [(1, "foo", 1.5), (2, None, None), (3, "bar", 2.5)],
+    )
+    cursor.execute("SELECT id, name, value, id AS id FROM t ORDER BY id")
+    rows = cursor.fetchall()
+    description = cursor.description
+
+    table = pa.Table.from_arrays(
+        [pa.array(column) for column in zip(*rows, strict=True)],
+        names=[column[0] for column in description],
+    )
+    from_rows = SupersetResultSet(rows, description, BaseEngineSpec)
+    from_arrow = SupersetResultSet.from_arrow(table, description, BaseEngineSpec)
+
+    assert from_arrow.columns == from_rows.columns
+    assert from_arrow.to_pandas_df().equals(from_rows.to_pandas_df())
+
+
+def test_from_arrow_nested_and_empty() -> None:
+    """
+    Test that nested Arrow columns are stringified and empty tables are dropped.
+    """
+    import pyarrow as pa
+
+    table = pa.table({"id": [1, 2], "items": [[1, 2], None]})
+    result_set = SupersetResultSet.from_arrow(table, None, BaseEngineSpec)
+    assert result_set.to_pandas_df().to_dict(orient="list") == {
+        "id": [1, 2],
+        "items": ["[1, 2]", None],
+    }
+
+    empty = SupersetResultSet.from_arrow(
+        pa.table({"id": pa.array([], pa.int64())}),
+        [("id", "int", None, None, None, None, False)],
+        BaseEngineSpec,
+    )
+    assert empty.size == 0
+    assert empty.columns == []
+
+
+def test_from_batches() -> None:
+    """
+    Test that batches with different types for a column are combined, as if the
+    result set had been built from all the rows at once.
+    """
+    description = [
+        ("a", "int", None, None, None, None, True),
+        ("b", "varchar", None, None, None, None, True),
+    ]
+    result_set = SupersetResultSet.from_batches(
+        iter([[(None, "x")], [], [(1, 2)]]),
+        description,
+        BaseEngineSpec,
+    )
+
+    assert not result_set.truncated
+    assert result_set.to_pandas_df().to_dict(orient="list") == {
+        "a": [None, 1],
+        "b": ["x", "2"],
+    }
+
+
+def test_from_batches_max_bytes() -> None:
+    """
+    Test that batches stop being consumed once the result reaches the byte budget.
+    """
+    consumed = []
+
+    def batches() -> Iterator[list[tuple[int]]]:
+        for i in range(10):
+            consumed.append(i)
+            yield [(value,) for value in range(i * 100, (i + 1) * 100)]
+
+    result_set = SupersetResultSet.from_batches(
+        batches(),
+        [("a", "int", None, None, None, None, True)],
+        BaseEngineSpec,
+        # 100 rows of int64 take 800 bytes
+        max_bytes=1000,
+    )
+
+    assert result_set.truncated
+    assert consumed == [0, 1]
+    assert result_set.to_pandas_df()["a"].tolist() == list(range(125))
@@ -0,0 +1,65 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from unittest.mock import MagicMock
+
+from pytest_mock import MockerFixture
+
+from superset.security import cache as security_cache
+
+
+def test_get_or_load(mocker: MockerFixture) -> None:
+    """
+    Test that values are cached under the current version.
+    """
+    store = {}
+    cache = mocker.patch("superset.extensions.cache_manager").cache
+    cache.get.side_effect = store.get
+    cache.add.side_effect = lambda key, value, timeout: store.setdefault(key, value)
+    cache.set.side_effect = lambda key, value, timeout: store.update({key: value})
+    load = MagicMock(return_value={"a": 1})
+
+    version = security_cache.get_version("version")
+    assert version
+    assert security_cache.get_or_load(version, "key", load, 60) == {"a": 1}
+    assert security_cache.get_or_load(version, "key", load, 60) == {"a": 1}
+    assert load.call_count == 1
+
+    security_cache.invalidate("version")
+    new_version = security_cache.get_version("version")
+    assert new_version != version
+    security_cache.get_or_load(new_version, "key", load, 60)
+    assert load.call_count == 2
+
+    # an evicted version is replaced by a new one
+    del store["version"]
+    assert security_cache.get_version("version") not in {None, version, new_version}
+
+
+def test_get_or_load_without_cache(mocker: MockerFixture) -> None:
+    """
+    Test that values are loaded every time when the cache is not available.
+    """
+    cache = mocker.patch("superset.extensions.cache_manager").cache
+    cache.get.side_effect = ConnectionError()
+    load = MagicMock(return_value={"a": 1})
+
+    version = security_cache.get_version("version")
+    assert version is None
+    assert security_cache.get_or_load(version, "key", load, 60) == {"a": 1}
+    assert security_cache.get_or_load(version, "key", load, 60) == {"a": 1}
+    assert load.call_count == 2
+    cache.set.assert_not_called()
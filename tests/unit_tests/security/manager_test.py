@@ -20,6 +20,7 @@
 import json
 
 import pytest
+from flask import Flask
 from flask_appbuilder.security.sqla.models import Role, User
 from pytest_mock import MockerFixture
 
@@ -1169,3 +1170,237 @@ def test_get_catalogs_accessible_by_user_schema_access(
     catalogs = {"catalog1", "catalog2"}
 
     assert sm.get_catalogs_accessible_by_user(database, catalogs) == {"catalog2"}
+
+
+def test_get_rls_filters_for_tables(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that the RLS filters of several tables are resolved with a single query,
+    cached, and invalidated when a filter changes.
+    """
+    from superset.connectors.sqla.models import RowLevelSecurityFilter
+    from superset.security import cache as security_cache
+    from superset.security.manager import RLS_FILTERS_VERSION_CACHE_KEY, RLSFilter
+
+    sm = SupersetSecurityManager(appbuilder)
+    session = sm.get_session
+    engine = session.get_bind()
+    SqlaTable.metadata.create_all(engine)  # pylint: disable=no-member
+
+    gamma, other = Role(name="Gamma"), Role(name="Other")
+    user = User(
+        first_name="Alice",
+        last_name="Doe",
+        email="adoe@example.org",
+        username="alice",
+        roles=[gamma],
+    )
+    database = Database(database_name="my_database", sqlalchemy_uri="sqlite://")
+    tables = [SqlaTable(table_name=f"table_{i}", database=database) for i in range(3)]
+    session.add_all([user, other, *tables])
+    session.flush()
+    regular = RowLevelSecurityFilter(
+        name="regular",
+        filter_type="Regular",
+        clause="a = 1",
+        group_key="a",
+        roles=[gamma],
+        tables=tables[:2],
+    )
+    base = RowLevelSecurityFilter(
+        name="base",
+        filter_type="Base",
+        clause="b = 1",
+        roles=[other],
+        tables=tables[1:],
+    )
+    session.add_all([regular, base])
+    session.flush()
+
+    cache = {}
+    cache_manager = mocker.patch("superset.extensions.cache_manager")
+    cache_manager.cache.get.side_effect = cache.get
+    cache_manager.cache.add.side_effect = lambda k, v, timeout: cache.setdefault(k, v)
+    cache_manager.cache.set.side_effect = lambda k, v, timeout: cache.update({k: v})
+    # a request context leaked by another test would memoize the filters
+    mocker.patch("superset.utils.cache.has_request_context", return_value=False)
+    query = mocker.spy(sm, "_get_rls_filters_by_table")
+
+    with override_user(user):
+        assert sm.get_rls_filters_for_tables(tables) == {
+            tables[0].id: [RLSFilter(regular.id, "a", "a = 1")],
+            tables[1].id: [
+                RLSFilter(regular.id, "a", "a = 1"),
+                RLSFilter(base.id, None, "b = 1"),
+            ],
+            tables[2].id: [RLSFilter(base.id, None, "b = 1")],
+        }
+        assert sm.get_rls_filters(tables[2]) == [RLSFilter(base.id, None, "b = 1")]
+        assert query.call_count == 1
+
+        # the filters don't apply to users with the role excluded by the base filter
+        user.roles.append(other)
+        assert sm.get_rls_filters(tables[2]) == []
+        assert query.call_count == 2
+
+        user.roles.remove(other)
+        assert sm.get_rls_filters(tables[1]) == [
+            RLSFilter(regular.id, "a", "a = 1"),
+            RLSFilter(base.id, None, "b = 1"),
+        ]
+        assert query.call_count == 2
+
+        security_cache.invalidate(RLS_FILTERS_VERSION_CACHE_KEY)
+        sm.get_rls_filters(tables[1])
+        assert query.call_count == 3
+
+
+def test_get_permission_index(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that the permissions of a set of roles are indexed, cached in the process,
+    and invalidated when the permissions change.
+    """
+    from flask_appbuilder.security.sqla.models import (
+        Permission,
+        PermissionView,
+        ViewMenu,
+    )
+
+    sm = SupersetSecurityManager(appbuilder)
+    session = sm.get_session
+    engine = session.get_bind()
+    Role.metadata.create_all(engine)  # pylint: disable=no-member
+
+    database_access = Permission(name="database_access")
+    gamma = Role(
+        name="Gamma",
+        permissions=[
+            PermissionView(
+                permission=database_access,
+                view_menu=ViewMenu(name="[db1].(id:1)"),
+            ),
+            PermissionView(
+                permission=Permission(name="can_read"),
+                view_menu=ViewMenu(name="Chart"),
+            ),
+        ],
+    )
+    other = Role(
+        name="Other",
+        permissions=[
+            PermissionView(
+                permission=database_access,
+                view_menu=ViewMenu(name="[db2].(id:2)"),
+            ),
+        ],
+    )
+    user = User(
+        first_name="Alice",
+        last_name="Doe",
+        email="adoe@example.org",
+        username="alice",
+        roles=[gamma, other],
+    )
+    session.add(user)
+    session.flush()
+
+    version = {"value": "v1"}
+    mocker.patch(
+        "superset.security.cache.get_version",
+        side_effect=lambda key: version["value"],
+    )
+    mocker.patch("superset.utils.cache.has_request_context", return_value=False)
+    mocker.patch.object(sm, "_is_permission_index_cached", return_value=True)
+    query = mocker.spy(sm, "_get_permission_index")
+
+    assert sm.get_permission_index([gamma, other]) == {
+        "database_access": frozenset({"[db1].(id:1)", "[db2].(id:2)"}),
+        "can_read": frozenset({"Chart"}),
+    }
+    with override_user(user):
+        assert sm.user_view_menu_names("database_access") == {
+            "[db1].(id:1)",
+            "[db2].(id:2)",
+        }
+        assert sm.can_access("can_read", "Chart")
+        assert not sm.can_access("can_write", "Chart")
+    assert query.call_count == 1
+
+    version["value"] = "v2"
+    assert sm.get_permission_index([gamma])["database_access"] == {"[db1].(id:1)"}
+    sm.get_permission_index([other, gamma])
+    assert query.call_count == 3
+
+
+def test_permission_index_null_cache(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that without a cache the permissions are checked without the index.
+    """
+    from flask_appbuilder.security.sqla.models import (
+        Permission,
+        PermissionView,
+        ViewMenu,
+    )
+
+    sm = SupersetSecurityManager(appbuilder)
+    session = sm.get_session
+    Role.metadata.create_all(session.get_bind())  # pylint: disable=no-member
+
+    gamma = Role(
+        name="Gamma",
+        permissions=[
+            PermissionView(
+                permission=Permission(name="database_access"),
+                view_menu=ViewMenu(name="[db1].(id:1)"),
+            ),
+            PermissionView(
+                permission=Permission(name="can_read"),
+                view_menu=ViewMenu(name="Chart"),
+            ),
+        ],
+    )
+    user = User(
+        first_name="Alice",
+        last_name="Doe",
+        email="adoe@example.org",
+        username="alice",
+        roles=[gamma],
+    )
+    session.add(user)
+    session.flush()
+
+    get_permission_index = mocker.spy(sm, "get_permission_index")
+    with override_user(user):
+        assert sm.user_view_menu_names("database_access") == {"[db1].(id:1)"}
+        assert sm.can_access("can_read", "Chart")
+        assert not sm.can_access("can_write", "Chart")
+    get_permission_index.assert_not_called()
+
+
+def test_invalidate_permission_index(mocker: MockerFixture, app: Flask) -> None:
+    """
+    Test that invalidating the permission index discards the indexes of the request,
+    and that updating a role invalidates it.
+    """
+    from superset.utils.cache import memoize_per_request
+
+    sm = SupersetSecurityManager(appbuilder)
+    with app.test_request_context():
+        memoize_per_request(("permission_index", (1,)), lambda: {"a": frozenset()})
+        memoize_per_request(("other",), lambda: 42)
+        sm._permission_indexes = {(1,): {}}
+
+        sm.invalidate_permission_index()
+
+        assert memoize_per_request(("permission_index", (1,)), dict) == {}
+        assert memoize_per_request(("other",), lambda: 0) == 42
+        assert sm._permission_indexes == {}
+
+    security_manager = mocker.patch("superset.extensions.security_manager")
+    session = sm.get_session
+    Role.metadata.create_all(session.get_bind())  # pylint: disable=no-member
+    role = Role(name="Gamma")
+    session.add(role)
+    session.flush()
+    role.name = "Alpha"
+    session.flush()
+    security_manager.on_role_after_update.assert_called_once()
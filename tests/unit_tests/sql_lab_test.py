@@ -50,6 +50,7 @@ def test_execute_query(mocker: MockerFixture, app: None) -> None:
     database = query.database
     database.allow_dml = False
     db_engine_spec = database.db_engine_spec
+    db_engine_spec.supports_arrow_fetch = False
     db_engine_spec.fetch_data.return_value = [(42,)]
 
     cursor = mocker.MagicMock()
@@ -65,6 +66,143 @@ def test_execute_query(mocker: MockerFixture, app: None) -> None:
     SupersetResultSet.assert_called_with([(42,)], cursor.description, db_engine_spec)
 
 
+def test_execute_query_arrow(mocker: MockerFixture, app: None) -> None:
+    """
+    Test that `execute_query` fetches Arrow data when the engine supports it.
+    """
+    import pyarrow as pa
+
+    query = mocker.MagicMock()
+    query.executed_sql = "SELECT 42 AS answer"
+
+    query.limit = 1
+    database = query.database
+    database.allow_dml = False
+    db_engine_spec = database.db_engine_spec
+    db_engine_spec.supports_arrow_fetch = True
+    db_engine_spec.fetch_arrow.return_value = pa.table({"answer": [42, 43]})
+
+    cursor = mocker.MagicMock()
+    SupersetResultSet = mocker.patch("superset.sql_lab.SupersetResultSet")  # noqa: N806
+
+    execute_query(query, cursor=cursor, log_params={})
+
+    db_engine_spec.fetch_arrow.assert_called_with(cursor, 2)
+    db_engine_spec.fetch_data.assert_not_called()
+    table = SupersetResultSet.from_arrow.call_args[0][0]
+    assert table.to_pydict() == {"answer": [42]}
+
+
+def test_execute_query_arrow_unavailable(mocker: MockerFixture, app: None) -> None:
+    """
+    Test that `execute_query` fetches rows when the cursor has no Arrow data.
+    """
+    query = mocker.MagicMock()
+    query.executed_sql = "SELECT 42 AS answer"
+
+    query.limit = 1
+    database = query.database
+    database.allow_dml = False
+    db_engine_spec = database.db_engine_spec
+    db_engine_spec.supports_arrow_fetch = True
+    db_engine_spec.supports_streaming_fetch = False
+    db_engine_spec.fetch_arrow.return_value = None
+    db_engine_spec.fetch_data.return_value = [(42,)]
+
+    cursor = mocker.MagicMock()
+    SupersetResultSet = mocker.patch("superset.sql_lab.SupersetResultSet")  # noqa: N806
+
+    execute_query(query, cursor=cursor, log_params={})
+
+    db_engine_spec.fetch_data.assert_called_with(cursor, 2)
+    SupersetResultSet.assert_called_with([(42,)], cursor.description, db_engine_spec)
+
+
+@mock.patch.dict(
+    "superset.sql_lab.config",
+    {"SQLLAB_RESULTS_MAX_BYTES": 8, "SQLLAB_FETCH_BATCH_ROWS": 1},
+)
+def test_execute_query_max_bytes(mocker: MockerFixture, app: None) -> None:
+    """
+    Test that `execute_query` stops fetching rows once they exceed the byte budget.
+    """
+    query = mocker.MagicMock()
+    query.executed_sql = "SELECT answer FROM t"
+
+    query.limit = 10
+    database = query.database
+    database.allow_dml = False
+    db_engine_spec = database.db_engine_spec
+    db_engine_spec.supports_arrow_fetch = False
+    db_engine_spec.supports_streaming_fetch = True
+    db_engine_spec.fetch_data_batches.return_value = iter([[(42,)], [(43,)]])
+
+    cursor = mocker.MagicMock()
+    cursor.description = [("answer", "int", None, None, None, None, True)]
+
+    result_set = execute_query(query, cursor=cursor, log_params={})
+
+    db_engine_spec.fetch_data_batches.assert_called_with(cursor, 1, 11)
+    db_engine_spec.fetch_data.assert_not_called()
+    assert result_set.to_pandas_df()["answer"].tolist() == [42]
+    query.set_extra_json_key.assert_called_with("results_truncated", True)
+
+
+@mock.patch.dict("superset.sql_lab.config", {"SQLLAB_RESULTS_MAX_BYTES": 80})
+def test_execute_query_arrow_max_bytes(mocker: MockerFixture, app: None) -> None:
+    """
+    Test that `execute_query` keeps the Arrow data within the byte budget.
+    """
+    import pyarrow as pa
+
+    query = mocker.MagicMock()
+    query.executed_sql = "SELECT answer FROM t"
+
+    query.limit = 1000
+    database = query.database
+    database.allow_dml = False
+    db_engine_spec = database.db_engine_spec
+    db_engine_spec.supports_arrow_fetch = True
+    db_engine_spec.fetch_arrow.return_value = pa.table(
+        {"answer": pa.array(range(100), pa.int64())}
+    )
+
+    cursor = mocker.MagicMock()
+    SupersetResultSet = mocker.patch("superset.sql_lab.SupersetResultSet")  # noqa: N806
+
+    execute_query(query, cursor=cursor, log_params={})
+
+    table = SupersetResultSet.from_arrow.call_args[0][0]
+    assert table.to_pydict() == {"answer": list(range(10))}
+    query.set_extra_json_key.assert_called_with("results_truncated", True)
+
+
+def test_get_results_payload_truncated(mocker: MockerFixture) -> None:
+    """
+    Test that truncated results are flagged in the payload shown by SQL Lab.
+    """
+    from superset.db_engine_specs.sqlite import SqliteEngineSpec
+    from superset.result_set import SupersetResultSet
+    from superset.sql_lab import _get_results_payload
+
+    query = mocker.MagicMock()
+    query.database.db_engine_spec = SqliteEngineSpec
+    query.to_dict.side_effect = dict
+    result_set = SupersetResultSet(
+        [(1,)],
+        [("answer", "int", None, None, None, None, True)],
+        SqliteEngineSpec,
+    )
+
+    query.extra = {}
+    payload = _get_results_payload(query, result_set, False, None, False)
+    assert "resultsTruncated" not in payload
+
+    query.extra = {"results_truncated": True}
+    payload = _get_results_payload(query, result_set, False, None, False)
+    assert payload["resultsTruncated"] is True
+
+
 @mock.patch.dict(
     "superset.sql_lab.config",
     {"SQLLAB_PAYLOAD_MAX_MB": 50},  # Set the desired config value for testing
@@ -172,6 +310,68 @@ def test_execute_sql_statement_within_payload_limit(mocker: MockerFixture) -> No
         )
 
 
+@mock.patch.dict(
+    "superset.sql_lab.config",
+    {"SQLLAB_PUBLISH_STATEMENT_RESULTS": True},
+)
+def test_execute_sql_statements_publish_statement_results(
+    mocker: MockerFixture,
+) -> None:
+    """
+    Test that the results of each statement of a script are stored as soon as the
+    statement completes, and that the progress is reported per statement.
+    """
+    from superset.db_engine_specs.sqlite import SqliteEngineSpec
+    from superset.result_set import SupersetResultSet
+
+    query = mocker.MagicMock()
+    query.id = 1
+    query.limit = 10
+    query.select_as_cta = False
+    query.database.cache_timeout = 100
+    query.database.db_engine_spec = SqliteEngineSpec
+    query.extra = {}
+    query.to_dict.side_effect = dict
+    mocker.patch("superset.sql_lab.get_query", return_value=query)
+    mocker.patch("superset.sql_lab.db")
+    mocker.patch("superset.sql_lab.results_backend_use_msgpack", False)
+    results_backend = mocker.patch("superset.sql_lab.results_backend")
+    mocker.patch("superset.sql_lab.uuid.uuid4", side_effect=["a", "b"])
+    description = [("answer", "int", None, None, None, None, True)]
+    execute_query = mocker.patch(
+        "superset.sql_lab.execute_query",
+        side_effect=[
+            SupersetResultSet([(1,)], description, SqliteEngineSpec),
+            SupersetResultSet([], None, SqliteEngineSpec),
+            SupersetResultSet([(3,), (4,)], description, SqliteEngineSpec),
+        ],
+    )
+    progress = []
+    type(query).progress = mock.PropertyMock(side_effect=progress.append)
+
+    execute_sql_statements(
+        query_id=1,
+        rendered_query="SELECT 1; DELETE FROM t; SELECT 3",
+        return_results=False,
+        store_results=True,
+        start_time=None,
+        expand_data=False,
+        log_params={},
+    )
+
+    assert execute_query.call_count == 3
+    assert progress == [33, 66, 100]
+    query.set_extra_json_key.assert_any_call(
+        "statement_results",
+        [{"statement": 1, "rows": 1, "resultsKey": "a_1"}],
+    )
+    assert [call.args[0] for call in results_backend.set.call_args_list] == [
+        "a_1",
+        "b",
+    ]
+    assert query.results_key == "b"
+
+
 @freeze_time("2021-04-01T00:00:00Z")
 def test_get_sql_results_oauth2(mocker: MockerFixture, app) -> None:
     """
@@ -0,0 +1,83 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from typing import Any
+
+import pyarrow as pa
+import pytest
+from pytest_mock import MockerFixture
+
+from superset.exceptions import SerializationError
+from superset.sqllab import result_chunks
+
+
+@pytest.fixture
+def results_backend(mocker: MockerFixture) -> Any:
+    values: dict[str, Any] = {}
+    backend = mocker.MagicMock()
+    backend.get.side_effect = values.get
+    backend.set_many.side_effect = lambda mapping, timeout: values.update(mapping)
+    mocker.patch("superset.sqllab.result_chunks.results_backend", new=backend)
+    return backend
+
+
+def store(data: result_chunks.ChunkData, chunk_rows: int) -> dict[str, Any]:
+    chunks, size = result_chunks.serialize_chunks(data, chunk_rows)
+    assert size > 0
+    result_chunks.write_chunks("key", chunks, 60)
+    return {"chunks": {"count": len(chunks), "rows": chunk_rows}}
+
+
+def test_read_rows_arrow(results_backend: Any) -> None:
+    """
+    Test that only the chunks overlapping the rows read are fetched.
+    """
+    manifest = store(pa.table({"a": list(range(10))}), 3)
+    assert manifest["chunks"]["count"] == 4
+
+    table = result_chunks.read_rows("key", manifest, True, offset=4, limit=3)
+    assert table.column("a").to_pylist() == [4, 5, 6]
+    assert [call.args[0] for call in results_backend.get.call_args_list] == [
+        "key/chunk/1",
+        "key/chunk/2",
+    ]
+
+    table = result_chunks.read_rows("key", manifest, True, offset=8)
+    assert table.column("a").to_pylist() == [8, 9]
+
+
+def test_read_rows_json(results_backend: Any) -> None:
+    """
+    Test reading rows stored as JSON records.
+    """
+    manifest = store([{"a": i} for i in range(10)], 4)
+
+    assert result_chunks.read_rows("key", manifest, False, offset=3, limit=2) == [
+        {"a": 3},
+        {"a": 4},
+    ]
+    assert result_chunks.read_rows("key", manifest, False, limit=0) == []
+    assert len(result_chunks.read_rows("key", manifest, False)) == 10
+
+
+def test_read_rows_missing_chunk(results_backend: Any) -> None:
+    """
+    Test that a missing chunk is a serialization error.
+    """
+    manifest = {"chunks": {"count": 2, "rows": 10}}
+
+    with pytest.raises(SerializationError):
+        result_chunks.read_rows("key", manifest, False)
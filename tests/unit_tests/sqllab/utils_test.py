@@ -0,0 +1,34 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from superset.sqllab.utils import (
+    get_statement_results_key,
+    get_statement_results_query_id,
+)
+
+
+def test_get_statement_results_query_id() -> None:
+    """
+    Test that the ID of the query is found from the results key of a statement.
+    """
+    key = get_statement_results_key(42)
+    assert key != get_statement_results_key(42)
+    assert get_statement_results_query_id(key) == 42
+    assert (
+        get_statement_results_query_id("2f1c6f0a-5d3b-4c3e-9e39-123456789012") is None
+    )
+    assert get_statement_results_query_id("a_b") is None
@@ -53,3 +53,78 @@ def test_load_chart_data_into_cache_with_error(
     mock_async_query_manager.update_job.assert_called_once_with(
         job_metadata, "error", errors=expected_errors
     )
+
+
+@pytest.mark.parametrize("limited", [False, True])
+@mock.patch("superset.tasks.async_queries._load_chart_data")
+@mock.patch("superset.tasks.async_queries.has_concurrency_limit")
+@mock.patch("superset.tasks.async_queries.security_manager")
+@mock.patch("superset.tasks.async_queries.DatasourceDAO")
+def test_load_chart_data_into_cache_dataset(
+    mock_datasource_dao,
+    mock_security_manager,
+    mock_has_concurrency_limit,
+    mock_load_chart_data,
+    limited,
+):
+    """
+    Test that the dataset is only loaded when the databases of charts are limited.
+    """
+    from superset.tasks.async_queries import load_chart_data_into_cache
+    from superset.tasks.routing import TaskClass
+
+    mock_has_concurrency_limit.return_value = limited
+
+    load_chart_data_into_cache(
+        {"user_id": 1}, {"datasource": {"id": 1, "type": "table"}}
+    )
+
+    mock_has_concurrency_limit.assert_called_once_with(
+        TaskClass.INTERACTIVE, "database"
+    )
+    assert mock_datasource_dao.get_datasource.called is limited
+    mock_load_chart_data.assert_called_once()
+
+
+@mock.patch("superset.tasks.async_queries.DatasourceDAO")
+@mock.patch("superset.tasks.async_queries.security_manager")
+@mock.patch("superset.tasks.async_queries.async_query_manager")
+@mock.patch("superset.tasks.async_queries.ChartDataQueryContextSchema")
+@mock.patch("superset.commands.chart.data.get_data_command.ChartDataCommand.run")
+def test_load_chart_data_batch_into_cache(
+    mock_run,
+    mock_query_context_schema_cls,
+    mock_async_query_manager,
+    mock_security_manager,
+    mock_datasource_dao,
+):
+    """
+    Test that the charts of a batch share the user, the dataset and the query
+    context schema, and that a failing chart doesn't prevent the next ones from loading.
+    """
+    from superset.tasks.async_queries import load_chart_data_batch_into_cache
+
+    jobs_metadata = [{"job_id": "1"}, {"job_id": "2"}, {"job_id": "3"}]
+    form_datas = [{"datasource": {"id": 1, "type": "table"}}, {}, {}]
+    mock_async_query_manager.STATUS_DONE = "done"
+    mock_async_query_manager.STATUS_ERROR = "error"
+    mock_run.side_effect = [
+        {"cache_key": "a"},
+        ChartDataQueryFailedError(_("Something went wrong")),
+        {"cache_key": "c"},
+    ]
+
+    load_chart_data_batch_into_cache({"user_id": 1}, jobs_metadata, form_datas)
+
+    mock_security_manager.get_user_by_id.assert_called_once_with(1)
+    mock_datasource_dao.get_datasource.assert_called_once()
+    mock_query_context_schema_cls.assert_called_once_with(
+        datasource_model=mock_datasource_dao.get_datasource.return_value
+    )
+    assert mock_async_query_manager.update_job.call_args_list == [
+        mock.call({"job_id": "1"}, "done", result_url="/api/v1/chart/data/a"),
+        mock.call(
+            {"job_id": "2"}, "error", errors=[{"message": "Something went wrong"}]
+        ),
+        mock.call({"job_id": "3"}, "done", result_url="/api/v1/chart/data/c"),
+    ]
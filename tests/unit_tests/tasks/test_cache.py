@@ -0,0 +1,138 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from flask import current_app
+from pytest_mock import MockerFixture
+
+from superset.tasks.cache import schedule_native_warmup, warm_up_charts
+
+
+def make_task(chart_id: int, dashboard_id: int | None, username: str | None) -> dict:
+    payload = {"chart_id": chart_id}
+    if dashboard_id:
+        payload["dashboard_id"] = dashboard_id
+    return {"payload": payload, "username": username}
+
+
+def test_schedule_native_warmup(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that charts shared by dashboards are warmed up once, unless they apply the
+    filters of the dashboard, and that the charts of a database are spread over
+    ``CACHE_WARMUP_DATABASE_CONCURRENCY`` tasks, with a time limit for each chart.
+    """
+    db = mocker.patch("superset.tasks.cache.db")
+    warm_up_charts_task = mocker.patch("superset.tasks.cache.warm_up_charts")
+    mocker.patch.dict(
+        current_app.config,
+        {
+            "CACHE_WARMUP_DATABASE_CONCURRENCY": 2,
+            "CACHE_WARMUP_CHART_TIME_LIMIT": 60,
+            "CACHE_WARMUP_CHART_INTERVAL": 5,
+        },
+    )
+    charts = [
+        mocker.MagicMock(id=1, viz_type="echarts_timeseries_line"),
+        mocker.MagicMock(id=2, viz_type="line"),
+        mocker.MagicMock(id=3, viz_type="table"),
+        mocker.MagicMock(id=4, viz_type="table"),
+    ]
+    for chart, database_id in zip(charts, (1, 1, 1, 2), strict=True):
+        chart.datasource.database_id = database_id
+    db.session.query.return_value.filter.return_value = charts
+    tasks = [
+        make_task(1, 10, "admin"),
+        make_task(1, 11, "admin"),
+        make_task(1, None, "alpha"),
+        make_task(2, 10, "admin"),
+        make_task(2, 11, "admin"),
+        make_task(3, None, None),
+        make_task(4, None, "admin"),
+        make_task(5, None, "admin"),
+    ]
+
+    results = schedule_native_warmup(tasks)
+
+    assert warm_up_charts_task.apply_async.call_args_list == [
+        mocker.call(([tasks[0], tasks[3]], 1), soft_time_limit=130),
+        mocker.call(([tasks[2], tasks[4]], 1), soft_time_limit=130),
+        mocker.call(([tasks[6]], 2), soft_time_limit=65),
+    ]
+    assert len(results["scheduled"]) == 5
+    assert results["errors"] == []
+
+
+def test_warm_up_charts(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that the charts of each executor are warmed up in a row, loading each user
+    once, while holding a slot of the database.
+    """
+    concurrency_slot = mocker.patch("superset.tasks.cache.concurrency_slot")
+    security_manager = mocker.patch(
+        "superset.tasks.cache.security_manager", new=mocker.MagicMock()
+    )
+    security_manager.find_user.side_effect = lambda username: f"user {username}"
+    warm_up_chart = mocker.patch(
+        "superset.tasks.cache.warm_up_chart",
+        side_effect=lambda payload, user: {
+            "chart_id": payload["chart_id"],
+            "duration": 0.5,
+            "cached_queries": 1,
+            "queries": 1,
+            "viz_error": None,
+        },
+    )
+    tasks = [
+        make_task(1, None, "gamma"),
+        make_task(2, None, "admin"),
+        make_task(3, None, "gamma"),
+    ]
+
+    results = warm_up_charts(tasks, 1)
+
+    assert [result["chart_id"] for result in results] == [2, 1, 3]
+    assert security_manager.find_user.call_count == 2
+    warm_up_chart.assert_called_with({"chart_id": 3}, "user gamma")
+    concurrency_slot.assert_called_once_with(
+        "warmup", database_id=1, limits={"database": 1}
+    )
+
+
+def test_warm_up_charts_time_limit(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that the remaining charts are skipped once the time limit is reached.
+    """
+    mocker.patch("superset.tasks.cache.security_manager", new=mocker.MagicMock())
+    # the first chart takes the time of the three charts, 10 minutes each
+    mocker.patch("superset.tasks.cache.now_as_float", side_effect=[0, 0, 1_800_001])
+    mocker.patch(
+        "superset.tasks.cache.warm_up_chart",
+        side_effect=lambda payload, user: {
+            "chart_id": payload["chart_id"],
+            "duration": 1800,
+            "cached_queries": 0,
+            "queries": 1,
+            "viz_error": "Timeout",
+        },
+    )
+    tasks = [
+        make_task(1, None, "admin"),
+        make_task(2, None, "admin"),
+        make_task(3, None, "admin"),
+    ]
+
+    results = warm_up_charts(tasks, 1)
+
+    assert [result["chart_id"] for result in results] == [1]
@@ -0,0 +1,128 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from unittest.mock import call
+
+from pytest_mock import MockerFixture
+
+from superset.tasks.database_metadata import (
+    prefetch_metadata,
+    refresh_database_metadata,
+)
+
+
+def test_refresh_database_metadata(mocker: MockerFixture) -> None:
+    """
+    Test that expired metadata is fetched again, replacing the cached listing.
+    """
+    database = mocker.MagicMock()
+    db = mocker.patch("superset.tasks.database_metadata.db")
+    db.session.query().get.return_value = database
+
+    refresh_database_metadata(
+        1,
+        "get_all_table_names_in_schema",
+        {"catalog": None, "schema": "public"},
+        60,
+    )
+    database.get_all_table_names_in_schema.assert_called_once_with(
+        catalog=None,
+        schema="public",
+        cache=True,
+        cache_timeout=60,
+        force=True,
+    )
+
+    refresh_database_metadata(1, "get_df", {}, 60)
+    database.get_df.assert_not_called()
+
+
+def test_prefetch_metadata(mocker: MockerFixture) -> None:
+    """
+    Test that the catalogs, schemas, tables and views of a database are crawled.
+    """
+    database = mocker.MagicMock(
+        catalog_cache_enabled=True,
+        catalog_cache_timeout=600,
+        schema_cache_enabled=True,
+        schema_cache_timeout=None,
+        table_cache_enabled=True,
+        table_cache_timeout=60,
+    )
+    database.db_engine_spec.supports_catalog = True
+    database.get_all_catalog_names.return_value = {"main"}
+    database.get_all_schema_names.return_value = {"public", "private"}
+
+    prefetch_metadata(database)
+
+    database.get_all_catalog_names.assert_called_once_with(
+        cache=True,
+        cache_timeout=600,
+        force=True,
+    )
+    database.get_all_schema_names.assert_called_once_with(
+        catalog="main",
+        cache=True,
+        cache_timeout=None,
+        force=True,
+    )
+    for method in (
+        database.get_all_table_names_in_schema,
+        database.get_all_view_names_in_schema,
+    ):
+        method.assert_has_calls(
+            [
+                call(
+                    catalog="main",
+                    schema=schema,
+                    cache=True,
+                    cache_timeout=60,
+                    force=True,
+                )
+                for schema in ("public", "private")
+            ],
+            any_order=True,
+        )
+
+
+def test_prefetch_metadata_cache_disabled(mocker: MockerFixture) -> None:
+    """
+    Test that the listings whose cache is disabled are only fetched when the
+    listings below them are cached.
+    """
+    database = mocker.MagicMock(
+        catalog_cache_enabled=False,
+        schema_cache_enabled=True,
+        table_cache_enabled=False,
+    )
+    database.db_engine_spec.supports_catalog = True
+    database.get_all_catalog_names.return_value = {"main"}
+    database.get_all_schema_names.return_value = {"public"}
+
+    prefetch_metadata(database)
+
+    database.get_all_catalog_names.assert_called_once()
+    database.get_all_schema_names.assert_called_once()
+    database.get_all_table_names_in_schema.assert_not_called()
+    database.get_all_view_names_in_schema.assert_not_called()
+
+    database.reset_mock()
+    database.schema_cache_enabled = False
+
+    prefetch_metadata(database)
+
+    database.get_all_catalog_names.assert_not_called()
+    database.get_all_schema_names.assert_not_called()
@@ -0,0 +1,50 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from pytest_mock import MockerFixture
+
+from superset.tasks.filter_values import refresh_filter_values
+
+
+def test_refresh_filter_values(mocker: MockerFixture) -> None:
+    """
+    Test that values are fetched again in the catalog and schema of the dataset, and
+    replace the cached values.
+    """
+    database = mocker.MagicMock()
+    db = mocker.patch("superset.tasks.filter_values.db")
+    db.session.query().get.return_value = database
+    fetch_values = mocker.patch(
+        "superset.tasks.filter_values.fetch_values",
+        return_value=["a", "b"],
+    )
+    set_values = mocker.patch("superset.tasks.filter_values.set_values")
+
+    refresh_filter_values(
+        1,
+        "SELECT DISTINCT a AS column_values FROM t",
+        "filter_values_key",
+        None,
+        catalog="main",
+        schema="public",
+    )
+
+    database.get_sqla_engine.assert_called_once_with(catalog="main", schema="public")
+    fetch_values.assert_called_once_with(
+        database.get_sqla_engine().__enter__(),
+        database.db_engine_spec.get_text_clause(),
+    )
+    set_values.assert_called_once_with("filter_values_key", ["a", "b"])
@@ -0,0 +1,211 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import pytest
+from cachelib import SimpleCache
+from flask import current_app
+from pytest_mock import MockerFixture
+
+from superset.tasks.routing import (
+    concurrency_slot,
+    get_task_router,
+    has_concurrency_limit,
+    on_task_prerun,
+    on_task_publish,
+    PUBLISHED_AT_HEADER,
+    TaskClass,
+)
+
+
+class RetryError(Exception):
+    pass
+
+
+def test_get_task_router() -> None:
+    """
+    Test that tasks are routed to the queue of their class, if any.
+    """
+    route_task = get_task_router({"interactive": "charts", "reports": "background"})
+
+    assert route_task("load_chart_data_into_cache", (), {}, {}) == {"queue": "charts"}
+    assert route_task("reports.execute", (), {}, {}) == {"queue": "background"}
+    assert route_task("sql_lab.get_sql_results", (), {}, {}) is None
+    assert route_task("unknown", (), {}, {}) is None
+
+
+def test_has_concurrency_limit(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that the scopes limited for a task class are reported.
+    """
+    mocker.patch.dict(
+        current_app.config,
+        {"CELERY_TASK_CONCURRENCY_LIMITS": {"interactive": {"user": 2}}},
+    )
+
+    assert has_concurrency_limit(TaskClass.INTERACTIVE, "user")
+    assert not has_concurrency_limit(TaskClass.INTERACTIVE, "database")
+    assert not has_concurrency_limit(TaskClass.SQL_LAB, "user")
+
+
+def test_concurrency_slot(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that tasks over the limit of a user or of a database are retried, and that
+    slots are released when tasks finish.
+    """
+    cache_manager = mocker.patch("superset.tasks.routing.cache_manager")
+    cache_manager.cache = SimpleCache()
+    task = mocker.patch("superset.tasks.routing.current_task")
+    task.request.called_directly = False
+    task.request.is_eager = False
+    task.request.timelimit = (None, None)
+    task.time_limit = task.soft_time_limit = None
+    task.retry.return_value = RetryError()
+    mocker.patch.dict(
+        current_app.config,
+        {"CELERY_TASK_CONCURRENCY_LIMITS": {"sql_lab": {"user": 2, "database": 1}}},
+    )
+
+    with concurrency_slot(TaskClass.SQL_LAB, user_id=1, database_id=1):
+        with pytest.raises(RetryError):
+            with concurrency_slot(TaskClass.SQL_LAB, user_id=2, database_id=1):
+                pass
+        with concurrency_slot(TaskClass.SQL_LAB, user_id=1, database_id=2):
+            with pytest.raises(RetryError):
+                with concurrency_slot(TaskClass.SQL_LAB, user_id=1, database_id=3):
+                    pass
+        # other classes are not limited
+        with concurrency_slot(TaskClass.INTERACTIVE, user_id=1, database_id=1):
+            pass
+
+    task.retry.assert_called_with(countdown=1, max_retries=None)
+    # the user slot taken before the database was found over its limit is released
+    with concurrency_slot(TaskClass.SQL_LAB, user_id=2, database_id=1):
+        with concurrency_slot(TaskClass.SQL_LAB, user_id=2, database_id=2):
+            pass
+
+
+@pytest.mark.parametrize(
+    "timelimit, time_limit, soft_time_limit, timeout",
+    [
+        ((None, None), None, None, 600),
+        ((None, None), 21660, 21600, 21660),
+        ((None, 1200), None, 300, 1200),
+        (None, None, 60, 600),
+    ],
+)
+def test_concurrency_slot_timeout(
+    mocker: MockerFixture,
+    app_context: None,
+    timelimit: tuple[int | None, int | None] | None,
+    time_limit: int | None,
+    soft_time_limit: int | None,
+    timeout: int,
+) -> None:
+    """
+    Test that slots are held for the time limit of the task, and at least
+    ``CELERY_TASK_CONCURRENCY_SLOT_TIMEOUT`` seconds.
+    """
+    cache_manager = mocker.patch("superset.tasks.routing.cache_manager")
+    task = mocker.patch("superset.tasks.routing.current_task")
+    task.request.called_directly = False
+    task.request.is_eager = False
+    task.request.timelimit = timelimit
+    task.time_limit = time_limit
+    task.soft_time_limit = soft_time_limit
+    mocker.patch.dict(
+        current_app.config,
+        {
+            "CELERY_TASK_CONCURRENCY_LIMITS": {"sql_lab": {"user": 1}},
+            "CELERY_TASK_CONCURRENCY_SLOT_TIMEOUT": 600,
+        },
+    )
+
+    with concurrency_slot(TaskClass.SQL_LAB, user_id=1):
+        pass
+
+    cache_manager.cache.add.assert_called_once_with(
+        "task_slot_sql_lab_user_1_0", True, timeout=timeout
+    )
+
+
+def test_concurrency_slot_limits(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that the limits given to a slot replace the limits of the task class.
+    """
+    cache_manager = mocker.patch("superset.tasks.routing.cache_manager")
+    cache_manager.cache = SimpleCache()
+    task = mocker.patch("superset.tasks.routing.current_task")
+    task.request.called_directly = False
+    task.request.is_eager = False
+    task.request.timelimit = None
+    task.time_limit = task.soft_time_limit = None
+    task.retry.return_value = RetryError()
+
+    with concurrency_slot(TaskClass.WARMUP, database_id=1, limits={"database": 1}):
+        with pytest.raises(RetryError):
+            with concurrency_slot(
+                TaskClass.WARMUP, database_id=1, limits={"database": 1}
+            ):
+                pass
+        # the class is not limited
+        with concurrency_slot(TaskClass.WARMUP, database_id=1):
+            pass
+
+
+def test_concurrency_slot_called_directly(
+    mocker: MockerFixture,
+    app_context: None,
+) -> None:
+    """
+    Test that tasks called directly, e.g. synchronous SQL Lab queries, are never
+    limited.
+    """
+    cache_manager = mocker.patch("superset.tasks.routing.cache_manager")
+    task = mocker.patch("superset.tasks.routing.current_task")
+    task.request.called_directly = True
+    mocker.patch.dict(
+        current_app.config,
+        {"CELERY_TASK_CONCURRENCY_LIMITS": {"sql_lab": {"user": 1}}},
+    )
+
+    with concurrency_slot(TaskClass.SQL_LAB, user_id=1):
+        with concurrency_slot(TaskClass.SQL_LAB, user_id=1):
+            pass
+
+    cache_manager.cache.add.assert_not_called()
+
+
+def test_task_metrics(mocker: MockerFixture) -> None:
+    """
+    Test that the tasks published and started, and their wait time, are logged for
+    classified tasks.
+    """
+    stats_logger = mocker.patch("superset.tasks.routing.stats_logger_manager").instance
+    mocker.patch("superset.tasks.routing.now_as_float", side_effect=[1000, 1250])
+
+    headers: dict[str, float] = {}
+    on_task_publish(sender="reports.execute", headers=headers)
+    on_task_publish(sender="unknown", headers={})
+    task = mocker.MagicMock()
+    task.name = "reports.execute"
+    setattr(task.request, PUBLISHED_AT_HEADER, headers[PUBLISHED_AT_HEADER])
+    on_task_prerun(task=task)
+
+    stats_logger.incr.assert_has_calls(
+        [mocker.call("celery.reports.published"), mocker.call("celery.reports.started")]
+    )
+    assert stats_logger.incr.call_count == 2
+    stats_logger.timing.assert_called_once_with("celery.reports.wait_time", 250)
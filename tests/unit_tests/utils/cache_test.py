@@ -17,6 +17,8 @@
 
 # pylint: disable=import-outside-toplevel, unused-argument
 
+from unittest.mock import patch
+
 from pytest_mock import MockerFixture
 
 
@@ -45,7 +47,81 @@ def test_memoized_func(mocker: MockerFixture) -> None:
     assert result == 42
     cache.get.assert_called_with("db:1:schema:public:view_list")
 
+    # no timeout, the default timeout of the cache backend applies
+    result = decorated(self, "public", cache=True, cache_timeout=None)
+    assert result == 42
+    cache.set.assert_called_with("db:1:schema:public:view_list", 42, timeout=None)
+
     # check cache, cached value
     cache.get.return_value = 43
     result = decorated(self, "public", cache=True)
     assert result == 43
+
+
+def test_memoize_per_request(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that ``memoize_per_request`` computes values once per request.
+    """
+    from flask import current_app
+
+    from superset.utils.cache import memoize_per_request
+
+    func = mocker.MagicMock(side_effect=[1, 2, 3, 4])
+
+    # outside of a request values are not stored
+    with patch("superset.utils.cache.has_request_context", return_value=False):
+        assert memoize_per_request("key", func) == 1
+        assert memoize_per_request("key", func) == 2
+
+    with current_app.test_request_context():
+        assert memoize_per_request("key", func) == 3
+        assert memoize_per_request("key", func) == 3
+
+    with current_app.test_request_context():
+        assert memoize_per_request("key", func) == 4
+
+
+def test_memoized_func_stale_while_revalidate(mocker: MockerFixture) -> None:
+    """
+    Test that ``memoized_func`` serves expired values while they are revalidated.
+    """
+    from cachelib import SimpleCache
+    from freezegun import freeze_time
+
+    from superset.utils.cache import memoized_func
+
+    revalidate = mocker.MagicMock(return_value=True)
+    func = mocker.MagicMock(side_effect=[1, 2, 3])
+
+    def get_value(schema: str) -> int:
+        return func()
+
+    decorated = memoized_func(
+        "schema:{schema}",
+        SimpleCache(),
+        revalidate=revalidate,
+        stale_timeout=lambda: 3600,
+    )(get_value)
+
+    with freeze_time("2024-01-01 00:00:00"):
+        assert decorated("public", cache_timeout=60) == 1
+        assert decorated("public", cache_timeout=60) == 1
+    revalidate.assert_not_called()
+
+    # expired values are served, and revalidated once
+    with freeze_time("2024-01-01 00:02:00"):
+        assert decorated("public", cache_timeout=60) == 1
+        assert decorated("public", cache_timeout=60) == 1
+    revalidate.assert_called_once_with(get_value, {"schema": "public"}, 60)
+    assert func.call_count == 1
+
+    # the refresh replaces the value
+    with freeze_time("2024-01-01 00:03:00"):
+        assert decorated("public", cache_timeout=60, force=True) == 2
+        assert decorated("public", cache_timeout=60) == 2
+
+    # values are computed in the request when they can't be revalidated
+    revalidate.return_value = False
+    with freeze_time("2024-01-01 00:05:00"):
+        assert decorated("public", cache_timeout=60) == 3
+    assert revalidate.call_count == 2
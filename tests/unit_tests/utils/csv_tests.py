@@ -95,3 +95,36 @@ def test_df_to_escaped_csv():
 
     df = pa.array([1, None]).to_pandas(integer_object_nulls=True).to_frame()
     assert csv.df_to_escaped_csv(df, encoding="utf8", index=False) == '0\n1\n""\n'
+
+
+def test_escape_values():
+    values = ["value", "-10", "=cmd|' /C calc'!A0", " =10+2", None, 1, ["=a"]]
+    result = csv.escape_values(pd.Series(values, dtype=object))
+    assert result.tolist() == [
+        csv.escape_value(value) if isinstance(value, str) else value for value in values
+    ]
+
+
+def test_escape_values_duplicate_labels():
+    values = ["=a", 1, "b", "-1", "+x|y", None]
+    column = pd.Series(values, index=[0, 0, 1, 1, 2, 2], dtype=object)
+    result = csv.escape_values(column)
+    assert result.tolist() == ["'=a", 1, "b", "-1", "'+x\\|y", None]
+    assert result.index.equals(column.index)
+
+
+def test_df_chunks_to_escaped_csv():
+    df = pd.DataFrame({"=name": ["a", "=b", "c"], "value": [1, 2, 3]})
+    chunks = [df[:2], df[2:]]
+
+    result = "".join(csv.df_chunks_to_escaped_csv(chunks, index=False))
+    assert result == csv.df_to_escaped_csv(df, index=False)
+    assert result == "'=name,value\na,1\n'=b,2\nc,3\n"
+
+
+def test_df_chunks_to_escaped_csv_empty():
+    result = "".join(
+        csv.df_chunks_to_escaped_csv([], columns=["=name", "value"], index=False)
+    )
+    assert result == "'=name,value\n"
+    assert "".join(csv.df_chunks_to_escaped_csv([], index=False)) == ""
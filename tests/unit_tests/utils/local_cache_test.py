@@ -0,0 +1,85 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from freezegun import freeze_time
+
+from superset.utils.local_cache import LocalCache
+
+
+def test_local_cache_disabled() -> None:
+    """
+    Test that nothing is stored when the maximum size is 0.
+    """
+    cache = LocalCache(max_bytes=0)
+    assert cache.set("a", 1, size=1) == 0
+    assert cache.get("a") is None
+
+
+def test_local_cache_lru_eviction() -> None:
+    """
+    Test that the least recently used entries are evicted to make room.
+    """
+    cache = LocalCache(max_bytes=10)
+    cache.set("a", 1, size=4)
+    cache.set("b", 2, size=4)
+    assert cache.get("a") == 1
+
+    assert cache.set("c", 3, size=4) == 1
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    assert cache.size == 8
+
+    # values larger than the cache are never stored
+    assert cache.set("d", 4, size=11) == 0
+    assert cache.get("d") is None
+    assert cache.size == 8
+
+
+def test_local_cache_timeout() -> None:
+    """
+    Test that entries expire, and that the timeout is bounded by the default.
+    """
+    cache = LocalCache(max_bytes=10, default_timeout=60)
+    with freeze_time("2024-01-01 00:00:00") as frozen_time:
+        cache.set("a", 1, size=1, timeout=10)
+        cache.set("b", 2, size=1, timeout=3600)
+        cache.set("c", 3, size=1, timeout=-1)
+        assert cache.get("c") is None
+
+        frozen_time.tick(11)
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+
+        frozen_time.tick(50)
+        assert cache.get("b") is None
+        assert cache.size == 0
+
+
+def test_local_cache_delete_tag() -> None:
+    """
+    Test that all the entries sharing a tag can be removed at once.
+    """
+    cache = LocalCache(max_bytes=10)
+    cache.set("a", 1, size=1, tag="table_1")
+    cache.set("b", 2, size=1, tag="table_1")
+    cache.set("c", 3, size=1, tag="table_2")
+
+    assert cache.delete_tag("table_1") == 2
+    assert cache.get("a") is None
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    assert cache.size == 1